@@ -0,0 +1,98 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.arista.avd.plugins.plugin_utils.fabric_documentation import get_fabric_documentation
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import is_octal_mode, stream_to_file
+
+
+class ActionModule(ActionBase):
+    def run(self, tmp=None, task_vars=None):
+        if task_vars is None:
+            task_vars = {}
+
+        result = super().run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        # Validate Arguments
+        dest_files = {}
+        for arg in ("fabric_documentation_file", "topology_csv_file", "p2p_links_csv_file"):
+            dest = self._task.args.get(arg)
+            if dest is not None and not isinstance(dest, str):
+                raise AnsibleActionFail(f"The argument '{arg}' must be a string if set")
+            dest_files[arg] = dest
+
+        fabric_name = self._templar.template(task_vars.get("fabric_name"))
+        if not isinstance(fabric_name, str) or fabric_name not in task_vars.get("groups", {}):
+            raise AnsibleActionFail("Invalid/missing 'fabric_name' variable. It must point to an Ansible Group containing the fabric devices.")
+
+        # This is not all the hostvars, but just the Ansible Hostvars Manager object where we can retrieve hostvars for each host on-demand.
+        hostvars = task_vars["hostvars"]
+
+        # One pass over the structured configs of the fabric devices collects the rows of all the outputs.
+        fabric_documentation = get_fabric_documentation(
+            fabric_name=fabric_name,
+            fabric_hosts=task_vars["groups"][fabric_name],
+            hostvars=hostvars,
+            avd_switch_facts=task_vars.get("avd_switch_facts", {}),
+            hostname=task_vars["inventory_hostname"],
+        )
+
+        outputs = {
+            "fabric_documentation_file": lambda: [fabric_documentation.get_documentation()],
+            "topology_csv_file": fabric_documentation.topology_csv_lines,
+            "p2p_links_csv_file": fabric_documentation.p2p_links_csv_lines,
+        }
+        for arg, get_chunks in outputs.items():
+            if dest_files[arg] is None:
+                continue
+
+            file_result = self.write_file(get_chunks(), dest_files[arg], task_vars)
+            if file_result.get("failed"):
+                return file_result
+
+            result["changed"] = result.get("changed", False) or file_result.get("changed", False)
+
+        return result
+
+    def can_stream_file(self):
+        """
+        The file can only be written directly when the task runs locally on the controller (delegate_to: localhost) without become.
+        For diff mode we use the Ansible 'copy' action to get the diff of the file.
+        Symbolic file modes like "u=rw,g=r,o=r" are only supported by the Ansible 'copy' action.
+        """
+        return self._connection.transport == "local" and not self._play_context.become and not self._task.diff and is_octal_mode(self._task.args.get("mode"))
+
+    def write_file(self, chunks, dest, task_vars):
+        """
+        Stream the chunks to a temporary file which is atomically renamed to dest if the content changed.
+
+        Otherwise this function implements the Ansible 'copy' action_module, to benefit from Ansible builtin functionality like 'changed'.
+        """
+        if self.can_stream_file():
+            try:
+                return stream_to_file(chunks, dest, mode=self._task.args.get("mode"), check_mode=self._task.check_mode)
+            except (OSError, ValueError) as e:
+                raise AnsibleActionFail(f"Unable to write the file '{dest}': {e}") from e
+
+        new_task = self._task.copy()
+        new_task.args = {
+            "dest": dest,
+            "mode": self._task.args.get("mode"),
+            "content": "".join(chunks),
+        }
+
+        copy_action = self._shared_loader_obj.action_loader.get(
+            "ansible.legacy.copy",
+            task=new_task,
+            connection=self._connection,
+            play_context=self._play_context,
+            loader=self._loader,
+            templar=self._templar,
+            shared_loader_obj=self._shared_loader_obj,
+        )
+
+        return copy_action.run(task_vars=task_vars)
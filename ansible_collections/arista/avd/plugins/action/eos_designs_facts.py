@@ -3,14 +3,16 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import cProfile
+import json
 import pstats
 
 from ansible.errors import AnsibleActionFail
 from ansible.plugins.action import ActionBase, display
 
-from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_facts import EosDesignsFacts
-from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_facts import EosDesignsFacts, FactsDependencyTracker, PeerIndex, render_facts_in_parallel
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils, clear_connected_endpoints_indexes, clear_node_indexes
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdMissingVariableError
+from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import FUNCTIONS, MODULES, RenderTimings, render_timer, write_render_timings_file
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import get_templar
 
@@ -31,6 +33,10 @@ class ActionModule(ActionBase):
         self.template_output = self._task.args.get("template_output", False)
         self._conversion_mode = self._task.args.get("conversion_mode")
         self._validation_mode = self._task.args.get("validation_mode")
+        self._max_workers = int(self._task.args.get("max_workers") or 1)
+        render_timings_file = self._task.args.get("render_timings_file")
+        # Timings per device. Only set if the timings should be recorded.
+        self._render_timings = {} if render_timings_file else None
 
         groups = task_vars.get("groups", {})
         fabric_name = self._templar.template(task_vars.get("fabric_name", ""))
@@ -57,7 +63,21 @@ class ActionModule(ActionBase):
             # Stop here if any of the devices failed input data validation
             return result
 
-        avd_switch_facts = self.render_avd_switch_facts(avd_switch_facts_instances)
+        # Optionally record which peer facts are read by each device and write the dependency graph to a file.
+        dependency_graph_file = self._task.args.get("dependency_graph_file")
+        if dependency_graph_file:
+            dependency_tracker = FactsDependencyTracker()
+            dependency_tracker.track(avd_switch_facts_instances)
+
+        # Timings are recorded in the current process, so parallel rendering is disabled while recording.
+        avd_switch_facts = self.render_avd_switch_facts(avd_switch_facts_instances, parallel=not (dependency_graph_file or render_timings_file))
+
+        if dependency_graph_file:
+            with open(dependency_graph_file, "w", encoding="UTF-8") as file:
+                json.dump(dependency_tracker.to_dict(), file, indent=2)
+
+        if render_timings_file:
+            write_render_timings_file(render_timings_file, {host: render_timings.to_dict() for host, render_timings in self._render_timings.items()})
 
         avd_overlay_peers = {}
         avd_topology_peers = {}
@@ -125,6 +145,12 @@ class ActionModule(ActionBase):
         )
 
         avd_switch_facts = {}
+        # Shared index used by all EosDesignsFacts instances to look up downstream switches without looping over all devices.
+        peer_index = PeerIndex(avd_switch_facts)
+        # Node and connected endpoints indexes are shared by all SharedUtils instances with equal input data.
+        # Start from scratch to pick up any changed inputs.
+        clear_node_indexes()
+        clear_connected_endpoints_indexes()
         data_conversions = 0
         data_validation_errors = 0
         for host in fabric_hosts:
@@ -140,9 +166,14 @@ class ActionModule(ActionBase):
             host_hostvars.setdefault("connected_endpoints_keys", shared_utils.connected_endpoints_keys)
             host_hostvars.setdefault("network_services_keys", shared_utils.network_services_keys)
 
+            render_timings = None
+            if self._render_timings is not None:
+                render_timings = self._render_timings[host] = RenderTimings()
+
             # Set correct hostname in schema tools and perform conversion and validation
             avdschematools.hostname = host
-            host_result = avdschematools.convert_and_validate_data(host_hostvars, return_counters=True)
+            with render_timer(render_timings, FUNCTIONS, "convert_and_validate_data"):
+                host_result = avdschematools.convert_and_validate_data(host_hostvars, return_counters=True)
 
             data_conversions += host_result["conversions"]
             data_validation_errors += host_result["validation_errors"]
@@ -155,9 +186,10 @@ class ActionModule(ActionBase):
             # Add reference to dict "avd_switch_facts".
             # This is used to access EosDesignsFacts objects of other switches during rendering of one switch.
             host_hostvars["avd_switch_facts"] = avd_switch_facts
+            host_hostvars["avd_switch_facts_peer_index"] = peer_index
 
             # Create an instance of EosDesignsFacts and insert into common avd_switch_facts dict
-            avd_switch_facts[host] = {"switch": EosDesignsFacts(hostvars=host_hostvars, shared_utils=shared_utils)}
+            avd_switch_facts[host] = {"switch": EosDesignsFacts(hostvars=host_hostvars, shared_utils=shared_utils, render_timings=render_timings)}
 
             # Add "switch" as a reference to the newly created EosDesignsFacts instance directly in the hostvars
             # to allow `shared_utils` to work the same when they are called from `EosDesignsFacts` or from `AvdStructuredConfig`.
@@ -168,13 +200,17 @@ class ActionModule(ActionBase):
 
         return avd_switch_facts
 
-    def render_avd_switch_facts(self, avd_switch_facts_instances: dict):
+    def render_avd_switch_facts(self, avd_switch_facts_instances: dict, parallel: bool = True):
         """
         Run the render method on each EosDesignsFacts object
 
+        If 'max_workers' is larger than 1 and parallel is True, the facts are rendered in worker processes.
+
         Parameters
         ----------
         avd_switch_facts_instances : dict of EosDesignsFacts
+        parallel : bool
+            Allow rendering in worker processes.
 
         Returns
         -------
@@ -184,16 +220,24 @@ class ActionModule(ActionBase):
             hostname2 : dict
                 switch : < switch.* facts >
         """
-        rendered_facts = {}
-        for host in avd_switch_facts_instances:
-            try:
-                rendered_facts[host] = {"switch": avd_switch_facts_instances[host]["switch"].render()}
-            except AristaAvdMissingVariableError as e:
-                raise AnsibleActionFail(f"{e} is required but was not found for host '{host}'") from e
-
-            # If the argument 'template_output' is set, run the output data through jinja2 rendering.
-            # This is to resolve any input values with inline jinja using variables/facts set by eos_designs_facts.
-            if self.template_output:
+        rendered_facts = None
+        if parallel and self._max_workers > 1:
+            rendered_facts = render_facts_in_parallel(avd_switch_facts_instances, self._max_workers)
+
+        if rendered_facts is None:
+            # Serial rendering. Also used if the parallel rendering failed, to raise the error for the first failing device.
+            rendered_facts = {}
+            for host in avd_switch_facts_instances:
+                try:
+                    with render_timer((self._render_timings or {}).get(host), MODULES, "EosDesignsFacts"):
+                        rendered_facts[host] = {"switch": avd_switch_facts_instances[host]["switch"].render()}
+                except AristaAvdMissingVariableError as e:
+                    raise AnsibleActionFail(f"{e} is required but was not found for host '{host}'") from e
+
+        # If the argument 'template_output' is set, run the output data through jinja2 rendering.
+        # This is to resolve any input values with inline jinja using variables/facts set by eos_designs_facts.
+        if self.template_output:
+            for host in avd_switch_facts_instances:
                 with self._templar.set_temporary_context(available_variables=avd_switch_facts_instances[host]["switch"]._hostvars):
                     rendered_facts[host]["switch"] = self._templar.template(rendered_facts[host]["switch"], fail_on_undefined=False)
 
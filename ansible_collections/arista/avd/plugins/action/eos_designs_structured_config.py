@@ -5,16 +5,24 @@ __metaclass__ = type
 import cProfile
 import pstats
 from collections import ChainMap
+from os.path import exists
 
-import yaml
 from ansible.errors import AnsibleActionFail
-from ansible.parsing.yaml.dumper import AnsibleDumper
 from ansible.plugins.action import ActionBase, display
 
+from ansible_collections.arista.avd.plugins.plugin_utils.fingerprint import DeviceFingerprint, read_fingerprint_file, write_fingerprint_file
 from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
+from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import FUNCTIONS, RenderTimings, render_timer, write_render_timings_file
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
 from ansible_collections.arista.avd.plugins.plugin_utils.strip_empties import strip_null_from_data
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import get, get_templar
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import (
+    dump_data,
+    get,
+    get_collection_version,
+    get_data_format,
+    get_templar,
+    load_data,
+)
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import template as templater
 from ansible_collections.arista.avd.roles.eos_designs.python_modules.get_structured_config import get_structured_config
 
@@ -28,6 +36,7 @@ class ActionModule(ActionBase):
         del tmp  # tmp no longer has any effect
 
         cprofile_file = self._task.args.get("cprofile_file")
+        profiler = None
         if cprofile_file:
             profiler = cProfile.Profile()
             profiler.enable()
@@ -37,6 +46,9 @@ class ActionModule(ActionBase):
         template_output = self._task.args.get("template_output", False)
         conversion_mode = self._task.args.get("conversion_mode")
         validation_mode = self._task.args.get("validation_mode")
+        incremental = self._task.args.get("incremental", False)
+        render_timings_file = self._task.args.get("render_timings_file")
+        render_timings = RenderTimings() if render_timings_file else None
 
         hostname = task_vars["inventory_hostname"]
 
@@ -56,6 +68,21 @@ class ActionModule(ActionBase):
         # Get updated templar instance to be passed along to our simplified "templater"
         self.templar = get_templar(self, task_vars)
 
+        # With 'incremental' the inputs are fingerprinted and stored next to the output file.
+        # If the fingerprint from the previous run is unchanged, we skip the generation and return the existing output.
+        fingerprint = None
+        if incremental and self.dest:
+            fingerprint_file = f"{self.dest}.fingerprint"
+            fingerprint_vars = ChainMap({"_eos_designs_structured_config_args": [eos_designs_custom_templates, template_output]}, task_vars)
+            fingerprint = DeviceFingerprint(hostvars=fingerprint_vars, avd_version=get_collection_version())
+            if exists(self.dest) and fingerprint.is_unchanged(read_fingerprint_file(fingerprint_file), task_vars.get("avd_switch_facts", {})):
+                display.vv(f"Skipping generation of structured config for '{hostname}' since no inputs changed since the previous run.")
+                result["changed"] = False
+                result["ansible_facts"] = self.read_file() or {}
+                result["ansible_facts"]["switch"] = task_vars.get("switch")
+                self._stop_profiler(profiler, cprofile_file)
+                return result
+
         # Load schema tools for input schema
         input_schema_tools = AvdSchemaTools(
             hostname=hostname,
@@ -84,6 +111,8 @@ class ActionModule(ActionBase):
                 output_schema_tools=output_schema_tools,
                 result=result,
                 templar=self.templar,
+                fingerprint=fingerprint,
+                render_timings=render_timings,
             )
         except Exception as error:
             raise AnsibleActionFail(message=str(error)) from error
@@ -99,6 +128,45 @@ class ActionModule(ActionBase):
         template_vars = ChainMap(output, task_vars)
 
         # eos_designs_custom_templates can contain a list of jinja templates to run after the builtin eos_designs python_modules
+        with render_timer(render_timings, FUNCTIONS, "eos_designs_custom_templates"):
+            self.render_custom_templates(eos_designs_custom_templates, output, template_vars, output_schema_tools)
+
+        # If the argument 'template_output' is set, run the output data through another jinja2 rendering.
+        # This is to resolve any input values with inline jinja using variables/facts set by the input templates.
+        if template_output:
+            with render_timer(render_timings, FUNCTIONS, "template_output"), self._templar.set_temporary_context(available_variables=template_vars):
+                output = self._templar.template(output, fail_on_undefined=False)
+
+        if render_timings is not None:
+            result["render_timings"] = render_timings.to_dict()
+            write_render_timings_file(render_timings_file, {hostname: result["render_timings"]})
+
+        # If the argument 'dest' is set, write the output data to a file.
+        if self.dest:
+            # Depending on the file suffix of 'dest' (default: 'json') we will format the data to yaml or json.
+            write_file_result = self.write_file(dump_data(output, get_data_format(self.dest) or "json"), task_vars)
+
+            # Overwrite result with the result from the copy operation (setting 'changed' flag accordingly)
+            result.update(write_file_result)
+
+            if fingerprint is not None and not result.get("failed"):
+                write_fingerprint_file(fingerprint_file, fingerprint.to_dict())
+
+        # If 'dest' is not set, hardcode 'changed' to true, since we don't know if something changed and later tasks may depend on this.
+        else:
+            result["changed"] = True
+
+        result["ansible_facts"] = output
+        result["ansible_facts"]["switch"] = task_vars.get("switch")
+
+        self._stop_profiler(profiler, cprofile_file)
+
+        return result
+
+    def render_custom_templates(self, eos_designs_custom_templates: list, output: dict, template_vars: ChainMap, output_schema_tools: AvdSchemaTools):
+        """
+        Render the jinja templates in eos_designs_custom_templates and merge the result in-place on top of the output.
+        """
         for template_item in eos_designs_custom_templates:
             template_options = template_item.get("options", {})
             list_merge = template_options.get("list_merge", "append_rp")
@@ -109,7 +177,7 @@ class ActionModule(ActionBase):
             template_result = templater(template, template_vars, self.templar)
 
             # Load data from the template result.
-            template_result_data = yaml.safe_load(template_result)
+            template_result_data = load_data(template_result, "yaml")
 
             # If the argument 'strip_empty_keys' is set, remove keys with value of null / None from the resulting dict (recursively).
             if strip_empty_keys:
@@ -126,37 +194,27 @@ class ActionModule(ActionBase):
                 except Exception as error:
                     raise AnsibleActionFail(message=str(error)) from error
 
-        # If the argument 'template_output' is set, run the output data through another jinja2 rendering.
-        # This is to resolve any input values with inline jinja using variables/facts set by the input templates.
-        if template_output:
-            with self._templar.set_temporary_context(available_variables=template_vars):
-                output = self._templar.template(output, fail_on_undefined=False)
-
-        # If the argument 'dest' is set, write the output data to a file.
-        if self.dest:
-            # Depending on the file suffix of 'dest' (default: 'json') we will format the data to yaml or just write the output data directly.
-            # The Copy module used in 'write_file' will convert the output data to json automatically.
-            if self.dest.split(".")[-1] in ["yml", "yaml"]:
-                write_file_result = self.write_file(yaml.dump(output, Dumper=AnsibleDumper, indent=2, sort_keys=False, width=130), task_vars)
-            else:
-                write_file_result = self.write_file(output, task_vars)
+    def _stop_profiler(self, profiler, cprofile_file):
+        if profiler is None:
+            return
 
-            # Overwrite result with the result from the copy operation (setting 'changed' flag accordingly)
-            result.update(write_file_result)
+        profiler.disable()
+        stats = pstats.Stats(profiler).sort_stats("cumtime")
+        stats.dump_stats(cprofile_file)
 
-        # If 'dest' is not set, hardcode 'changed' to true, since we don't know if something changed and later tasks may depend on this.
-        else:
-            result["changed"] = True
+    def read_file(self):
+        """
+        Read the existing output data from 'dest'.
 
-        result["ansible_facts"] = output
-        result["ansible_facts"]["switch"] = task_vars.get("switch")
+        Vaulted values are only understood by the Ansible loader, so it is used instead of the faster 'read_data_file' for such files.
+        """
+        with open(self.dest, "r", encoding="UTF-8") as file:
+            content = file.read()
 
-        if cprofile_file:
-            profiler.disable()
-            stats = pstats.Stats(profiler).sort_stats("cumtime")
-            stats.dump_stats(cprofile_file)
+        if "!vault" in content or "__ansible_vault" in content:
+            return self._loader.load(content, file_name=self.dest)
 
-        return result
+        return load_data(content, get_data_format(self.dest))
 
     def write_file(self, content, task_vars):
         """
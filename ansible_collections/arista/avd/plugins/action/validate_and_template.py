@@ -2,12 +2,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from contextlib import nullcontext
+
 from ansible.errors import AnsibleActionFail
 from ansible.plugins.action import ActionBase, display
 
 from ansible_collections.arista.avd.plugins.filter.add_md_toc import add_md_toc
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import get_templar, template
+from ansible_collections.arista.avd.plugins.plugin_utils.template_profiler import TemplateProfiler, write_template_profile_files
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get_templar, is_octal_mode, stream_to_file, template, template_generator
 
 
 class ActionModule(ActionBase):
@@ -40,6 +43,10 @@ class ActionModule(ActionBase):
         if not isinstance(self.md_toc_skip_lines, int):
             raise AnsibleActionFail("The argument 'md_toc_skip_lines' must be an integer")
 
+        self.template_profile_file = self._task.args.get("template_profile_file")
+        if self.template_profile_file is not None and not isinstance(self.template_profile_file, str):
+            raise AnsibleActionFail("The argument 'template_profile_file' must be a string if set")
+
         # Build data from hostvars and role default vars
         hostname = task_vars["inventory_hostname"]
         self.data = self._templar.template(self._task._role.get_default_vars())
@@ -58,7 +65,7 @@ class ActionModule(ActionBase):
         result.update(avdschematools.convert_and_validate_data(self.data))
 
         # Template to file
-        # Update result from Ansible "copy" operation (setting 'changed' flag accordingly)
+        # Update result from the file operation (setting 'changed' flag accordingly)
         if not result.get("failed"):
             result.update(self.template(task_vars, dest))
 
@@ -68,18 +75,57 @@ class ActionModule(ActionBase):
         # Get updated templar instance to be passed along to our simplified "templater"
         templar = get_templar(self, task_vars)
 
-        output = template(self.templatefile, self.data, templar)
+        if self.template_profile_file is None:
+            return self.render(templar, task_vars, dest)
+
+        profiler = TemplateProfiler()
+        with profiler.install(templar.environment):
+            result = self.render(templar, task_vars, dest, profiler)
+
+        result["template_profile"] = profiler.to_dict()
+        write_template_profile_files(self.template_profile_file, result["template_profile"])
+        return result
+
+    def render(self, templar, task_vars, dest, profiler=None):
+        if dest is not None and not self.add_md_toc and self.can_stream_file():
+            # Stream the rendered template directly to the file, so the full output is never held in memory.
+            chunks = template_generator(self.templatefile, self.data, templar)
+            if profiler is not None:
+                chunks = profiler.profile_generator(self.templatefile, chunks)
+            return self.stream_file(chunks, dest)
+
+        with profiler.frame(self.templatefile) if profiler is not None else nullcontext():
+            output = template(self.templatefile, self.data, templar)
         if self.add_md_toc:
-            output = add_md_toc(output, skip_lines=self.md_toc_skip_lines)
+            with profiler.frame("add_md_toc") if profiler is not None else nullcontext():
+                output = add_md_toc(output, skip_lines=self.md_toc_skip_lines)
 
         if dest is None:
             # Return dict with template output in 'output' key for fileless operation
             return {"output": output}
 
-        write_file_result = self.write_file(output, dest, task_vars)
+        if self.can_stream_file():
+            return self.stream_file([output], dest)
 
-        # Return result with the result from the copy operation
-        return write_file_result
+        return self.write_file(output, dest, task_vars)
+
+    def can_stream_file(self):
+        """
+        The file can only be written directly when the task runs locally on the controller (delegate_to: localhost) without become.
+        For diff mode we use the Ansible 'copy' action to get the diff of the file.
+        Symbolic file modes like "u=rw,g=r,o=r" are only supported by the Ansible 'copy' action.
+        """
+        return self._connection.transport == "local" and not self._play_context.become and not self._task.diff and is_octal_mode(self._task.args.get("mode"))
+
+    def stream_file(self, chunks, dest):
+        """
+        Write the chunks to a temporary file which is atomically renamed to dest if the content changed.
+        The checksum is calculated while writing, so 'changed' is set without reading the new file again.
+        """
+        try:
+            return stream_to_file(chunks, dest, mode=self._task.args.get("mode"), check_mode=self._task.check_mode)
+        except (OSError, ValueError) as e:
+            raise AnsibleActionFail(f"Unable to write the file '{dest}': {e}") from e
 
     def write_file(self, content, dest, task_vars):
         """
@@ -19,7 +19,7 @@ from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvd
 from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
 from ansible_collections.arista.avd.plugins.plugin_utils.strip_empties import strip_null_from_data
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import get, get_templar, load_python_class
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get, get_templar, load_data, load_python_class
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import template as templater
 
 DEFAULT_PYTHON_CLASS_NAME = "AvdStructuredConfig"
@@ -166,7 +166,7 @@ class ActionModule(ActionBase):
                     debug_item["timestamps"]["load_yaml"] = datetime.now()
 
                 # Load data from the template result.
-                template_result_data = yaml.safe_load(template_result)
+                template_result_data = load_data(template_result, "yaml")
 
                 # If the argument 'strip_empty_keys' is set, remove keys with value of null / None from the resulting dict (recursively).
                 if strip_empty_keys:
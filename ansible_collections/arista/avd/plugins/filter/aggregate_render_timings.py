@@ -0,0 +1,51 @@
+#
+# arista.avd.aggregate_render_timings filter
+#
+__metaclass__ = type
+
+from jinja2.runtime import Undefined
+
+from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import aggregate_render_timings as aggregate
+
+DOCUMENTATION = r"""
+  name: aggregate_render_timings
+  version_added: "4.2.0"
+  short_description: Aggregate render timings of eos_designs across the fabric
+  description:
+    - Aggregate the timings returned as "render_timings" by the C(arista.avd.eos_designs_structured_config) action for each device.
+    - The calls and seconds of each module, top-level key and function are added up across the devices,
+      and the device with the highest number of seconds is given for each of them.
+  positional: _input
+  options:
+    _input:
+      description: Dictionary with the render timings of each device. Devices with undefined or null timings are left out.
+      type: dict
+      required: true
+"""
+
+EXAMPLES = r"""
+{{ dict(ansible_play_hosts | zip(ansible_play_hosts | map('extract', hostvars, ['structured_config', 'render_timings'])))
+   | arista.avd.aggregate_render_timings | to_nice_json }}
+"""
+
+RETURN = r"""
+  _value:
+    description: Dictionary with the aggregated timings under "fabric" and the timings of each device under "devices".
+    type: dict
+"""
+
+
+def aggregate_render_timings(device_render_timings: dict) -> dict:
+    device_render_timings = {
+        hostname: render_timings
+        for hostname, render_timings in device_render_timings.items()
+        if not isinstance(render_timings, Undefined) and render_timings is not None
+    }
+    return {"fabric": aggregate(device_render_timings), "devices": device_render_timings}
+
+
+class FilterModule(object):
+    def filters(self):
+        return {
+            "aggregate_render_timings": aggregate_render_timings,
+        }
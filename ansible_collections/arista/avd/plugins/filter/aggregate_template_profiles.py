@@ -0,0 +1,66 @@
+#
+# arista.avd.aggregate_template_profiles filter
+#
+__metaclass__ = type
+
+from jinja2.runtime import Undefined
+
+from ansible_collections.arista.avd.plugins.plugin_utils.template_profiler import aggregate_template_profiles as aggregate
+from ansible_collections.arista.avd.plugins.plugin_utils.template_profiler import format_folded_stacks
+
+DOCUMENTATION = r"""
+  name: aggregate_template_profiles
+  version_added: "4.2.0"
+  short_description: Aggregate template profiles of eos_cli_config_gen across the fabric
+  description:
+    - Aggregate the profiles returned as "template_profile" by the C(arista.avd.validate_and_template) action for each device.
+    - The calls and seconds of each included template and custom filter/test are added up across the devices,
+      and the device with the highest number of seconds is given for each of them.
+  positional: _input
+  options:
+    _input:
+      description: Dictionary with the template profile of each device. Devices with undefined or empty profiles are left out.
+      type: dict
+      required: true
+    folded:
+      description: Return the aggregated stacks in the "folded stacks" format read by flamegraph tools instead of the aggregated profile.
+      type: bool
+      default: false
+"""
+
+EXAMPLES = r"""
+{{ dict(ansible_play_hosts | zip(ansible_play_hosts | map('extract', hostvars, ['eosconfig', 'template_profile'])))
+   | arista.avd.aggregate_template_profiles | to_json(indent=2) }}
+
+{{ dict(ansible_play_hosts | zip(ansible_play_hosts | map('extract', hostvars, ['eosconfig', 'template_profile'])))
+   | arista.avd.aggregate_template_profiles(folded=true) }}
+"""
+
+RETURN = r"""
+  _value:
+    description:
+      - Dictionary with the number of devices under "devices", the aggregated time of each template or filter under "sections"
+        and the aggregated time of each stack under "stacks".
+      - With folded=true, a string with one line per stack followed by the number of microseconds.
+    type: raw
+"""
+
+
+def aggregate_template_profiles(device_template_profiles: dict, folded: bool = False):
+    device_template_profiles = {
+        hostname: template_profile
+        for hostname, template_profile in device_template_profiles.items()
+        if not isinstance(template_profile, Undefined) and template_profile
+    }
+    aggregated_template_profile = aggregate(device_template_profiles)
+    if folded:
+        return format_folded_stacks(aggregated_template_profile)
+
+    return aggregated_template_profile
+
+
+class FilterModule(object):
+    def filters(self):
+        return {
+            "aggregate_template_profiles": aggregate_template_profiles,
+        }
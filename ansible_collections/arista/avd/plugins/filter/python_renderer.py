@@ -0,0 +1,61 @@
+#
+# arista.avd.python_renderer filter
+#
+__metaclass__ = type
+
+from jinja2.runtime import Undefined
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+from ansible_collections.arista.avd.roles.eos_cli_config_gen.python_modules.renderers import PYTHON_RENDERERS
+
+DOCUMENTATION = r"""
+  name: python_renderer
+  version_added: "4.2.0"
+  short_description: Render an eos_cli_config_gen section with Python instead of the Jinja2 template
+  description:
+    - Render the EOS CLI configuration of one eos_cli_config_gen section using a Python renderer.
+    - The output is identical to the output of the corresponding Jinja2 template, but much faster for large data models.
+    - Supported sections are C(ethernet_interfaces), C(port_channel_interfaces) and C(router_bgp).
+  positional: _input
+  options:
+    _input:
+      description: Data model of the section. An undefined or null value gives an empty string.
+      type: raw
+      required: true
+    section:
+      description: Name of the section to render.
+      type: str
+      required: true
+      choices: ["ethernet_interfaces", "port_channel_interfaces", "router_bgp"]
+    hide_passwords:
+      description: Replace passwords by "<removed>" in the output.
+      type: bool
+      default: false
+"""
+
+EXAMPLES = r"""
+{{ router_bgp | arista.avd.python_renderer('router_bgp', hide_passwords) }}
+"""
+
+RETURN = r"""
+  _value:
+    description: EOS CLI configuration of the section.
+    type: string
+"""
+
+
+def python_renderer(value, section: str, hide_passwords: bool = False) -> str:
+    if section not in PYTHON_RENDERERS:
+        raise AristaAvdError(f"Section '{section}' is not supported by the python_renderer filter. Supported sections are {sorted(PYTHON_RENDERERS)}")
+
+    if isinstance(value, Undefined) or value is None:
+        return ""
+
+    return PYTHON_RENDERERS[section](value, hide_passwords)
+
+
+class FilterModule(object):
+    def filters(self):
+        return {
+            "python_renderer": python_renderer,
+        }
@@ -0,0 +1,62 @@
+# Copyright 2023 Arista Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+DOCUMENTATION = r"""
+---
+module: eos_designs_documentation
+version_added: "4.1.0"
+author: Arista Ansible Team (@aristanetworks)
+short_description: Generate fabric documentation, topology and point-to-point links summary
+description:
+  - The `arista.avd.eos_designs_documentation` module is an Ansible Action Plugin providing the following capabilities
+  - Generate the fabric documentation in Markdown format with a table of contents.
+  - Generate the fabric topology in CSV format.
+  - Generate the fabric point-to-point links summary in CSV format.
+  - All outputs are built in one pass over the structured configurations of the devices in the Ansible group set in `fabric_name`.
+  - The node types, underlay routing protocol and `eos_designs_documentation` settings are read from the device running the task.
+  - The plugin is designed to `run_once` after the structured configurations have been generated and before `avd_switch_facts` is removed.
+  - When running locally on the controller, each output is streamed to a temporary file which is atomically renamed to the destination file.
+  - Files are only replaced if the content changed.
+options:
+  fabric_documentation_file:
+    description: Destination path for the fabric documentation. The documentation is only generated if this is set.
+    required: false
+    type: str
+  topology_csv_file:
+    description: Destination path for the fabric topology CSV. The topology CSV is only generated if this is set.
+    required: false
+    type: str
+  p2p_links_csv_file:
+    description: Destination path for the fabric point-to-point links CSV. The point-to-point links CSV is only generated if this is set.
+    required: false
+    type: str
+  mode:
+    description: File mode for the destination files.
+    required: false
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Generate fabric documentation, point-to-point links summary and topology in csv format
+  tags: [build, provision, documentation]
+  arista.avd.eos_designs_documentation:
+    fabric_documentation_file: "{{ fabric_dir }}/{{ fabric_name }}-documentation.md"
+    topology_csv_file: "{{ fabric_dir }}/{{ fabric_name }}-topology.csv"
+    p2p_links_csv_file: "{{ fabric_dir }}/{{ fabric_name }}-p2p-links.csv"
+    mode: 0664
+  delegate_to: localhost
+  run_once: true
+  check_mode: false
+"""
@@ -68,6 +68,29 @@ options:
     default: "warning"
     type: str
     choices: [ "error", "warning", "info", "debug", "disabled" ]
+  max_workers:
+    description:
+      - Number of worker processes used to render the facts.
+      - With 1 the facts are rendered in the Ansible worker process. The output is the same regardless of the number of workers.
+      - Ignored if "dependency_graph_file" or "render_timings_file" is set.
+    required: false
+    default: 1
+    type: int
+  dependency_graph_file:
+    description:
+      - Filename for storing the dependency graph of the facts as JSON.
+      - The graph contains an edge for every fact of a peer device read while rendering the facts of a device,
+        which can be used to see which devices are affected by a change to one device.
+      - Recording the dependencies will slow down performance, so only set this while troubleshooting.
+    required: false
+    type: str
+  render_timings_file:
+    description:
+      - Filename for storing the time spent on each fact and the data conversion of each device as JSON,
+        together with the timings aggregated across the fabric.
+      - Facts read from peer devices are computed when they are first needed, so the time is recorded on the fact reading them.
+    required: false
+    type: str
   cprofile_file:
     description:
       - Filename for storing cprofile data used to debug performance issues.
@@ -101,6 +101,24 @@ options:
     default: "warning"
     type: str
     choices: [ "error", "warning", "info", "debug", "disabled" ]
+  incremental:
+    description:
+      - Skip the generation of structured configuration if none of the inputs changed since the previous run.
+      - Requires "dest" to be set. A fingerprint of the inputs is stored next to the output file as "<dest>.fingerprint".
+      - The fingerprint covers the input variables of the device, the AVD version and the switch facts of the device and any peers used during
+        the generation. Changes to custom Jinja2 templates or custom python modules are not detected, so remove the fingerprint files after
+        changing those.
+    required: false
+    default: false
+    type: bool
+  render_timings_file:
+    description:
+      - Filename for storing the time spent on each module, each top-level key, data conversion and merge as JSON.
+      - The timings are also returned as "render_timings" in the task result, so they can be aggregated across the fabric
+        with the "arista.avd.aggregate_render_timings" filter.
+      - The timings are not recorded if the generation is skipped because of "incremental".
+    required: false
+    type: str
   cprofile_file:
     description:
       - Filename for storing cprofile data used to debug performance issues.
@@ -25,6 +25,8 @@ description:
   - The Action Plugin supports different modes for conversion and validation, to either block the playbook or just warn the user if
   - the input data is not valid.
   - For Markdown files the plugin can also run md_toc on the output before writing to the file.
+  - When running locally on the controller, the output is streamed to a temporary file which is atomically renamed to the destination file.
+  - The file is only replaced if the content changed.
 options:
   template:
     description: Path to Jinja2 Template file
@@ -56,6 +58,14 @@ options:
     default: 0
     type: int
     required: false
+  template_profile_file:
+    description:
+      - Path to a JSON file where the time spent in each included template and custom filter/test is written.
+      - The stacks of templates are also written in the "folded stacks" format read by flamegraph tools
+        to a file next to it with the extension ".folded".
+      - The profile is also returned in the "template_profile" key of the result.
+    required: false
+    type: str
   conversion_mode:
     description:
       - Run data conversion in either "warning", "info", "debug", "quiet" or "disabled" mode.
@@ -3,14 +3,18 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING
 
+from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import KEYS
+
 if TYPE_CHECKING:
     from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+    from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import RenderTimings
 
 
 class AvdFacts:
-    def __init__(self, hostvars: dict, shared_utils: SharedUtils):
+    def __init__(self, hostvars: dict, shared_utils: SharedUtils, render_timings: RenderTimings | None = None):
         self._hostvars = hostvars
         self.shared_utils = shared_utils
+        self._render_timings = render_timings
 
     @classmethod
     def __keys(cls):  # pylint: disable=bad-option-value, unused-private-member # CH Sep-22: Some pylint bug.
@@ -60,5 +64,17 @@ class AvdFacts:
         If the value is cached, it will automatically get returned from cache
         If the value is not cached, it will be resolved by the attribute function first.
         Empty values are removed from the returned data.
+
+        If a RenderTimings instance was given, the time spent on each key is recorded.
         """
-        return {key: getattr(self, key) for key in self.keys() if getattr(self, key) is not None}
+        if self._render_timings is None:
+            return {key: getattr(self, key) for key in self.keys() if getattr(self, key) is not None}
+
+        rendered = {}
+        for key in self.keys():
+            with self._render_timings.timer(KEYS, key):
+                value = getattr(self, key)
+            if value is not None:
+                rendered[key] = value
+
+        return rendered
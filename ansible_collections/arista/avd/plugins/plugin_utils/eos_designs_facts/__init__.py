@@ -1,3 +1,6 @@
+from .dependency_tracker import FactsDependencyTracker
 from .eos_designs_facts import EosDesignsFacts
+from .parallel import render_facts_in_parallel
+from .peer_index import PeerIndex
 
-__all__ = ["EosDesignsFacts"]
+__all__ = ["EosDesignsFacts", "FactsDependencyTracker", "PeerIndex", "render_facts_in_parallel"]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from functools import cached_property, lru_cache, wraps
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .eos_designs_facts import EosDesignsFacts
+
+
+class FactsDependencyTracker:
+    """
+    Records which facts of which peers are read while rendering EosDesignsFacts.
+
+    Once an EosDesignsFacts instance is tracked, every computation of one of its cached_properties (including internal ones)
+    is recorded as the current context. Every read of a peer through "SharedUtils.get_peer_facts" is then recorded as an edge
+    (device, fact) -> (peer, peer_fact). Reads of the peer's SharedUtils are recorded with the peer_fact "shared_utils.<attribute>".
+    Lookups in the shared PeerIndex are recorded as reads of "uplink_peers" on all devices, since the index bypasses "get_peer_facts".
+
+    Since the facts are cached, an edge is only recorded for the first fact reading a value which is cached on the device.
+    The dependencies between devices are complete though, so the graph can be used to find all devices affected by a change.
+
+    Tracking is enabled per instance with "track()" and must be done before rendering the facts.
+    """
+
+    def __init__(self):
+        self.edges: set[tuple[str, str, str, str]] = set()
+        self._context: list[tuple[str, str]] = []
+
+    def track(self, avd_switch_facts_instances: dict) -> None:
+        """
+        Enable tracking on all EosDesignsFacts instances.
+
+        Parameters
+        ----------
+        avd_switch_facts_instances : dict
+            hostname1 : dict
+                switch : <EosDesignsFacts object>
+        """
+        for host_facts in avd_switch_facts_instances.values():
+            self.track_instance(host_facts["switch"])
+
+    def track_instance(self, eos_designs_facts: EosDesignsFacts) -> None:
+        eos_designs_facts.__class__ = _get_tracked_class(type(eos_designs_facts))
+        eos_designs_facts._dependency_tracker = self
+        eos_designs_facts.shared_utils.dependency_tracker = self
+
+    def wrap_peer_facts(self, peer_name: str, peer_facts):
+        """
+        Return a proxy of the given peer facts recording all reads of the peer facts.
+        """
+        return _PeerFactsProxy(self, peer_name, peer_facts)
+
+    def record(self, peer_name: str, peer_fact: str) -> None:
+        if not self._context:
+            return
+
+        device, fact = self._context[-1]
+        if device != peer_name:
+            self.edges.add((device, fact, peer_name, peer_fact))
+
+    def record_peers(self, peer_names: Iterable[str], peer_fact: str) -> None:
+        """
+        Record a read of the same fact on all the given peers. Used for lookups in shared indexes bypassing "SharedUtils.get_peer_facts".
+        """
+        for peer_name in peer_names:
+            self.record(peer_name, peer_fact)
+
+    def get_dependencies(self, device: str) -> set[str]:
+        """
+        Return the peers read directly by the given device.
+        """
+        return {peer for edge_device, _, peer, _ in self.edges if edge_device == device}
+
+    def get_dependents(self, device: str) -> set[str]:
+        """
+        Return the devices directly reading facts of the given device.
+        """
+        return {edge_device for edge_device, _, peer, _ in self.edges if peer == device}
+
+    def get_affected_devices(self, changed_devices: list[str]) -> list[str]:
+        """
+        Return the sorted list of devices where the facts must be recomputed if the inputs of the given devices changed.
+
+        This includes the changed devices and all devices which directly or indirectly read facts of the changed devices.
+        """
+        dependents = {}
+        for device, _, peer, _ in self.edges:
+            dependents.setdefault(peer, set()).add(device)
+
+        affected_devices = set(changed_devices)
+        pending_devices = list(changed_devices)
+        while pending_devices:
+            for dependent in dependents.get(pending_devices.pop(), ()):
+                if dependent not in affected_devices:
+                    affected_devices.add(dependent)
+                    pending_devices.append(dependent)
+
+        return sorted(affected_devices)
+
+    def to_dict(self) -> dict:
+        """
+        Export the dependency graph.
+
+        Returns
+        -------
+        dict
+            edges : list
+                - device : str
+                  fact : str
+                  peer : str
+                  peer_fact : str
+            dependents : dict
+                <peer> : list[str]
+                    Sorted list of devices directly reading facts of the peer
+        """
+        dependents = {}
+        for device, _, peer, _ in self.edges:
+            dependents.setdefault(peer, set()).add(device)
+
+        return {
+            "edges": [{"device": device, "fact": fact, "peer": peer, "peer_fact": peer_fact} for device, fact, peer, peer_fact in sorted(self.edges)],
+            "dependents": {peer: sorted(devices) for peer, devices in sorted(dependents.items())},
+        }
+
+
+class _PeerFactsProxy:
+    """
+    Proxy of EosDesignsFacts for a peer, recording every attribute read with the FactsDependencyTracker.
+    """
+
+    __slots__ = ("_tracker", "_peer_name", "_peer_facts", "_prefix")
+
+    def __init__(self, tracker: FactsDependencyTracker, peer_name: str, peer_facts, prefix: str = ""):
+        self._tracker = tracker
+        self._peer_name = peer_name
+        self._peer_facts = peer_facts
+        self._prefix = prefix
+
+    def __getattr__(self, name: str):
+        value = getattr(self._peer_facts, name)
+        if name == "shared_utils" and not self._prefix:
+            return _PeerFactsProxy(self._tracker, self._peer_name, value, prefix="shared_utils.")
+
+        self._tracker.record(self._peer_name, f"{self._prefix}{name}")
+        return value
+
+    def get(self, key, default_value=None):
+        self._tracker.record(self._peer_name, f"{self._prefix}{key}")
+        return self._peer_facts.get(key, default_value)
+
+
+def _tracked_fact(fact: str, func):
+    @wraps(func)
+    def wrapper(self: EosDesignsFacts):
+        tracker: FactsDependencyTracker = self._dependency_tracker
+        tracker._context.append((self.shared_utils.hostname, fact))
+        try:
+            return func(self)
+        finally:
+            tracker._context.pop()
+
+    return wrapper
+
+
+@lru_cache
+def _get_tracked_class(cls: type) -> type:
+    """
+    Return a subclass of the given AvdFacts class where all cached_properties record the current context on the tracker.
+
+    The cached_properties are added in the same order as on the original class, so "keys()" and "render()" return the same order.
+    """
+    namespace = {key: cached_property(_tracked_fact(key, getattr(cls, key).func)) for key in cls.keys() + cls.internal_keys()}
+    return type(f"Tracked{cls.__name__}", (cls,), namespace)
@@ -8,6 +8,7 @@ from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
 
 from .mlag import MlagMixin
 from .overlay import OverlayMixin
+from .peer_index import PeerIndex
 from .short_esi import ShortEsiMixin
 from .uplinks import UplinksMixin
 from .vlans import VlansMixin
@@ -21,6 +22,17 @@ class EosDesignsFacts(AvdFacts, MlagMixin, ShortEsiMixin, OverlayMixin, UplinksM
     which is a dict of `EosDesignsfacts` instances covering all devices.
     """
 
+    @cached_property
+    def _peer_index(self) -> PeerIndex:
+        """
+        PeerIndex shared by all devices, inserted into the hostvars as "avd_switch_facts_peer_index" by eos_designs_facts.
+        If not set, an index is created for this device only.
+        """
+        if (peer_index := get(self._hostvars, "avd_switch_facts_peer_index")) is not None:
+            return peer_index
+
+        return PeerIndex(get(self._hostvars, "avd_switch_facts", required=True))
+
     @cached_property
     def id(self) -> int | None:
         """
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+
+from .peer_index import PeerIndex
+
+if TYPE_CHECKING:
+    from .dependency_tracker import FactsDependencyTracker
+
+# Leveraging copy on write from fork. The EosDesignsFacts instances are inherited by the workers instead of being pickled.
+GLOBALS = {}
+
+# Internal facts which are not plain data and cannot be published from the workers.
+UNPUBLISHED_FACTS = ("_peer_index",)
+
+
+class _PeerFactsRequired(BaseException):
+    """
+    Raised in the first stage when a fact needs the facts of another device.
+
+    Inheriting from BaseException so it is not caught by any generic exception handling in the facts.
+    """
+
+
+class _LocalFactsGuard:
+    """
+    Used in place of the PeerIndex and the dependency tracker of SharedUtils in the first stage,
+    to stop the computation of any fact reading the facts of other devices.
+    """
+
+    def __init__(self, peer_index: PeerIndex):
+        self._peer_index = peer_index
+
+    def wrap_peer_facts(self, peer_name: str, peer_facts):
+        raise _PeerFactsRequired(peer_name)
+
+    def is_fabric_device(self, hostname: str) -> bool:
+        return self._peer_index.is_fabric_device(hostname)
+
+    def get_downstream_switches(self, hostname: str, dependency_tracker: FactsDependencyTracker | None = None) -> list[str]:
+        raise _PeerFactsRequired(hostname)
+
+
+def _render_local_facts(hostnames: list[str]) -> dict:
+    """
+    This function runs as a separate fork.
+
+    Compute all public and internal facts which do not read the facts of other devices.
+    Facts failing for any other reason are also left out, so the error is raised in the second stage.
+
+    Returns
+    -------
+    dict
+        hostname1 : dict
+            <fact> : <value>
+    """
+    avd_switch_facts_instances = GLOBALS["avd_switch_facts_instances"]
+    local_facts = {}
+    for hostname in hostnames:
+        eos_designs_facts = avd_switch_facts_instances[hostname]["switch"]
+        guard = _LocalFactsGuard(eos_designs_facts._peer_index)
+        eos_designs_facts.__dict__["_peer_index"] = guard
+        eos_designs_facts.shared_utils.dependency_tracker = guard
+
+        local_facts[hostname] = {}
+        for key in eos_designs_facts.keys() + eos_designs_facts.internal_keys():
+            if key in UNPUBLISHED_FACTS:
+                continue
+            try:
+                local_facts[hostname][key] = getattr(eos_designs_facts, key)
+            except (_PeerFactsRequired, Exception):
+                # Computed in the second stage.
+                continue
+
+    return local_facts
+
+
+def _render_facts(hostnames: list[str]) -> dict | None:
+    """
+    This function runs as a separate fork.
+
+    Render the facts of the given devices. The facts of other devices are computed as needed in this process.
+
+    Returns
+    -------
+    dict | None
+        Rendered facts per hostname or None if rendering failed for any device.
+    """
+    avd_switch_facts_instances = GLOBALS["avd_switch_facts_instances"]
+    try:
+        return {hostname: avd_switch_facts_instances[hostname]["switch"].render() for hostname in hostnames}
+    except Exception:
+        return None
+
+
+def render_facts_in_parallel(avd_switch_facts_instances: dict, max_workers: int) -> dict | None:
+    """
+    Render the facts of all devices in worker processes.
+
+    EosDesignsFacts instances read facts from each other, so the rendering is done in two stages:
+    1. All facts not depending on other devices are computed in parallel and published back as plain data.
+       The published values are inserted into the cache of the EosDesignsFacts instances.
+    2. The devices are rendered in parallel. Facts depending on other devices are computed from the cached local facts.
+
+    Since the workers are forked after each stage, they inherit the instances and the cached values from the first stage.
+    Each fact is computed with the same code as the serial rendering, so the output is identical.
+
+    Parameters
+    ----------
+    avd_switch_facts_instances : dict
+        hostname1 : dict
+            switch : <EosDesignsFacts object>
+    max_workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    dict | None
+        hostname1 : dict
+            switch : < switch.* facts >
+        None is returned if the rendering failed for any device. Render the facts serially to get the error.
+    """
+    hostnames = list(avd_switch_facts_instances)
+    # Using more chunks than workers to balance the load. Chunks are contiguous, so devices in the same chunk tend to be neighbors,
+    # which avoids computing the same peer facts in multiple workers.
+    chunk_count = min(len(hostnames), max_workers * 2) or 1
+    chunk_size = -(-len(hostnames) // chunk_count)
+    chunks = [hostnames[index : index + chunk_size] for index in range(0, len(hostnames), chunk_size)]
+
+    GLOBALS["avd_switch_facts_instances"] = avd_switch_facts_instances
+    context = get_context("fork")
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            for local_facts in executor.map(_render_local_facts, chunks):
+                for hostname, host_local_facts in local_facts.items():
+                    avd_switch_facts_instances[hostname]["switch"].__dict__.update(host_local_facts)
+
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            rendered_chunks = list(executor.map(_render_facts, chunks))
+    finally:
+        GLOBALS.pop("avd_switch_facts_instances", None)
+
+    if any(rendered_chunk is None for rendered_chunk in rendered_chunks):
+        return None
+
+    return {hostname: {"switch": rendered_facts} for rendered_chunk in rendered_chunks for hostname, rendered_facts in rendered_chunk.items()}
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .dependency_tracker import FactsDependencyTracker
+    from .eos_designs_facts import EosDesignsFacts
+
+
+class PeerIndex:
+    """
+    Reverse index of the relations between devices, shared by all EosDesignsFacts instances of one facts run.
+
+    Looking up the downstream switches of a device would otherwise require a loop over all devices for every device.
+    The mapping is built once, on first access, by reading "uplink_peers" of all devices.
+    The lists of devices follow the order of "avd_switch_facts".
+
+    "uplink_peers" does not depend on downstream lookups, so building the index cannot cause circular references.
+
+    Parameters
+    ----------
+    avd_switch_facts : dict
+        hostname1 : dict
+            switch : <EosDesignsFacts object>
+    """
+
+    def __init__(self, avd_switch_facts: dict):
+        self._avd_switch_facts = avd_switch_facts
+
+    def is_fabric_device(self, hostname: str) -> bool:
+        return hostname in self._avd_switch_facts
+
+    def _get_facts(self, hostname: str) -> EosDesignsFacts:
+        return self._avd_switch_facts[hostname]["switch"]
+
+    @cached_property
+    def downstream_switches(self) -> dict[str, list[str]]:
+        """
+        Uplink peer mapped to the list of devices having it as uplink peer.
+        """
+        downstream_switches = {}
+        for hostname in self._avd_switch_facts:
+            for uplink_peer in self._get_facts(hostname).uplink_peers:
+                downstream_switches.setdefault(uplink_peer, []).append(hostname)
+
+        return downstream_switches
+
+    def get_downstream_switches(self, hostname: str, dependency_tracker: FactsDependencyTracker | None = None) -> list[str]:
+        """
+        Return the devices having the given device as uplink peer.
+
+        Any device can change its uplinks to point to the given device, so the result depends on "uplink_peers" of all devices.
+        If a dependency_tracker is given, a read of "uplink_peers" is recorded for all devices, since the index bypasses
+        "SharedUtils.get_peer_facts".
+        """
+        if dependency_tracker is not None:
+            dependency_tracker.record_peers(self._avd_switch_facts, "uplink_peers")
+
+        return self.downstream_switches.get(hostname, [])
@@ -91,16 +91,25 @@ class UplinksMixin:
             uplink_interfaces = self._uplink_interfaces
             uplink_switches = self.shared_utils.uplink_switches
             uplink_switch_interfaces = self._uplink_switch_interfaces
+            p2p_uplinks = []
             for uplink_index, uplink_interface in enumerate(uplink_interfaces):
                 if len(uplink_switches) <= uplink_index or len(uplink_switch_interfaces) <= uplink_index:
                     # Invalid length of input variables. Skipping
                     continue
 
                 uplink_switch = uplink_switches[uplink_index]
-                if uplink_switch is None or uplink_switch not in self.shared_utils.all_fabric_devices:
+                if uplink_switch is None or not self._peer_index.is_fabric_device(uplink_switch):
                     # Invalid uplink_switch. Skipping.
                     continue
 
+                p2p_uplinks.append((uplink_index, uplink_interface, uplink_switch))
+
+            # Get the IP addresses of all uplinks in one call.
+            p2p_uplinks_ips = []
+            if not self.shared_utils.underlay_rfc5549:
+                p2p_uplinks_ips = self.shared_utils.ip_addressing.p2p_uplinks_ips([uplink_index for uplink_index, _, _ in p2p_uplinks])
+
+            for p2p_uplink_index, (uplink_index, uplink_interface, uplink_switch) in enumerate(p2p_uplinks):
                 uplink_switch_facts: EosDesignsFacts = self.shared_utils.get_peer_facts(uplink_switch, required=True)
                 uplink = {}
                 uplink["interface"] = uplink_interface
@@ -125,8 +134,7 @@ class UplinksMixin:
                 if self.shared_utils.underlay_rfc5549:
                     uplink["ipv6_enable"] = True
                 else:
-                    uplink["ip_address"] = self.shared_utils.ip_addressing.p2p_uplinks_ip(uplink_index)
-                    uplink["peer_ip_address"] = self.shared_utils.ip_addressing.p2p_uplinks_peer_ip(uplink_index)
+                    uplink["ip_address"], uplink["peer_ip_address"] = p2p_uplinks_ips[p2p_uplink_index]
 
                 if self.shared_utils.link_tracking_groups is not None:
                     uplink["link_tracking_groups"] = []
@@ -149,7 +157,7 @@ class UplinksMixin:
                     continue
 
                 uplink_switch = uplink_switches[uplink_index]
-                if uplink_switch is None or uplink_switch not in self.shared_utils.all_fabric_devices:
+                if uplink_switch is None or not self._peer_index.is_fabric_device(uplink_switch):
                     # Invalid uplink_switch. Skipping.
                     continue
 
@@ -228,7 +236,7 @@ class UplinksMixin:
         These are used to generate the "avd_topology_peers" fact covering downlinks for all devices.
         """
         uplink_switches = self.shared_utils.uplink_switches
-        return [uplink_switch for uplink_switch in uplink_switches if uplink_switch in self.shared_utils.all_fabric_devices]
+        return [uplink_switch for uplink_switch in uplink_switches if self._peer_index.is_fabric_device(uplink_switch)]
 
     @cached_property
     def _default_downlink_interfaces(self: EosDesignsFacts) -> list:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -78,43 +77,26 @@ class VlansMixin:
         if self.shared_utils.configure_inband_mgmt:
             vlans.add(self.shared_utils.inband_mgmt_vlan)
 
-        for connected_endpoints_key in self.shared_utils.connected_endpoints_keys:
-            connected_endpoints = convert_dicts(get(self._hostvars, connected_endpoints_key["key"], default=[]), "name")
-            for connected_endpoint in connected_endpoints:
-                for adapter in connected_endpoint.get("adapters", []):
-                    adapter_settings = self.shared_utils.get_merged_adapter_settings(adapter)
-                    if self.shared_utils.hostname not in adapter_settings.get("switches", []):
-                        # This switch is not connected to this endpoint. Skipping.
-                        continue
-
-                    adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
-                    vlans.update(adapter_vlans)
-                    trunk_groups.update(adapter_trunk_groups)
-                    if len(vlans) >= 4094:
-                        # No need to check further, since the set is now containing all vlans.
-                        # The trunk group list may not be complete, but it will not matter, since we will
-                        # configure all vlans anyway.
-                        return vlans, trunk_groups
-
-        network_ports = get(self._hostvars, "network_ports", default=[])
-        for network_port_item in network_ports:
-            for switch_regex in network_port_item.get("switches", []):
-                # The match test is built on Python re.match which tests from the beginning of the string #}
-                # Since the user would not expect "DC1-LEAF1" to also match "DC-LEAF11" we will force ^ and $ around the regex
-                switch_regex = rf"^{switch_regex}$"
-                if not re.match(switch_regex, self.shared_utils.hostname):
-                    # Skip entry if no match
-                    continue
-
-                adapter_settings = self.shared_utils.get_merged_adapter_settings(network_port_item)
-                adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
-                vlans.update(adapter_vlans)
-                trunk_groups.update(adapter_trunk_groups)
-                if len(vlans) >= 4094:
-                    # No need to check further, since the list is now containing all vlans.
-                    # The trunk group list may not be complete, but it will not matter, since we will
-                    # configure all vlans anyway.
-                    return vlans, trunk_groups
+        # Only the adapters connected to this switch are returned.
+        for _connected_endpoints_key, _connected_endpoint, _adapter_index, adapter_settings in self.shared_utils.connected_endpoints_adapters:
+            adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
+            vlans.update(adapter_vlans)
+            trunk_groups.update(adapter_trunk_groups)
+            if len(vlans) >= 4094:
+                # No need to check further, since the set is now containing all vlans.
+                # The trunk group list may not be complete, but it will not matter, since we will
+                # configure all vlans anyway.
+                return vlans, trunk_groups
+
+        for adapter_settings in self.shared_utils.connected_network_ports:
+            adapter_vlans, adapter_trunk_groups = self._parse_adapter_settings(adapter_settings)
+            vlans.update(adapter_vlans)
+            trunk_groups.update(adapter_trunk_groups)
+            if len(vlans) >= 4094:
+                # No need to check further, since the list is now containing all vlans.
+                # The trunk group list may not be complete, but it will not matter, since we will
+                # configure all vlans anyway.
+                return vlans, trunk_groups
 
         return vlans, trunk_groups
 
@@ -129,12 +111,12 @@ class VlansMixin:
 
         vlans = set()
         trunk_groups = set()
-        for fabric_switch in self.shared_utils.all_fabric_devices:
-            fabric_switch_facts: EosDesignsFacts = self.shared_utils.get_peer_facts(fabric_switch, required=True)
-            if fabric_switch_facts.shared_utils.uplink_type == "port-channel" and self.shared_utils.hostname in fabric_switch_facts.uplink_peers:
-                fabric_switch_endpoint_vlans, fabric_switch_endpoint_trunk_groups = fabric_switch_facts._endpoint_vlans_and_trunk_groups
-                vlans.update(fabric_switch_endpoint_vlans)
-                trunk_groups.update(fabric_switch_endpoint_trunk_groups)
+        for downstream_switch in self._peer_index.get_downstream_switches(self.shared_utils.hostname, self.shared_utils.dependency_tracker):
+            downstream_switch_facts: EosDesignsFacts = self.shared_utils.get_peer_facts(downstream_switch, required=True)
+            if downstream_switch_facts.shared_utils.uplink_type == "port-channel":
+                downstream_switch_endpoint_vlans, downstream_switch_endpoint_trunk_groups = downstream_switch_facts._endpoint_vlans_and_trunk_groups
+                vlans.update(downstream_switch_endpoint_vlans)
+                trunk_groups.update(downstream_switch_endpoint_trunk_groups)
 
         return vlans, trunk_groups
 
@@ -1,3 +1,5 @@
+from .connected_endpoints_index import clear_connected_endpoints_indexes
+from .node_index import clear_node_indexes
 from .shared_utils import SharedUtils
 
-__all__ = ["SharedUtils"]
+__all__ = ["SharedUtils", "clear_connected_endpoints_indexes", "clear_node_indexes"]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import RegexMatcher
+
+from .index_cache import IndexCache
+
+if TYPE_CHECKING:
+    from .shared_utils import SharedUtils
+
+# Connected endpoints indexes shared by all SharedUtils instances in this process.
+# Cleared at the start of every facts run, so changes to the inputs between runs are picked up.
+# The caches are bounded, so repeated pyavd calls without a facts run do not grow them without bound.
+CONNECTED_ENDPOINTS_INDEXES: IndexCache[ConnectedEndpointsIndex] = IndexCache()
+NETWORK_PORTS_INDEXES: IndexCache[NetworkPortsIndex] = IndexCache()
+
+
+class ConnectedEndpointsIndex:
+    """
+    Index of the connected endpoint adapters per switch, shared by all devices with equal connected endpoints and port profiles.
+
+    Finding the adapters of a device would otherwise require merging the port profile onto every adapter of every
+    connected endpoint for every device. The index is built once, on first access, by reading the "switches" of each adapter
+    or of its port profile. The merged adapter settings are only computed for adapters connected to the device asking, and are reused
+    by all other devices connected to the same adapter, for both facts and structured config generated in the same process.
+
+    The input data is not modified.
+
+    Parameters
+    ----------
+    connected_endpoints_keys : list[dict]
+        Filtered "connected_endpoints_keys" as returned by SharedUtils.
+    connected_endpoints : list
+        Data set under each of the connected_endpoints_keys.
+    port_profiles : list[dict]
+        Converted "port_profiles" as returned by SharedUtils.
+    """
+
+    def __init__(self, connected_endpoints_keys: list[dict], connected_endpoints: list, port_profiles: list[dict]):
+        self.connected_endpoints_keys = connected_endpoints_keys
+        self.connected_endpoints = connected_endpoints
+        self.port_profiles = port_profiles
+        self._switches: dict[str, list[tuple[int, int, int]]] | None = None
+        self._adapter_settings: dict[tuple[int, int, int], dict] = {}
+
+    @cached_property
+    def _converted_connected_endpoints(self) -> list[list[dict]]:
+        # Support legacy data model by converting nested dict to list of dict
+        return [convert_dicts(connected_endpoints, "name") for connected_endpoints in self.connected_endpoints]
+
+    def _build_switches(self, shared_utils: SharedUtils) -> dict[str, list[tuple[int, int, int]]]:
+        """
+        Return switch name mapped to the list of (connected_endpoints_key index, connected_endpoint index, adapter index) connected to the switch.
+
+        The items are in the order of connected_endpoints_keys, connected endpoints and adapters.
+        """
+        switches = {}
+        for key_index, connected_endpoints in enumerate(self._converted_connected_endpoints):
+            for endpoint_index, connected_endpoint in enumerate(connected_endpoints):
+                for adapter_index, adapter in enumerate(connected_endpoint.get("adapters", [])):
+                    # The port profile is only applied on the switches when "switches" is not set on the adapter.
+                    if "switches" in adapter:
+                        adapter_switches = adapter["switches"]
+                    else:
+                        adapter_switches = shared_utils.get_merged_port_profile(adapter.get("profile")).get("switches", [])
+
+                    # The same switch can be listed multiple times for adapters with multiple ports on the same switch.
+                    for switch in dict.fromkeys(adapter_switches or []):
+                        switches.setdefault(switch, []).append((key_index, endpoint_index, adapter_index))
+
+        return switches
+
+    def get_adapters(self, shared_utils: SharedUtils) -> list[tuple[dict, dict, int, dict]]:
+        """
+        Return the adapters connected to the device of the given SharedUtils. See "SharedUtils.connected_endpoints_adapters" for the format.
+
+        The merged port profiles of the given SharedUtils are used to build the index and merge the adapter settings,
+        which gives the same result for all devices with equal port profiles.
+        """
+        if self._switches is None:
+            self._switches = self._build_switches(shared_utils)
+
+        adapters = []
+        for key_index, endpoint_index, adapter_index in self._switches.get(shared_utils.hostname, []):
+            connected_endpoint = self._converted_connected_endpoints[key_index][endpoint_index]
+            if (key_index, endpoint_index, adapter_index) not in self._adapter_settings:
+                adapter = connected_endpoint["adapters"][adapter_index]
+                self._adapter_settings[(key_index, endpoint_index, adapter_index)] = shared_utils.get_merged_adapter_settings(adapter)
+
+            adapters.append(
+                (
+                    self.connected_endpoints_keys[key_index],
+                    connected_endpoint,
+                    adapter_index,
+                    self._adapter_settings[(key_index, endpoint_index, adapter_index)],
+                )
+            )
+
+        return adapters
+
+
+def get_connected_endpoints_index(connected_endpoints_keys: list[dict], connected_endpoints: list, port_profiles: list[dict]) -> ConnectedEndpointsIndex:
+    """
+    Return the shared ConnectedEndpointsIndex for the given data, building it if no index exists for equal data.
+    """
+    return CONNECTED_ENDPOINTS_INDEXES.get(
+        (port_profiles, connected_endpoints_keys, connected_endpoints),
+        lambda: ConnectedEndpointsIndex(connected_endpoints_keys, connected_endpoints, port_profiles),
+    )
+
+
+class NetworkPortsIndex:
+    """
+    Index of the "switches" regexes of all network_ports, shared by all devices with equal network_ports and port profiles.
+
+    Finding the network_ports of a device would otherwise require merging the port profile onto every network_ports entry
+    and matching every regex for every device. The regexes are compiled once, on first access, into a RegexMatcher
+    answering which entries apply to a device in one pass, for both facts and structured config generated in the same process.
+
+    The input data is not modified.
+
+    Parameters
+    ----------
+    network_ports : list[dict]
+        Data set under "network_ports".
+    port_profiles : list[dict]
+        Converted "port_profiles" as returned by SharedUtils.
+    """
+
+    def __init__(self, network_ports: list[dict], port_profiles: list[dict]):
+        self.network_ports = network_ports
+        self.port_profiles = port_profiles
+        self._matcher: RegexMatcher | None = None
+        self._regex_network_port_indexes: list[int] = []
+
+    def _build_matcher(self, shared_utils: SharedUtils) -> RegexMatcher:
+        regexes = []
+        for network_port_index, network_port in enumerate(self.network_ports):
+            # The port profile is only applied on the switches when "switches" is not set on the network_ports entry.
+            if "switches" in network_port:
+                switch_regexes = network_port["switches"]
+            else:
+                switch_regexes = shared_utils.get_merged_port_profile(network_port.get("profile")).get("switches", [])
+
+            for switch_regex in switch_regexes or []:
+                regexes.append(switch_regex)
+                self._regex_network_port_indexes.append(network_port_index)
+
+        return RegexMatcher(regexes)
+
+    def get_network_ports(self, shared_utils: SharedUtils) -> list[dict]:
+        """
+        Return the network_ports entries with a "switches" regex matching the hostname of the given SharedUtils, merged with the port profile.
+
+        The merged port profiles of the given SharedUtils are used to build the index, which gives the same result
+        for all devices with equal port profiles. The returned settings are not shared with other devices.
+        """
+        if self._matcher is None:
+            self._matcher = self._build_matcher(shared_utils)
+
+        # One entry can have multiple matching regexes.
+        network_port_indexes = dict.fromkeys(self._regex_network_port_indexes[regex_index] for regex_index in self._matcher.match(shared_utils.hostname))
+        return [shared_utils.get_merged_adapter_settings(self.network_ports[network_port_index]) for network_port_index in network_port_indexes]
+
+
+def get_network_ports_index(network_ports: list[dict], port_profiles: list[dict]) -> NetworkPortsIndex:
+    """
+    Return the shared NetworkPortsIndex for the given data, building it if no index exists for equal data.
+    """
+    return NETWORK_PORTS_INDEXES.get((port_profiles, network_ports), lambda: NetworkPortsIndex(network_ports, port_profiles))
+
+
+def clear_connected_endpoints_indexes() -> None:
+    CONNECTED_ENDPOINTS_INDEXES.clear()
+    NETWORK_PORTS_INDEXES.clear()
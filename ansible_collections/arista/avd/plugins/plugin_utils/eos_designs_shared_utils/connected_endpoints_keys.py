@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
 
+from .connected_endpoints_index import get_connected_endpoints_index, get_network_ports_index
+
 if TYPE_CHECKING:
     from .shared_utils import SharedUtils
 
@@ -45,3 +47,31 @@ class ConnectedEndpointsKeysMixin:
         connected_endpoints_keys = convert_dicts(get(self.hostvars, "connected_endpoints_keys", default=DEFAULT_CONNECTED_ENDPOINTS_KEYS), "key")
         connected_endpoints_keys = [entry for entry in connected_endpoints_keys if entry.get("key") is not None and self.hostvars.get(entry["key"]) is not None]
         return connected_endpoints_keys
+
+    @cached_property
+    def connected_endpoints_adapters(self: SharedUtils) -> list[tuple[dict, dict, int, dict]]:
+        """
+        Return the adapters of connected endpoints which are connected to this switch.
+
+        Each item is a tuple of the connected_endpoints_key entry, the connected endpoint, the index of the adapter on the
+        connected endpoint and the adapter settings merged with the port profile.
+        The items are in the order of connected_endpoints_keys, connected endpoints and adapters.
+
+        The connected endpoints and merged adapter settings are shared with other devices, so they must not be modified.
+        """
+        connected_endpoints_index = get_connected_endpoints_index(
+            self.connected_endpoints_keys,
+            [get(self.hostvars, connected_endpoints_key["key"], default=[]) for connected_endpoints_key in self.connected_endpoints_keys],
+            self.port_profiles,
+        )
+        return connected_endpoints_index.get_adapters(self)
+
+    @cached_property
+    def connected_network_ports(self: SharedUtils) -> list[dict]:
+        """
+        Return the "network_ports" entries with a "switches" regex matching this switch, merged with the port profile.
+
+        Each regex must match the full hostname, so the user would not expect "DC1-LEAF1" to also match "DC1-LEAF11".
+        """
+        network_ports_index = get_network_ports_index(get(self.hostvars, "network_ports", default=[]), self.port_profiles)
+        return network_ports_index.get_network_ports(self)
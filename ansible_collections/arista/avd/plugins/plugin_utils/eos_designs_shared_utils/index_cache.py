@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+# Number of indexes built from different data which are kept per IndexCache.
+# A fabric usually needs one index, but pyavd callers can run many fabrics in the same process.
+MAX_CACHED_INDEXES = 16
+
+
+class IndexCache(Generic[T]):
+    """
+    Bounded cache of indexes shared by all SharedUtils instances in this process, keyed by the input data the index was built from.
+
+    The cache keeps the data of each index, so the ids of the data objects stay valid while the index is cached.
+    An index is found by the ids of the data first, since devices with vars from the same group_vars usually share the same data objects.
+    Otherwise the data is compared with the data of the cached indexes. The least recently used index is dropped when more than
+    'maxsize' indexes are cached, so calling pyavd repeatedly with different inputs does not grow the cache without bound.
+
+    Parameters
+    ----------
+    maxsize : int, default=MAX_CACHED_INDEXES
+        Maximum number of cached indexes.
+    """
+
+    def __init__(self, maxsize: int = MAX_CACHED_INDEXES):
+        self.maxsize = maxsize
+        self._indexes: OrderedDict[tuple[int, ...], tuple[tuple, T]] = OrderedDict()
+
+    def get(self, data: tuple, build_index: Callable[[], T]) -> T:
+        """
+        Return the cached index for the given data, calling 'build_index' if no index exists for equal data.
+        """
+        key = tuple(id(item) for item in data)
+        if key in self._indexes:
+            self._indexes.move_to_end(key)
+            return self._indexes[key][1]
+
+        for cached_key, (cached_data, index) in reversed(self._indexes.items()):
+            if cached_data == data:
+                # Replace the entry, so the next lookup with the same data objects is found by id.
+                del self._indexes[cached_key]
+                break
+        else:
+            index = build_index()
+
+        self._indexes[key] = (data, index)
+        if len(self._indexes) > self.maxsize:
+            self._indexes.popitem(last=False)
+
+        return index
+
+    def indexes(self) -> list[T]:
+        """
+        Return the cached indexes from the least to the most recently used.
+        """
+        return [index for _data, index in self._indexes.values()]
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+    def __len__(self) -> int:
+        return len(self._indexes)
@@ -20,6 +20,7 @@ class MiscMixin:
 
     @cached_property
     def all_fabric_devices(self: SharedUtils) -> list[str]:
+        self.accessed_all_fabric_devices = True
         avd_switch_facts: dict = get(self.hostvars, "avd_switch_facts", required=True)
         return list(avd_switch_facts.keys())
 
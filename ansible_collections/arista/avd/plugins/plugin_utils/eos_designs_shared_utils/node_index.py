@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
+from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+from .index_cache import IndexCache
+
+# Node indexes shared by all SharedUtils instances in this process, per node type key.
+# Cleared at the start of every facts run, so changes to the inputs between runs are picked up.
+# Each IndexCache is bounded, so repeated pyavd calls without a facts run do not grow it without bound.
+NODE_INDEXES: dict[str, IndexCache[NodeIndex]] = {}
+
+
+class NodeIndex:
+    """
+    Index of the nodes defined under one node type key like "l3leaf", shared by all devices with equal data for the node type key.
+
+    Finding a device would otherwise require converting and looping over all node_groups and nodes for every device.
+    The index is built once, on first access, and the switch_data of each device is computed once and reused
+    for both facts and structured config generated in the same process.
+
+    The data of the node type key is not modified.
+
+    Parameters
+    ----------
+    node_type_config : dict
+        Data set under the node type key.
+    """
+
+    def __init__(self, node_type_config: dict):
+        self.node_type_config = node_type_config
+        self._switch_data: dict[str, dict] = {}
+
+    @cached_property
+    def nodes(self) -> dict[str, tuple[dict, dict]]:
+        """
+        Hostname mapped to a tuple of the node_group and the node config.
+
+        The node_group is an empty dict for nodes defined under "nodes". Otherwise it is a copy of the node_group with converted "nodes".
+        Nodes under "nodes" take precedence over nodes under "node_groups", and the first definition of a node is used.
+        """
+        nodes = {}
+        for node in convert_dicts(self.node_type_config.get("nodes", []), "name"):
+            nodes.setdefault(node["name"], ({}, node))
+
+        for node_group in convert_dicts(self.node_type_config.get("node_groups", []), "group"):
+            node_group = {**node_group, "nodes": convert_dicts(node_group.get("nodes", []), "name")}
+            for node in node_group["nodes"]:
+                nodes.setdefault(node["name"], (node_group, node))
+
+        return nodes
+
+    def get_switch_data(self, hostname: str) -> dict:
+        """
+        Return the switch_data for the given hostname. See "SharedUtils.switch_data" for the format.
+        """
+        if hostname not in self._switch_data:
+            node_group, node_config = self.nodes.get(hostname, ({}, {}))
+            switch_data = {"node_group": node_group}
+            if node_group:
+                switch_data["group"] = node_group["group"]
+
+            # Load defaults
+            defaults_config = get(self.node_type_config, "defaults", default={})
+
+            # Merge node data -> node_group data -> defaults into combined
+            switch_data["combined"] = merge(defaults_config, node_group, node_config, list_merge="replace", destructive_merge=False)
+            self._switch_data[hostname] = switch_data
+
+        return self._switch_data[hostname]
+
+
+def get_node_index(node_type_key: str, node_type_config: dict) -> NodeIndex:
+    """
+    Return the shared NodeIndex for the given node type data, building it if no index exists for equal data.
+    """
+    return NODE_INDEXES.setdefault(node_type_key, IndexCache()).get((node_type_config,), lambda: NodeIndex(node_type_config))
+
+
+def clear_node_indexes() -> None:
+    NODE_INDEXES.clear()
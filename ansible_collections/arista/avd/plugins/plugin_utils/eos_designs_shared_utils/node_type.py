@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from functools import cached_property
-from re import search
 from typing import TYPE_CHECKING
 
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdMissingVariableError
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get, get_regex_matcher
 
 if TYPE_CHECKING:
     from .shared_utils import SharedUtils
@@ -38,10 +37,16 @@ class NodeTypeMixin:
         """
         default_node_types = get(self.hostvars, "default_node_types", default=[])
 
+        node_types = []
+        hostname_regexes = []
         for default_node_type in default_node_types:
             for hostname_regex in default_node_type["match_hostnames"]:
-                if search(f"^{hostname_regex}$", self.hostname):
-                    return default_node_type["node_type"]
+                node_types.append(default_node_type["node_type"])
+                hostname_regexes.append(hostname_regex)
+
+        # The matcher is shared by all devices with the same regexes, so each regex is only compiled once.
+        if matches := get_regex_matcher(tuple(hostname_regexes), search=True).match(self.hostname):
+            return node_types[matches[0]]
 
         return None
 
@@ -56,3 +56,11 @@ class SharedUtils(
     def __init__(self, hostvars: dict, templar) -> None:
         self.hostvars = hostvars
         self.templar = templar
+
+        # Record which peers were read through "get_peer_facts" and if the list of all fabric devices was read.
+        # This is used to fingerprint the inputs of a device for incremental builds.
+        self.accessed_peers: set[str] = set()
+        self.accessed_all_fabric_devices = False
+
+        # Set by FactsDependencyTracker to record reads of peer facts while rendering EosDesignsFacts.
+        self.dependency_tracker = None
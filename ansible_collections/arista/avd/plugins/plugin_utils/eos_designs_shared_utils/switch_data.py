@@ -3,10 +3,10 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
-from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
 
+from .node_index import get_node_index
+
 if TYPE_CHECKING:
     from .shared_utils import SharedUtils
 
@@ -40,39 +40,10 @@ class SwitchDataMixin:
             combined : dict
                 Combined configuration after inheritance from all levels
         """
-        switch_data = {"node_group": {}}
-        node_config = {}
-        hostname = self.hostname
-
+        # The index is shared by all devices with equal data for the node type key, so the nodes are only converted and looped once.
         node_type_key = self.node_type_key_data["key"]
-        node_type_config = get(self.hostvars, f"{node_type_key}", required=True)
-        nodes = convert_dicts(node_type_config.get("nodes", []), "name")
-
-        for node in nodes:
-            if hostname == node["name"]:
-                node_config = node
-                break
-        if not node_config:
-            node_groups = convert_dicts(node_type_config.get("node_groups", []), "group")
-            for node_group in node_groups:
-                nodes = convert_dicts(node_group.get("nodes", []), "name")
-                node_group["nodes"] = nodes
-                for node in nodes:
-                    if hostname == node["name"]:
-                        node_config = node
-                        switch_data["node_group"] = node_group
-                        switch_data["group"] = node_group["group"]
-                        break
-                if node_config:
-                    break
-
-        # Load defaults
-        defaults_config = get(node_type_config, "defaults", default={})
-
-        # Merge node data -> node_group data -> defaults into combined
-        switch_data["combined"] = merge(defaults_config, switch_data["node_group"], node_config, list_merge="replace", destructive_merge=False)
-
-        return switch_data
+        node_index = get_node_index(node_type_key, get(self.hostvars, f"{node_type_key}", required=True))
+        return node_index.get_switch_data(self.hostname)
 
     @property
     def switch_data_combined(self: SharedUtils) -> dict:
@@ -29,7 +29,8 @@ class UtilsMixin:
         by default required is True and so the function will raise is peer_facts cannot be found
         using the separator `..` to be able to handle hostnames with `.` inside
         """
-        return get(
+        self.accessed_peers.add(peer_name)
+        peer_facts = get(
             self.hostvars,
             f"avd_switch_facts..{peer_name}..switch",
             separator="..",
@@ -39,6 +40,10 @@ class UtilsMixin:
                 f"Check that '{peer_name}' is in the inventory and is part of the group set by 'fabric_name'. Node"
             ),
         )
+        if self.dependency_tracker is not None and peer_facts is not None:
+            return self.dependency_tracker.wrap_peer_facts(peer_name, peer_facts)
+
+        return peer_facts
 
     def template_var(self: SharedUtils, template_file: str, template_vars: dict) -> str:
         """
@@ -0,0 +1,568 @@
+from __future__ import annotations
+
+import ipaddress
+import math
+from collections.abc import Iterator, Mapping
+
+from ansible_collections.arista.avd.plugins.filter.add_md_toc import add_md_toc
+from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
+from ansible_collections.arista.avd.plugins.filter.default import default
+from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+DEFAULT_NODE_TYPES = {
+    "l3ls-evpn": ["spine", "l3leaf", "l2leaf", "super-spine", "overlay-controller"],
+    "mpls": ["p", "pe", "rr"],
+    "l2ls": ["l3spine", "spine", "leaf"],
+}
+DEFAULT_CONNECTED_ENDPOINTS_KEYS = [
+    {"key": "servers", "type": "server", "description": "Server"},
+    {"key": "firewalls", "type": "firewall", "description": "Firewall"},
+    {"key": "routers", "type": "router", "description": "Router"},
+    {"key": "load_balancers", "type": "load_balancer", "description": "Load Balancer"},
+    {"key": "storage_arrays", "type": "storage_array", "description": "Storage Array"},
+    {"key": "cpes", "type": "cpe", "description": "CPE"},
+    {"key": "workstations", "type": "workstation", "description": "Workstation"},
+    {"key": "access_points", "type": "access_point", "description": "Access Point"},
+    {"key": "phones", "type": "phone", "description": "Phone"},
+    {"key": "printers", "type": "printer", "description": "Printer"},
+    {"key": "cameras", "type": "camera", "description": "Camera"},
+    {"key": "generic_devices", "type": "generic_device", "description": "Generic Device"},
+]
+ISIS_UNDERLAY_ROUTING_PROTOCOLS = ("isis", "isis-sr", "isis-ldp", "isis-sr-ldp")
+TOPOLOGY_CSV_HEADER = "Node Type,Node,Node Interface,Peer Type,Peer Node,Peer Interface,Node Interface Enabled"
+P2P_LINKS_CSV_HEADER = "Type,Node,Node Interface,Leaf IP Address,Peer Type,Peer Node,Peer Interface,Peer IP Address"
+
+
+def get_node_types(node_type_keys: list | dict | None, design_type: str | None) -> list[str]:
+    """
+    Return the node types included in the fabric documentation.
+
+    These are the types of the custom "node_type_keys" or the default node types of the design.
+    """
+    if node_type_keys is not None:
+        return [node_type_key.get("type") for node_type_key in convert_dicts(node_type_keys, "key")]
+
+    return DEFAULT_NODE_TYPES[default(design_type, "l3ls-evpn")]
+
+
+def _unique(items: list) -> list:
+    """
+    Return the items without duplicates in the order of first occurrence. Strings are compared case-insensitively like the Jinja2 "unique" filter.
+    """
+    unique_items = {}
+    for item in items:
+        unique_items.setdefault(item.lower() if isinstance(item, str) else item, item)
+
+    return list(unique_items.values())
+
+
+def _parse_ip_network(ip_address) -> tuple[int, int, int] | None:
+    """
+    Return the IP version with the first and last address of the network of the given address or network, or None if it is not valid.
+    """
+    try:
+        network = ipaddress.ip_interface(ip_address).network
+    except ValueError:
+        return None
+
+    return network.version, int(network.network_address), int(network.broadcast_address)
+
+
+def _round_ceil(value: float, precision: int) -> float:
+    """
+    Round up to the given precision like the Jinja2 filter "round(precision, 'ceil')".
+    """
+    return math.ceil(value * (10**precision)) / (10**precision)
+
+
+class FabricDocumentation:
+    """
+    Fabric documentation, topology and point-to-point links built in one linear pass over the structured configs of the fabric devices.
+
+    The pass collects the rows of all the tables and CSV files, so the structured config of each device is only read once,
+    and the IP addresses of peer interfaces are looked up by name instead of searching the interfaces of the peer for every link.
+    The output is identical to the "fabric-documentation.j2", "fabric-topology.j2" and "fabric-p2p-links.j2" templates.
+
+    Parameters
+    ----------
+    fabric_name : str
+        Name of the fabric.
+    fabric_hosts : list[str]
+        Hostnames of the devices in the fabric like the Ansible group "fabric_name".
+    hostvars : Mapping
+        Hostname mapped to the variables of the device, including the structured config. Peers outside the fabric are also looked up here.
+    avd_switch_facts : Mapping
+        Hostname mapped to the facts of the device as returned by "eos_designs_facts".
+    node_types : list[str]
+        Node types included in the documentation. See "get_node_types".
+    underlay_routing_protocol : str, optional
+        The "ISIS CLNS interfaces" table is only included if this is one of the ISIS underlay routing protocols.
+    connected_endpoints : bool, default=False
+        Include the "Connected Endpoints" section in the documentation.
+    """
+
+    def __init__(
+        self,
+        fabric_name: str,
+        fabric_hosts: list[str],
+        hostvars: Mapping,
+        avd_switch_facts: Mapping,
+        node_types: list[str],
+        underlay_routing_protocol: str | None = None,
+        connected_endpoints: bool = False,
+    ):
+        self.fabric_name = fabric_name
+        self.hostvars = hostvars
+        self.avd_switch_facts = avd_switch_facts
+        self.node_types = node_types
+        self.underlay_routing_protocol = underlay_routing_protocol
+        self.connected_endpoints = connected_endpoints
+
+        self._ethernet_interfaces: dict[str, list[dict]] = {}
+        self._ethernet_interface_ip_addresses: dict[str, dict] = {}
+        # "<node>,<interface>" of the interfaces already added. Links are only added from the first of the two nodes.
+        self._topology_links_done: set[str] = set()
+        self._p2p_links_done: set[str] = set()
+
+        self.fabric_switches: list[dict] = []
+        self.topology_links: list[dict] = []
+        self.uplink_ipv4_pools: list[str] = []
+        self.loopback_ipv4_pools: list[str] = []
+        self.vtep_loopback_ipv4_pools: list[str] = []
+        self.assigned_ip_addresses: list[str] = []
+        self.topology_csv_rows: list[str] = []
+        self.p2p_links_csv_rows: list[str] = []
+        self.connected_endpoints_keys: list[dict] = []
+        self.connected_endpoints_by_key: dict[str, list[dict]] = {}
+        self.port_profiles: list[dict] = []
+
+        for node in natural_sort(fabric_hosts):
+            self._add_node(node)
+
+    def _get_ethernet_interfaces(self, hostname: str) -> list[dict]:
+        """
+        Return the converted ethernet_interfaces of the device. Each device is only read once.
+        """
+        if hostname not in self._ethernet_interfaces:
+            self._ethernet_interfaces[hostname] = convert_dicts(self.hostvars[hostname].get("ethernet_interfaces"), "name") or []
+
+        return self._ethernet_interfaces[hostname]
+
+    def _get_peer_ip_address(self, peer: str, peer_interface: str) -> str | None:
+        """
+        Return the ip_address of the first ethernet interface of the peer with the given name or None.
+        """
+        if peer not in self._ethernet_interface_ip_addresses:
+            ip_addresses = {}
+            if peer in self.hostvars:
+                for ethernet_interface in self._get_ethernet_interfaces(peer):
+                    ip_addresses.setdefault(ethernet_interface.get("name"), ethernet_interface.get("ip_address"))
+            self._ethernet_interface_ip_addresses[peer] = ip_addresses
+
+        return self._ethernet_interface_ip_addresses[peer].get(peer_interface)
+
+    def _add_node(self, node: str) -> None:
+        node_hostvars = self.hostvars[node]
+        ethernet_interfaces = natural_sort(self._get_ethernet_interfaces(node), "name")
+
+        if self.connected_endpoints:
+            self._add_connected_endpoints(node, node_hostvars, ethernet_interfaces)
+
+        switch_facts = get(self.avd_switch_facts, f"{node}..switch", separator="..", default={})
+        node_type = default(switch_facts.get("type"), "undefined")
+        if node_type not in self.node_types:
+            return
+
+        self.uplink_ipv4_pools.append(switch_facts.get("uplink_ipv4_pool"))
+        self.loopback_ipv4_pools.append(switch_facts.get("loopback_ipv4_pool"))
+        self.vtep_loopback_ipv4_pools.append(switch_facts.get("vtep_loopback_ipv4_pool"))
+        self._add_fabric_switch(node, node_type, node_hostvars, switch_facts)
+
+        for ethernet_interface in ethernet_interfaces:
+            interface_name = ethernet_interface.get("name")
+            peer_type = default(ethernet_interface.get("peer_type"), "undefined")
+            peer = ethernet_interface.get("peer")
+            peer_interface = ethernet_interface.get("peer_interface")
+
+            self.topology_csv_rows.append(
+                ",".join(
+                    str(value)
+                    for value in (
+                        node_type,
+                        node,
+                        interface_name,
+                        default(ethernet_interface.get("peer_type"), ""),
+                        default(peer, ""),
+                        default(peer_interface, ""),
+                        not default(ethernet_interface.get("shutdown"), False),
+                    )
+                )
+            )
+
+            if peer_type not in self.node_types and peer_type != "mlag_peer":
+                continue
+
+            self._topology_links_done.add(f"{node},{interface_name}")
+            if peer is not None and peer_interface is not None and f"{peer},{peer_interface}" not in self._topology_links_done:
+                self._add_topology_link(node, node_type, ethernet_interface, peer_type, peer, peer_interface)
+
+            if ethernet_interface.get("type") != "routed" or peer_type not in self.node_types:
+                continue
+
+            self._p2p_links_done.add(f"{node},{interface_name}")
+            if peer is not None and peer_interface is not None and f"{peer},{peer_interface}" not in self._p2p_links_done:
+                self.p2p_links_csv_rows.append(
+                    ",".join(
+                        str(value)
+                        for value in (
+                            node_type,
+                            node,
+                            interface_name,
+                            default(ethernet_interface.get("ip_address"), ""),
+                            peer_type,
+                            peer,
+                            peer_interface,
+                            default(self._get_peer_ip_address(peer, peer_interface), ""),
+                        )
+                    )
+                )
+
+    def _add_fabric_switch(self, node: str, node_type: str, node_hostvars: Mapping, switch_facts: dict) -> None:
+        fabric_switch = {
+            "pod": default(node_hostvars.get("pod_name"), node_hostvars.get("dc_name"), self.fabric_name),
+            "type": node_type,
+            "node": node,
+            "mgmt_ip": default(switch_facts.get("mgmt_ip"), "-"),
+            "platform": default(switch_facts.get("platform"), "-"),
+            "provisioned": "Not Available" if node_hostvars.get("is_deployed") is False else "Provisioned",
+            "serial_number": default(switch_facts.get("serial_number"), "-"),
+        }
+        if switch_facts.get("mgmt_ip") is not None:
+            self.assigned_ip_addresses.append(switch_facts["mgmt_ip"])
+
+        if switch_facts.get("inband_mgmt_vlan") is not None:
+            fabric_switch["inband_mgmt_interface"] = f"Vlan{switch_facts['inband_mgmt_vlan']}"
+            for vlan_interface in convert_dicts(node_hostvars.get("vlan_interfaces"), "name") or []:
+                if vlan_interface.get("name") == fabric_switch["inband_mgmt_interface"]:
+                    fabric_switch["inband_mgmt_ip"] = vlan_interface.get("ip_address")
+                    break
+
+        loopback_interfaces = convert_dicts(node_hostvars.get("loopback_interfaces"), "name") or []
+        for loopback_name, key in (("Loopback0", "loopback0_ip_address"), ("Loopback1", "loopback1_ip_address")):
+            loopback_interface = next((loopback for loopback in loopback_interfaces if loopback.get("name") == loopback_name), {})
+            if loopback_interface.get("ip_address") is not None:
+                fabric_switch[key] = loopback_interface["ip_address"]
+                self.assigned_ip_addresses.append(fabric_switch[key])
+
+        fabric_switch["router_isis_net"] = get(node_hostvars, "router_isis.net")
+        self.fabric_switches.append(fabric_switch)
+
+    def _add_topology_link(self, node: str, node_type: str, ethernet_interface: dict, peer_type: str, peer: str, peer_interface: str) -> None:
+        topology_link = {
+            "type": node_type,
+            "node": node,
+            "node_interface": ethernet_interface.get("name"),
+            "node_ip_address": ethernet_interface.get("ip_address"),
+            "peer_type": peer_type,
+            "peer": peer,
+            "peer_interface": peer_interface,
+            "peer_ip_address": self._get_peer_ip_address(peer, peer_interface),
+        }
+        for ip_address in (topology_link["node_ip_address"], topology_link["peer_ip_address"]):
+            if ip_address is not None:
+                self.assigned_ip_addresses.append(ip_address)
+
+        self.topology_links.append(topology_link)
+
+    def _add_connected_endpoints(self, node: str, node_hostvars: Mapping, ethernet_interfaces: list[dict]) -> None:
+        # Keys and profiles are deduplicated as they are added. Lookups return the first match, so the result is the same as deduplicating at the end.
+        for connected_endpoints_key in default(convert_dicts(node_hostvars.get("connected_endpoints_keys"), "key"), DEFAULT_CONNECTED_ENDPOINTS_KEYS):
+            if connected_endpoints_key not in self.connected_endpoints_keys:
+                self.connected_endpoints_keys.append(connected_endpoints_key)
+
+        for port_profile in default(convert_dicts(node_hostvars.get("port_profiles"), "profile"), []):
+            if port_profile not in self.port_profiles:
+                self.port_profiles.append(port_profile)
+
+        connected_endpoints_types = {}
+        for connected_endpoints_key in self.connected_endpoints_keys:
+            connected_endpoints_types.setdefault(connected_endpoints_key.get("type"), connected_endpoints_key.get("key"))
+
+        for ethernet_interface in ethernet_interfaces:
+            peer_type = default(ethernet_interface.get("peer_type"), "undefined")
+            if peer_type not in connected_endpoints_types:
+                continue
+
+            port_channel_interface = {}
+            if (channel_group_id := get(ethernet_interface, "channel_group.id")) is not None:
+                port_channel_name = f"Port-Channel{channel_group_id}"
+                port_channel_interface = next(
+                    (interface for interface in node_hostvars.get("port_channel_interfaces") or [] if interface.get("name") == port_channel_name), {}
+                )
+
+            if ethernet_interface.get("type") == "port-channel-member":
+                interface_type = default(port_channel_interface.get("type"), "-")
+            else:
+                interface_type = default(ethernet_interface.get("type"), port_channel_interface.get("type"), "-")
+
+            self.connected_endpoints_by_key.setdefault(connected_endpoints_types[peer_type], []).append(
+                {
+                    "fabric_switch": node,
+                    "fabric_port": ethernet_interface.get("name"),
+                    "peer": default(ethernet_interface.get("peer"), "-"),
+                    "peer_interface": default(ethernet_interface.get("peer_interface"), "-"),
+                    "description": default(ethernet_interface.get("description"), "-"),
+                    "shutdown": default(ethernet_interface.get("shutdown"), port_channel_interface.get("shutdown"), "-"),
+                    "type": interface_type,
+                    "mode": default(ethernet_interface.get("mode"), port_channel_interface.get("mode"), "-"),
+                    "vlans": default(ethernet_interface.get("vlans"), port_channel_interface.get("vlans"), "-"),
+                    "profile": default(ethernet_interface.get("port_profile"), "-"),
+                }
+            )
+
+    def _pool_rows(self, pools: list[str | None]) -> Iterator[str]:
+        """
+        Yield the table rows with the size and number of assigned addresses of each pool.
+
+        An address is assigned from a pool if the network of the address is within the pool like the "ansible.utils.ipaddr" filter.
+        """
+        assigned_networks = [network for network in map(_parse_ip_network, self.assigned_ip_addresses) if network is not None]
+        for pool in natural_sort(pool for pool in _unique(pools) if pool is not None):
+            pool_network = ipaddress.ip_network(pool, strict=False)
+            pool_first, pool_last = int(pool_network.network_address), int(pool_network.broadcast_address)
+            size = pool_network.num_addresses
+            used = sum(1 for version, first, last in assigned_networks if version == pool_network.version and pool_first <= first and last <= pool_last)
+            yield f"| {pool} | {size} | {used} | {_round_ceil(used / size * 100, 2)} % |"
+
+    def _documentation_lines(self) -> Iterator[str]:
+        yield from (
+            f"# {self.fabric_name}",
+            "",
+            "## Table of Contents",
+            "",
+            "<!-- toc -->",
+            "<!-- toc -->",
+            "",
+            "## Fabric Switches and Management IP",
+            "",
+            "| POD | Type | Node | Management IP | Platform | Provisioned in CloudVision | Serial Number |",
+            "| --- | ---- | ---- | ------------- | -------- | -------------------------- | ------------- |",
+        )
+        for fabric_switch in self.fabric_switches:
+            yield (
+                f"| {fabric_switch['pod']} | {fabric_switch['type']} | {fabric_switch['node']} | {fabric_switch['mgmt_ip']} | {fabric_switch['platform']} "
+                f"| {fabric_switch['provisioned']} | {fabric_switch['serial_number']} |"
+            )
+
+        yield from (
+            "",
+            "> Provision status is based on Ansible inventory declaration and do not represent real status from CloudVision.",
+            "",
+            "### Fabric Switches with inband Management IP",
+            "",
+            "| POD | Type | Node | Management IP | Inband Interface |",
+            "| --- | ---- | ---- | ------------- | ---------------- |",
+        )
+        for fabric_switch in self.fabric_switches:
+            if fabric_switch.get("inband_mgmt_ip") is not None:
+                yield (
+                    f"| {fabric_switch['pod']} | {fabric_switch['type']} | {fabric_switch['node']} | {fabric_switch['inband_mgmt_ip']} "
+                    f"| {fabric_switch['inband_mgmt_interface']} |"
+                )
+
+        yield from (
+            "",
+            "## Fabric Topology",
+            "",
+            "| Type | Node | Node Interface | Peer Type | Peer Node | Peer Interface |",
+            "| ---- | ---- | -------------- | --------- | ----------| -------------- |",
+        )
+        for topology_link in self.topology_links:
+            yield (
+                f"| {topology_link['type']} | {topology_link['node']} | {topology_link['node_interface']} | {topology_link['peer_type']} "
+                f"| {topology_link['peer']} | {topology_link['peer_interface']} |"
+            )
+
+        yield from (
+            "",
+            "## Fabric IP Allocation",
+            "",
+            "### Fabric Point-To-Point Links",
+            "",
+            "| Uplink IPv4 Pool | Available Addresses | Assigned addresses | Assigned Address % |",
+            "| ---------------- | ------------------- | ------------------ | ------------------ |",
+        )
+        yield from self._pool_rows(self.uplink_ipv4_pools)
+
+        yield from (
+            "",
+            "### Point-To-Point Links Node Allocation",
+            "",
+            "| Node | Node Interface | Node IP Address | Peer Node | Peer Interface | Peer IP Address |",
+            "| ---- | -------------- | --------------- | --------- | -------------- | --------------- |",
+        )
+        for topology_link in self.topology_links:
+            if topology_link["node_ip_address"] is not None and topology_link["peer_ip_address"] is not None:
+                yield (
+                    f"| {topology_link['node']} | {topology_link['node_interface']} | {topology_link['node_ip_address']} | {topology_link['peer']} "
+                    f"| {topology_link['peer_interface']} | {topology_link['peer_ip_address']} |"
+                )
+
+        yield from (
+            "",
+            "### Loopback Interfaces (BGP EVPN Peering)",
+            "",
+            "| Loopback Pool | Available Addresses | Assigned addresses | Assigned Address % |",
+            "| ------------- | ------------------- | ------------------ | ------------------ |",
+        )
+        yield from self._pool_rows(self.loopback_ipv4_pools)
+
+        yield from (
+            "",
+            "### Loopback0 Interfaces Node Allocation",
+            "",
+            "| POD | Node | Loopback0 |",
+            "| --- | ---- | --------- |",
+        )
+        for fabric_switch in self.fabric_switches:
+            if "loopback0_ip_address" in fabric_switch:
+                yield f"| {fabric_switch['pod']} | {fabric_switch['node']} | {fabric_switch['loopback0_ip_address']} |"
+        yield ""
+
+        if self.underlay_routing_protocol in ISIS_UNDERLAY_ROUTING_PROTOCOLS:
+            yield from (
+                "### ISIS CLNS interfaces",
+                "",
+                "| POD | Node | CLNS Address |",
+                "| --- | ---- | ------------ |",
+            )
+            for fabric_switch in self.fabric_switches:
+                if fabric_switch["router_isis_net"] is not None:
+                    yield f"| {fabric_switch['pod']} | {fabric_switch['node']} | {fabric_switch['router_isis_net']} |"
+            yield ""
+
+        yield from (
+            "### VTEP Loopback VXLAN Tunnel Source Interfaces (VTEPs Only)",
+            "",
+            "| VTEP Loopback Pool | Available Addresses | Assigned addresses | Assigned Address % |",
+            "| --------------------- | ------------------- | ------------------ | ------------------ |",
+        )
+        yield from self._pool_rows(self.vtep_loopback_ipv4_pools)
+
+        yield from (
+            "",
+            "### VTEP Loopback Node allocation",
+            "",
+            "| POD | Node | Loopback1 |",
+            "| --- | ---- | --------- |",
+        )
+        for fabric_switch in self.fabric_switches:
+            if "loopback1_ip_address" in fabric_switch:
+                yield f"| {fabric_switch['pod']} | {fabric_switch['node']} | {fabric_switch['loopback1_ip_address']} |"
+
+        if self.connected_endpoints:
+            yield ""
+            yield from self._connected_endpoints_lines()
+
+    def _connected_endpoints_lines(self) -> Iterator[str]:
+        yield "## Connected Endpoints"
+        yield ""
+        if not self.connected_endpoints_by_key:
+            yield "No connected endpoint configured!"
+        else:
+            yield from (
+                "### Connected Endpoint Keys",
+                "",
+                "| Key | Type | Description |",
+                "| --- | ---- | ----------- |",
+            )
+            for connected_endpoints_key in natural_sort(self.connected_endpoints_keys, "key"):
+                description = default(connected_endpoints_key.get("description"), "-")
+                yield f"| {connected_endpoints_key.get('key')} | {connected_endpoints_key.get('type')} | {description} |"
+
+        for key in natural_sort(self.connected_endpoints_by_key):
+            yield from (
+                "",
+                f"### {str(key).replace('_', ' ').capitalize()}",
+                "",
+                "| Name | Port | Fabric Device | Fabric Port | Description | Shutdown | Type | Mode | VLANs | Profile |",
+                "| ---- | ---- | ------------- | ------------| ----------- | -------- | ---- | ---- | ----- | ------- |",
+            )
+            for connected_endpoint in natural_sort(self.connected_endpoints_by_key[key], "peer"):
+                yield (
+                    f"| {connected_endpoint['peer']} | {connected_endpoint['peer_interface']} | {connected_endpoint['fabric_switch']} "
+                    f"| {connected_endpoint['fabric_port']} | {connected_endpoint['description']} | {connected_endpoint['shutdown']} "
+                    f"| {connected_endpoint['type']} | {connected_endpoint['mode']} | {connected_endpoint['vlans']} | {connected_endpoint['profile']} |"
+                )
+
+        if self.port_profiles:
+            yield from (
+                "",
+                "### Port Profiles",
+                "",
+                "| Profile Name | Parent Profile |",
+                "| ------------ | -------------- |",
+            )
+            for port_profile in self.port_profiles:
+                yield f"| {port_profile.get('profile')} | {default(port_profile.get('parent_profile'), '-')} |"
+
+    def get_documentation(self) -> str:
+        """
+        Return the fabric documentation in Markdown format with the table of contents.
+        """
+        # The table of contents is built from all the headings, so the full documentation is held in memory.
+        documentation = "".join(f"{line}\n" for line in self._documentation_lines())
+        return add_md_toc(documentation, skip_lines=3)
+
+    def topology_csv_lines(self) -> Iterator[str]:
+        """
+        Yield the lines of the fabric topology CSV including newlines.
+        """
+        yield f"{TOPOLOGY_CSV_HEADER}\n"
+        for row in self.topology_csv_rows:
+            yield f"{row}\n"
+
+    def p2p_links_csv_lines(self) -> Iterator[str]:
+        """
+        Yield the lines of the fabric point-to-point links CSV including newlines.
+        """
+        yield f"{P2P_LINKS_CSV_HEADER}\n"
+        for row in self.p2p_links_csv_rows:
+            yield f"{row}\n"
+
+
+def get_fabric_documentation(fabric_name: str, fabric_hosts: list[str], hostvars: Mapping, avd_switch_facts: Mapping, hostname: str) -> FabricDocumentation:
+    """
+    Return the FabricDocumentation of the fabric.
+
+    The node types, underlay routing protocol and "eos_designs_documentation" settings are read from the variables of the given device,
+    like the templates read them from the device running the task.
+
+    Parameters
+    ----------
+    fabric_name : str
+        Name of the fabric.
+    fabric_hosts : list[str]
+        Hostnames of the devices in the fabric like the Ansible group "fabric_name".
+    hostvars : Mapping
+        Hostname mapped to the variables of the device, including the structured config.
+    avd_switch_facts : Mapping
+        Hostname mapped to the facts of the device as returned by "eos_designs_facts".
+    hostname : str
+        Hostname of the device to read the settings from.
+
+    Returns
+    -------
+    FabricDocumentation
+    """
+    device_hostvars = hostvars[hostname]
+    return FabricDocumentation(
+        fabric_name=fabric_name,
+        fabric_hosts=fabric_hosts,
+        hostvars=hostvars,
+        avd_switch_facts=avd_switch_facts,
+        node_types=get_node_types(device_hostvars.get("node_type_keys"), get(device_hostvars, "design.type")),
+        underlay_routing_protocol=get(avd_switch_facts, f"{hostname}..switch..underlay_routing_protocol", separator=".."),
+        connected_endpoints=get(device_hostvars, "eos_designs_documentation.connected_endpoints") is True,
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+# Facts of a device pointing to the peers whose facts are read while generating the structured config of the device.
+PEER_FACTS = ("uplink_peers", "evpn_route_servers", "mpls_route_reflectors")
+
+
+def get_facts_closure(avd_facts: Mapping, hostname: str, extra_peers: list[str] | None = None) -> list[str]:
+    """
+    Return the fabric devices whose facts are read while generating the structured config of the given device.
+
+    The closure holds the device itself, the MLAG peer, the uplink peers, the EVPN route servers and MPLS route reflectors
+    as well as the devices using the device as uplink peer, route server or route reflector.
+
+    Peers only given in the input variables, like the nodes of "core_interfaces" or "l3_edge" p2p_links, "evpn_gateway.remote_peers"
+    or "overlay_cvx_servers", and the devices read by "overlay_routing_protocol: her" or "bgp_mesh_pes: true" are not derived from the facts.
+    Give those as extra_peers. The peers read in a previous run are listed under "peer_facts" in the fingerprint of the device.
+
+    Parameters
+    ----------
+    avd_facts : Mapping
+        avd_switch_facts : dict
+        avd_overlay_peers : dict
+        avd_topology_peers : dict
+    hostname : str
+        Hostname of the device.
+    extra_peers : list[str], optional
+        Additional devices to include in the closure.
+
+    Returns
+    -------
+    list[str]
+        Hostnames in the order of "avd_switch_facts".
+    """
+    avd_switch_facts = get(avd_facts, "avd_switch_facts", required=True)
+    switch_facts = get(avd_switch_facts, f"{hostname}..switch", separator="..", required=True, org_key=f"avd_switch_facts.{hostname}.switch")
+
+    closure = {hostname, *(extra_peers or [])}
+    if (mlag_peer := switch_facts.get("mlag_peer")) is not None:
+        closure.add(mlag_peer)
+    for peer_fact in PEER_FACTS:
+        closure.update(switch_facts.get(peer_fact) or [])
+
+    closure.update(get(avd_facts, f"avd_topology_peers..{hostname}", separator="..", default=[]))
+    closure.update(get(avd_facts, f"avd_overlay_peers..{hostname}", separator="..", default=[]))
+
+    # Peers outside of the fabric have no facts, so they are left out like with the full facts.
+    return [device for device in avd_switch_facts if device in closure]
+
+
+def get_device_facts_slice(avd_facts: Mapping, hostname: str, strict: bool = True, extra_peers: list[str] | None = None) -> dict:
+    """
+    Return the subset of the avd_facts needed to generate the structured config of the given device.
+
+    The slice holds the "avd_switch_facts" of the devices returned by "get_facts_closure" and the "avd_overlay_peers"
+    and "avd_topology_peers" of the device itself, so it is a few kilobytes instead of the facts of the full fabric.
+    "avd_switch_facts" is returned as a FactsSlice which still lists all fabric devices, so the list of fabric devices is the same
+    as with the full facts.
+
+    Parameters
+    ----------
+    avd_facts : Mapping
+        avd_switch_facts : dict
+        avd_overlay_peers : dict
+        avd_topology_peers : dict
+    hostname : str
+        Hostname of the device.
+    strict : bool, default=True
+        If True, reading the facts of a fabric device outside of the slice raises an error, so a slice missing a peer
+        never gives a different structured config than the full facts.
+        If False, the facts of fabric devices outside of the slice are missing just like the facts of devices outside of the fabric.
+    extra_peers : list[str], optional
+        Additional devices to include in the slice. See "get_facts_closure".
+
+    Returns
+    -------
+    dict
+        avd_switch_facts : FactsSlice
+        avd_overlay_peers : dict
+        avd_topology_peers : dict
+    """
+    avd_switch_facts = get(avd_facts, "avd_switch_facts", required=True)
+    switch_facts = {device: avd_switch_facts[device] for device in get_facts_closure(avd_facts, hostname, extra_peers)}
+
+    facts_slice = {
+        "avd_switch_facts": FactsSlice(hostname, switch_facts, list(avd_switch_facts), strict=strict),
+        "avd_overlay_peers": {},
+        "avd_topology_peers": {},
+    }
+    for peers_key in ("avd_overlay_peers", "avd_topology_peers"):
+        if (peers := get(avd_facts, f"{peers_key}..{hostname}", separator="..")) is not None:
+            facts_slice[peers_key][hostname] = peers
+
+    return facts_slice
+
+
+class FactsSlice(Mapping):
+    """
+    Read-only "avd_switch_facts" holding the facts of the devices in a facts slice.
+
+    All fabric devices are listed like with the full facts, so the list of fabric devices is still correct.
+    Reading the facts of a fabric device outside of the slice raises an AristaAvdError if strict is set.
+    Otherwise the device is missing like a device outside of the fabric.
+
+    Parameters
+    ----------
+    hostname : str
+        Hostname of the device the slice was made for. Used in the error message.
+    switch_facts : dict
+        avd_switch_facts of the devices in the slice.
+    fabric_devices : list[str]
+        Hostnames of all fabric devices.
+    strict : bool, default=True
+        Raise an error when the facts of a fabric device outside of the slice are read.
+    """
+
+    def __init__(self, hostname: str, switch_facts: dict, fabric_devices: list[str], strict: bool = True):
+        self._hostname = hostname
+        self._switch_facts = switch_facts
+        self._fabric_devices = fabric_devices
+        self._fabric_devices_set = set(fabric_devices)
+        self.strict = strict
+
+    def __getitem__(self, device: str):
+        if device in self._switch_facts:
+            return self._switch_facts[device]
+
+        if self.strict and device in self._fabric_devices_set:
+            raise AristaAvdError(
+                f"The facts of '{device}' were read for '{self._hostname}', but '{device}' is not part of the facts slice for '{self._hostname}'."
+            )
+
+        raise KeyError(device)
+
+    def __contains__(self, device: object) -> bool:
+        return device in self._fabric_devices_set
+
+    def __iter__(self):
+        return iter(self._fabric_devices)
+
+    def __len__(self) -> int:
+        return len(self._fabric_devices)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from hashlib import sha256
+from json import dump as json_dump
+from json import dumps as json_dumps
+from json import load as json_load
+from typing import TYPE_CHECKING
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+if TYPE_CHECKING:
+    from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+
+# Bump this whenever the content or format of the fingerprint changes.
+FINGERPRINT_VERSION = 2
+
+# Variables which are not inputs to eos_designs or which change on every run.
+# The facts of the device itself and of the peers are covered by the "peer_facts" fingerprints.
+# The overlay and topology peers of the device itself are covered by the "overlay_peers" and "topology_peers" fingerprints.
+IGNORED_VARS = (
+    "avd_overlay_peers",
+    "avd_switch_facts",
+    "avd_topology_peers",
+    "environment",
+    "group_names",
+    "groups",
+    "hostvars",
+    "omit",
+    "play_hosts",
+    "playbook_dir",
+    "role_name",
+    "role_names",
+    "role_path",
+    "role_uuid",
+    "switch",
+    "vars",
+)
+IGNORED_VAR_PREFIXES = ("ansible_", "molecule")
+
+
+def get_fingerprint(data) -> str:
+    """
+    Return a sha256 hex digest of the given data.
+
+    Dict keys are hashed in the order they are stored, since the order can affect the generated output.
+    Objects which cannot be serialized to JSON are hashed using their repr(). If the repr() contains a memory address,
+    the fingerprint will just never match, causing a regeneration.
+    """
+    try:
+        serialized_data = json_dumps(data, default=repr)
+    except (TypeError, ValueError):
+        serialized_data = repr(data)
+
+    return sha256(serialized_data.encode("UTF-8")).hexdigest()
+
+
+def get_vars_fingerprint(hostvars: Mapping) -> str:
+    """
+    Return a fingerprint of the input variables for one device, leaving out the variables in IGNORED_VARS and IGNORED_VAR_PREFIXES.
+    """
+    input_vars = {key: hostvars[key] for key in sorted(hostvars, key=str) if not (key in IGNORED_VARS or str(key).startswith(IGNORED_VAR_PREFIXES))}
+    return get_fingerprint(input_vars)
+
+
+def get_peer_facts_fingerprint(avd_switch_facts: Mapping, peer_name: str) -> str:
+    return get_fingerprint(get(avd_switch_facts, f"{peer_name}..switch", separator=".."))
+
+
+def get_peers_fingerprint(peers: list) -> str:
+    # The order of the peers is kept, since it can affect the generated output.
+    return get_fingerprint(peers)
+
+
+def get_fabric_devices_fingerprint(avd_switch_facts: Mapping) -> str:
+    # The order of the hosts in an Ansible group can change between runs, so the hostnames are sorted.
+    return get_fingerprint(sorted(avd_switch_facts))
+
+
+def read_fingerprint_file(path: str) -> dict | None:
+    """
+    Read a fingerprint from the given JSON file. Returns None if the file does not exist or cannot be read.
+    """
+    try:
+        with open(path, "r", encoding="UTF-8") as file:
+            fingerprint = json_load(file)
+    except Exception:
+        return None
+
+    return fingerprint if isinstance(fingerprint, dict) else None
+
+
+def write_fingerprint_file(path: str, fingerprint: dict) -> None:
+    with open(path, "w", encoding="UTF-8") as file:
+        json_dump(fingerprint, file, indent=2)
+
+
+class DeviceFingerprint:
+    """
+    Fingerprint of the effective inputs used to generate the structured configuration of one device.
+
+    The fingerprint covers:
+    - The input variables of the device. These must be fingerprinted before generating the structured config,
+      since the generation can update the variables in-place.
+    - The "avd_topology_peers" and "avd_overlay_peers" of the device. These are not part of the input variables of the device,
+      so adding or removing a downlink or overlay client on another device is only detected through these.
+    - The rendered avd_switch_facts of the device itself, of all topology and overlay peers and of all peers read through
+      "SharedUtils.get_peer_facts".
+    - The list of all fabric devices if it was read through "SharedUtils.all_fabric_devices".
+    - The AVD version.
+
+    If the fingerprint of a previous run is unchanged, the structured config of the previous run is still valid.
+    Changes to custom Jinja2 templates or custom python modules are not covered.
+
+    Parameters
+    ----------
+    hostvars : Mapping
+        The input variables of the device including "inventory_hostname", "avd_topology_peers" and "avd_overlay_peers".
+    avd_version : str
+        The version of AVD.
+    """
+
+    def __init__(self, hostvars: Mapping, avd_version: str):
+        self.hostname = get(hostvars, "inventory_hostname", required=True)
+        self.avd_version = avd_version
+        self.vars_fingerprint = get_vars_fingerprint(hostvars)
+        self.topology_peers = get(hostvars, f"avd_topology_peers..{self.hostname}", separator="..", default=[])
+        self.overlay_peers = get(hostvars, f"avd_overlay_peers..{self.hostname}", separator="..", default=[])
+        self.peer_facts_fingerprints = {}
+        self.fabric_devices_fingerprint = None
+
+    def add_peer_facts(self, shared_utils: SharedUtils) -> None:
+        """
+        Add fingerprints of the facts of the device itself, the topology and overlay peers and all peers read through the given
+        SharedUtils instance. Must be called after generating the structured config.
+        """
+        avd_switch_facts = get(shared_utils.hostvars, "avd_switch_facts", default={})
+        for peer_name in sorted(shared_utils.accessed_peers.union(self.topology_peers, self.overlay_peers, [self.hostname])):
+            self.peer_facts_fingerprints[peer_name] = get_peer_facts_fingerprint(avd_switch_facts, peer_name)
+
+        if shared_utils.accessed_all_fabric_devices:
+            self.fabric_devices_fingerprint = get_fabric_devices_fingerprint(avd_switch_facts)
+
+    def to_dict(self) -> dict:
+        fingerprint = {
+            "fingerprint_version": FINGERPRINT_VERSION,
+            "avd_version": self.avd_version,
+            "hostname": self.hostname,
+            "vars": self.vars_fingerprint,
+            "topology_peers": get_peers_fingerprint(self.topology_peers),
+            "overlay_peers": get_peers_fingerprint(self.overlay_peers),
+            "peer_facts": self.peer_facts_fingerprints,
+        }
+        if self.fabric_devices_fingerprint is not None:
+            fingerprint["fabric_devices"] = self.fabric_devices_fingerprint
+
+        return fingerprint
+
+    def is_unchanged(self, previous_fingerprint: dict | None, avd_switch_facts: Mapping) -> bool:
+        """
+        Compare with the fingerprint of a previous run.
+
+        Since the peers read during generation only depend on the inputs and the topology and overlay peers, the peers recorded
+        in the previous fingerprint are the ones that would be read again, so only those are compared using the current avd_switch_facts.
+
+        Parameters
+        ----------
+        previous_fingerprint : dict | None
+            Fingerprint of a previous run as returned by "to_dict()"
+        avd_switch_facts : Mapping
+            The current avd_switch_facts of all devices
+
+        Returns
+        -------
+        bool
+            True if none of the inputs changed since the previous run.
+        """
+        if not previous_fingerprint:
+            return False
+
+        if (
+            previous_fingerprint.get("fingerprint_version") != FINGERPRINT_VERSION
+            or previous_fingerprint.get("avd_version") != self.avd_version
+            or previous_fingerprint.get("hostname") != self.hostname
+            or previous_fingerprint.get("vars") != self.vars_fingerprint
+            or previous_fingerprint.get("topology_peers") != get_peers_fingerprint(self.topology_peers)
+            or previous_fingerprint.get("overlay_peers") != get_peers_fingerprint(self.overlay_peers)
+        ):
+            return False
+
+        if "fabric_devices" in previous_fingerprint and previous_fingerprint["fabric_devices"] != get_fabric_devices_fingerprint(avd_switch_facts):
+            return False
+
+        peer_facts_fingerprints = previous_fingerprint.get("peer_facts", {})
+        if self.hostname not in peer_facts_fingerprints:
+            return False
+
+        return all(
+            peer_facts_fingerprint == get_peer_facts_fingerprint(avd_switch_facts, peer_name)
+            for peer_name, peer_facts_fingerprint in peer_facts_fingerprints.items()
+        )
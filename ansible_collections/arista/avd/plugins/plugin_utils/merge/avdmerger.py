@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+
+if TYPE_CHECKING:
+    from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschema import AvdSchema
+
+
+def _strategy_override(path: tuple, base, nxt):
+    """use nxt, and ignore base."""
+    return nxt
+
+
+def _strategy_use_existing(path: tuple, base, nxt):
+    """use base, and ignore nxt."""
+    return base
+
+
+def _strategy_must_match(path: tuple, base, nxt):
+    if base != nxt:
+        raise ValueError(f"Values of {'.'.join(path)} do not match: {base} != {nxt}")
+    return base
+
+
+def _strategy_keep(path: tuple, base: list, nxt: list) -> list:
+    """prefer base, otherwise nxt"""
+    if base is not None:
+        return base
+    return nxt
+
+
+def _strategy_append(path: tuple, base: list, nxt: list) -> list:
+    """append nxt to base."""
+    return base + nxt
+
+
+def _strategy_prepend(path: tuple, base: list, nxt: list) -> list:
+    """prepend nxt to base."""
+    return nxt + base
+
+
+def _unique_items(items: list, existing_items: list) -> list:
+    """
+    Return the items from "items" which are not in "existing_items".
+
+    Hashable items are checked with a set lookup. Unhashable items like dicts are compared with the unhashable existing items.
+    """
+    hashable_items = set()
+    unhashable_items = []
+    for existing_item in existing_items:
+        try:
+            hashable_items.add(existing_item)
+        except TypeError:
+            unhashable_items.append(existing_item)
+
+    unique_items = []
+    for item in items:
+        try:
+            if item in hashable_items:
+                continue
+        except TypeError:
+            if item in unhashable_items:
+                continue
+        unique_items.append(item)
+
+    return unique_items
+
+
+def _strategy_append_unique(path: tuple, base: list, nxt: list) -> list:
+    """append nxt items without duplicates in base to base."""
+    return base + _unique_items(nxt, base)
+
+
+def _strategy_prepend_unique(path: tuple, base: list, nxt: list) -> list:
+    """prepend nxt items without duplicates in base to base."""
+    return nxt + _unique_items(base, nxt)
+
+
+LIST_MERGE_STRATEGIES = {
+    "replace": _strategy_override,
+    "keep": _strategy_keep,
+    "append": _strategy_append,
+    "prepend": _strategy_prepend,
+    "append_rp": _strategy_append_unique,
+    "prepend_rp": _strategy_prepend_unique,
+}
+
+SAME_KEY_STRATEGIES = {
+    "override": _strategy_override,
+    "use_existing": _strategy_use_existing,
+    "must_match": _strategy_must_match,
+}
+
+
+class AvdMerger:
+    """
+    AvdMerger merges data sets in-place following the AVD merge rules.
+
+    Dicts are merged recursively, sets are combined and lists are merged according to "list_merge".
+    Any other value or values of conflicting types are handled according to "same_key_strategy".
+
+    If an AvdSchema is given and "list_merge" is not "replace", list items with the same value of the "primary_key" defined
+    in the schema are merged as dicts. The remaining items are merged according to "list_merge".
+    The primary keys are looked up by data path in AvdSchema.primary_key_index, so the schema is only walked once.
+
+    Parameters
+    ----------
+    list_merge : str, default="append"
+        Valid values: "append, replace, keep, prepend, append_rp, prepend_rp"
+    same_key_strategy : str, default="override"
+        Valid values: "override", "use_existing", "must_match"
+    recursive : bool, default=True
+        Perform recursive merge of dicts or just override with nxt.
+    schema : AvdSchema, optional
+        An instance of AvdSchema used to merge lists of dictionaries using the "primary_key" defined in the schema.
+    """
+
+    def __init__(self, list_merge: str = "append", same_key_strategy: str = "override", recursive: bool = True, schema: AvdSchema = None):
+        if list_merge not in LIST_MERGE_STRATEGIES:
+            raise AristaAvdError(f"merge: 'list_merge' argument can only be equal to one of {list(LIST_MERGE_STRATEGIES.keys())}")
+
+        if same_key_strategy not in SAME_KEY_STRATEGIES:
+            raise AristaAvdError(f"merge: 'same_key_strategy' argument can only be equal to one of {list(SAME_KEY_STRATEGIES.keys())}")
+
+        self._list_strategy = LIST_MERGE_STRATEGIES[list_merge]
+        self._same_key_strategy = SAME_KEY_STRATEGIES[same_key_strategy]
+        self.recursive = recursive
+        # With list_merge "replace" there is no point in merging on primary keys, since the list from nxt will be used anyway.
+        self.schema = schema if list_merge != "replace" else None
+
+    def merge(self, base, nxt):
+        """
+        Merge nxt onto base. Base is updated in-place and the merged value is returned.
+        """
+        # The index is fetched on every merge, since it is reset on the schema if the schema is reloaded or extended.
+        primary_keys = self.schema.primary_key_index if self.schema is not None else {}
+        return self._merge_value((), base, nxt, primary_keys)
+
+    def _merge_value(self, path: tuple, base, nxt, primary_keys: dict):
+        if not (isinstance(base, type(nxt)) or isinstance(nxt, type(base))):
+            # Type conflict
+            return self._same_key_strategy(path, base, nxt)
+
+        if isinstance(nxt, list):
+            return self._merge_list(path, base, nxt, primary_keys)
+
+        if isinstance(nxt, dict):
+            if not self.recursive:
+                return nxt
+
+            for key, value in nxt.items():
+                if key in base:
+                    base[key] = self._merge_value(path + (key,), base[key], value, primary_keys)
+                else:
+                    base[key] = value
+            return base
+
+        if isinstance(nxt, set):
+            return base | nxt
+
+        return self._same_key_strategy(path, base, nxt)
+
+    def _merge_list(self, path: tuple, base: list, nxt: list, primary_keys: dict) -> list:
+        if (primary_key := primary_keys.get(path)) is not None:
+            nxt = self._merge_on_primary_key(path, base, nxt, primary_key, primary_keys)
+            if not nxt:
+                # All nxt items were merged into base.
+                return base
+
+        return self._list_strategy(path, base, nxt)
+
+    def _merge_on_primary_key(self, path: tuple, base: list, nxt: list, primary_key: str, primary_keys: dict) -> list:
+        """
+        Merge nxt items onto base items with the same value of primary_key.
+
+        Base items are updated in-place. Returns the list of nxt items which were not merged.
+        """
+        # Index base items on the primary key value. Multiple base items can have the same value.
+        base_indexes = {}
+        # Unhashable primary key values cannot be indexed, so we keep them aside and compare them one by one.
+        unhashable_base_indexes = []
+        for base_index, base_item in enumerate(base):
+            # Skipping items if they are not dicts or don't have primary_key
+            if not (isinstance(base_item, dict) and primary_key in base_item):
+                continue
+
+            try:
+                base_indexes.setdefault(base_item[primary_key], []).append(base_index)
+            except TypeError:
+                unhashable_base_indexes.append(base_index)
+
+        remaining_nxt = []
+        for nxt_item in nxt:
+            # Skipping items if they are not dicts or don't have primary_key
+            if not (isinstance(nxt_item, dict) and primary_key in nxt_item):
+                remaining_nxt.append(nxt_item)
+                continue
+
+            primary_key_value = nxt_item[primary_key]
+            try:
+                matching_base_indexes = base_indexes.get(primary_key_value, ())
+            except TypeError:
+                matching_base_indexes = [base_index for base_index in unhashable_base_indexes if base[base_index][primary_key] == primary_key_value]
+
+            if not matching_base_indexes:
+                remaining_nxt.append(nxt_item)
+                continue
+
+            # Perform regular dict merge on the matching items.
+            for base_index in matching_base_indexes:
+                base[base_index] = self._merge_value(path, base[base_index], nxt_item, primary_keys)
+
+        return remaining_nxt
@@ -1,55 +1,28 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
-
-from .mergeonschema import MergeOnSchema
+from .avdmerger import AvdMerger
 
 if TYPE_CHECKING:
     from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschema import AvdSchema
 
-try:
-    from deepmerge import Merger
-except ImportError as imp_exc:
-    DEEPMERGE_IMPORT_ERROR = imp_exc
-else:
-    DEEPMERGE_IMPORT_ERROR = None
-
-
-def _strategy_keep(config, path, base, nxt):
-    """prefer base, otherwise nxt"""
-    if base is not None:
-        return base
-    return nxt
-
-
-def _strategy_prepend_unique(config, path, base, nxt):
-    """prepend nxt items without duplicates in base to base."""
-    nxt_as_set = set(nxt)
-    return nxt + [n for n in base if n not in nxt_as_set]
-
-
-def _strategy_must_match(config, path, base, nxt):
-    if base != nxt:
-        raise ValueError(f"Values of {'.'.join(path)} do not match: {base} != {nxt}")
-    return base
 
+@lru_cache
+def _get_merger(list_merge: str, same_key_strategy: str, recursive: bool, schema: AvdSchema = None) -> AvdMerger:
+    """
+    Return a cached AvdMerger for the given combination of merge options and schema.
 
-MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY = {
-    "replace": "override",
-    "keep": _strategy_keep,
-    "append": "append",
-    "prepend": "prepend",
-    "append_rp": "append_unique",
-    "prepend_rp": _strategy_prepend_unique,
-}
+    AvdSchema instances are hashed by identity, so each schema instance gets its own merger.
+    """
+    return AvdMerger(list_merge=list_merge, same_key_strategy=same_key_strategy, recursive=recursive, schema=schema)
 
 
 def merge(base, *nxt_list, recursive=True, list_merge="append", same_key_strategy="override", destructive_merge=True, schema: AvdSchema = None):
     """
-    Merge two or more data sets using deepmerge
+    Merge two or more data sets using AvdMerger
 
     Parameters
     ----------
@@ -76,37 +49,11 @@ def merge(base, *nxt_list, recursive=True, list_merge="append", same_key_strateg
         An instance of AvdSchema can be passed to merge, to allow merging lists of dictionaries using the "primary_key" defined in the schema.
     """
 
-    if DEEPMERGE_IMPORT_ERROR:
-        raise AristaAvdError("AVD requires python deepmerge to be installed") from DEEPMERGE_IMPORT_ERROR
-
     if not destructive_merge:
         base = deepcopy(base)
 
-    if list_merge not in MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY:
-        raise AristaAvdError(f"merge: 'list_merge' argument can only be equal to one of {list(MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY.keys())}")
-
-    list_strategies = [MAP_ANSIBLE_LIST_MERGE_TO_DEEPMERGE_LIST_STRATEGY.get(list_merge, "append")]
-
-    if list_merge != "replace" and schema is not None:
-        # If list_merge is not "replace" and we have a schema, we prepend the list_strategies
-        # with our schema based list merger "MergeOnSchema"
-        # If "primary_key" is not set and equal, we will fallback to the supplied "list_merge" strategy
-        merge_on_schema = MergeOnSchema(schema)
-        list_strategies.insert(0, merge_on_schema.strategy)
-
-    dict_strategies = ["merge" if recursive else "override"]
-
-    if same_key_strategy == "must_match":
-        same_key_strategy = _strategy_must_match
+    merger = _get_merger(list_merge, same_key_strategy, recursive, schema)
 
-    merger = Merger(
-        # List of tuples with strategies for each type
-        [(list, list_strategies), (dict, dict_strategies), (set, ["union"])],
-        # Fallback strategy applied to all other types
-        [same_key_strategy],
-        # Strategy for type conflict
-        [same_key_strategy],
-    )
     for nxt in nxt_list:
         if isinstance(nxt, list):
             for nxt_item in nxt:
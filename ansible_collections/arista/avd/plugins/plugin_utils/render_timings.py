@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from json import dump as json_dump
+from time import perf_counter
+
+# Categories of timings recorded during the rendering of one device.
+MODULES = "modules"
+KEYS = "keys"
+FUNCTIONS = "functions"
+
+
+class RenderTimings:
+    """
+    Records the wall time and number of calls while rendering facts or structured config for one device.
+
+    Timings are grouped in categories:
+    - "modules": The AvdFacts classes rendered for the device like "AvdStructuredConfigBase".
+    - "keys": The top-level keys rendered by the AvdFacts classes like "router_bgp" or "ethernet_interfaces".
+      Keys rendered by multiple classes are added up.
+    - "functions": Other functions like "convert_data" and "merge".
+
+    Since values of cached_properties are cached, the time spent on any internal cached_property or peer facts
+    is recorded on the first key reading them.
+    """
+
+    def __init__(self):
+        self._timings: dict[str, dict[str, list]] = {}
+
+    @contextmanager
+    def timer(self, category: str, name: str):
+        """
+        Context manager recording the wall time of the enclosed code.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(category, name, perf_counter() - start)
+
+    def add(self, category: str, name: str, seconds: float) -> None:
+        timing = self._timings.setdefault(category, {}).setdefault(name, [0, 0.0])
+        timing[0] += 1
+        timing[1] += seconds
+
+    def to_dict(self) -> dict:
+        """
+        Export the timings as plain data which can be dumped to JSON.
+
+        Returns
+        -------
+        dict
+            <category> : dict
+                <name> : dict
+                    calls : int
+                    seconds : float
+        """
+        return {
+            category: {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in timings.items()} for category, timings in self._timings.items()
+        }
+
+
+def render_timer(render_timings: RenderTimings | None, category: str, name: str):
+    """
+    Return the timer context manager of the given RenderTimings or a no-op context manager if render_timings is None.
+    """
+    if render_timings is None:
+        return nullcontext()
+
+    return render_timings.timer(category, name)
+
+
+def aggregate_render_timings(device_render_timings: dict[str, dict]) -> dict:
+    """
+    Aggregate the timings of all devices in the fabric.
+
+    Parameters
+    ----------
+    device_render_timings : dict
+        <hostname> : dict
+            Timings as returned by RenderTimings.to_dict()
+
+    Returns
+    -------
+    dict
+        devices : int
+            Number of devices.
+        <category> : dict
+            <name> : dict
+                calls : int
+                    Sum of calls across all devices.
+                seconds : float
+                    Sum of seconds across all devices.
+                max_seconds : float
+                    Highest number of seconds for one device.
+                max_device : str
+                    Device with the highest number of seconds.
+            Names are sorted by the sum of seconds in descending order.
+    """
+    aggregated = {}
+    for hostname, render_timings in device_render_timings.items():
+        for category, timings in render_timings.items():
+            for name, timing in timings.items():
+                aggregated_timing = aggregated.setdefault(category, {}).setdefault(name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "max_device": None})
+                aggregated_timing["calls"] += timing["calls"]
+                aggregated_timing["seconds"] += timing["seconds"]
+                if aggregated_timing["max_device"] is None or timing["seconds"] > aggregated_timing["max_seconds"]:
+                    aggregated_timing["max_seconds"] = timing["seconds"]
+                    aggregated_timing["max_device"] = hostname
+
+    return {
+        "devices": len(device_render_timings),
+        **{category: dict(sorted(timings.items(), key=lambda item: item[1]["seconds"], reverse=True)) for category, timings in aggregated.items()},
+    }
+
+
+def write_render_timings_file(filename: str, device_render_timings: dict[str, dict]) -> None:
+    """
+    Write the aggregated timings of the fabric and the timings of each device to a JSON file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the JSON file.
+    device_render_timings : dict
+        <hostname> : dict
+            Timings as returned by RenderTimings.to_dict()
+    """
+    with open(filename, "w", encoding="UTF-8") as file:
+        json_dump({"fabric": aggregate_render_timings(device_render_timings), "devices": device_render_timings}, file, indent=2)
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import re
+from collections import ChainMap
+from numbers import Number
+from typing import Callable, Generator, NamedTuple
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avddataconverter import SCHEMA_TO_PY_TYPE_MAP, SIMPLE_CONVERTERS, AvdDataConverter
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get_all
+
+try:
+    import jsonschema
+except ImportError as imp_exc:
+    JSONSCHEMA_IMPORT_ERROR = imp_exc
+else:
+    JSONSCHEMA_IMPORT_ERROR = None
+
+TYPE_CHECKERS = {
+    "any": lambda instance: True,
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: isinstance(instance, int) and not isinstance(instance, bool),
+    "object": lambda instance: isinstance(instance, dict),
+    "null": lambda instance: instance is None,
+    "None": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, Number) and not isinstance(instance, bool),
+    "string": lambda instance: isinstance(instance, str),
+    "dict": lambda instance: isinstance(instance, (dict, ChainMap)),
+    "str": lambda instance: isinstance(instance, str),
+    "bool": lambda instance: isinstance(instance, bool),
+    "list": lambda instance: isinstance(instance, list),
+    "int": lambda instance: isinstance(instance, int) and not isinstance(instance, bool),
+}
+
+
+CONVERTING_KEYWORDS = ("items", "keys", "dynamic_keys")
+
+
+def _is_number(instance) -> bool:
+    return isinstance(instance, Number) and not isinstance(instance, bool)
+
+
+def _converter_path(path: list) -> list[str]:
+    """
+    Returns the path in the format used by AvdDataConverter, where list indexes are formatted as "[<index>]".
+    """
+    return [f"[{elem}]" if isinstance(elem, int) else elem for elem in path]
+
+
+class CompiledChild(NamedTuple):
+    validate: Callable
+    convert: Callable | None
+    required: bool
+    valid_values: list | None
+    dynamic_valid_values: str | None
+
+
+class AvdCompiledValidator:
+    """
+    AvdCompiledValidator is used to validate AVD Data.
+
+    It is an alternative to AvdValidator, which compiles the fully resolved schema once into a tree of closures.
+    Each closure performs the validations for one level of the schema, so no schema lookups, $ref resolution
+    or type checker dispatching is done while validating data.
+
+    Errors are returned as jsonschema.ValidationError with the same paths and messages as AvdValidator,
+    so they are handled identically by AvdSchema.
+
+    If "convert" is set, the data is also converted in-place like AvdDataConverter in the same single pass over the data.
+    Each level of the data is converted before it is validated, and the conversion warnings and deprecation warnings
+    are returned among the validation errors.
+
+    Parameters
+    ----------
+    resolved_schema : dict
+        Fully resolved AVD Schema (where all $ref has been expanded recursively) as returned by AvdSchema.resolved_schema.
+    convert : bool, default=False
+        Perform in-place data conversion (convert_types, convert_to_lower_case and deprecation warnings) during validation.
+    """
+
+    def __init__(self, resolved_schema: dict, convert: bool = False):
+        if JSONSCHEMA_IMPORT_ERROR:
+            raise AristaAvdError('Python library "jsonschema" must be installed to use this plugin') from JSONSCHEMA_IMPORT_ERROR
+
+        self._convert = convert
+        # The AvdDataConverter methods used for the actual conversions do not need the schema.
+        self._dataconverter = AvdDataConverter(None)
+
+        self._compilers = {
+            "type": self._compile_type,
+            "max": self._compile_max,
+            "min": self._compile_min,
+            "valid_values": self._compile_valid_values,
+            "max_length": self._compile_max_length,
+            "min_length": self._compile_min_length,
+            "pattern": self._compile_pattern,
+            "items": self._compile_items,
+            "primary_key": self._compile_primary_key,
+            "keys": self._compile_keys,
+            "dynamic_keys": self._compile_dynamic_keys,
+        }
+        self._validate = self._compile(resolved_schema)
+
+    def iter_errors(self, instance) -> Generator:
+        """
+        Validate the instance and yield any jsonschema.ValidationError found.
+        If "convert" is set, AvdConversionWarning and AvdDeprecationWarning are also yielded.
+
+        All validations are performed before the first error is yielded.
+        Any exception raised during validation is raised after the errors found before the exception.
+        """
+        errors = []
+        try:
+            self._validate(instance, [], errors)
+        except Exception:
+            yield from errors
+            raise
+
+        yield from errors
+
+    def _compile(self, schema: dict, skip: tuple = ()) -> Callable:
+        """
+        Compile one level of the schema into a single closure running all the relevant validations in the order of the schema keywords.
+
+        The returned closure takes the arguments (instance, path, errors).
+        "path" is a shared list of keys/indexes leading to the instance. It is only copied when an error is created.
+        "errors" is a shared list where ValidationErrors will be appended.
+
+        When converting, the validators for child data are run first, so the child data is converted before being validated on this level.
+        """
+        keywords = list(schema)
+        if self._convert:
+            keywords.sort(key=lambda keyword: keyword not in CONVERTING_KEYWORDS)
+
+        validators = []
+        for keyword in keywords:
+            if keyword in skip or keyword not in self._compilers:
+                continue
+
+            validator = self._compilers[keyword](schema[keyword], schema)
+            if validator is not None:
+                validators.append(validator)
+
+        if len(validators) == 1:
+            return validators[0]
+
+        def validate(instance, path: list, errors: list):
+            for validator in validators:
+                validator(instance, path, errors)
+
+        return validate
+
+    @staticmethod
+    def _error(message: str, path: list):
+        return jsonschema.ValidationError(message, path=list(path))
+
+    def _compile_type(self, types: str | list, schema: dict) -> Callable:
+        if not isinstance(types, list):
+            types = [types]
+
+        try:
+            checkers = [TYPE_CHECKERS[schema_type] for schema_type in types]
+        except KeyError as error:
+            raise AristaAvdError(f"Unknown type {error} in schema") from error
+
+        reprs = ", ".join(repr(schema_type) for schema_type in types)
+        error = self._error
+
+        if len(checkers) == 1:
+            checker = checkers[0]
+
+            def validate_type(instance, path: list, errors: list):
+                if not checker(instance):
+                    errors.append(error(f"{instance!r} is not of type {reprs}", path))
+
+        else:
+
+            def validate_type(instance, path: list, errors: list):
+                if not any(checker(instance) for checker in checkers):
+                    errors.append(error(f"{instance!r} is not of type {reprs}", path))
+
+        return validate_type
+
+    def _compile_max(self, maximum: int, schema: dict) -> Callable:
+        error = self._error
+
+        def validate_max(instance, path: list, errors: list):
+            if _is_number(instance) and instance > maximum:
+                errors.append(error(f"{instance!r} is greater than the maximum of {maximum!r}", path))
+
+        return validate_max
+
+    def _compile_min(self, minimum: int, schema: dict) -> Callable:
+        error = self._error
+
+        def validate_min(instance, path: list, errors: list):
+            if _is_number(instance) and instance < minimum:
+                errors.append(error(f"{instance!r} is less than the minimum of {minimum!r}", path))
+
+        return validate_min
+
+    def _compile_max_length(self, max_length: int, schema: dict) -> Callable:
+        error = self._error
+
+        def validate_max_length(instance, path: list, errors: list):
+            if isinstance(instance, str) and len(instance) > max_length:
+                errors.append(error(f"{instance!r} is too long", path))
+
+        return validate_max_length
+
+    def _compile_min_length(self, min_length: int, schema: dict) -> Callable:
+        error = self._error
+
+        def validate_min_length(instance, path: list, errors: list):
+            if isinstance(instance, str) and len(instance) < min_length:
+                errors.append(error(f"{instance!r} is too short", path))
+
+        return validate_min_length
+
+    def _compile_pattern(self, pattern: str, schema: dict) -> Callable:
+        search = re.compile(pattern).search
+        error = self._error
+
+        def validate_pattern(instance, path: list, errors: list):
+            if isinstance(instance, str) and not search(instance):
+                errors.append(error(f"{instance!r} does not match {pattern!r}", path))
+
+        return validate_pattern
+
+    def _compile_valid_values(self, valid_values: list, schema: dict) -> Callable:
+        return self._valid_values_validator(valid_values)
+
+    def _valid_values_validator(self, valid_values: list) -> Callable:
+        """
+        Returns closure validating if the instance conforms to the "valid_values".
+
+        Hashable values are looked up in a set. Unhashable instances fall back to the list.
+        """
+        try:
+            valid_values_set = frozenset(valid_values)
+        except TypeError:
+            valid_values_set = None
+
+        error = self._error
+
+        if valid_values_set is None:
+
+            def validate_valid_values(instance, path: list, errors: list):
+                if instance not in valid_values:
+                    errors.append(error(f"'{instance}' is not one of {valid_values}", path))
+
+            return validate_valid_values
+
+        def validate_valid_values(instance, path: list, errors: list):
+            try:
+                if instance in valid_values_set:
+                    return
+            except TypeError:
+                if instance in valid_values:
+                    return
+
+            errors.append(error(f"'{instance}' is not one of {valid_values}", path))
+
+        return validate_valid_values
+
+    def _compile_converter(self, schema: dict) -> Callable | None:
+        """
+        Returns closure converting one value in-place according to the schema, or None if there is nothing to convert.
+
+        The closure takes the arguments (data, index, path, errors), where "data" is either the parent dict or the parent list
+        and "index" is either the key of the parent dict or the index of the parent list.
+        The conversions themselves are done by AvdDataConverter to keep the exact same behavior and warnings.
+        """
+        if not self._convert:
+            return None
+
+        convert_types = schema.get("convert_types")
+        convert_to_lower_case = schema.get("convert_to_lower_case")
+        deprecation = schema.get("deprecation")
+        if not (convert_types or convert_to_lower_case or deprecation):
+            return None
+
+        schema_type = schema.get("type")
+        simple_type = SCHEMA_TO_PY_TYPE_MAP[schema_type] if schema_type in SIMPLE_CONVERTERS else None
+        dataconverter = self._dataconverter
+
+        def convert(data: dict | list, index: str | int, path: list, errors: list):
+            if convert_types:
+                value = data[index]
+                # For simple conversions, skip conversion if the value is of the correct type
+                # Avoid corner case where we want to convert bool to int. Bool is a subclass of Int so it passes the check.
+                if simple_type is None or not isinstance(value, simple_type) or (schema_type == "int" and isinstance(value, bool)):
+                    errors.extend(dataconverter.convert_types(convert_types, data, index, schema, _converter_path(path)))
+
+            # Convert to lower case if set in schema and value is a string
+            if convert_to_lower_case and isinstance(data[index], str):
+                data[index] = data[index].lower()
+
+            if deprecation:
+                errors.extend(dataconverter.deprecation(deprecation, data[index], schema, _converter_path(path)))
+
+        return convert
+
+    def _compile_items(self, items: dict, schema: dict) -> Callable:
+        validate_item = self._compile(items)
+        convert_item = self._compile_converter(items)
+
+        def validate_items(instance, path: list, errors: list):
+            if not isinstance(instance, list):
+                return
+
+            for index in range(len(instance)):
+                path.append(index)
+                if convert_item is not None:
+                    convert_item(instance, index, path, errors)
+                validate_item(instance[index], path, errors)
+                path.pop()
+
+        return validate_items
+
+    def _compile_primary_key(self, primary_key: str, schema: dict) -> Callable | None:
+        if not isinstance(primary_key, str):
+            return None
+
+        error = self._error
+
+        def validate_primary_key(instance, path: list, errors: list):
+            if not isinstance(instance, list):
+                return
+
+            if not all(isinstance(element, (dict, ChainMap)) for element in instance):
+                return
+
+            if not all(element.get(primary_key) is not None for element in instance):
+                errors.append(error(f"Primary key '{primary_key}' is not set on all items as required.", path))
+
+            if len(set(element.get(primary_key) for element in instance)) < len(instance):
+                errors.append(error(f"Values of Primary key '{primary_key}' are not unique as required.", path))
+
+        return validate_primary_key
+
+    def _compile_child(self, childschema: dict) -> CompiledChild:
+        """
+        Compile a child schema of "keys" or "dynamic_keys".
+
+        "valid_values" is left out of the compiled child validator if "dynamic_valid_values" is set,
+        since the valid values must be expanded using the parent dict during validation.
+        """
+        if "dynamic_valid_values" in childschema:
+            return CompiledChild(
+                validate=self._compile(childschema, skip=("valid_values",)),
+                convert=self._compile_converter(childschema),
+                required=bool(childschema.get("required")),
+                valid_values=childschema.get("valid_values", []),
+                dynamic_valid_values=childschema["dynamic_valid_values"],
+            )
+
+        return CompiledChild(
+            validate=self._compile(childschema),
+            convert=self._compile_converter(childschema),
+            required=bool(childschema.get("required")),
+            valid_values=None,
+            dynamic_valid_values=None,
+        )
+
+    def _compile_keys(self, keys: dict, schema: dict) -> Callable:
+        """
+        Returns closure validating each key with the relevant child validator.
+
+        It also includes various child key validations,
+        which can only be implemented with access to the parent "keys" instance.
+        - Expand dynamic_keys
+        - Validate "allow_other_keys" (default is false)
+        - Validate "required" under child keys
+        - Expand "dynamic_valid_values" under child keys
+
+        When converting, each child key is converted and validated before resolving dynamic keys and running
+        the validations above, since those may be referencing the converted data.
+        """
+        child_validators = {key: self._compile_child(childschema) for key, childschema in keys.items()}
+        dynamic_keys = {dynamic_key: self._compile_child(childschema) for dynamic_key, childschema in schema.get("dynamic_keys", {}).items()}
+        allow_other_keys = schema.get("allow_other_keys", False)
+        convert = self._convert
+        error = self._error
+        valid_values_validator = self._valid_values_validator
+
+        def convert_and_validate_child(instance: dict, key: str, child: CompiledChild, path: list, errors: list):
+            path.append(key)
+            if child.convert is not None:
+                child.convert(instance, key, path, errors)
+            if instance[key] is not None:
+                child.validate(instance[key], path, errors)
+            path.pop()
+
+        def validate_keys(instance, path: list, errors: list):
+            if not isinstance(instance, dict):
+                return
+
+            if convert:
+                for key, child in child_validators.items():
+                    if key in instance:
+                        convert_and_validate_child(instance, key, child, path, errors)
+
+            validators = child_validators
+            if dynamic_keys:
+                # Resolve "keys" from schema "dynamic_keys" by looking for the dynamic key in data.
+                validators = child_validators.copy()
+                for dynamic_key, child in dynamic_keys.items():
+                    for resolved_key in get_all(instance, dynamic_key):
+                        if resolved_key in validators:
+                            continue
+
+                        validators[resolved_key] = child
+                        if convert and resolved_key in instance:
+                            convert_and_validate_child(instance, resolved_key, child, path, errors)
+
+            # Validation of "allow_other_keys"
+            if not allow_other_keys:
+                # Check that instance only contains the schema keys
+                invalid_keys = ", ".join([key for key in instance if key not in validators and key[0] != "_"])
+                if invalid_keys:
+                    errors.append(error(f"Unexpected key(s) '{invalid_keys}' found in dict.", path))
+
+            for key, (validate_child, _, required, valid_values, dynamic_valid_values) in validators.items():
+                value = instance.get(key)
+                if value is None:
+                    # Validation of "required" on child keys
+                    if required:
+                        errors.append(error(f"Required key '{key}' is not set in dict.", path))
+
+                    # Skip further validation since there is nothing to validate.
+                    continue
+
+                if convert and dynamic_valid_values is None:
+                    # Child was already converted and validated above.
+                    continue
+
+                path.append(key)
+                if not convert:
+                    validate_child(value, path, errors)
+                if dynamic_valid_values is not None:
+                    # Expand "dynamic_valid_values" and add to "valid_values"
+                    valid_values_validator(valid_values + get_all(instance, dynamic_valid_values))(value, path, errors)
+                path.pop()
+
+        return validate_keys
+
+    def _compile_dynamic_keys(self, dynamic_keys: dict, schema: dict) -> Callable | None:
+        """
+        The "keys" validator also covers "dynamic_keys", so we only compile "dynamic_keys" if "keys" is not set.
+        """
+        if "keys" in schema:
+            return None
+
+        return self._compile_keys({}, schema)
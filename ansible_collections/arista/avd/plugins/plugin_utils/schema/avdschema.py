@@ -4,10 +4,12 @@ from copy import deepcopy
 from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError, AvdSchemaError, AvdValidationError
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdcompiledvalidator import AvdCompiledValidator
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avddataconverter import AvdDataConverter
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschemaresolver import AvdSchemaResolver
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdvalidator import AvdValidator
-from ansible_collections.arista.avd.plugins.plugin_utils.schema.store import create_store
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.schema_cache import get_primary_key_index
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.store import create_store, load_schema_cache
 
 try:
     import jsonschema
@@ -28,6 +30,11 @@ DEFAULT_SCHEMA = {
     "allow_other_keys": True,
 }
 
+# Compiled validators of builtin schemas shared by all instances of AvdSchema in this process, keyed by (schema_id, convert).
+# The compiled validators are trees of closures which cannot be pickled into the schema cache,
+# so they are compiled once per process from the resolved schema in the schema cache.
+COMPILED_VALIDATORS: dict[tuple[str, bool], AvdCompiledValidator] = {}
+
 
 class AvdSchema:
     """
@@ -41,15 +48,19 @@ class AvdSchema:
         AVD Schema as dictionary. Will be validated towards AVD_META_SCHEMA.
     schema_id : str
         ID of AVD Schema. Either 'eos_cli_config_gen' or 'eos_designs'
+    compiled_validator : bool, default=False
+        Validate data with AvdCompiledValidator instead of the jsonschema based AvdValidator.
+        The resolved schema is compiled once on the first validation.
     """
 
-    def __init__(self, schema: dict = None, schema_id: str = None):
+    def __init__(self, schema: dict = None, schema_id: str = None, compiled_validator: bool = False):
         if JSONSCHEMA_IMPORT_ERROR:
             raise AristaAvdError('Python library "jsonschema" must be installed to use this plugin') from JSONSCHEMA_IMPORT_ERROR
         if DEEPMERGE_IMPORT_ERROR:
             raise AristaAvdError('Python library "deepmerge" must be installed to use this plugin') from DEEPMERGE_IMPORT_ERROR
 
         self.store = create_store()
+        self.compiled_validator = compiled_validator
         self._schema_validator = jsonschema.Draft7Validator(self.store["avd_meta_schema"])
         self.load_schema(schema, schema_id)
 
@@ -72,8 +83,14 @@ class AvdSchema:
             ID of AVD Schema. Either 'eos_cli_config_gen' or 'eos_designs'
         """
 
-        # Clear cached resolved_schema if any
+        # Clear cached resolved_schema, compiled validators and primary_key_index if any
         self.__dict__.pop("resolved_schema", None)
+        self.__dict__.pop("_compiled_validator", None)
+        self.__dict__.pop("_compiled_converter_validator", None)
+        self.__dict__.pop("primary_key_index", None)
+
+        # Only set when a builtin schema is loaded, so the resolved schema and indexes can be fetched from the schema cache.
+        self._schema_id = None
 
         if schema:
             # Validate the schema
@@ -85,6 +102,7 @@ class AvdSchema:
                 raise AristaAvdError(f"Schema id {schema_id} not found in store. Must be one of {self.store.keys()}")
 
             schema = self.store[schema_id]
+            self._schema_id = schema_id
         else:
             schema = DEFAULT_SCHEMA
 
@@ -97,8 +115,16 @@ class AvdSchema:
             raise AristaAvdError("An error occured during creation of the validator") from e
 
     def extend_schema(self, schema: dict):
-        # Clear cached resolved_schema if any
+        # Clear cached resolved_schema, compiled validators and primary_key_index if any
         self.__dict__.pop("resolved_schema", None)
+        self.__dict__.pop("_compiled_validator", None)
+        self.__dict__.pop("_compiled_converter_validator", None)
+        self.__dict__.pop("primary_key_index", None)
+
+        if self._schema_id is not None:
+            # Builtin schemas are shared by all instances of AvdSchema, so we extend a copy instead.
+            # The extended schema no longer matches the schema cache, so this also clears _schema_id.
+            self.load_schema(deepcopy(self._schema))
 
         for validation_error in self.validate_schema(schema):
             raise validation_error
@@ -107,7 +133,10 @@ class AvdSchema:
             raise validation_error
 
     def validate(self, data):
-        validation_errors = self._validator.iter_errors(data)
+        if self.compiled_validator:
+            validation_errors = self._compiled_validator.iter_errors(data)
+        else:
+            validation_errors = self._validator.iter_errors(data)
 
         try:
             for validation_error in validation_errors:
@@ -124,6 +153,20 @@ class AvdSchema:
         except Exception as error:
             yield self._error_handler(error)
 
+    def convert_and_validate(self, data):
+        """
+        Convert and validate data in a single pass using the compiled validator.
+
+        Yields conversion warnings, deprecation warnings and validation errors.
+        """
+        conversion_and_validation_errors = self._compiled_converter_validator.iter_errors(data)
+
+        try:
+            for error in conversion_and_validation_errors:
+                yield self._error_handler(error)
+        except Exception as error:
+            yield self._error_handler(error)
+
     @cached_property
     def resolved_schema(self):
         """
@@ -131,7 +174,12 @@ class AvdSchema:
         _schemaresolver performs inplace update of the argument so we give it a copy of the existing schema.
 
         The resolved schema is cached on the instance of AvdSchema.
+        For builtin schemas the resolved schema is copied from the schema cache shared by all instances of AvdSchema,
+        so changes to the resolved schema of one instance never leak into other instances.
         """
+        if self._schema_id is not None and (resolved_schema := load_schema_cache()["resolved_schemas"].get(self._schema_id)) is not None:
+            return deepcopy(resolved_schema)
+
         resolved_schema = deepcopy(self._schema)
         resolve_errors = self._schemaresolver.iter_errors(resolved_schema)
         for resolve_error in resolve_errors:
@@ -140,6 +188,76 @@ class AvdSchema:
                 raise self._error_handler(resolve_error)
         return resolved_schema
 
+    @cached_property
+    def _compiled_validator(self):
+        """
+        AvdCompiledValidator compiled from the fully resolved schema.
+
+        The compiled validator is cached on the instance of AvdSchema.
+        For builtin schemas the compiled validator is shared by all instances of AvdSchema.
+        """
+        return self._get_compiled_validator(convert=False)
+
+    @cached_property
+    def _compiled_converter_validator(self):
+        """
+        AvdCompiledValidator compiled from the fully resolved schema with data conversion enabled.
+
+        The compiled validator is cached on the instance of AvdSchema.
+        For builtin schemas the compiled validator is shared by all instances of AvdSchema.
+        """
+        return self._get_compiled_validator(convert=True)
+
+    def _get_compiled_validator(self, convert: bool) -> AvdCompiledValidator:
+        """
+        Return AvdCompiledValidator for the loaded schema.
+
+        Builtin schemas are compiled once per process from the resolved schema in the schema cache, which is never modified.
+        """
+        try:
+            if self._schema_id is None or (resolved_schema := load_schema_cache()["resolved_schemas"].get(self._schema_id)) is None:
+                return AvdCompiledValidator(self.resolved_schema, convert=convert)
+
+            if (self._schema_id, convert) not in COMPILED_VALIDATORS:
+                COMPILED_VALIDATORS[(self._schema_id, convert)] = AvdCompiledValidator(resolved_schema, convert=convert)
+            return COMPILED_VALIDATORS[(self._schema_id, convert)]
+        except Exception as e:
+            raise AristaAvdError("An error occured during creation of the validator") from e
+
+    @cached_property
+    def primary_key_index(self) -> dict:
+        """
+        Index of all lists with a "primary_key" in the fully resolved schema.
+
+        Maps the datapath of the list as a tuple of keys to the primary_key. The datapath follows the same rules as subschema(),
+        so the items of a list are addressed without any index.
+
+        Example
+        -------
+        Schema:
+        a:
+          type: dict
+          keys:
+            b:
+              type: list
+              primary_key: c
+              items:
+                type: dict
+                keys:
+                  c:
+                    type: str
+
+        primary_key_index
+        >> {("a", "b"): "c"}
+
+        The index is cached on the instance of AvdSchema.
+        For builtin schemas the index is copied from the schema cache shared by all instances of AvdSchema.
+        """
+        if self._schema_id is not None and (primary_key_index := load_schema_cache()["primary_key_indexes"].get(self._schema_id)) is not None:
+            return dict(primary_key_index)
+
+        return get_primary_key_index(self.resolved_schema)
+
     def _error_handler(self, error: Exception):
         if isinstance(error, AristaAvdError):
             return error
@@ -5,7 +5,7 @@ from typing import Generator
 from ansible.errors import AnsibleActionFail
 from ansible.utils.display import Display
 
-from ansible_collections.arista.avd.plugins.plugin_utils.errors.errors import AvdDeprecationWarning
+from ansible_collections.arista.avd.plugins.plugin_utils.errors.errors import AvdConversionWarning, AvdDeprecationWarning
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschema import AristaAvdError, AvdSchema
 
 VALID_CONVERSION_MODES = ["disabled", "error", "warning", "info", "debug", "quiet"]
@@ -115,13 +115,21 @@ class AvdSchemaTools:
         """
         result = {}
 
-        # Perform data conversions
-        conversions = self.convert_data(data)
+        if self.conversion_mode == "disabled" or self.validation_mode == "disabled":
+            # Perform data conversions
+            conversions = self.convert_data(data)
+
+            # Perform validation
+            validation_errors = self.validate_data(data)
+        else:
+            # Perform data conversions and validation in a single pass over the data.
+            # avd_schema.convert_and_validate returns a generator, which we iterate through in handle_exceptions to perform the actual work.
+            exceptions = self.avdschema.convert_and_validate(data)
+            conversions, validation_errors = self.handle_conversion_and_validation_exceptions(exceptions)
+
         if conversions and self.conversion_mode == "error":
             result["failed"] = True
 
-        # Perform validation
-        validation_errors = self.validate_data(data)
         if validation_errors and self.validation_mode == "error":
             result["failed"] = True
 
@@ -145,37 +153,66 @@ class AvdSchemaTools:
         """
         counter = 0
         for exception in exceptions:
-            if not isinstance(exception, AristaAvdError):
-                continue
-
-            if isinstance(exception, AvdDeprecationWarning):
-                # Deprecation warnings are not subject to "conversion_mode".
-                # Instead we display using Ansible's deprecation notices.
-                message = f"[{self.hostname}]: {exception}"
-                self.ansible_display.deprecated(
-                    msg=message,
-                    version=exception.version,
-                    date=exception.date,
-                    collection_name=self.plugin_name,
-                    removed=exception.removed,
-                )
-                continue
-
-            counter += 1
-            if mode == "quiet":
-                continue
-            message = f"[{self.hostname}]: {exception}"
-            if mode == "error":
-                self.ansible_display.error(message, False)
-            elif mode == "info":
-                self.ansible_display.display(message)
-            elif mode == "debug":
-                self.ansible_display.v(message)
-            else:
-                # mode == "warning"
-                self.ansible_display.warning(message, False)
+            counter += self.handle_validation_exception(exception, mode)
         return counter
 
+    def handle_conversion_and_validation_exceptions(self, exceptions: Generator) -> tuple[int, int]:
+        """
+        Iterate through the Generator of exceptions from the combined conversion and validation.
+
+        Conversion and deprecation warnings are displayed according to `conversion_mode`.
+        Everything else, including any error raised during validation, according to `validation_mode` like `validate_data`.
+
+        Returns:
+        - conversions: <int> the number of AvdConversionWarning in the exceptions Generator
+        - validation_errors: <int> the number of other AristaAvdError in the exceptions Generator
+        """
+        conversions = 0
+        validation_errors = 0
+        for exception in exceptions:
+            if isinstance(exception, (AvdConversionWarning, AvdDeprecationWarning)):
+                conversions += self.handle_validation_exception(exception, self.conversion_mode)
+            else:
+                validation_errors += self.handle_validation_exception(exception, self.validation_mode)
+        return conversions, validation_errors
+
+    def handle_validation_exception(self, exception: Exception, mode: str) -> int:
+        """
+        Displays one exception depending on the `mode` parameter
+
+        Returns:
+        - counter: <int> 1 if the exception is counted as an AristaAvdError, otherwise 0
+        """
+        if not isinstance(exception, AristaAvdError):
+            return 0
+
+        if isinstance(exception, AvdDeprecationWarning):
+            # Deprecation warnings are not subject to "conversion_mode".
+            # Instead we display using Ansible's deprecation notices.
+            message = f"[{self.hostname}]: {exception}"
+            self.ansible_display.deprecated(
+                msg=message,
+                version=exception.version,
+                date=exception.date,
+                collection_name=self.plugin_name,
+                removed=exception.removed,
+            )
+            return 0
+
+        if mode == "quiet":
+            return 1
+        message = f"[{self.hostname}]: {exception}"
+        if mode == "error":
+            self.ansible_display.error(message, False)
+        elif mode == "info":
+            self.ansible_display.display(message)
+        elif mode == "debug":
+            self.ansible_display.v(message)
+        else:
+            # mode == "warning"
+            self.ansible_display.warning(message, False)
+        return 1
+
     def validate_schema(self) -> int:
         """
         Validate the loaded schema according to the meta-schema
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+from copy import deepcopy
+from hashlib import sha256
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dump, load
+from tempfile import NamedTemporaryFile
+
+from yaml import safe_load
+
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschemaresolver import AvdSchemaResolver
+
+# Bump this whenever the content or format of the cache changes.
+SCHEMA_CACHE_VERSION = 1
+
+
+def get_primary_key_index(resolved_schema: dict) -> dict:
+    """
+    Build an index of all lists with a "primary_key" in the given fully resolved schema.
+
+    Maps the datapath of the list as a tuple of keys to the primary_key. The datapath follows the same rules as AvdSchema.subschema(),
+    so the items of a list are addressed without any index.
+    """
+    primary_key_index = {}
+
+    def recursive_function(path: tuple, schema: dict):
+        schema_type = schema.get("type")
+        if schema_type == "dict":
+            keys = schema.get("keys", {})
+            for key, childschema in keys.items():
+                recursive_function(path + (key,), childschema)
+            for key, childschema in schema.get("dynamic_keys", {}).items():
+                # Regular keys take precedence over dynamic keys with the same name. See AvdSchema.subschema().
+                if key not in keys:
+                    recursive_function(path + (key,), childschema)
+        elif schema_type == "list":
+            if "primary_key" in schema:
+                primary_key_index[path] = schema["primary_key"]
+            for key, childschema in schema.get("items", {}).get("keys", {}).items():
+                recursive_function(path + (key,), childschema)
+
+    recursive_function((), resolved_schema)
+    return primary_key_index
+
+
+def get_schema_cache_key(schema_files: dict, avd_version: str) -> str:
+    """
+    Return a key covering the cache format, the AVD version and the content of all schema files.
+    """
+    cache_key = sha256(f"{SCHEMA_CACHE_VERSION}-{avd_version}".encode("UTF-8"))
+    for schema_id, schema_file in sorted(schema_files.items()):
+        cache_key.update(schema_id.encode("UTF-8"))
+        cache_key.update(Path(schema_file).read_bytes())
+
+    return cache_key.hexdigest()
+
+
+def build_schema_cache(schema_files: dict, cache_key: str = None) -> dict:
+    """
+    Load all schemas from YAML/JSON and build the fully resolved schemas and derived indexes.
+
+    Only the primary_key index is stored as derived index. AvdSchema.subschema() walks the cached resolved schema directly,
+    and the compiled validators and data converters are trees of closures which cannot be pickled.
+    Those are compiled once per process from the cached resolved schema and shared by all instances of AvdSchema.
+
+    Parameters
+    ----------
+    schema_files : dict
+        Schema IDs mapped to the path of the schema file. Must contain "avd_meta_schema".
+    cache_key : str, optional
+        Cache key as returned by get_schema_cache_key. Stored in the cache to verify the cache when it is loaded again.
+
+    Returns
+    -------
+    dict
+        "cache_key": The given cache_key
+        "store": Schema IDs mapped to the schemas as loaded from the files
+        "resolved_schemas": Schema IDs mapped to the fully resolved schemas (where all $ref has been expanded recursively)
+        "primary_key_indexes": Schema IDs mapped to the primary_key index of the resolved schema
+    """
+    store = {}
+    for schema_id, schema_file in schema_files.items():
+        with open(schema_file, "r", encoding="UTF-8") as file:
+            store[schema_id] = safe_load(file.read())
+
+    resolved_schemas = {}
+    primary_key_indexes = {}
+    for schema_id, schema in store.items():
+        if schema_id == "avd_meta_schema":
+            continue
+
+        resolved_schema = deepcopy(schema)
+        resolve_errors = [error for error in AvdSchemaResolver(schema, store).iter_errors(resolved_schema) if isinstance(error, Exception)]
+        if resolve_errors:
+            # Leave it to AvdSchema to resolve the schema and raise the errors.
+            continue
+
+        resolved_schemas[schema_id] = resolved_schema
+        primary_key_indexes[schema_id] = get_primary_key_index(resolved_schema)
+
+    return {
+        "cache_key": cache_key,
+        "store": store,
+        "resolved_schemas": resolved_schemas,
+        "primary_key_indexes": primary_key_indexes,
+    }
+
+
+def read_schema_cache(cache_file: Path, cache_key: str = None) -> dict | None:
+    """
+    Read the schema cache from the given file.
+
+    Returns None if the file does not exist or cannot be read. If cache_key is given, None is also returned if the cache was built
+    with a different cache_key.
+    """
+    try:
+        with open(cache_file, "rb") as file:
+            schema_cache = load(file)
+    except Exception:
+        return None
+
+    if not isinstance(schema_cache, dict) or (cache_key is not None and schema_cache.get("cache_key") != cache_key):
+        return None
+
+    return schema_cache
+
+
+def write_schema_cache(cache_file: Path, schema_cache: dict) -> None:
+    """
+    Write the schema cache to the given file.
+
+    The cache is written to a temporary file which is then renamed, so concurrent readers never see a partial file.
+    """
+    cache_file = Path(cache_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile("wb", dir=cache_file.parent, prefix=f".{cache_file.name}.", delete=False) as file:
+        try:
+            dump(schema_cache, file, HIGHEST_PROTOCOL)
+        except Exception:
+            os.unlink(file.name)
+            raise
+
+    # NamedTemporaryFile is only readable by the owner.
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, cache_file)
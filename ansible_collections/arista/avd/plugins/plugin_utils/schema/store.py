@@ -1,16 +1,57 @@
+import os
 from functools import lru_cache
-
-from yaml import safe_load
+from pathlib import Path
 
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.default_schemas import DEFAULT_SCHEMAS
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.schema_cache import (
+    build_schema_cache,
+    get_schema_cache_key,
+    read_schema_cache,
+    write_schema_cache,
+)
+from ansible_collections.arista.avd.plugins.plugin_utils.utils.get_collection_version import get_collection_version
+
+
+def _get_schema_cache_dir() -> Path:
+    """
+    The schema cache is stored in the directory set in the environment variable "AVD_SCHEMA_CACHE_DIR".
+    Otherwise it is stored in "arista.avd/schemas" under the user cache directory.
+    """
+    if cache_dir := os.environ.get("AVD_SCHEMA_CACHE_DIR"):
+        return Path(cache_dir)
+
+    user_cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(user_cache_dir, "arista.avd", "schemas")
 
 
 @lru_cache
-def create_store():
-    store = {}
-    for id, schema_file in DEFAULT_SCHEMAS.items():
-        with open(schema_file, "r", encoding="UTF-8") as file:
-            schema_file_data = safe_load(file.read())
-            store[id] = schema_file_data
+def load_schema_cache() -> dict:
+    """
+    Load the builtin schemas, the fully resolved schemas and the derived indexes.
+
+    The result is cached on disk keyed on the AVD version and the content of the schema files,
+    so only the first process after a change of the schemas has to load the YAML files and resolve the schemas.
+    The on-disk cache can be disabled by setting the environment variable "AVD_DISABLE_SCHEMA_CACHE".
 
-    return store
+    The loaded cache is shared by all AvdSchema instances in this process, so it must not be modified.
+    """
+    if os.environ.get("AVD_DISABLE_SCHEMA_CACHE"):
+        return build_schema_cache(DEFAULT_SCHEMAS)
+
+    cache_key = get_schema_cache_key(DEFAULT_SCHEMAS, get_collection_version())
+    cache_file = _get_schema_cache_dir().joinpath(f"schemas-{cache_key}.pickle")
+    if (schema_cache := read_schema_cache(cache_file, cache_key)) is not None:
+        return schema_cache
+
+    schema_cache = build_schema_cache(DEFAULT_SCHEMAS, cache_key)
+    try:
+        write_schema_cache(cache_file, schema_cache)
+    except OSError:
+        # The cache is only an optimization, so we ignore any issues with writing the file.
+        pass
+
+    return schema_cache
+
+
+def create_store():
+    return load_schema_cache()["store"]
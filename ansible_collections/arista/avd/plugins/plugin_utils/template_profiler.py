@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import wraps
+from json import dump as json_dump
+from os import path
+from time import perf_counter
+
+# Only filters and tests with this prefix are profiled, since the builtin Jinja2 filters are too cheap to be worth the overhead.
+PROFILED_PLUGIN_PREFIX = "arista.avd."
+
+
+class TemplateProfiler:
+    """
+    Records the wall time spent in each template, include and custom filter/test call while rendering templates for one device.
+
+    Time is recorded per stack of frames like "eos-intended-config.j2;eos/router-bgp.j2;filter:arista.avd.natural_sort",
+    with separate "load:<template>" frames for loading included templates. The result can be exported in the "folded stacks" format
+    supported by flamegraph tools like flamegraph.pl, inferno or speedscope.
+
+    Since templates are rendered as generators, only the time spent inside the template code is recorded.
+    Time spent by the consumer of the output, like writing to a file, is not included.
+    """
+
+    def __init__(self):
+        # Each entry in the stack is a list of [name, start time, time spent in child frames].
+        self._stack: list[list] = []
+        # <stack tuple>: [calls, seconds including child frames, seconds excluding child frames]
+        self._stacks: dict[tuple, list] = {}
+
+    def _enter(self, name: str) -> None:
+        self._stack.append([name, perf_counter(), 0.0])
+
+    def _exit(self, count_call: bool = False) -> None:
+        name, start, child_seconds = self._stack.pop()
+        seconds = perf_counter() - start
+        stack = tuple(frame[0] for frame in self._stack) + (name,)
+        timing = self._stacks.setdefault(stack, [0, 0.0, 0.0])
+        timing[0] += count_call
+        timing[1] += seconds
+        timing[2] += seconds - child_seconds
+        if self._stack:
+            self._stack[-1][2] += seconds
+
+    @contextmanager
+    def frame(self, name: str, count_call: bool = True):
+        """
+        Context manager recording the enclosed code as one call of the frame 'name'.
+
+        With count_call=False the time is added to the frame without counting a call.
+        """
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit(count_call=count_call)
+
+    def profile_generator(self, name: str, iterable):
+        """
+        Wrap the iterable in a generator recording the time spent producing each item as one call of the frame 'name'.
+        """
+        iterator = iter(iterable)
+        count_call = True
+        while True:
+            self._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit(count_call=count_call)
+                count_call = False
+            yield item
+
+    def profile_function(self, name: str, function):
+        """
+        Wrap the function recording each call as one call of the frame 'name'.
+
+        The attributes of the function are copied by 'wraps', so Jinja2 decorators like 'pass_context' keep working.
+        """
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.frame(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    @contextmanager
+    def install(self, environment):
+        """
+        Context manager profiling all includes and custom filters/tests of templates rendered with the given Jinja2 environment.
+
+        Included templates are loaded with 'environment.get_template', so the method is overridden on the instance to return a
+        proxy of the template which profiles the render function. Filters and tests are looked up in 'environment.filters'
+        and 'environment.tests' when the template is rendered, so the mappings are replaced with profiling proxies.
+        The original attributes are restored when the context exits.
+        """
+        original_filters = environment.filters
+        original_tests = environment.tests
+        get_template = environment.get_template
+
+        @wraps(get_template)
+        def profiled_get_template(name, *args, **kwargs):
+            # Loading is recorded separately, since a template is compiled or imported the first time it is loaded in the environment.
+            with self.frame(f"load:{name}"):
+                template = get_template(name, *args, **kwargs)
+            return _ProfiledTemplate(template, self)
+
+        environment.get_template = profiled_get_template
+        environment.filters = _ProfiledPlugins(original_filters, self, "filter")
+        environment.tests = _ProfiledPlugins(original_tests, self, "test")
+        try:
+            yield
+        finally:
+            del environment.get_template
+            environment.filters = original_filters
+            environment.tests = original_tests
+
+    def to_dict(self) -> dict:
+        """
+        Export the profile as plain data which can be dumped to JSON.
+
+        Returns
+        -------
+        dict
+            sections : dict
+                <name> : dict
+                    calls : int
+                    seconds : float
+                        Time spent in the template or filter including child frames.
+                    self_seconds : float
+                        Time spent in the template or filter excluding child frames.
+                Names are sorted by seconds in descending order.
+            stacks : dict
+                <folded stack> : float
+                    Seconds spent in the last frame of the stack excluding child frames.
+        """
+        sections = {}
+        for stack, (calls, seconds, self_seconds) in self._stacks.items():
+            name = stack[-1]
+            section = sections.setdefault(name, {"calls": 0, "seconds": 0.0, "self_seconds": 0.0})
+            section["calls"] += calls
+            section["self_seconds"] += self_seconds
+            # Recursive frames are already included in the time of the outer frame.
+            if name not in stack[:-1]:
+                section["seconds"] += seconds
+
+        return {
+            "sections": dict(sorted(sections.items(), key=lambda item: item[1]["seconds"], reverse=True)),
+            "stacks": {";".join(stack): self_seconds for stack, (calls, seconds, self_seconds) in self._stacks.items()},
+        }
+
+
+class _ProfiledTemplate:
+    """
+    Proxy of a Jinja2 Template profiling the render function used by "include".
+    """
+
+    def __init__(self, template, profiler: TemplateProfiler):
+        self._template = template
+        self._profiler = profiler
+
+    def new_context(self, *args, **kwargs):
+        # The variables of the including template are copied into the new context, which is part of the cost of the include.
+        with self._profiler.frame(self._template.name, count_call=False):
+            return self._template.new_context(*args, **kwargs)
+
+    def root_render_func(self, context):
+        return self._profiler.profile_generator(self._template.name, self._template.root_render_func(context))
+
+    def __getattr__(self, name: str):
+        return getattr(self._template, name)
+
+
+class _ProfiledPlugins(Mapping):
+    """
+    Proxy of the Jinja2 'filters' or 'tests' mapping returning profiled functions for the custom AVD plugins.
+    """
+
+    def __init__(self, plugins: Mapping, profiler: TemplateProfiler, plugin_type: str):
+        self._plugins = plugins
+        self._profiler = profiler
+        self._plugin_type = plugin_type
+        self._profiled_plugins = {}
+
+    def __getitem__(self, name: str):
+        if not name.startswith(PROFILED_PLUGIN_PREFIX):
+            return self._plugins[name]
+
+        if name not in self._profiled_plugins:
+            self._profiled_plugins[name] = self._profiler.profile_function(f"{self._plugin_type}:{name}", self._plugins[name])
+
+        return self._profiled_plugins[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._plugins
+
+    def __iter__(self):
+        return iter(self._plugins)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+
+def aggregate_template_profiles(device_template_profiles: dict[str, dict]) -> dict:
+    """
+    Aggregate the template profiles of all devices in the fabric.
+
+    Parameters
+    ----------
+    device_template_profiles : dict
+        <hostname> : dict
+            Profile as returned by TemplateProfiler.to_dict()
+
+    Returns
+    -------
+    dict
+        devices : int
+            Number of devices.
+        sections : dict
+            <name> : dict
+                calls : int
+                seconds : float
+                self_seconds : float
+                    Sums across all devices.
+                max_seconds : float
+                    Highest number of seconds for one device.
+                max_device : str
+                    Device with the highest number of seconds.
+            Names are sorted by the sum of seconds in descending order.
+        stacks : dict
+            <folded stack> : float
+                Sum of seconds across all devices.
+    """
+    sections = {}
+    stacks = {}
+    for hostname, template_profile in device_template_profiles.items():
+        for name, section in template_profile["sections"].items():
+            aggregated_section = sections.setdefault(name, {"calls": 0, "seconds": 0.0, "self_seconds": 0.0, "max_seconds": 0.0, "max_device": None})
+            aggregated_section["calls"] += section["calls"]
+            aggregated_section["seconds"] += section["seconds"]
+            aggregated_section["self_seconds"] += section["self_seconds"]
+            if aggregated_section["max_device"] is None or section["seconds"] > aggregated_section["max_seconds"]:
+                aggregated_section["max_seconds"] = section["seconds"]
+                aggregated_section["max_device"] = hostname
+
+        for stack, seconds in template_profile["stacks"].items():
+            stacks[stack] = stacks.get(stack, 0.0) + seconds
+
+    return {
+        "devices": len(device_template_profiles),
+        "sections": dict(sorted(sections.items(), key=lambda item: item[1]["seconds"], reverse=True)),
+        "stacks": stacks,
+    }
+
+
+def format_folded_stacks(template_profile: dict) -> str:
+    """
+    Format the stacks of a template profile in the "folded stacks" format read by flamegraph tools.
+
+    Each line holds the frames separated by ";" and the number of microseconds spent in the last frame.
+
+    Parameters
+    ----------
+    template_profile : dict
+        Profile as returned by TemplateProfiler.to_dict() or aggregate_template_profiles()
+
+    Returns
+    -------
+    str
+        One line per stack, sorted by stack.
+    """
+    lines = []
+    for stack, seconds in sorted(template_profile["stacks"].items()):
+        if (microseconds := round(seconds * 1_000_000)) > 0:
+            lines.append(f"{stack} {microseconds}\n")
+
+    return "".join(lines)
+
+
+def write_template_profile_files(filename: str, template_profile: dict) -> None:
+    """
+    Write the template profile to a JSON file and the stacks to a ".folded" file next to it.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the JSON file. The extension is replaced with ".folded" for the folded stacks file.
+    template_profile : dict
+        Profile as returned by TemplateProfiler.to_dict() or aggregate_template_profiles()
+    """
+    with open(filename, "w", encoding="UTF-8") as file:
+        json_dump(template_profile, file, indent=2)
+
+    with open(f"{path.splitext(filename)[0]}.folded", "w", encoding="UTF-8") as file:
+        file.write(format_folded_stacks(template_profile))
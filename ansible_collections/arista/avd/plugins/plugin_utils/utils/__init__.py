@@ -1,31 +1,49 @@
 from .append_if_not_duplicate import append_if_not_duplicate
 from .compare_dicts import compare_dicts
 from .compile_searchpath import compile_searchpath
+from .data_file import dump_data, get_data_format, load_data, read_data_file
 from .default import default
 from .get import get
 from .get_all import get_all
+from .get_collection_version import get_collection_version
 from .get_item import get_item
 from .get_templar import get_templar
 from .groupby import groupby
+from .indexed_list import IndexedList
 from .load_python_class import load_python_class
+from .regex_matcher import RegexMatcher, get_regex_matcher
 from .replace_or_append_item import replace_or_append_item
-from .template import template
+from .stream_to_file import is_octal_mode, stream_to_file
+from .template import template, template_generator
+from .template_cache import get_template_bytecode_cache
 from .template_var import template_var
 from .unique import unique
 
 __all__ = [
+    "IndexedList",
+    "RegexMatcher",
     "append_if_not_duplicate",
     "compare_dicts",
     "compile_searchpath",
     "default",
+    "dump_data",
     "get",
     "get_all",
+    "get_collection_version",
+    "get_data_format",
     "get_item",
+    "get_regex_matcher",
     "get_templar",
+    "get_template_bytecode_cache",
     "groupby",
+    "is_octal_mode",
+    "load_data",
     "load_python_class",
+    "read_data_file",
     "replace_or_append_item",
+    "stream_to_file",
     "template",
+    "template_generator",
     "template_var",
     "unique",
 ]
@@ -19,11 +19,13 @@ def append_if_not_duplicate(
     """
     Append new_dict to list_of_dicts if there is not already an item with the same primary key in list_of_dicts.
 
+    Use an IndexedList for list_of_dicts when appending many items, so the duplicate lookup does not loop over the list.
+
     Raise AristaAvdDuplicateDataError with relevant context and context_keys extracted from new_dict and existing duplicate.
 
     Parameters
     ----------
-    list_of_dicts : list(dict)
+    list_of_dicts : list(dict) | IndexedList
         List of Dictionaries to look for duplicate item.
     primary_key : str
         Dictionary Key to match on.
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from json import JSONDecodeError, JSONEncoder
+from json import dumps as json_dumps
+from json import loads as json_loads
+from os import path
+
+from yaml import dump as yaml_dump
+from yaml import load as yaml_load
+
+try:
+    # Use the libyaml bindings if available, since they are many times faster than the pure Python implementation.
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    # Ansible is only available when running as Ansible collection. Vaulted values can only be found in the data when running in Ansible.
+    from ansible.module_utils.common.json import AnsibleJSONEncoder as DataJSONEncoder
+    from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
+
+    HAS_ANSIBLE = True
+except ImportError:
+    DataJSONEncoder = JSONEncoder
+    HAS_ANSIBLE = False
+
+DATA_FORMATS = {
+    ".json": "json",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+}
+
+
+class AvdDumper(SafeDumper):
+    """
+    YAML dumper used for all AVD data files like structured configs and facts.
+
+    Aliases are never used, so the YAML output holds the same data as the JSON output.
+    Subclasses of str, bytes, dict and list like Ansible's "AnsibleUnsafeText" are represented like the builtin types.
+    Ansible vaulted values are represented with the "!vault" tag like Ansible's "AnsibleDumper" does.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+# str.__str__ is used since some subclasses like "AnsibleUnsafeText" return themselves from str(), which the libyaml emitter rejects.
+AvdDumper.add_multi_representer(str, lambda dumper, data: dumper.represent_str(str.__str__(data)))
+AvdDumper.add_multi_representer(dict, lambda dumper, data: dumper.represent_dict(data))
+AvdDumper.add_multi_representer(list, lambda dumper, data: dumper.represent_list(data))
+AvdDumper.add_multi_representer(bytes, lambda dumper, data: dumper.represent_binary(bytes(data)))
+if HAS_ANSIBLE:
+    AvdDumper.add_representer(AnsibleVaultEncryptedUnicode, lambda dumper, data: dumper.represent_scalar("!vault", data._ciphertext.decode(), style="|"))
+
+
+def get_data_format(filename: str) -> str | None:
+    """
+    Return the data format "json" or "yaml" based on the file extension or None for unknown extensions.
+    """
+    return DATA_FORMATS.get(path.splitext(filename)[1].lower())
+
+
+def load_data(data: str, data_format: str | None = None):
+    """
+    Parse JSON or YAML data.
+
+    Parameters
+    ----------
+    data : str
+        JSON or YAML formatted string.
+    data_format : str, optional
+        "json" or "yaml". If not set, the data is first parsed as JSON and then as YAML.
+
+    Returns
+    -------
+    any
+        The parsed data.
+    """
+    if data_format == "json":
+        return json_loads(data)
+
+    if data_format is None:
+        # JSON is a subset of YAML and much faster to parse, so it is tried first.
+        try:
+            return json_loads(data)
+        except JSONDecodeError:
+            pass
+
+    return yaml_load(data, Loader=SafeLoader)
+
+
+def read_data_file(filename: str):
+    """
+    Read and parse a JSON or YAML file. The parser is selected by the file extension.
+
+    Files with unknown extensions like "/dev/stdin" are first parsed as JSON and then as YAML.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the file.
+
+    Returns
+    -------
+    any
+        The parsed data.
+    """
+    with open(filename, "r", encoding="UTF-8") as file:
+        return load_data(file.read(), get_data_format(filename))
+
+
+def dump_data(data, data_format: str = "yaml") -> str:
+    """
+    Format data as JSON or YAML.
+
+    The key order is kept for both formats, and both formats hold the same data when parsed again.
+    When running in Ansible, vaulted values are kept encrypted like Ansible does, using the "!vault" tag for YAML
+    and the "__ansible_vault" key for JSON.
+
+    Parameters
+    ----------
+    data : any
+        Data to format.
+    data_format : str
+        "json" or "yaml".
+
+    Returns
+    -------
+    str
+        The formatted data.
+    """
+    if data_format == "json":
+        return json_dumps(data, indent=2, cls=DataJSONEncoder) + "\n"
+
+    return yaml_dump(data, Dumper=AvdDumper, indent=2, sort_keys=False, width=130)
@@ -0,0 +1,20 @@
+from functools import lru_cache
+from json import load as json_load
+from pathlib import Path
+
+from yaml import safe_load
+
+collection_dir = Path(__file__).parents[3]
+
+
+@lru_cache
+def get_collection_version() -> str:
+    """
+    Returns the version of the arista.avd collection based on either galaxy.yml or MANIFEST.json
+    """
+    try:
+        with open(collection_dir.joinpath("galaxy.yml"), "r", encoding="UTF-8") as file:
+            return str(safe_load(file)["version"])
+    except FileNotFoundError:
+        with open(collection_dir.joinpath("MANIFEST.json"), "r", encoding="UTF-8") as file:
+            return str(json_load(file)["collection_info"]["version"])
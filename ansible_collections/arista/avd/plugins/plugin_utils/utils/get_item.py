@@ -1,5 +1,7 @@
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdMissingVariableError
 
+from .indexed_list import IndexedList
+
 
 def get_item(list_of_dicts: list, key, value, default=None, required=False, case_sensitive=False, var_name=None):
     """
@@ -9,6 +11,8 @@ def get_item(list_of_dicts: list, key, value, default=None, required=False, case
 
     Will return the first matching item if there are multiple matching items.
 
+    If list_of_dicts is an IndexedList, the item is found using the index instead of looping over the list.
+
     Parameters
     ----------
     list_of_dicts : list(dict)
@@ -45,14 +49,19 @@ def get_item(list_of_dicts: list, key, value, default=None, required=False, case
             raise AristaAvdMissingVariableError(var_name)
         return default
 
-    for list_item in list_of_dicts:
-        if not isinstance(list_item, dict):
-            # List item is not a dict as required. Skip this item
-            continue
-        if list_item.get(key) == value:
-            # Match. Return this item
+    if isinstance(list_of_dicts, IndexedList):
+        if (list_item := list_of_dicts.get_indexed_item(key, value)) is not None:
             return list_item
 
+    else:
+        for list_item in list_of_dicts:
+            if not isinstance(list_item, dict):
+                # List item is not a dict as required. Skip this item
+                continue
+            if list_item.get(key) == value:
+                # Match. Return this item
+                return list_item
+
     # No Match
     if required is True:
         raise AristaAvdMissingVariableError(var_name)
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from ansible.template import Templar
 
 from .compile_searchpath import compile_searchpath
+from .template_cache import get_template_bytecode_cache
 
 
 def get_templar(action_plugin_instance: ActionBase, task_vars: dict) -> Templar:
@@ -15,7 +16,9 @@ def get_templar(action_plugin_instance: ActionBase, task_vars: dict) -> Templar:
     "._templar" from the given action_plugin_instance.
     The new instance is loaded with new searchpath based on
     ".ansible_search_path" from the given task_vars.
+    The new environment uses the persistent bytecode cache, so included templates are only compiled once across all hosts.
     """
     return action_plugin_instance._templar.copy_with_new_env(
         searchpath=compile_searchpath(task_vars.get("ansible_search_path", [])),
+        bytecode_cache=get_template_bytecode_cache(),
     )
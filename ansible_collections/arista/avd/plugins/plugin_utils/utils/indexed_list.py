@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+
+class IndexedList(list):
+    """
+    List of dictionaries with a lookup index per key, so finding an item by key and value does not scan the list.
+
+    Used with "append_if_not_duplicate" and "get_item", which would otherwise loop over the full list for every lookup,
+    making it O(N²) to build a list of N items.
+
+    The index for a key is built on the first lookup with that key and kept in sync by "append" and "extend".
+    Any other modification of the list drops all indexes, so they are rebuilt on the next lookup.
+    The value of an indexed key must not be changed on an item after it was added to the list.
+
+    IndexedList is a subclass of list, but it cannot be dumped as YAML. Use "list()" to get a plain list for the structured config.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._indexes: dict[str, dict] = {}
+
+    def get_indexed_item(self, key, value, default=None):
+        """
+        Return the first dictionary with the given key and value, or the default if there is no match.
+
+        Same as "get_item" but using the index for the key.
+        """
+        if not isinstance(value, Hashable):
+            return next((item for item in self if isinstance(item, dict) and item.get(key) == value), default)
+
+        if key not in self._indexes:
+            self._indexes[key] = {}
+            self._add_to_indexes(self, [key])
+
+        return self._indexes[key].get(value, default)
+
+    def _add_to_indexes(self, items, keys) -> None:
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for key in keys:
+                if isinstance(value := item.get(key), Hashable):
+                    # First match wins like with get_item.
+                    self._indexes[key].setdefault(value, item)
+
+    def _clear_indexes(self) -> None:
+        self._indexes.clear()
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._add_to_indexes([item], self._indexes)
+
+    def extend(self, items) -> None:
+        items = list(items)
+        super().extend(items)
+        self._add_to_indexes(items, self._indexes)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._clear_indexes()
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._clear_indexes()
+
+    def pop(self, *args):
+        self._clear_indexes()
+        return super().pop(*args)
+
+    def clear(self) -> None:
+        super().clear()
+        self._clear_indexes()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        # Sorting changes which duplicate comes first.
+        self._clear_indexes()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._clear_indexes()
+
+    def __setitem__(self, index, item) -> None:
+        super().__setitem__(index, item)
+        self._clear_indexes()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._clear_indexes()
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._clear_indexes()
+        return self
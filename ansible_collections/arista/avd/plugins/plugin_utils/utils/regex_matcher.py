@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+# Characters with a special meaning in a regex. A literal prefix ends at the first of these.
+REGEX_SPECIAL_CHARACTERS = frozenset("\\.^$*+?{}[]()|")
+
+# Quantifiers allowing zero occurrences of the previous character, which is then not part of the literal prefix.
+REGEX_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+
+def _get_literal_prefix(regex: str) -> str:
+    """
+    Return the literal characters at the start of the regex, which any matching value must start with.
+
+    Returns an empty string for regexes with alternations or inline flags, which can match values not starting with the literal characters.
+    """
+    if "|" in regex or "(?" in regex:
+        return ""
+
+    prefix = []
+    for character in regex:
+        if character in REGEX_SPECIAL_CHARACTERS:
+            if character in REGEX_OPTIONAL_QUANTIFIERS and prefix:
+                prefix.pop()
+            break
+        prefix.append(character)
+
+    return "".join(prefix)
+
+
+class RegexMatcher:
+    """
+    Match a value against many regexes at once, like matching a hostname against the "switches" of all "network_ports".
+
+    Each regex must match the full value, so it is wrapped in ^$ like "re.match(rf"^{regex}$", value)" or "re.search(rf"^{regex}$", value)".
+    Regexes are compiled once, and duplicate regexes are only tested once. Regexes are grouped by their literal prefix,
+    so only the regexes with a literal prefix matching the start of the value are tested.
+
+    Parameters
+    ----------
+    regexes : list[str] | tuple[str]
+        Regexes to match.
+    search : bool, default=False
+        Use "re.search" instead of "re.match". This only changes the result for regexes with alternations.
+    """
+
+    def __init__(self, regexes: list[str] | tuple[str], search: bool = False):
+        regex_indexes = {}
+        for index, regex in enumerate(regexes):
+            regex_indexes.setdefault(str(regex), []).append(index)
+
+        self._buckets: dict[str, list[tuple[re.Pattern, list[int]]]] = {}
+        for regex, indexes in regex_indexes.items():
+            self._buckets.setdefault(_get_literal_prefix(regex), []).append((re.compile(rf"^{regex}$"), indexes))
+
+        self._search = search
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._buckets})
+
+    def match(self, value: str) -> list[int]:
+        """
+        Return the sorted indexes of all the regexes matching the value.
+        """
+        matches = []
+        for prefix_length in self._prefix_lengths:
+            if prefix_length > len(value):
+                break
+
+            for pattern, indexes in self._buckets.get(value[:prefix_length], []):
+                if (pattern.search(value) if self._search else pattern.match(value)) is not None:
+                    matches.extend(indexes)
+
+        return sorted(matches)
+
+
+@lru_cache
+def get_regex_matcher(regexes: tuple[str], search: bool = False) -> RegexMatcher:
+    """
+    Return a cached RegexMatcher for the given regexes. See "RegexMatcher".
+    """
+    return RegexMatcher(regexes, search)
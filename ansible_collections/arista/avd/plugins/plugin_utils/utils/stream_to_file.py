@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+from hashlib import sha1
+from tempfile import mkstemp
+from typing import Iterable
+
+# Same block size as used by Ansible when calculating checksums of files.
+READ_BLOCK_SIZE = 64 * 1024
+
+
+def stream_to_file(chunks: Iterable[str], dest: str, mode: int | str | None = None, check_mode: bool = False) -> dict:
+    """
+    Write the given chunks of text to the file 'dest' without holding the full content in memory.
+
+    The chunks are written to a temporary file next to 'dest', which is atomically renamed into place once all chunks are written.
+    The SHA1 checksum of the content is calculated while writing, so the "changed" state is known without reading the new file again.
+    If the content is unchanged, the temporary file is removed and 'dest' is left untouched.
+
+    Parameters
+    ----------
+    chunks : iterable of str
+        Text to write. Typically the generator returned by Jinja2 'Template.generate()'.
+    dest : str
+        Path of the destination file. The directory must exist.
+    mode : int | str, optional
+        File mode like 0o664 or "0664". If not set, the mode of an existing file is kept and new files get the default mode.
+    check_mode : bool, default=False
+        Only calculate the checksum and "changed" state, but do not write the file.
+
+    Returns
+    -------
+    dict
+        Result with the keys "changed", "dest" and "checksum" similar to the result of the Ansible "copy" module.
+    """
+    if isinstance(mode, str):
+        mode = int(mode, 8)
+
+    dest_checksum = _get_file_checksum(dest)
+    checksum = sha1()
+
+    if check_mode:
+        for chunk in chunks:
+            checksum.update(chunk.encode("UTF-8"))
+        return {"changed": checksum.hexdigest() != dest_checksum, "dest": dest, "checksum": checksum.hexdigest()}
+
+    dest_dir, dest_name = os.path.split(os.path.abspath(dest))
+    fd, tmp_path = mkstemp(dir=dest_dir, prefix=f".{dest_name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            for chunk in chunks:
+                encoded_chunk = chunk.encode("UTF-8")
+                checksum.update(encoded_chunk)
+                tmp_file.write(encoded_chunk)
+
+        changed = checksum.hexdigest() != dest_checksum
+        if changed:
+            os.chmod(tmp_path, _get_new_file_mode(dest, mode))
+            os.replace(tmp_path, dest)
+        else:
+            os.remove(tmp_path)
+            if mode is not None and os.stat(dest).st_mode & 0o7777 != mode:
+                os.chmod(dest, mode)
+                changed = True
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return {"changed": changed, "dest": dest, "checksum": checksum.hexdigest()}
+
+
+def is_octal_mode(mode: int | str | None) -> bool:
+    """
+    Return True if the mode can be applied by 'stream_to_file', meaning it is unset, an int or an octal string like "0664".
+
+    Symbolic modes like "u=rw,g=r,o=r" or "preserve" are only supported by the Ansible "copy" action.
+    """
+    if mode is None or (isinstance(mode, int) and not isinstance(mode, bool)):
+        return True
+    if not isinstance(mode, str):
+        return False
+    try:
+        int(mode, 8)
+    except ValueError:
+        return False
+    return True
+
+
+def _get_file_checksum(path: str) -> str | None:
+    """
+    Return the SHA1 checksum of the file or None if the file does not exist.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    checksum = sha1()
+    with open(path, "rb") as file:
+        while block := file.read(READ_BLOCK_SIZE):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+def _get_new_file_mode(dest: str, mode: int | None) -> int:
+    """
+    Return the mode for the new file. Keep the mode of an existing file or use the default mode for new files based on umask.
+    """
+    if mode is not None:
+        return mode
+    if os.path.isfile(dest):
+        return os.stat(dest).st_mode & 0o7777
+
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
@@ -1,4 +1,5 @@
 from ansible.module_utils._text import to_text
+from jinja2.exceptions import UndefinedError
 
 
 def template(template_file, template_vars, templar):
@@ -28,13 +29,87 @@ def template(template_file, template_vars, templar):
         The rendered template
     """
 
-    dataloader = templar._loader
-    searchpath = templar.environment.loader.searchpath
-    template_file_path = dataloader.path_dwim_relative_stack(searchpath, "templates", template_file)
-    j2template, dummy = dataloader._get_file_contents(template_file_path)
-    j2template = to_text(j2template)
+    j2template = _get_template_source(template_file, templar)
 
     with templar.set_temporary_context(available_variables=template_vars):
         result = templar.template(j2template, convert_data=False, escape_backslashes=False)
 
     return result
+
+
+def template_generator(template_file, template_vars, templar):
+    """
+    Run Ansible Templar with template file and yield the rendered output in chunks.
+
+    Same as "template" but using the render function of the Jinja2 template directly like Jinja2 'Template.generate()',
+    so the output can be written to a file without building the full string in memory.
+
+    This function does not support the following Ansible features in addition to the ones listed for "template":
+    - No Jinja2 overrides in the first line of the template ("#jinja2:...").
+
+    Parameters
+    ----------
+    template_file : str
+        Path to Jinja2 template file
+    template_vars : any
+        Variables to use when rendering template
+    templar : func
+        Instance of Ansible Templar class
+
+    Yields
+    ------
+    str
+        Chunks of the rendered template
+    """
+
+    # Imported here since importing ansible.template initializes the Ansible plugin loaders.
+    from ansible.errors import AnsibleUndefinedVariable
+    from ansible.template.vars import AnsibleJ2Vars
+
+    try:
+        from ansible.template.native_helpers import ansible_concat
+    except ImportError:
+        # Not available in older versions of Ansible, where the default concat function of the environment is used instead.
+        ansible_concat = None
+
+    j2template = _get_template_source(template_file, templar)
+    environment = templar.environment
+
+    with templar.set_temporary_context(available_variables=template_vars):
+        compiled_template = environment.from_string(j2template)
+        jvars = AnsibleJ2Vars(templar, compiled_template.globals)
+
+        # Same handling of the concat function and context as in Ansible's Templar.do_template with convert_data=False.
+        cached_context = templar.cur_context
+        cached_concat = environment.concat
+        if ansible_concat is not None and not templar.jinja2_native:
+            environment.concat = ansible_concat
+        templar.cur_context = compiled_template.new_context(jvars, shared=True)
+
+        # Counting the newlines at the end of the output, to preserve the trailing newlines of the template like Ansible.
+        output_newlines = 0
+        try:
+            for chunk in compiled_template.root_render_func(templar.cur_context):
+                chunk = to_text(chunk)
+                if not chunk:
+                    continue
+                stripped_chunk = chunk.rstrip("\n")
+                output_newlines = len(chunk) - len(stripped_chunk) if stripped_chunk else output_newlines + len(chunk)
+                yield chunk
+        except UndefinedError as e:
+            raise AnsibleUndefinedVariable(e, orig_exc=e)
+        finally:
+            templar.cur_context = cached_context
+            environment.concat = cached_concat
+
+    template_newlines = len(j2template) - len(j2template.rstrip("\n"))
+    if template_newlines > output_newlines:
+        yield environment.newline_sequence * (template_newlines - output_newlines)
+
+
+def _get_template_source(template_file, templar):
+    dataloader = templar._loader
+    searchpath = templar.environment.loader.searchpath
+    template_file_path = dataloader.path_dwim_relative_stack(searchpath, "templates", template_file)
+    j2template, dummy = dataloader._get_file_contents(template_file_path)
+    return to_text(j2template)
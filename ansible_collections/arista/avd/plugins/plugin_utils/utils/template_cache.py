@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+
+from jinja2 import __version__ as jinja2_version
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+
+from .get_collection_version import get_collection_version
+
+# Bump this whenever the format of the cache key changes.
+TEMPLATE_CACHE_VERSION = 2
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Persistent cache of compiled Jinja2 templates shared by all processes and by Ansible and pyavd.
+
+    Jinja2 only keys the cached bytecode on the template name and verifies the template source on load.
+    Here the key also covers the template source and the environment options affecting the generated code,
+    since the same templates are compiled differently by Ansible's native environment and by the plain pyavd environment.
+    The key also covers the AVD version, since the generated code depends on how the filters and tests are called
+    (like "pass_context"), which can change with AVD even if the template does not.
+    Changing a template simply leads to a new key, so stale entries are never loaded.
+    """
+
+    def get_bucket(self, environment, name: str, filename: str | None, source: str) -> Bucket:
+        cache_key = sha256(f"{TEMPLATE_CACHE_VERSION}-{jinja2_version}-{get_collection_version()}-{_get_environment_signature(environment)}".encode("UTF-8"))
+        cache_key.update(f"{name}|{filename}".encode("UTF-8"))
+        cache_key.update(source.encode("UTF-8"))
+
+        bucket = Bucket(environment, cache_key.hexdigest(), self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            # The cache is only an optimization, so we ignore any issues with writing the file.
+            pass
+
+
+def _get_environment_signature(environment) -> str:
+    """
+    Return a string covering the environment options used when generating code from a template.
+    """
+    finalize = getattr(environment, "finalize", None)
+    autoescape = environment.autoescape
+    return repr(
+        (
+            f"{type(environment).__module__}.{type(environment).__qualname__}",
+            f"{environment.code_generator_class.__module__}.{environment.code_generator_class.__qualname__}",
+            environment.block_start_string,
+            environment.block_end_string,
+            environment.variable_start_string,
+            environment.variable_end_string,
+            environment.comment_start_string,
+            environment.comment_end_string,
+            environment.line_statement_prefix,
+            environment.line_comment_prefix,
+            environment.trim_blocks,
+            environment.lstrip_blocks,
+            environment.newline_sequence,
+            environment.keep_trailing_newline,
+            sorted(environment.extensions),
+            environment.optimized,
+            environment.is_async,
+            autoescape if isinstance(autoescape, bool) else getattr(autoescape, "__qualname__", repr(autoescape)),
+            None if finalize is None else getattr(finalize, "__qualname__", repr(finalize)),
+        )
+    )
+
+
+def _get_template_cache_dir() -> Path:
+    """
+    The template cache is stored in the directory set in the environment variable "AVD_TEMPLATE_CACHE_DIR".
+    Otherwise it is stored in "arista.avd/templates" under the user cache directory.
+    """
+    if cache_dir := os.environ.get("AVD_TEMPLATE_CACHE_DIR"):
+        return Path(cache_dir)
+
+    user_cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(user_cache_dir, "arista.avd", "templates")
+
+
+@lru_cache
+def get_template_bytecode_cache() -> TemplateBytecodeCache | None:
+    """
+    Return the bytecode cache to set as "bytecode_cache" on a Jinja2 environment rendering the AVD role templates.
+
+    With the cache, templates loaded through the environment loader (like all "include" statements) are only parsed and compiled
+    by the first process after a change of the template. All later renders, also in other processes, load the compiled code from disk.
+    The on-disk cache can be disabled by setting the environment variable "AVD_DISABLE_TEMPLATE_CACHE".
+
+    Returns None if the cache is disabled or the cache directory cannot be created.
+    """
+    if os.environ.get("AVD_DISABLE_TEMPLATE_CACHE"):
+        return None
+
+    cache_dir = _get_template_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    return TemplateBytecodeCache(directory=str(cache_dir), pattern="avd-%s.cache")
@@ -0,0 +1,16 @@
+from .ethernet_interfaces import render_ethernet_interfaces
+from .port_channel_interfaces import render_port_channel_interfaces
+from .router_bgp import render_router_bgp
+
+PYTHON_RENDERERS = {
+    "ethernet_interfaces": render_ethernet_interfaces,
+    "port_channel_interfaces": render_port_channel_interfaces,
+    "router_bgp": render_router_bgp,
+}
+"""
+Python renderers which can replace the Jinja2 templates of the heaviest eos_cli_config_gen sections.
+
+Each renderer takes the section data and the "hide_passwords" flag and returns the exact same output as the template.
+"""
+
+__all__ = ["PYTHON_RENDERERS", "render_ethernet_interfaces", "render_port_channel_interfaces", "render_router_bgp"]
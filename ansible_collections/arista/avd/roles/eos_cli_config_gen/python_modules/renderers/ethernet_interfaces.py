@@ -0,0 +1,516 @@
+from __future__ import annotations
+
+from jinja2.filters import do_float
+
+from ansible_collections.arista.avd.plugins.filter.hide_passwords import hide_passwords
+from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+from .interface_ip_nat import render_interface_ip_nat
+from .utils import get_encapsulation_vlan_cli, render_eos_cli
+
+POE_CLASS_MAP = {0: "15.40", 1: "4.00", 2: "7.00", 3: "15.40", 4: "30.00", 5: "45.00", 6: "60.00", 7: "75.00", 8: "90.00"}
+
+
+def render_ethernet_interfaces(ethernet_interfaces: list, hide_passwords: bool = False) -> str:
+    """
+    Return the EOS CLI configuration of all ethernet interfaces.
+
+    Python version of the template "eos/ethernet-interfaces.j2" giving the exact same output.
+    """
+    lines = []
+    for ethernet_interface in natural_sort(ethernet_interfaces, "name"):
+        lines.extend(_render_ethernet_interface(ethernet_interface, hide_passwords))
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _render_ethernet_interface(ethernet_interface: dict, hide_passwords_flag: bool) -> list[str]:
+    eth = ethernet_interface
+    lines = ["!", f"interface {eth.get('name')}"]
+    if eth.get("profile") is not None:
+        lines.append(f"   profile {eth['profile']}")
+    if eth.get("description") is not None:
+        lines.append(f"   description {eth['description']}")
+    if eth.get("shutdown") is True:
+        lines.append("   shutdown")
+    elif eth.get("shutdown") is False:
+        lines.append("   no shutdown")
+    if eth.get("load_interval") is not None:
+        lines.append(f"   load-interval {eth['load_interval']}")
+    if eth.get("mtu") is not None:
+        lines.append(f"   mtu {eth['mtu']}")
+    if (logging_event := get(eth, "logging.event")) is not None:
+        for key in ["link_status", "congestion_drops", "spanning_tree", "storm_control"]:
+            if logging_event.get(key) is True:
+                lines.append(f"   logging event {key.replace('_', '-')}")
+            elif logging_event.get(key) is False:
+                lines.append(f"   no logging event {key.replace('_', '-')}")
+    if (flowcontrol_received := get(eth, "flowcontrol.received")) is not None:
+        lines.append(f"   flowcontrol receive {flowcontrol_received}")
+    if eth.get("speed") is not None:
+        lines.append(f"   speed {eth['speed']}")
+    if eth.get("l2_mtu") is not None:
+        lines.append(f"   l2 mtu {eth['l2_mtu']}")
+    if (session_tracker := get(eth, "bgp.session_tracker")) is not None:
+        lines.append(f"   bgp session tracker {session_tracker}")
+    if (mac_security_profile := get(eth, "mac_security.profile")) is not None:
+        lines.append(f"   mac security profile {mac_security_profile}")
+
+    error_correction_encoding = eth.get("error_correction_encoding") or {}
+    if error_correction_encoding.get("enabled") is False:
+        lines.append("   no error-correction encoding")
+    else:
+        if error_correction_encoding.get("fire_code") is True:
+            lines.append("   error-correction encoding fire-code")
+        elif error_correction_encoding.get("fire_code") is False:
+            lines.append("   no error-correction encoding fire-code")
+        if error_correction_encoding.get("reed_solomon") is True:
+            lines.append("   error-correction encoding reed-solomon")
+        elif error_correction_encoding.get("reed_solomon") is False:
+            lines.append("   no error-correction encoding reed-solomon")
+
+    mode = eth.get("mode")
+    if mode in ["access", "dot1q-tunnel"] and eth.get("vlans") is not None:
+        lines.append(f"   switchport access vlan {eth['vlans']}")
+    if mode is not None and mode in ["trunk", "trunk phone"]:
+        if eth.get("native_vlan_tag") is True:
+            lines.append("   switchport trunk native vlan tag")
+        elif eth.get("native_vlan") is not None:
+            lines.append(f"   switchport trunk native vlan {eth['native_vlan']}")
+    if (phone_vlan := get(eth, "phone.vlan")) is not None:
+        lines.append(f"   switchport phone vlan {phone_vlan}")
+    if (phone_trunk := get(eth, "phone.trunk")) is not None:
+        lines.append(f"   switchport phone trunk {phone_trunk}")
+    for vlan_translation in natural_sort(eth.get("vlan_translations")):
+        if vlan_translation.get("from") is not None and vlan_translation.get("to") is not None:
+            vlan_translation_cli = "switchport vlan translation"
+            if vlan_translation.get("direction") in ["in", "out"]:
+                vlan_translation_cli += f" {vlan_translation['direction']}"
+            vlan_translation_cli += f" {vlan_translation['from']} {vlan_translation['to']}"
+            lines.append(f"   {vlan_translation_cli}")
+    if mode == "trunk" and eth.get("vlans") is not None:
+        lines.append(f"   switchport trunk allowed vlan {eth['vlans']}")
+    if mode is not None:
+        lines.append(f"   switchport mode {mode}")
+    for trunk_group in natural_sort(eth.get("trunk_groups")):
+        lines.append(f"   switchport trunk group {trunk_group}")
+
+    interface_type = eth.get("type")
+    if interface_type == "routed":
+        lines.append("   no switchport")
+    elif interface_type in ["l3dot1q", "l2dot1q"]:
+        if eth.get("vlan_id") is not None and interface_type == "l2dot1q":
+            lines.append(f"   vlan id {eth['vlan_id']}")
+        if eth.get("encapsulation_dot1q_vlan") is not None:
+            lines.append(f"   encapsulation dot1q vlan {eth['encapsulation_dot1q_vlan']}")
+        elif (encapsulation_cli := get_encapsulation_vlan_cli(eth)) is not None:
+            lines.append("   encapsulation vlan")
+            lines.append(f"      {encapsulation_cli}")
+    elif get(eth, "type", default="switched") == "switched":
+        lines.append("   switchport")
+
+    if eth.get("trunk_private_vlan_secondary") is True:
+        lines.append("   switchport trunk private-vlan secondary")
+    elif eth.get("trunk_private_vlan_secondary") is False:
+        lines.append("   no switchport trunk private-vlan secondary")
+    if eth.get("pvlan_mapping") is not None:
+        lines.append(f"   switchport pvlan mapping {eth['pvlan_mapping']}")
+    if (l2_protocol_encapsulation_dot1q_vlan := get(eth, "l2_protocol.encapsulation_dot1q_vlan")) is not None:
+        lines.append(f"   l2-protocol encapsulation dot1q vlan {l2_protocol_encapsulation_dot1q_vlan}")
+    if (l2_protocol_forwarding_profile := get(eth, "l2_protocol.forwarding_profile")) is not None:
+        lines.append(f"   l2-protocol forwarding profile {l2_protocol_forwarding_profile}")
+    if (flow_tracker_sampled := get(eth, "flow_tracker.sampled")) is not None:
+        lines.append(f"   flow tracker sampled {flow_tracker_sampled}")
+    if (evpn_ethernet_segment := eth.get("evpn_ethernet_segment")) is not None:
+        lines.extend(_render_evpn_ethernet_segment(evpn_ethernet_segment))
+    if (dot1x := eth.get("dot1x")) is not None:
+        lines.extend(_render_dot1x(dot1x))
+    if eth.get("snmp_trap_link_change") is False:
+        lines.append("   no snmp trap link-change")
+    elif eth.get("snmp_trap_link_change") is True:
+        lines.append("   snmp trap link-change")
+    address_locking_ipv4 = get(eth, "address_locking.ipv4") is True
+    address_locking_ipv6 = get(eth, "address_locking.ipv6") is True
+    if address_locking_ipv4 or address_locking_ipv6:
+        address_locking_cli = "address locking"
+        if address_locking_ipv4:
+            address_locking_cli += " ipv4"
+        if address_locking_ipv6:
+            address_locking_cli += " ipv6"
+        lines.append(f"   {address_locking_cli}")
+    if eth.get("vrf") is not None:
+        lines.append(f"   vrf {eth['vrf']}")
+    if eth.get("ip_proxy_arp") is True:
+        lines.append("   ip proxy-arp")
+    if eth.get("ip_address") is not None:
+        lines.append(f"   ip address {eth['ip_address']}")
+        if eth.get("ip_address_secondaries") is not None:
+            for ip_address_secondary in eth["ip_address_secondaries"]:
+                lines.append(f"   ip address {ip_address_secondary} secondary")
+        for ip_helper in natural_sort(eth.get("ip_helpers"), "ip_helper"):
+            ip_helper_cli = f"ip helper-address {ip_helper.get('ip_helper')}"
+            if ip_helper.get("vrf") is not None:
+                ip_helper_cli += f" vrf {ip_helper['vrf']}"
+            if ip_helper.get("source_interface") is not None:
+                ip_helper_cli += f" source-interface {ip_helper['source_interface']}"
+            lines.append(f"   {ip_helper_cli}")
+    if (bfd := eth.get("bfd")) is not None:
+        if bfd.get("interval") is not None and bfd.get("min_rx") is not None and bfd.get("multiplier") is not None:
+            lines.append(f"   bfd interval {bfd['interval']} min-rx {bfd['min_rx']} multiplier {bfd['multiplier']}")
+        if bfd.get("echo") is True:
+            lines.append("   bfd echo")
+        elif bfd.get("echo") is False:
+            lines.append("   no bfd echo")
+    if eth.get("ipv6_enable") is True:
+        lines.append("   ipv6 enable")
+    if eth.get("ipv6_address") is not None:
+        lines.append(f"   ipv6 address {eth['ipv6_address']}")
+    if eth.get("ipv6_address_link_local") is not None:
+        lines.append(f"   ipv6 address {eth['ipv6_address_link_local']} link-local")
+    if eth.get("ipv6_nd_ra_disabled") is True:
+        lines.append("   ipv6 nd ra disabled")
+    if eth.get("ipv6_nd_managed_config_flag") is True:
+        lines.append("   ipv6 nd managed-config-flag")
+    if eth.get("ipv6_nd_prefixes") is not None:
+        for prefix in eth["ipv6_nd_prefixes"]:
+            ipv6_nd_prefix_cli = f"ipv6 nd prefix {prefix.get('ipv6_prefix')}"
+            if prefix.get("valid_lifetime") is not None:
+                ipv6_nd_prefix_cli += f" {prefix['valid_lifetime']}"
+                if prefix.get("preferred_lifetime") is not None:
+                    ipv6_nd_prefix_cli += f" {prefix['preferred_lifetime']}"
+            if prefix.get("no_autoconfig_flag") is True:
+                ipv6_nd_prefix_cli += " no-autoconfig"
+            lines.append(f"   {ipv6_nd_prefix_cli}")
+    for destination in natural_sort(eth.get("ipv6_dhcp_relay_destinations"), "address"):
+        destination_cli = f"ipv6 dhcp relay destination {destination.get('address')}"
+        if destination.get("vrf") is not None:
+            destination_cli += f" vrf {destination['vrf']}"
+        if destination.get("local_interface") is not None:
+            destination_cli += f" local-interface {destination['local_interface']}"
+        elif destination.get("source_address") is not None:
+            destination_cli += f" source-address {destination['source_address']}"
+        if destination.get("link_address") is not None:
+            destination_cli += f" link-address {destination['link_address']}"
+        lines.append(f"   {destination_cli}")
+    if (channel_group_id := get(eth, "channel_group.id")) is not None and (channel_group_mode := get(eth, "channel_group.mode")) is not None:
+        lines.append(f"   channel-group {channel_group_id} mode {channel_group_mode}")
+        if (lacp_timer_mode := get(eth, "lacp_timer.mode")) is not None:
+            lines.append(f"   lacp timer {lacp_timer_mode}")
+        if (lacp_timer_multiplier := get(eth, "lacp_timer.multiplier")) is not None:
+            lines.append(f"   lacp timer multiplier {lacp_timer_multiplier}")
+        if eth.get("lacp_port_priority") is not None:
+            lines.append(f"   lacp port-priority {eth['lacp_port_priority']}")
+    if (lldp := eth.get("lldp")) is not None:
+        if lldp.get("transmit") is False:
+            lines.append("   no lldp transmit")
+        if lldp.get("receive") is False:
+            lines.append("   no lldp receive")
+        if lldp.get("ztp_vlan") is not None:
+            lines.append(f"   lldp tlv transmit ztp vlan {lldp['ztp_vlan']}")
+    if get(eth, "mpls.ldp.igp_sync") is True:
+        lines.append("   mpls ldp igp sync")
+    if (mpls_ldp_interface := get(eth, "mpls.ldp.interface")) is True:
+        lines.append("   mpls ldp interface")
+    elif mpls_ldp_interface is False:
+        lines.append("   no mpls ldp interface")
+    if eth.get("access_group_in") is not None:
+        lines.append(f"   ip access-group {eth['access_group_in']} in")
+    if eth.get("access_group_out") is not None:
+        lines.append(f"   ip access-group {eth['access_group_out']} out")
+    if eth.get("ipv6_access_group_in") is not None:
+        lines.append(f"   ipv6 access-group {eth['ipv6_access_group_in']} in")
+    if eth.get("ipv6_access_group_out") is not None:
+        lines.append(f"   ipv6 access-group {eth['ipv6_access_group_out']} out")
+    if eth.get("mac_access_group_in") is not None:
+        lines.append(f"   mac access-group {eth['mac_access_group_in']} in")
+    if eth.get("mac_access_group_out") is not None:
+        lines.append(f"   mac access-group {eth['mac_access_group_out']} out")
+    if (multicast := eth.get("multicast")) is not None:
+        if (ipv4_boundaries := get(multicast, "ipv4.boundaries")) is not None:
+            for boundary in ipv4_boundaries:
+                boundary_cli = f"multicast ipv4 boundary {boundary.get('boundary')}"
+                if boundary.get("out") is True:
+                    boundary_cli += " out"
+                lines.append(f"   {boundary_cli}")
+        if (ipv6_boundaries := get(multicast, "ipv6.boundaries")) is not None:
+            for boundary in ipv6_boundaries:
+                lines.append(f"   multicast ipv6 boundary {boundary.get('boundary')} out")
+        if get(multicast, "ipv4.static") is True:
+            lines.append("   multicast ipv4 static")
+        if get(multicast, "ipv6.static") is True:
+            lines.append("   multicast ipv6 static")
+    if (mpls_ip := get(eth, "mpls.ip")) is True:
+        lines.append("   mpls ip")
+    elif mpls_ip is False:
+        lines.append("   no mpls ip")
+    if eth.get("ip_nat") is not None:
+        lines.extend(render_interface_ip_nat(eth["ip_nat"]))
+    if eth.get("ospf_cost") is not None:
+        lines.append(f"   ip ospf cost {eth['ospf_cost']}")
+    if eth.get("ospf_network_point_to_point") is True:
+        lines.append("   ip ospf network point-to-point")
+    if eth.get("ospf_authentication") == "simple":
+        lines.append("   ip ospf authentication")
+    elif eth.get("ospf_authentication") == "message-digest":
+        lines.append("   ip ospf authentication message-digest")
+    if eth.get("ospf_authentication_key") is not None:
+        lines.append(f"   ip ospf authentication-key 7 {hide_passwords(eth['ospf_authentication_key'], hide_passwords_flag)}")
+    if eth.get("ospf_area") is not None:
+        lines.append(f"   ip ospf area {eth['ospf_area']}")
+    for ospf_message_digest_key in natural_sort(eth.get("ospf_message_digest_keys"), "id"):
+        if ospf_message_digest_key.get("hash_algorithm") is not None and ospf_message_digest_key.get("key") is not None:
+            lines.append(
+                f"   ip ospf message-digest-key {ospf_message_digest_key.get('id')} {ospf_message_digest_key['hash_algorithm']} 7"
+                f" {hide_passwords(ospf_message_digest_key['key'], hide_passwords_flag)}"
+            )
+    if get(eth, "pim.ipv4.sparse_mode") is True:
+        lines.append("   pim ipv4 sparse-mode")
+    if (pim_dr_priority := get(eth, "pim.ipv4.dr_priority")) is not None:
+        lines.append(f"   pim ipv4 dr-priority {pim_dr_priority}")
+    if (poe := eth.get("poe")) is not None:
+        lines.extend(_render_poe(poe))
+    if (qos_trust := get(eth, "qos.trust")) is not None:
+        if qos_trust == "disabled":
+            lines.append("   no qos trust")
+        else:
+            lines.append(f"   qos trust {qos_trust}")
+    if (qos_cos := get(eth, "qos.cos")) is not None:
+        lines.append(f"   qos cos {qos_cos}")
+    if (qos_dscp := get(eth, "qos.dscp")) is not None:
+        lines.append(f"   qos dscp {qos_dscp}")
+    if (shape_rate := get(eth, "shape.rate")) is not None:
+        lines.append(f"   shape rate {shape_rate}")
+    if (priority_flow_control_enabled := get(eth, "priority_flow_control.enabled")) is True:
+        lines.append("   priority-flow-control on")
+    elif priority_flow_control_enabled is False:
+        lines.append("   no priority-flow-control")
+    for priority_block in natural_sort(get(eth, "priority_flow_control.priorities")):
+        if priority_block.get("priority") is not None:
+            if priority_block.get("no_drop") is True:
+                lines.append(f"   priority-flow-control priority {priority_block['priority']} no-drop")
+            elif priority_block.get("no_drop") is False:
+                lines.append(f"   priority-flow-control priority {priority_block['priority']} drop")
+    for section in natural_sort(eth.get("storm_control")):
+        storm_control_section = eth["storm_control"][section] or {}
+        if storm_control_section.get("level") is not None:
+            if storm_control_section.get("unit") == "pps":
+                lines.append(f"   storm-control {section.replace('_', '-')} level pps {storm_control_section['level']}")
+            else:
+                lines.append(f"   storm-control {section.replace('_', '-')} level {storm_control_section['level']}")
+
+    if (ptp := eth.get("ptp")) is not None:
+        if ptp.get("enable") is True:
+            lines.append("   ptp enable")
+        if (sync_message_interval := get(ptp, "sync_message.interval")) is not None:
+            lines.append(f"   ptp sync-message interval {sync_message_interval}")
+        if ptp.get("delay_mechanism") is not None:
+            lines.append(f"   ptp delay-mechanism {ptp['delay_mechanism']}")
+        if (announce_interval := get(ptp, "announce.interval")) is not None:
+            lines.append(f"   ptp announce interval {announce_interval}")
+        if ptp.get("transport") is not None:
+            lines.append(f"   ptp transport {ptp['transport']}")
+        if (announce_timeout := get(ptp, "announce.timeout")) is not None:
+            lines.append(f"   ptp announce timeout {announce_timeout}")
+        if ptp.get("delay_req") is not None:
+            lines.append(f"   ptp delay-req interval {ptp['delay_req']}")
+        if ptp.get("role") is not None:
+            lines.append(f"   ptp role {ptp['role']}")
+        if ptp.get("vlan") is not None:
+            lines.append(f"   ptp vlan {ptp['vlan']}")
+
+    if (service_policy_pbr_input := get(eth, "service_policy.pbr.input")) is not None:
+        lines.append(f"   service-policy type pbr input {service_policy_pbr_input}")
+    if (service_policy_qos_input := get(eth, "service_policy.qos.input")) is not None:
+        lines.append(f"   service-policy type qos input {service_policy_qos_input}")
+    if eth.get("service_profile") is not None:
+        lines.append(f"   service-profile {eth['service_profile']}")
+    if eth.get("isis_enable") is not None:
+        lines.append(f"   isis enable {eth['isis_enable']}")
+    if eth.get("isis_circuit_type") is not None:
+        lines.append(f"   isis circuit-type {eth['isis_circuit_type']}")
+    if eth.get("isis_metric") is not None:
+        lines.append(f"   isis metric {eth['isis_metric']}")
+    if eth.get("isis_passive") is True:
+        lines.append("   isis passive")
+    if eth.get("isis_hello_padding") is False:
+        lines.append("   no isis hello padding")
+    elif eth.get("isis_hello_padding") is True:
+        lines.append("   isis hello padding")
+    if eth.get("isis_network_point_to_point") is True:
+        lines.append("   isis network point-to-point")
+    if eth.get("isis_authentication_mode") is not None and eth["isis_authentication_mode"] in ["text", "md5"]:
+        lines.append(f"   isis authentication mode {eth['isis_authentication_mode']}")
+    if eth.get("isis_authentication_key") is not None:
+        lines.append(f"   isis authentication key 7 {hide_passwords(eth['isis_authentication_key'], hide_passwords_flag)}")
+    if eth.get("spanning_tree_portfast") == "edge":
+        lines.append("   spanning-tree portfast")
+    elif eth.get("spanning_tree_portfast") == "network":
+        lines.append("   spanning-tree portfast network")
+    if eth.get("spanning_tree_bpduguard") is not None and eth["spanning_tree_bpduguard"] in [True, "True", "enabled"]:
+        lines.append("   spanning-tree bpduguard enable")
+    elif eth.get("spanning_tree_bpduguard") == "disabled":
+        lines.append("   spanning-tree bpduguard disable")
+    if eth.get("spanning_tree_bpdufilter") is not None and eth["spanning_tree_bpdufilter"] in [True, "True", "enabled"]:
+        lines.append("   spanning-tree bpdufilter enable")
+    elif eth.get("spanning_tree_bpdufilter") == "disabled":
+        lines.append("   spanning-tree bpdufilter disable")
+    if eth.get("spanning_tree_guard") is not None:
+        if eth["spanning_tree_guard"] == "disabled":
+            lines.append("   spanning-tree guard none")
+        else:
+            lines.append(f"   spanning-tree guard {eth['spanning_tree_guard']}")
+
+    if (sflow := eth.get("sflow")) is not None:
+        if sflow.get("enable") is True:
+            lines.append("   sflow enable")
+        elif sflow.get("enable") is False:
+            lines.append("   no sflow enable")
+        if (egress_enable := get(sflow, "egress.enable")) is True:
+            lines.append("   sflow egress enable")
+        elif egress_enable is False:
+            lines.append("   no sflow egress enable")
+        if (egress_unmodified_enable := get(sflow, "egress.unmodified_enable")) is True:
+            lines.append("   sflow egress unmodified enable")
+        elif egress_unmodified_enable is False:
+            lines.append("   no sflow egress unmodified enable")
+
+    if eth.get("vmtracer") is True:
+        lines.append("   vmtracer vmware-esx")
+    if (transceiver_media_override := get(eth, "transceiver.media.override")) is not None:
+        lines.append(f"   transceiver media override {transceiver_media_override}")
+    for link_tracking_group in natural_sort(eth.get("link_tracking_groups")):
+        if link_tracking_group.get("name") is not None and link_tracking_group.get("direction") is not None:
+            lines.append(f"   link tracking group {link_tracking_group['name']} {link_tracking_group['direction']}")
+    if (traffic_policy_input := get(eth, "traffic_policy.input")) is not None:
+        lines.append(f"   traffic-policy input {traffic_policy_input}")
+    if (traffic_policy_output := get(eth, "traffic_policy.output")) is not None:
+        lines.append(f"   traffic-policy output {traffic_policy_output}")
+    if eth.get("eos_cli") is not None:
+        lines.append(render_eos_cli(eth["eos_cli"], 3))
+
+    return lines
+
+
+def _render_evpn_ethernet_segment(evpn_ethernet_segment: dict) -> list[str]:
+    lines = ["   evpn ethernet-segment"]
+    if evpn_ethernet_segment.get("identifier") is not None:
+        lines.append(f"      identifier {evpn_ethernet_segment['identifier']}")
+    if evpn_ethernet_segment.get("redundancy") is not None:
+        lines.append(f"      redundancy {evpn_ethernet_segment['redundancy']}")
+    if (designated_forwarder_election := evpn_ethernet_segment.get("designated_forwarder_election")) is not None:
+        algorithm = designated_forwarder_election.get("algorithm")
+        if algorithm == "modulus":
+            lines.append("      designated-forwarder election algorithm modulus")
+        elif algorithm == "preference" and designated_forwarder_election.get("preference_value") is not None:
+            dfe_algo_cli = f"designated-forwarder election algorithm preference {designated_forwarder_election['preference_value']}"
+            if designated_forwarder_election.get("dont_preempt") is True:
+                dfe_algo_cli += " dont-preempt"
+            lines.append(f"      {dfe_algo_cli}")
+        if designated_forwarder_election.get("hold_time") is not None:
+            dfe_hold_time_cli = f"designated-forwarder election hold-time {designated_forwarder_election['hold_time']}"
+            if designated_forwarder_election.get("subsequent_hold_time") is not None:
+                dfe_hold_time_cli += f" subsequent-hold-time {designated_forwarder_election['subsequent_hold_time']}"
+            lines.append(f"      {dfe_hold_time_cli}")
+        if designated_forwarder_election.get("candidate_reachability_required") is True:
+            lines.append("      designated-forwarder election candidate reachability required")
+        elif designated_forwarder_election.get("candidate_reachability_required") is False:
+            lines.append("      no designated-forwarder election candidate reachability required")
+    if (mpls_tunnel_flood_filter_time := get(evpn_ethernet_segment, "mpls.tunnel_flood_filter_time")) is not None:
+        lines.append(f"      mpls tunnel flood filter time {mpls_tunnel_flood_filter_time}")
+    if (mpls_shared_index := get(evpn_ethernet_segment, "mpls.shared_index")) is not None:
+        lines.append(f"      mpls shared index {mpls_shared_index}")
+    if evpn_ethernet_segment.get("route_target") is not None:
+        lines.append(f"      route-target import {evpn_ethernet_segment['route_target']}")
+    return lines
+
+
+def _render_dot1x(dot1x: dict) -> list[str]:
+    lines = []
+    if (pae_mode := get(dot1x, "pae.mode")) is not None:
+        lines.append(f"   dot1x pae {pae_mode}")
+    if (authentication_failure := dot1x.get("authentication_failure")) is not None:
+        if authentication_failure.get("action") == "allow" and authentication_failure.get("allow_vlan") is not None:
+            lines.append(f"   dot1x authentication failure action traffic allow vlan {authentication_failure['allow_vlan']}")
+        elif authentication_failure.get("action") == "drop":
+            lines.append("   dot1x authentication failure action traffic drop")
+    if dot1x.get("reauthentication") is True:
+        lines.append("   dot1x reauthentication")
+    if dot1x.get("port_control") is not None:
+        lines.append(f"   dot1x port-control {dot1x['port_control']}")
+    if dot1x.get("port_control_force_authorized_phone") is True:
+        lines.append("   dot1x port-control force-authorized phone")
+    elif dot1x.get("port_control_force_authorized_phone") is False:
+        lines.append("   no dot1x port-control force-authorized phone")
+    if (host_mode := dot1x.get("host_mode")) is not None:
+        if host_mode.get("mode") == "single-host":
+            lines.append("   dot1x host-mode single-host")
+        elif host_mode.get("mode") == "multi-host":
+            host_mode_cli = "dot1x host-mode multi-host"
+            if host_mode.get("multi_host_authenticated") is True:
+                host_mode_cli += " authenticated"
+            lines.append(f"   {host_mode_cli}")
+    if get(dot1x, "mac_based_authentication.enabled") is True:
+        mac_based_authentication = dot1x["mac_based_authentication"]
+        if mac_based_authentication.get("host_mode_common") is True:
+            lines.append("   dot1x mac based authentication host-mode common")
+            if mac_based_authentication.get("always") is True:
+                lines.append("   dot1x mac based authentication always")
+        else:
+            auth_cli = "dot1x mac based authentication"
+            if mac_based_authentication.get("always") is True:
+                auth_cli += " always"
+            lines.append(f"   {auth_cli}")
+    if (timeout := dot1x.get("timeout")) is not None:
+        if timeout.get("quiet_period") is not None:
+            lines.append(f"   dot1x timeout quiet-period {timeout['quiet_period']}")
+        if timeout.get("reauth_timeout_ignore") is True:
+            lines.append("   dot1x timeout reauth-timeout-ignore always")
+        if timeout.get("tx_period") is not None:
+            lines.append(f"   dot1x timeout tx-period {timeout['tx_period']}")
+        if timeout.get("reauth_period") is not None:
+            lines.append(f"   dot1x timeout reauth-period {timeout['reauth_period']}")
+        if timeout.get("idle_host") is not None:
+            lines.append(f"   dot1x timeout idle-host {timeout['idle_host']} seconds")
+    if dot1x.get("reauthorization_request_limit") is not None:
+        lines.append(f"   dot1x reauthorization request limit {dot1x['reauthorization_request_limit']}")
+    if (eapol := dot1x.get("eapol")) is not None:
+        if eapol.get("disabled") is True:
+            lines.append("   dot1x eapol disabled")
+        elif get(eapol, "authentication_failure_fallback_mba.enabled") is True:
+            auth_failure_fallback_mba = "dot1x eapol authentication failure fallback mba"
+            if (fallback_timeout := get(eapol, "authentication_failure_fallback_mba.timeout")) is not None:
+                auth_failure_fallback_mba += f" timeout {fallback_timeout}"
+            lines.append(f"   {auth_failure_fallback_mba}")
+    return lines
+
+
+def _render_poe(poe: dict) -> list[str]:
+    lines = []
+    if poe.get("priority") is not None:
+        lines.append(f"   poe priority {poe['priority']}")
+    if (reboot_action := get(poe, "reboot.action")) is not None:
+        lines.append(f"   poe reboot action {reboot_action}")
+    if (link_down_action := get(poe, "link_down.action")) is not None:
+        poe_link_down_action_cli = f"poe link down action {link_down_action}"
+        if (power_off_delay := get(poe, "link_down.power_off_delay")) is not None:
+            poe_link_down_action_cli += f" {power_off_delay}"
+        lines.append(f"   {poe_link_down_action_cli}")
+    if (shutdown_action := get(poe, "shutdown.action")) is not None:
+        lines.append(f"   poe shutdown action {shutdown_action}")
+    if poe.get("disabled") is True:
+        lines.append("   poe disabled")
+    if (limit := poe.get("limit")) is not None:
+        poe_limit_cli = None
+        if limit.get("class") is not None:
+            poe_limit_cli = f"poe limit {POE_CLASS_MAP[limit['class']]} watts"
+        elif limit.get("watts") is not None:
+            poe_limit_cli = f"poe limit {'%.2f' % do_float(limit['watts'])} watts"
+        if poe_limit_cli is not None and limit.get("fixed") is True:
+            poe_limit_cli += " fixed"
+        lines.append(f"   {poe_limit_cli}")
+    if poe.get("negotiation_lldp") is False:
+        lines.append("   poe negotiation lldp disabled")
+    if poe.get("legacy_detect") is True:
+        lines.append("   poe legacy detect")
+    return lines
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+
+def render_interface_ip_nat(interface_ip_nat: dict) -> list[str]:
+    """
+    Return the "ip nat" lines of an interface.
+
+    Python version of the template "eos/interface-ip-nat.j2".
+    """
+    lines = []
+
+    # Static source nat entries
+    for nat in natural_sort(get(interface_ip_nat, "source.static", default=[]), "original_ip"):
+        if _is_valid_static_nat(nat):
+            lines.append(f"   {_get_static_nat_cli('ip nat source', nat)}")
+
+    # Dynamic source nat entries
+    for nat in natural_sort(get(interface_ip_nat, "source.dynamic", default=[]), "access_list"):
+        nat_cli = f"ip nat source dynamic access-list {nat.get('access_list')}"
+        if nat.get("nat_type") == "overload":
+            nat_cli += " overload"
+        elif nat.get("pool_name") is not None:
+            nat_cli += f" pool {nat['pool_name']}"
+            if nat.get("nat_type") == "pool-address-only":
+                nat_cli += " address-only"
+            elif nat.get("nat_type") == "pool-full-cone":
+                nat_cli += " full-cone"
+        else:
+            continue
+
+        lines.append(f"   {_add_priority_and_comment(nat_cli, nat)}")
+
+    # Static destination nat entries
+    for nat in natural_sort(get(interface_ip_nat, "destination.static", default=[]), "original_ip"):
+        if _is_valid_static_nat(nat):
+            lines.append(f"   {_get_static_nat_cli('ip nat destination', nat)}")
+
+    # Dynamic destination nat entries
+    for nat in natural_sort(get(interface_ip_nat, "destination.dynamic", default=[]), "access_list"):
+        nat_cli = f"ip nat destination dynamic access-list {nat.get('access_list')} pool {nat.get('pool_name')}"
+        lines.append(f"   {_add_priority_and_comment(nat_cli, nat)}")
+
+    return lines
+
+
+def _is_valid_static_nat(nat: dict) -> bool:
+    if nat.get("access_list") is not None and nat.get("group") is not None:
+        return False
+    return not (nat.get("original_port") is None and nat.get("translated_port") is not None)
+
+
+def _get_static_nat_cli(nat_cli: str, nat: dict) -> str:
+    if nat.get("direction") is not None:
+        nat_cli += f" {nat['direction']}"
+    nat_cli += f" static {nat.get('original_ip')}"
+    if nat.get("original_port") is not None:
+        nat_cli += f" {nat['original_port']}"
+    if nat.get("access_list") is not None:
+        nat_cli += f" access-list {nat['access_list']}"
+    nat_cli += f" {nat.get('translated_ip')}"
+    if nat.get("translated_port") is not None:
+        nat_cli += f" {nat['translated_port']}"
+    if nat.get("protocol") is not None:
+        nat_cli += f" protocol {nat['protocol']}"
+    if nat.get("group") is not None:
+        nat_cli += f" group {nat['group']}"
+    if nat.get("comment") is not None:
+        nat_cli += f" comment {nat['comment']}"
+    return nat_cli
+
+
+def _add_priority_and_comment(nat_cli: str, nat: dict) -> str:
+    if get(nat, "priority", default=0) > 0:
+        nat_cli += f" priority {nat['priority']}"
+    if nat.get("comment") is not None:
+        nat_cli += f" comment {nat['comment']}"
+    return nat_cli
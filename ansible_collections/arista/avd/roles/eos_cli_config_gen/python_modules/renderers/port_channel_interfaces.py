@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
+from ansible_collections.arista.avd.plugins.filter.hide_passwords import hide_passwords
+from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+from .interface_ip_nat import render_interface_ip_nat
+from .utils import get_encapsulation_vlan_cli, render_eos_cli
+
+
+def render_port_channel_interfaces(port_channel_interfaces: list, hide_passwords: bool = False) -> str:
+    """
+    Return the EOS CLI configuration of all port-channel interfaces.
+
+    Python version of the template "eos/port-channel-interfaces.j2" giving the exact same output.
+    """
+    lines = []
+    for port_channel_interface in natural_sort(port_channel_interfaces, "name"):
+        lines.extend(_render_port_channel_interface(port_channel_interface, hide_passwords))
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _render_port_channel_interface(port_channel_interface: dict, hide_passwords_flag: bool) -> list[str]:
+    pci = port_channel_interface
+    lines = ["!", f"interface {pci.get('name')}"]
+    if pci.get("description") is not None:
+        lines.append(f"   description {pci['description']}")
+    if (link_status := get(pci, "logging.event.link_status")) is True:
+        lines.append("   logging event link-status")
+    elif link_status is False:
+        lines.append("   no logging event link-status")
+    if pci.get("shutdown") is True:
+        lines.append("   shutdown")
+    elif pci.get("shutdown") is False:
+        lines.append("   no shutdown")
+    if pci.get("mtu") is not None:
+        lines.append(f"   mtu {pci['mtu']}")
+    if (session_tracker := get(pci, "bgp.session_tracker")) is not None:
+        lines.append(f"   bgp session tracker {session_tracker}")
+
+    interface_type = pci.get("type")
+    if interface_type == "routed":
+        lines.append("   no switchport")
+    elif interface_type in ["l3dot1q", "l2dot1q"]:
+        if pci.get("vlan_id") is not None and interface_type == "l2dot1q":
+            lines.append(f"   vlan id {pci['vlan_id']}")
+        if pci.get("encapsulation_dot1q_vlan") is not None:
+            lines.append(f"   encapsulation dot1q vlan {pci['encapsulation_dot1q_vlan']}")
+        elif (encapsulation_cli := get_encapsulation_vlan_cli(pci)) is not None:
+            lines.append("   encapsulation vlan")
+            lines.append(f"      {encapsulation_cli}")
+    elif get(pci, "type", default="switched") == "switched":
+        lines.append("   switchport")
+
+    mode = pci.get("mode")
+    if pci.get("vlans") is not None and mode == "access":
+        lines.append(f"   switchport access vlan {pci['vlans']}")
+    if pci.get("vlans") is not None and mode == "trunk":
+        lines.append(f"   switchport trunk allowed vlan {pci['vlans']}")
+    if mode is not None and mode in ["trunk", "trunk phone"]:
+        if pci.get("native_vlan_tag") is True:
+            lines.append("   switchport trunk native vlan tag")
+        elif pci.get("native_vlan") is not None:
+            lines.append(f"   switchport trunk native vlan {pci['native_vlan']}")
+    if (phone_vlan := get(pci, "phone.vlan")) is not None:
+        lines.append(f"   switchport phone vlan {phone_vlan}")
+    if (phone_trunk := get(pci, "phone.trunk")) is not None:
+        lines.append(f"   switchport phone trunk {phone_trunk}")
+    if mode == "trunk":
+        lines.append(f"   switchport mode {mode}")
+    for trunk_group in natural_sort(pci.get("trunk_groups")):
+        lines.append(f"   switchport trunk group {trunk_group}")
+    if pci.get("trunk_private_vlan_secondary") is True:
+        lines.append("   switchport trunk private-vlan secondary")
+    elif pci.get("trunk_private_vlan_secondary") is False:
+        lines.append("   no switchport trunk private-vlan secondary")
+    if pci.get("pvlan_mapping") is not None:
+        lines.append(f"   switchport pvlan mapping {pci['pvlan_mapping']}")
+    for vlan_translation in natural_sort(pci.get("vlan_translations")):
+        if vlan_translation.get("from") is not None and vlan_translation.get("to") is not None:
+            vlan_translation_cli = "switchport vlan translation"
+            if vlan_translation.get("direction") in ["in", "out"]:
+                vlan_translation_cli += f" {vlan_translation['direction']}"
+            vlan_translation_cli += f" {vlan_translation['from']} {vlan_translation['to']}"
+            lines.append(f"   {vlan_translation_cli}")
+    if (l2_protocol_encapsulation_dot1q_vlan := get(pci, "l2_protocol.encapsulation_dot1q_vlan")) is not None:
+        lines.append(f"   l2-protocol encapsulation dot1q vlan {l2_protocol_encapsulation_dot1q_vlan}")
+    if (l2_protocol_forwarding_profile := get(pci, "l2_protocol.forwarding_profile")) is not None:
+        lines.append(f"   l2-protocol forwarding profile {l2_protocol_forwarding_profile}")
+    if (flow_tracker_sampled := get(pci, "flow_tracker.sampled")) is not None:
+        lines.append(f"   flow tracker sampled {flow_tracker_sampled}")
+
+    evpn_ethernet_segment = pci.get("evpn_ethernet_segment")
+    identifier = get(pci, "evpn_ethernet_segment.identifier", default=pci.get("esi"))
+    if identifier is not None or evpn_ethernet_segment is not None:
+        lines.append("   evpn ethernet-segment")
+        if identifier is not None:
+            lines.append(f"      identifier {identifier}")
+        lines.extend(_render_evpn_ethernet_segment(evpn_ethernet_segment or {}))
+        if (route_target := get(pci, "evpn_ethernet_segment.route_target", default=pci.get("rt"))) is not None:
+            lines.append(f"      route-target import {route_target}")
+
+    if pci.get("snmp_trap_link_change") is False:
+        lines.append("   no snmp trap link-change")
+    elif pci.get("snmp_trap_link_change") is True:
+        lines.append("   snmp trap link-change")
+    if pci.get("lacp_id") is not None:
+        lines.append(f"   lacp system-id {pci['lacp_id']}")
+    if pci.get("lacp_fallback_timeout") is not None:
+        lines.append(f"   port-channel lacp fallback timeout {pci['lacp_fallback_timeout']}")
+    if pci.get("lacp_fallback_mode") is not None:
+        lines.append(f"   port-channel lacp fallback {pci['lacp_fallback_mode']}")
+    if pci.get("mlag") is not None:
+        lines.append(f"   mlag {pci['mlag']}")
+    if (qos_trust := get(pci, "qos.trust")) is not None:
+        if qos_trust == "disabled":
+            lines.append("   no qos trust")
+        else:
+            lines.append(f"   qos trust {qos_trust}")
+    if (qos_dscp := get(pci, "qos.dscp")) is not None:
+        lines.append(f"   qos dscp {qos_dscp}")
+    if (qos_cos := get(pci, "qos.cos")) is not None:
+        lines.append(f"   qos cos {qos_cos}")
+    if (shape_rate := get(pci, "shape.rate")) is not None:
+        lines.append(f"   shape rate {shape_rate}")
+    if pci.get("spanning_tree_portfast") == "edge":
+        lines.append("   spanning-tree portfast")
+    elif pci.get("spanning_tree_portfast") == "network":
+        lines.append("   spanning-tree portfast network")
+    if pci.get("spanning_tree_bpduguard") is not None and pci["spanning_tree_bpduguard"] in [True, "True", "enabled"]:
+        lines.append("   spanning-tree bpduguard enable")
+    elif pci.get("spanning_tree_bpduguard") == "disabled":
+        lines.append("   spanning-tree bpduguard disable")
+    if pci.get("spanning_tree_bpdufilter") is not None and pci["spanning_tree_bpdufilter"] in [True, "True", "enabled"]:
+        lines.append("   spanning-tree bpdufilter enable")
+    elif pci.get("spanning_tree_bpdufilter") == "disabled":
+        lines.append("   spanning-tree bpdufilter disable")
+    if pci.get("spanning_tree_guard") is not None:
+        if pci["spanning_tree_guard"] == "disabled":
+            lines.append("   spanning-tree guard none")
+        else:
+            lines.append(f"   spanning-tree guard {pci['spanning_tree_guard']}")
+    if pci.get("vrf") is not None:
+        lines.append(f"   vrf {pci['vrf']}")
+    if pci.get("ip_proxy_arp") is True:
+        lines.append("   ip proxy-arp")
+    if pci.get("ip_address") is not None:
+        lines.append(f"   ip address {pci['ip_address']}")
+    if pci.get("ipv6_enable") is True:
+        lines.append("   ipv6 enable")
+    if pci.get("ipv6_address") is not None:
+        lines.append(f"   ipv6 address {pci['ipv6_address']}")
+    if pci.get("ipv6_address_link_local") is not None:
+        lines.append(f"   ipv6 address {pci['ipv6_address_link_local']} link-local")
+    if pci.get("ipv6_nd_ra_disabled") is True:
+        lines.append("   ipv6 nd ra disabled")
+    if pci.get("ipv6_nd_managed_config_flag") is True:
+        lines.append("   ipv6 nd managed-config-flag")
+    if pci.get("ipv6_nd_prefixes") is not None:
+        for ipv6_nd_prefix in convert_dicts(pci["ipv6_nd_prefixes"], "ipv6_prefix"):
+            ipv6_nd_prefix_cli = f"ipv6 nd prefix {ipv6_nd_prefix.get('ipv6_prefix')}"
+            if ipv6_nd_prefix.get("valid_lifetime") is not None:
+                ipv6_nd_prefix_cli += f" {ipv6_nd_prefix['valid_lifetime']}"
+            if ipv6_nd_prefix.get("preferred_lifetime") is not None:
+                ipv6_nd_prefix_cli += f" {ipv6_nd_prefix['preferred_lifetime']}"
+            if ipv6_nd_prefix.get("no_autoconfig_flag") is True:
+                ipv6_nd_prefix_cli += " no-autoconfig"
+            lines.append(f"   {ipv6_nd_prefix_cli}")
+    if pci.get("access_group_in") is not None:
+        lines.append(f"   ip access-group {pci['access_group_in']} in")
+    if pci.get("access_group_out") is not None:
+        lines.append(f"   ip access-group {pci['access_group_out']} out")
+    if pci.get("ipv6_access_group_in") is not None:
+        lines.append(f"   ipv6 access-group {pci['ipv6_access_group_in']} in")
+    if pci.get("ipv6_access_group_out") is not None:
+        lines.append(f"   ipv6 access-group {pci['ipv6_access_group_out']} out")
+    if pci.get("mac_access_group_in") is not None:
+        lines.append(f"   mac access-group {pci['mac_access_group_in']} in")
+    if pci.get("mac_access_group_out") is not None:
+        lines.append(f"   mac access-group {pci['mac_access_group_out']} out")
+    if pci.get("ospf_network_point_to_point") is True:
+        lines.append("   ip ospf network point-to-point")
+    if pci.get("ospf_area") is not None:
+        lines.append(f"   ip ospf area {pci['ospf_area']}")
+    if pci.get("ospf_cost") is not None:
+        lines.append(f"   ip ospf cost {pci['ospf_cost']}")
+    if pci.get("ospf_authentication") == "simple":
+        lines.append("   ip ospf authentication")
+    elif pci.get("ospf_authentication") == "message-digest":
+        lines.append("   ip ospf authentication message-digest")
+    if pci.get("ospf_authentication_key") is not None:
+        lines.append(f"   ip ospf authentication-key 7 {hide_passwords(pci['ospf_authentication_key'], hide_passwords_flag)}")
+    for ospf_message_digest_key in natural_sort(convert_dicts(pci.get("ospf_message_digest_keys"), "id"), "id"):
+        if ospf_message_digest_key.get("hash_algorithm") is not None and ospf_message_digest_key.get("key") is not None:
+            lines.append(
+                f"   ip ospf message-digest-key {ospf_message_digest_key.get('id')} {ospf_message_digest_key['hash_algorithm']} 7"
+                f" {hide_passwords(ospf_message_digest_key['key'], hide_passwords_flag)}"
+            )
+    if get(pci, "pim.ipv4.sparse_mode") is True:
+        lines.append("   pim ipv4 sparse-mode")
+    if (pim_dr_priority := get(pci, "pim.ipv4.dr_priority")) is not None:
+        lines.append(f"   pim ipv4 dr-priority {pim_dr_priority}")
+    if pci.get("vmtracer") is True:
+        lines.append("   vmtracer vmware-esx")
+
+    if (ptp := pci.get("ptp")) is not None:
+        if ptp.get("enable") is True:
+            lines.append("   ptp enable")
+        if (announce_interval := get(ptp, "announce.interval")) is not None:
+            lines.append(f"   ptp announce interval {announce_interval}")
+        if (announce_timeout := get(ptp, "announce.timeout")) is not None:
+            lines.append(f"   ptp announce timeout {announce_timeout}")
+        if ptp.get("delay_req") is not None:
+            lines.append(f"   ptp delay-req interval {ptp['delay_req']}")
+        if ptp.get("delay_mechanism") is not None:
+            lines.append(f"   ptp delay-mechanism {ptp['delay_mechanism']}")
+        if (sync_message_interval := get(ptp, "sync_message.interval")) is not None:
+            lines.append(f"   ptp sync-message interval {sync_message_interval}")
+        if ptp.get("role") is not None:
+            lines.append(f"   ptp role {ptp['role']}")
+        if ptp.get("vlan") is not None:
+            lines.append(f"   ptp vlan {ptp['vlan']}")
+        if ptp.get("transport") is not None:
+            lines.append(f"   ptp transport {ptp['transport']}")
+
+    if pci.get("service_profile") is not None:
+        lines.append(f"   service-profile {pci['service_profile']}")
+    for section in natural_sort(pci.get("storm_control")):
+        storm_control_section = pci["storm_control"][section] or {}
+        if storm_control_section.get("unit") == "pps":
+            lines.append(f"   storm-control {section.replace('_', '-')} level pps {storm_control_section.get('level')}")
+        else:
+            lines.append(f"   storm-control {section.replace('_', '-')} level {storm_control_section.get('level')}")
+    if (bfd := pci.get("bfd")) is not None:
+        if bfd.get("interval") is not None and bfd.get("min_rx") is not None and bfd.get("multiplier") is not None:
+            lines.append(f"   bfd interval {bfd['interval']} min-rx {bfd['min_rx']} multiplier {bfd['multiplier']}")
+        if bfd.get("echo") is True:
+            lines.append("   bfd echo")
+        elif bfd.get("echo") is False:
+            lines.append("   no bfd echo")
+    for link_tracking_group in natural_sort(pci.get("link_tracking_groups"), "name"):
+        if link_tracking_group.get("name") is not None and link_tracking_group.get("direction") is not None:
+            lines.append(f"   link tracking group {link_tracking_group['name']} {link_tracking_group['direction']}")
+    if (service_policy_pbr_input := get(pci, "service_policy.pbr.input")) is not None:
+        lines.append(f"   service-policy type pbr input {service_policy_pbr_input}")
+    if (service_policy_qos_input := get(pci, "service_policy.qos.input")) is not None:
+        lines.append(f"   service-policy type qos input {service_policy_qos_input}")
+
+    if (mpls := pci.get("mpls")) is not None:
+        if mpls.get("ip") is True:
+            lines.append("   mpls ip")
+        elif mpls.get("ip") is False:
+            lines.append("   no mpls ip")
+        if (ldp_interface := get(mpls, "ldp.interface")) is True:
+            lines.append("   mpls ldp interface")
+        elif ldp_interface is False:
+            lines.append("   no mpls ldp interface")
+        if get(mpls, "ldp.igp_sync") is True:
+            lines.append("   mpls ldp igp sync")
+
+    if pci.get("ip_nat") is not None:
+        lines.extend(render_interface_ip_nat(pci["ip_nat"]))
+    if pci.get("isis_enable") is not None:
+        lines.append(f"   isis enable {pci['isis_enable']}")
+    if pci.get("isis_circuit_type") is not None:
+        lines.append(f"   isis circuit-type {pci['isis_circuit_type']}")
+    if pci.get("isis_metric") is not None:
+        lines.append(f"   isis metric {pci['isis_metric']}")
+    if pci.get("isis_passive") is True:
+        lines.append("   isis passive")
+    if pci.get("isis_network_point_to_point") is True:
+        lines.append("   isis network point-to-point")
+    if pci.get("isis_hello_padding") is False:
+        lines.append("   no isis hello padding")
+    elif pci.get("isis_hello_padding") is True:
+        lines.append("   isis hello padding")
+    if pci.get("isis_authentication_mode") is not None and pci["isis_authentication_mode"] in ["text", "md5"]:
+        lines.append(f"   isis authentication mode {pci['isis_authentication_mode']}")
+    if pci.get("isis_authentication_key") is not None:
+        lines.append(f"   isis authentication key 7 {hide_passwords(pci['isis_authentication_key'], hide_passwords_flag)}")
+    if (traffic_policy_input := get(pci, "traffic_policy.input")) is not None:
+        lines.append(f"   traffic-policy input {traffic_policy_input}")
+    if (traffic_policy_output := get(pci, "traffic_policy.output")) is not None:
+        lines.append(f"   traffic-policy output {traffic_policy_output}")
+
+    if (sflow := pci.get("sflow")) is not None:
+        if sflow.get("enable") is True:
+            lines.append("   sflow enable")
+        elif sflow.get("enable") is False:
+            lines.append("   no sflow enable")
+        if (egress_enable := get(sflow, "egress.enable")) is True:
+            lines.append("   sflow egress enable")
+        elif egress_enable is False:
+            lines.append("   no sflow egress enable")
+        if (egress_unmodified_enable := get(sflow, "egress.unmodified_enable")) is True:
+            lines.append("   sflow egress unmodified enable")
+        elif egress_unmodified_enable is False:
+            lines.append("   no sflow egress unmodified enable")
+
+    if pci.get("eos_cli") is not None:
+        lines.append(render_eos_cli(pci["eos_cli"], 3))
+
+    return lines
+
+
+def _render_evpn_ethernet_segment(evpn_ethernet_segment: dict) -> list[str]:
+    """
+    Return the lines under "evpn ethernet-segment" except for the identifier and the route-target.
+    """
+    lines = []
+    if evpn_ethernet_segment.get("redundancy") is not None:
+        lines.append(f"      redundancy {evpn_ethernet_segment['redundancy']}")
+    if (designated_forwarder_election := evpn_ethernet_segment.get("designated_forwarder_election")) is not None:
+        algorithm = designated_forwarder_election.get("algorithm")
+        if algorithm == "modulus":
+            lines.append("      designated-forwarder election algorithm modulus")
+        elif algorithm == "preference" and designated_forwarder_election.get("preference_value") is not None:
+            dfe_algo_cli = f"designated-forwarder election algorithm preference {designated_forwarder_election['preference_value']}"
+            if designated_forwarder_election.get("dont_preempt") is True:
+                dfe_algo_cli += " dont-preempt"
+            lines.append(f"      {dfe_algo_cli}")
+        if designated_forwarder_election.get("hold_time") is not None:
+            dfe_hold_time_cli = f"designated-forwarder election hold-time {designated_forwarder_election['hold_time']}"
+            if designated_forwarder_election.get("subsequent_hold_time") is not None:
+                dfe_hold_time_cli += f" subsequent-hold-time {designated_forwarder_election['subsequent_hold_time']}"
+            lines.append(f"      {dfe_hold_time_cli}")
+        if designated_forwarder_election.get("candidate_reachability_required") is True:
+            lines.append("      designated-forwarder election candidate reachability required")
+        elif designated_forwarder_election.get("candidate_reachability_required") is False:
+            lines.append("      no designated-forwarder election candidate reachability required")
+    if (mpls_tunnel_flood_filter_time := get(evpn_ethernet_segment, "mpls.tunnel_flood_filter_time")) is not None:
+        lines.append(f"      mpls tunnel flood filter time {mpls_tunnel_flood_filter_time}")
+    if (mpls_shared_index := get(evpn_ethernet_segment, "mpls.shared_index")) is not None:
+        lines.append(f"      mpls shared index {mpls_shared_index}")
+    return lines
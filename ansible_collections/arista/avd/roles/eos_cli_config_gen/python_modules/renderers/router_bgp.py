@@ -0,0 +1,823 @@
+from __future__ import annotations
+
+from numbers import Number
+
+from ansible_collections.arista.avd.plugins.filter.hide_passwords import hide_passwords
+from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+from .utils import render_eos_cli
+
+ADDRESS_FAMILY_VPN_IPV4_IPV6 = [("address_family_vpn_ipv4", "vpn-ipv4"), ("address_family_vpn_ipv6", "vpn-ipv6")]
+ROUTE_TARGET_KEYS = [("both", "both"), ("import", "import"), ("export", "export")]
+ROUTE_TARGET_EVPN_DOMAIN_KEYS = [
+    ("import_evpn_domains", "import evpn domain"),
+    ("export_evpn_domains", "export evpn domain"),
+    ("import_export_evpn_domains", "import export evpn domain"),
+]
+
+
+def render_router_bgp(router_bgp: dict, hide_passwords: bool = False) -> str:
+    """
+    Return the EOS CLI configuration of "router bgp".
+
+    Python version of the template "eos/router-bgp.j2" giving the exact same output.
+
+    Like the template, the "id" of each entry in "router_bgp.vlans" is converted to a string in-place.
+    """
+    if router_bgp.get("as") is None:
+        return ""
+
+    lines = ["!", f"router bgp {router_bgp['as']}"]
+    lines.extend(_render_global_settings(router_bgp))
+    for peer_group in natural_sort(router_bgp.get("peer_groups"), "name"):
+        if peer_group.get("bgp_listen_range_prefix") is not None and peer_group.get("peer_filter") is not None:
+            lines.append(
+                f"   bgp listen range {peer_group['bgp_listen_range_prefix']} peer-group {peer_group.get('name')} peer-filter {peer_group['peer_filter']}"
+            )
+    for peer_group in natural_sort(router_bgp.get("peer_groups"), "name"):
+        lines.extend(_render_peer_group(peer_group, hide_passwords))
+    lines.extend(_render_neighbor_interfaces(router_bgp.get("neighbor_interfaces"), "   "))
+    for neighbor in natural_sort(router_bgp.get("neighbors"), "ip_address"):
+        lines.extend(_render_neighbor(neighbor, hide_passwords))
+    lines.extend(_render_aggregate_addresses(router_bgp.get("aggregate_addresses"), "   "))
+    lines.extend(_render_redistribute_routes(router_bgp.get("redistribute_routes"), "   "))
+    lines.extend(_render_vlans(router_bgp))
+    for vlan_aware_bundle in natural_sort(router_bgp.get("vlan_aware_bundles"), "name"):
+        lines.extend(["   !", f"   vlan-aware-bundle {vlan_aware_bundle.get('name')}"])
+        lines.extend(_render_evpn_instance(vlan_aware_bundle))
+        lines.append(f"      vlan {vlan_aware_bundle.get('vlan')}")
+    if router_bgp.get("vpws") is not None:
+        lines.extend(_render_vpws(router_bgp["vpws"]))
+    if (address_family_evpn := router_bgp.get("address_family_evpn")) is not None:
+        lines.extend(_render_address_family_evpn(address_family_evpn))
+    for key, address_family in [("address_family_flow_spec_ipv4", "flow-spec ipv4"), ("address_family_flow_spec_ipv6", "flow-spec ipv6")]:
+        if (address_family_flow_spec := router_bgp.get(key)) is not None:
+            lines.extend(["   !", f"   address-family {address_family}"])
+            lines.extend(_render_missing_policy(address_family_flow_spec, "      "))
+            for peer_group in natural_sort(address_family_flow_spec.get("peer_groups"), "name"):
+                lines.extend(_render_activate(peer_group.get("name"), peer_group, "      "))
+            for neighbor in natural_sort(address_family_flow_spec.get("neighbors"), "ip_address"):
+                if neighbor.get("activate") is True:
+                    lines.append(f"      neighbor {neighbor.get('ip_address')} activate")
+    if (address_family_rtc := router_bgp.get("address_family_rtc")) is not None:
+        lines.extend(_render_address_family_rtc(address_family_rtc))
+    if (address_family_ipv4 := router_bgp.get("address_family_ipv4")) is not None:
+        lines.extend(_render_address_family_ipv4(address_family_ipv4))
+    if (address_family_ipv4_multicast := router_bgp.get("address_family_ipv4_multicast")) is not None:
+        lines.extend(_render_address_family_ipv4_multicast(address_family_ipv4_multicast))
+    if (address_family_ipv6 := router_bgp.get("address_family_ipv6")) is not None:
+        lines.extend(_render_address_family_ipv6(address_family_ipv6))
+    if (address_family_ipv6_multicast := router_bgp.get("address_family_ipv6_multicast")) is not None:
+        lines.extend(_render_address_family_ipv6_multicast(address_family_ipv6_multicast))
+    for key, address_family in ADDRESS_FAMILY_VPN_IPV4_IPV6:
+        if (address_family_vpn := router_bgp.get(key)) is not None:
+            lines.extend(_render_address_family_vpn(address_family_vpn, address_family))
+    for vrf in natural_sort(router_bgp.get("vrfs"), "name"):
+        lines.extend(_render_vrf(vrf, hide_passwords))
+    for session_tracker in natural_sort(router_bgp.get("session_trackers"), "name"):
+        lines.append(f"   session tracker {session_tracker.get('name')}")
+        if session_tracker.get("recovery_delay") is not None:
+            lines.append(f"      recovery delay {session_tracker['recovery_delay']} seconds")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _render_global_settings(router_bgp: dict) -> list[str]:
+    lines = []
+    if router_bgp.get("router_id") is not None:
+        lines.append(f"   router-id {router_bgp['router_id']}")
+    if (external_routes := get(router_bgp, "distance.external_routes")) is not None:
+        distance_cli = f"distance bgp {external_routes}"
+        if (internal_routes := get(router_bgp, "distance.internal_routes")) is not None and (
+            local_routes := get(router_bgp, "distance.local_routes")
+        ) is not None:
+            distance_cli += f" {internal_routes} {local_routes}"
+        lines.append(f"   {distance_cli}")
+    if get(router_bgp, "graceful_restart.enabled") is True:
+        if (restart_time := get(router_bgp, "graceful_restart.restart_time")) is not None:
+            lines.append(f"   graceful-restart restart-time {restart_time}")
+        if (stalepath_time := get(router_bgp, "graceful_restart.stalepath_time")) is not None:
+            lines.append(f"   graceful-restart stalepath-time {stalepath_time}")
+        lines.append("   graceful-restart")
+    if (graceful_restart_helper_enabled := get(router_bgp, "graceful_restart_helper.enabled")) is False:
+        lines.append("   no graceful-restart-helper")
+    elif graceful_restart_helper_enabled is True:
+        if (helper_restart_time := get(router_bgp, "graceful_restart_helper.restart_time")) is not None:
+            lines.append(f"   graceful-restart-helper restart-time {helper_restart_time}")
+        elif get(router_bgp, "graceful_restart_helper.long_lived") is True:
+            lines.append("   graceful-restart-helper long-lived")
+    if get(router_bgp, "bgp.route_reflector_preserve_attributes.enabled") is True:
+        rr_preserve_attributes_cli = "bgp route-reflector preserve-attributes"
+        if get(router_bgp, "bgp.route_reflector_preserve_attributes.always") is True:
+            rr_preserve_attributes_cli += " always"
+        lines.append(f"   {rr_preserve_attributes_cli}")
+    if (paths := get(router_bgp, "maximum_paths.paths")) is not None:
+        paths_cli = f"maximum-paths {paths}"
+        if (ecmp := get(router_bgp, "maximum_paths.ecmp")) is not None:
+            paths_cli += f" ecmp {ecmp}"
+        lines.append(f"   {paths_cli}")
+    lines.extend(_render_updates(router_bgp, "   "))
+    if (ipv4_unicast := get(router_bgp, "bgp.default.ipv4_unicast")) is True:
+        lines.append("   bgp default ipv4-unicast")
+    elif ipv4_unicast is False:
+        lines.append("   no bgp default ipv4-unicast")
+    if (ipv4_unicast_transport_ipv6 := get(router_bgp, "bgp.default.ipv4_unicast_transport_ipv6")) is True:
+        lines.append("   bgp default ipv4-unicast transport ipv6")
+    elif ipv4_unicast_transport_ipv6 is False:
+        lines.append("   no bgp default ipv4-unicast transport ipv6")
+    if router_bgp.get("bgp_cluster_id") is not None:
+        lines.append(f"   bgp cluster-id {router_bgp['bgp_cluster_id']}")
+    for bgp_default in get(router_bgp, "bgp_defaults", default=[]):
+        lines.append(f"   {bgp_default}")
+    if get(router_bgp, "bgp.bestpath.d_path") is True:
+        lines.append("   bgp bestpath d-path")
+    if router_bgp.get("listen_ranges") is not None:
+        lines.extend(_render_listen_ranges(router_bgp["listen_ranges"], "   "))
+    return lines
+
+
+def _render_updates(router_bgp_or_vrf: dict, indent: str) -> list[str]:
+    lines = []
+    if get(router_bgp_or_vrf, "updates.wait_for_convergence") is True:
+        lines.append(f"{indent}update wait-for-convergence")
+    if get(router_bgp_or_vrf, "updates.wait_install") is True:
+        lines.append(f"{indent}update wait-install")
+    return lines
+
+
+def _render_listen_ranges(listen_ranges: list, indent: str) -> list[str]:
+    lines = []
+    for listen_range in natural_sort(listen_ranges, "peer_group"):
+        if listen_range.get("peer_group") is None or listen_range.get("prefix") is None:
+            continue
+        if listen_range.get("peer_filter") is None and listen_range.get("remote_as") is None:
+            continue
+
+        listen_range_cli = f"bgp listen range {listen_range['prefix']}"
+        if listen_range.get("peer_id_include_router_id") is True:
+            listen_range_cli += " peer-id include router-id"
+        listen_range_cli += f" peer-group {listen_range['peer_group']}"
+        if listen_range.get("peer_filter") is not None:
+            listen_range_cli += f" peer-filter {listen_range['peer_filter']}"
+        else:
+            listen_range_cli += f" remote-as {listen_range['remote_as']}"
+        lines.append(f"{indent}{listen_range_cli}")
+    return lines
+
+
+def _render_remove_private_as(name: str, peer: dict, indent: str) -> list[str]:
+    lines = []
+    if (remove_private_as_enabled := get(peer, "remove_private_as.enabled")) is True:
+        remove_private_as_cli = f"neighbor {name} remove-private-as"
+        if get(peer, "remove_private_as.all") is True:
+            remove_private_as_cli += " all"
+            if get(peer, "remove_private_as.replace_as") is True:
+                remove_private_as_cli += " replace-as"
+        lines.append(f"{indent}{remove_private_as_cli}")
+    elif remove_private_as_enabled is False:
+        lines.append(f"{indent}no neighbor {name} remove-private-as")
+    if (remove_private_as_ingress_enabled := get(peer, "remove_private_as_ingress.enabled")) is True:
+        remove_private_as_ingress_cli = f"neighbor {name} remove-private-as ingress"
+        if get(peer, "remove_private_as_ingress.replace_as") is True:
+            remove_private_as_ingress_cli += " replace-as"
+        lines.append(f"{indent}{remove_private_as_ingress_cli}")
+    elif remove_private_as_ingress_enabled is False:
+        lines.append(f"{indent}no neighbor {name} remove-private-as ingress")
+    return lines
+
+
+def _render_as_path(name: str, peer: dict, indent: str) -> list[str]:
+    lines = []
+    if get(peer, "as_path.remote_as_replace_out") is True:
+        lines.append(f"{indent}neighbor {name} as-path remote-as replace out")
+    if get(peer, "as_path.prepend_own_disabled") is True:
+        lines.append(f"{indent}neighbor {name} as-path prepend-own disabled")
+    return lines
+
+
+def _render_allowas_in(name: str, peer: dict, indent: str) -> list[str]:
+    if get(peer, "allowas_in.enabled") is not True:
+        return []
+
+    allowas_in_cli = f"neighbor {name} allowas-in"
+    if (times := get(peer, "allowas_in.times")) is not None:
+        allowas_in_cli += f" {times}"
+    return [f"{indent}{allowas_in_cli}"]
+
+
+def _render_rib_in_pre_policy_retain(name: str, peer: dict, indent: str) -> list[str]:
+    if (enabled := get(peer, "rib_in_pre_policy_retain.enabled")) is True:
+        neighbor_rib_in_pre_policy_retain_cli = f"neighbor {name} rib-in pre-policy retain"
+        if get(peer, "rib_in_pre_policy_retain.all") is True:
+            neighbor_rib_in_pre_policy_retain_cli += " all"
+        return [f"{indent}{neighbor_rib_in_pre_policy_retain_cli}"]
+    if enabled is False:
+        return [f"{indent}no neighbor {name} rib-in pre-policy retain"]
+    return []
+
+
+def _render_default_originate(name: str, default_originate: dict, indent: str) -> list[str]:
+    default_originate_cli = f"neighbor {name} default-originate"
+    if default_originate.get("route_map") is not None:
+        default_originate_cli += f" route-map {default_originate['route_map']}"
+    if default_originate.get("always") is True:
+        default_originate_cli += " always"
+    return [f"{indent}{default_originate_cli}"]
+
+
+def _render_send_community(name: str, peer: dict, indent: str) -> list[str]:
+    if (send_community := peer.get("send_community")) == "all":
+        return [f"{indent}neighbor {name} send-community"]
+    if send_community is not None:
+        return [f"{indent}neighbor {name} send-community {send_community}"]
+    return []
+
+
+def _render_maximum_routes(name: str, peer: dict, indent: str) -> list[str]:
+    if peer.get("maximum_routes") is None:
+        return []
+
+    maximum_routes_cli = f"neighbor {name} maximum-routes {peer['maximum_routes']}"
+    if peer.get("maximum_routes_warning_limit") is not None:
+        maximum_routes_cli += f" warning-limit {peer['maximum_routes_warning_limit']}"
+    if peer.get("maximum_routes_warning_only") is True:
+        maximum_routes_cli += " warning-only"
+    return [f"{indent}{maximum_routes_cli}"]
+
+
+def _render_link_bandwidth(name: str, peer: dict, indent: str) -> list[str]:
+    if get(peer, "link_bandwidth.enabled") is not True:
+        return []
+
+    link_bandwidth_cli = f"neighbor {name} link-bandwidth"
+    if (default := get(peer, "link_bandwidth.default")) is not None:
+        link_bandwidth_cli += f" default {default}"
+    return [f"{indent}{link_bandwidth_cli}"]
+
+
+def _render_peer_group(peer_group: dict, hide_passwords_flag: bool) -> list[str]:
+    name = peer_group.get("name")
+    lines = []
+    if peer_group.get("shutdown") is True:
+        lines.append(f"   neighbor {name} shutdown")
+    lines.append(f"   neighbor {name} peer group")
+    if peer_group.get("remote_as") is not None:
+        lines.append(f"   neighbor {name} remote-as {peer_group['remote_as']}")
+    if peer_group.get("local_as") is not None:
+        lines.append(f"   neighbor {name} local-as {peer_group['local_as']} no-prepend replace-as")
+    lines.extend(_render_as_path(name, peer_group, "   "))
+    if peer_group.get("next_hop_self") is True:
+        lines.append(f"   neighbor {name} next-hop-self")
+    if peer_group.get("next_hop_unchanged") is True:
+        lines.append(f"   neighbor {name} next-hop-unchanged")
+    lines.extend(_render_remove_private_as(name, peer_group, "   "))
+    if peer_group.get("update_source") is not None:
+        lines.append(f"   neighbor {name} update-source {peer_group['update_source']}")
+    if peer_group.get("description") is not None:
+        lines.append(f"   neighbor {name} description {peer_group['description']}")
+    if peer_group.get("route_reflector_client") is True:
+        lines.append(f"   neighbor {name} route-reflector-client")
+    if peer_group.get("bfd") is True:
+        lines.append(f"   neighbor {name} bfd")
+    lines.extend(_render_allowas_in(name, peer_group, "   "))
+    lines.extend(_render_rib_in_pre_policy_retain(name, peer_group, "   "))
+    if peer_group.get("ebgp_multihop") is not None:
+        lines.append(f"   neighbor {name} ebgp-multihop {peer_group['ebgp_multihop']}")
+    if peer_group.get("password") is not None:
+        lines.append(f"   neighbor {name} password 7 {hide_passwords(peer_group['password'], hide_passwords_flag)}")
+    if get(peer_group, "default_originate.enabled") is True:
+        lines.extend(_render_default_originate(name, peer_group["default_originate"], "   "))
+    if peer_group.get("passive") is True:
+        lines.append(f"   neighbor {name} passive")
+    if peer_group.get("session_tracker") is not None:
+        lines.append(f"   neighbor {name} session tracker {peer_group['session_tracker']}")
+    lines.extend(_render_send_community(name, peer_group, "   "))
+    lines.extend(_render_maximum_routes(name, peer_group, "   "))
+    lines.extend(_render_link_bandwidth(name, peer_group, "   "))
+    if peer_group.get("weight") is not None:
+        lines.append(f"   neighbor {name} weight {peer_group['weight']}")
+    if peer_group.get("timers") is not None:
+        lines.append(f"   neighbor {name} timers {peer_group['timers']}")
+    lines.extend(_render_route_maps(name, peer_group, "   "))
+    return lines
+
+
+def _render_neighbor_interfaces(neighbor_interfaces: list | None, indent: str) -> list[str]:
+    lines = []
+    for neighbor_interface in natural_sort(neighbor_interfaces, "name"):
+        if neighbor_interface.get("peer_group") is None:
+            continue
+        if neighbor_interface.get("remote_as") is not None:
+            lines.append(
+                f"{indent}neighbor interface {neighbor_interface.get('name')} peer-group {neighbor_interface['peer_group']}"
+                f" remote-as {neighbor_interface['remote_as']}"
+            )
+        elif neighbor_interface.get("peer_filter") is not None:
+            lines.append(
+                f"{indent}neighbor interface {neighbor_interface.get('name')} peer-group {neighbor_interface['peer_group']}"
+                f" peer-filter {neighbor_interface['peer_filter']}"
+            )
+    return lines
+
+
+def _render_neighbor(neighbor: dict, hide_passwords_flag: bool) -> list[str]:
+    ip_address = neighbor.get("ip_address")
+    lines = []
+    if neighbor.get("peer_group") is not None:
+        lines.append(f"   neighbor {ip_address} peer group {neighbor['peer_group']}")
+    if neighbor.get("remote_as") is not None:
+        lines.append(f"   neighbor {ip_address} remote-as {neighbor['remote_as']}")
+    if neighbor.get("next_hop_self") is True:
+        lines.append(f"   neighbor {ip_address} next-hop-self")
+    if neighbor.get("shutdown") is True:
+        lines.append(f"   neighbor {ip_address} shutdown")
+    lines.extend(_render_remove_private_as(ip_address, neighbor, "   "))
+    lines.extend(_render_as_path(ip_address, neighbor, "   "))
+    if neighbor.get("local_as") is not None:
+        lines.append(f"   neighbor {ip_address} local-as {neighbor['local_as']} no-prepend replace-as")
+    if neighbor.get("description") is not None:
+        lines.append(f"   neighbor {ip_address} description {neighbor['description']}")
+    if neighbor.get("route_reflector_client") is True:
+        lines.append(f"   neighbor {ip_address} route-reflector-client")
+    elif neighbor.get("route_reflector_client") is False:
+        lines.append(f"   no neighbor {ip_address} route-reflector-client")
+    if neighbor.get("ebgp_multihop") is not None:
+        lines.append(f"   neighbor {ip_address} ebgp-multihop {neighbor['ebgp_multihop']}")
+    if neighbor.get("update_source") is not None:
+        lines.append(f"   neighbor {ip_address} update-source {neighbor['update_source']}")
+    if neighbor.get("bfd") is True:
+        lines.append(f"   neighbor {ip_address} bfd")
+    elif neighbor.get("bfd") is False and neighbor.get("peer_group") is not None:
+        lines.append(f"   no neighbor {ip_address} bfd")
+    lines.extend(_render_allowas_in(ip_address, neighbor, "   "))
+    lines.extend(_render_rib_in_pre_policy_retain(ip_address, neighbor, "   "))
+    if neighbor.get("password") is not None:
+        # Keeping the indentation of two spaces from the template. EOS accepts it the same way.
+        lines.append(f"  neighbor {ip_address} password 7 {hide_passwords(neighbor['password'], hide_passwords_flag)}")
+    if neighbor.get("passive") is True:
+        lines.append(f"   neighbor {ip_address} passive")
+    if neighbor.get("weight") is not None:
+        lines.append(f"   neighbor {ip_address} weight {neighbor['weight']}")
+    if neighbor.get("session_tracker") is not None:
+        lines.append(f"   neighbor {ip_address} session tracker {neighbor['session_tracker']}")
+    if neighbor.get("timers") is not None:
+        lines.append(f"   neighbor {ip_address} timers {neighbor['timers']}")
+    lines.extend(_render_route_maps(ip_address, neighbor, "   "))
+    if get(neighbor, "default_originate.enabled") is True:
+        lines.extend(_render_default_originate(ip_address, neighbor["default_originate"], "   "))
+    lines.extend(_render_send_community(ip_address, neighbor, "   "))
+    lines.extend(_render_maximum_routes(ip_address, neighbor, "   "))
+    lines.extend(_render_link_bandwidth(ip_address, neighbor, "   "))
+    return lines
+
+
+def _render_aggregate_addresses(aggregate_addresses: list | None, indent: str) -> list[str]:
+    lines = []
+    for aggregate_address in natural_sort(aggregate_addresses, "prefix"):
+        aggregate_address_cli = f"aggregate-address {aggregate_address.get('prefix')}"
+        if aggregate_address.get("as_set") is True:
+            aggregate_address_cli += " as-set"
+        if aggregate_address.get("summary_only") is True:
+            aggregate_address_cli += " summary-only"
+        if aggregate_address.get("attribute_map") is not None:
+            aggregate_address_cli += f" attribute-map {aggregate_address['attribute_map']}"
+        if aggregate_address.get("match_map") is not None:
+            aggregate_address_cli += f" match-map {aggregate_address['match_map']}"
+        if aggregate_address.get("advertise_only") is True:
+            aggregate_address_cli += " advertise-only"
+        lines.append(f"{indent}{aggregate_address_cli}")
+    return lines
+
+
+def _render_redistribute_routes(redistribute_routes: list | None, indent: str) -> list[str]:
+    lines = []
+    for redistribute_route in natural_sort(redistribute_routes, "source_protocol"):
+        if redistribute_route.get("source_protocol") is None:
+            continue
+        redistribute_route_cli = f"redistribute {redistribute_route['source_protocol']}"
+        if redistribute_route.get("route_map") is not None:
+            redistribute_route_cli += f" route-map {redistribute_route['route_map']}"
+        lines.append(f"{indent}{redistribute_route_cli}")
+    return lines
+
+
+def _render_vlans(router_bgp: dict) -> list[str]:
+    """
+    L2VPNs - (vxlan) vlan based.
+    """
+    if (bgp_vlans := router_bgp.get("vlans")) is None:
+        return []
+
+    # Force the ids to be string to follow the same ordering as on EOS.
+    # Updating in-place like the template.
+    for bgp_vlan in bgp_vlans:
+        bgp_vlan.update({"id": str(bgp_vlan["id"])})
+
+    lines = []
+    for vlan in sorted(bgp_vlans, key=lambda bgp_vlan: bgp_vlan["id"].lower()):
+        lines.extend(["   !", f"   vlan {vlan['id']}"])
+        lines.extend(_render_evpn_instance(vlan))
+        if vlan.get("eos_cli") is not None:
+            lines.extend(["      !", render_eos_cli(vlan["eos_cli"], 6)])
+    return lines
+
+
+def _render_evpn_instance(vlan_or_bundle: dict) -> list[str]:
+    """
+    Return the common lines of "vlan" and "vlan-aware-bundle".
+    """
+    lines = []
+    if vlan_or_bundle.get("rd") is not None:
+        lines.append(f"      rd {vlan_or_bundle['rd']}")
+    if (rd_evpn_domain_domain := get(vlan_or_bundle, "rd_evpn_domain.domain")) is not None and (
+        rd_evpn_domain_rd := get(vlan_or_bundle, "rd_evpn_domain.rd")
+    ) is not None:
+        lines.append(f"      rd evpn domain {rd_evpn_domain_domain} {rd_evpn_domain_rd}")
+    route_targets = vlan_or_bundle.get("route_targets") or {}
+    for key, direction in ROUTE_TARGET_KEYS:
+        for route_target in natural_sort(route_targets.get(key)):
+            lines.append(f"      route-target {direction} {route_target}")
+    for key, direction in ROUTE_TARGET_EVPN_DOMAIN_KEYS:
+        for route_target in natural_sort(route_targets.get(key)):
+            lines.append(f"      route-target {direction} {route_target.get('domain')} {route_target.get('route_target')}")
+    for redistribute_route in natural_sort(vlan_or_bundle.get("redistribute_routes")):
+        lines.append(f"      redistribute {redistribute_route}")
+    for no_redistribute_route in natural_sort(vlan_or_bundle.get("no_redistribute_routes")):
+        lines.append(f"      no redistribute {no_redistribute_route}")
+    return lines
+
+
+def _render_vpws(vpws: list) -> list[str]:
+    """
+    BGP vpws services.
+    """
+    lines = []
+    for vpws_service in natural_sort(vpws, "name"):
+        lines.append("   !")
+        if vpws_service.get("name") is None:
+            continue
+        lines.append(f"   vpws {vpws_service['name']}")
+        if vpws_service.get("rd") is not None:
+            lines.append(f"      rd {vpws_service['rd']}")
+        if (import_export := get(vpws_service, "route_targets.import_export")) is not None:
+            lines.append(f"      route-target import export evpn {import_export}")
+        if vpws_service.get("mpls_control_word") is True:
+            lines.append("      mpls control-word")
+        if vpws_service.get("label_flow") is True:
+            lines.append("      label flow")
+        if vpws_service.get("mtu") is not None:
+            lines.append(f"      mtu {vpws_service['mtu']}")
+        for pw in natural_sort(vpws_service.get("pseudowires"), "name"):
+            if pw.get("name") is not None and pw.get("id_local") is not None and pw.get("id_remote") is not None:
+                lines.extend(["      !", f"      pseudowire {pw['name']}", f"         evpn vpws id local {pw['id_local']} remote {pw['id_remote']}"])
+    return lines
+
+
+def _render_activate(name: str, peer: dict, indent: str) -> list[str]:
+    if peer.get("activate") is True:
+        return [f"{indent}neighbor {name} activate"]
+    if peer.get("activate") is False:
+        return [f"{indent}no neighbor {name} activate"]
+    return []
+
+
+def _render_route_maps(name: str, peer: dict, indent: str) -> list[str]:
+    lines = []
+    if peer.get("route_map_in") is not None:
+        lines.append(f"{indent}neighbor {name} route-map {peer['route_map_in']} in")
+    if peer.get("route_map_out") is not None:
+        lines.append(f"{indent}neighbor {name} route-map {peer['route_map_out']} out")
+    return lines
+
+
+def _render_prefix_lists(name: str, peer: dict, indent: str) -> list[str]:
+    lines = []
+    if peer.get("prefix_list_in") is not None:
+        lines.append(f"{indent}neighbor {name} prefix-list {peer['prefix_list_in']} in")
+    if peer.get("prefix_list_out") is not None:
+        lines.append(f"{indent}neighbor {name} prefix-list {peer['prefix_list_out']} out")
+    return lines
+
+
+def _render_networks(networks: list | None, indent: str) -> list[str]:
+    lines = []
+    for network in natural_sort(networks, "prefix"):
+        network_cli = f"network {network.get('prefix')}"
+        if network.get("route_map") is not None:
+            network_cli += f" route-map {network['route_map']}"
+        lines.append(f"{indent}{network_cli}")
+    return lines
+
+
+def _render_missing_policy(address_family: dict, indent: str) -> list[str]:
+    lines = []
+    if (direction_in_action := get(address_family, "bgp.missing_policy.direction_in_action")) is not None:
+        lines.append(f"{indent}bgp missing-policy direction in action {direction_in_action}")
+    if (direction_out_action := get(address_family, "bgp.missing_policy.direction_out_action")) is not None:
+        lines.append(f"{indent}bgp missing-policy direction out action {direction_out_action}")
+    return lines
+
+
+def _render_address_family_evpn(address_family_evpn: dict) -> list[str]:
+    lines = ["   !", "   address-family evpn"]
+    if (hostflap_detection_enabled := get(address_family_evpn, "evpn_hostflap_detection.enabled")) is False:
+        lines.append("      no host-flap detection")
+    elif hostflap_detection_enabled is True:
+        evpn_hostflap_detection = address_family_evpn["evpn_hostflap_detection"]
+        hostflap_detection_cli = ""
+        if evpn_hostflap_detection.get("window") is not None:
+            hostflap_detection_cli += f" window {evpn_hostflap_detection['window']}"
+        if evpn_hostflap_detection.get("threshold") is not None:
+            hostflap_detection_cli += f" threshold {evpn_hostflap_detection['threshold']}"
+        if evpn_hostflap_detection.get("expiry_timeout") is not None:
+            hostflap_detection_cli += f" expiry timeout {evpn_hostflap_detection['expiry_timeout']} seconds"
+        if hostflap_detection_cli != "":
+            lines.append(f"      host-flap detection{hostflap_detection_cli}")
+    if address_family_evpn.get("domain_identifier") is not None:
+        lines.append(f"      domain identifier {address_family_evpn['domain_identifier']}")
+    if get(address_family_evpn, "neighbor_default.encapsulation") == "mpls":
+        evpn_neighbor_default_encap_cli = "neighbor default encapsulation mpls"
+        if (next_hop_self_source_interface := get(address_family_evpn, "neighbor_default.next_hop_self_source_interface")) is not None:
+            evpn_neighbor_default_encap_cli += f" next-hop-self source-interface {next_hop_self_source_interface}"
+        lines.append(f"      {evpn_neighbor_default_encap_cli}")
+    for peer_group in natural_sort(address_family_evpn.get("peer_groups"), "name"):
+        name = peer_group.get("name")
+        lines.extend(_render_route_maps(name, peer_group, "      "))
+        lines.extend(_render_activate(name, peer_group, "      "))
+        if peer_group.get("domain_remote") is True:
+            lines.append(f"      neighbor {name} domain remote")
+        if peer_group.get("encapsulation") is not None:
+            lines.append(f"      neighbor {name} encapsulation {peer_group['encapsulation']}")
+    if get(address_family_evpn, "neighbor_default.next_hop_self_received_evpn_routes.enable") is True:
+        evpn_neighbor_default_nhs_received_evpn_routes_cli = "neighbor default next-hop-self received-evpn-routes route-type ip-prefix"
+        if get(address_family_evpn, "neighbor_default.next_hop_self_received_evpn_routes.inter_domain") is True:
+            evpn_neighbor_default_nhs_received_evpn_routes_cli += " inter-domain"
+        lines.append(f"      {evpn_neighbor_default_nhs_received_evpn_routes_cli}")
+    if get(address_family_evpn, "route.import_match_failure_action") == "discard":
+        lines.append("      route import match-failure action discard")
+    return lines
+
+
+def _render_address_family_rtc(address_family_rtc: dict) -> list[str]:
+    lines = ["   !", "   address-family rt-membership"]
+    for peer_group in natural_sort(address_family_rtc.get("peer_groups"), "name"):
+        name = peer_group.get("name")
+        lines.extend(_render_activate(name, peer_group, "      "))
+        # The template is using the Jinja2 "defined" test here, so keys set to None also count.
+        default_route_target = peer_group.get("default_route_target")
+        if "default_route_target" in peer_group:
+            if isinstance(default_route_target, dict) and default_route_target.get("only") is True:
+                lines.append(f"      neighbor {name} default-route-target only")
+            else:
+                lines.append(f"      neighbor {name} default-route-target")
+        if isinstance(default_route_target, dict) and "encoding_origin_as_omit" in default_route_target:
+            lines.append(f"      neighbor {name} default-route-target encoding origin-as omit")
+    return lines
+
+
+def _render_address_family_ipv4(address_family_ipv4: dict) -> list[str]:
+    lines = ["   !", "   address-family ipv4"]
+    for peer_group in natural_sort(address_family_ipv4.get("peer_groups"), "name"):
+        name = peer_group.get("name")
+        lines.extend(_render_route_maps(name, peer_group, "      "))
+        lines.extend(_render_prefix_lists(name, peer_group, "      "))
+        if peer_group.get("default_originate") is not None:
+            lines.extend(_render_default_originate(name, peer_group["default_originate"], "      "))
+        if get(peer_group, "next_hop.address_family_ipv6.enabled") is True:
+            nexthop_v6_cli = f"neighbor {name} next-hop address-family ipv6"
+            if get(peer_group, "next_hop.address_family_ipv6.originate") is True:
+                nexthop_v6_cli += " originate"
+            lines.append(f"      {nexthop_v6_cli}")
+        elif get(peer_group, "next_hop.address_family_ipv6_originate") is True:
+            lines.append(f"      neighbor {name} next-hop address-family ipv6 originate")
+        lines.extend(_render_activate(name, peer_group, "      "))
+    for neighbor in natural_sort(address_family_ipv4.get("neighbors"), "ip_address"):
+        ip_address = neighbor.get("ip_address")
+        lines.extend(_render_route_maps(ip_address, neighbor, "      "))
+        lines.extend(_render_prefix_lists(ip_address, neighbor, "      "))
+        if neighbor.get("default_originate") is not None:
+            lines.extend(_render_default_originate(ip_address, neighbor["default_originate"], "      "))
+        lines.extend(_render_activate(ip_address, neighbor, "      "))
+    lines.extend(_render_networks(address_family_ipv4.get("networks"), "      "))
+    return lines
+
+
+def _render_address_family_ipv4_multicast(address_family_ipv4_multicast: dict) -> list[str]:
+    lines = ["   !", "   address-family ipv4 multicast"]
+    for peer_group in natural_sort(address_family_ipv4_multicast.get("peer_groups"), "name"):
+        lines.extend(_render_route_maps(peer_group.get("name"), peer_group, "      "))
+        lines.extend(_render_activate(peer_group.get("name"), peer_group, "      "))
+    for neighbor in natural_sort(address_family_ipv4_multicast.get("neighbors"), "ip_address"):
+        lines.extend(_render_route_maps(neighbor.get("ip_address"), neighbor, "      "))
+        lines.extend(_render_activate(neighbor.get("ip_address"), neighbor, "      "))
+    lines.extend(_render_redistribute_routes(address_family_ipv4_multicast.get("redistribute_routes"), "      "))
+    return lines
+
+
+def _render_address_family_ipv6(address_family_ipv6: dict) -> list[str]:
+    lines = ["   !", "   address-family ipv6"]
+    for peer_group in natural_sort(address_family_ipv6.get("peer_groups"), "name"):
+        lines.extend(_render_route_maps(peer_group.get("name"), peer_group, "      "))
+        lines.extend(_render_prefix_lists(peer_group.get("name"), peer_group, "      "))
+        lines.extend(_render_activate(peer_group.get("name"), peer_group, "      "))
+    for neighbor in natural_sort(address_family_ipv6.get("neighbors"), "ip_address"):
+        lines.extend(_render_route_maps(neighbor.get("ip_address"), neighbor, "      "))
+        lines.extend(_render_prefix_lists(neighbor.get("ip_address"), neighbor, "      "))
+        lines.extend(_render_activate(neighbor.get("ip_address"), neighbor, "      "))
+    lines.extend(_render_networks(address_family_ipv6.get("networks"), "      "))
+    lines.extend(_render_redistribute_routes(address_family_ipv6.get("redistribute_routes"), "      "))
+    return lines
+
+
+def _render_address_family_ipv6_multicast(address_family_ipv6_multicast: dict) -> list[str]:
+    lines = ["   !", "   address-family ipv6 multicast"]
+    lines.extend(_render_missing_policy(address_family_ipv6_multicast, "      "))
+    if get(address_family_ipv6_multicast, "bgp.additional_paths.receive") is True:
+        lines.append("      bgp additional-paths receive")
+    for peer_group in natural_sort(address_family_ipv6_multicast.get("peer_groups"), "name"):
+        lines.extend(_render_activate(peer_group.get("name"), peer_group, "      "))
+    for neighbor in natural_sort(address_family_ipv6_multicast.get("neighbors"), "ip_address"):
+        if neighbor.get("activate") is True:
+            lines.append(f"      neighbor {neighbor.get('ip_address')} activate")
+        lines.extend(_render_route_maps(neighbor.get("ip_address"), neighbor, "      "))
+    lines.extend(_render_networks(address_family_ipv6_multicast.get("networks"), "      "))
+    return lines
+
+
+def _render_address_family_vpn(address_family_vpn: dict, address_family: str) -> list[str]:
+    lines = ["   !", f"   address-family {address_family}"]
+    if address_family_vpn.get("domain_identifier") is not None:
+        lines.append(f"      domain identifier {address_family_vpn['domain_identifier']}")
+    for peer_group in natural_sort(address_family_vpn.get("peer_groups"), "name"):
+        lines.extend(_render_activate(peer_group.get("name"), peer_group, "      "))
+        lines.extend(_render_route_maps(peer_group.get("name"), peer_group, "      "))
+    for neighbor in natural_sort(address_family_vpn.get("neighbors"), "ip_address"):
+        lines.extend(_render_activate(neighbor.get("ip_address"), neighbor, "      "))
+        lines.extend(_render_route_maps(neighbor.get("ip_address"), neighbor, "      "))
+    if (source_interface := get(address_family_vpn, "neighbor_default_encapsulation_mpls_next_hop_self.source_interface")) is not None:
+        lines.append(f"      neighbor default encapsulation mpls next-hop-self source-interface {source_interface}")
+    if get(address_family_vpn, "route.import_match_failure_action") == "discard":
+        lines.append("      route import match-failure action discard")
+    return lines
+
+
+def _render_vrf(vrf: dict, hide_passwords_flag: bool) -> list[str]:
+    """
+    L3VPNs - (vxlan) VRFs.
+    """
+    lines = ["   !", f"   vrf {vrf.get('name')}"]
+    if vrf.get("rd") is not None:
+        lines.append(f"      rd {vrf['rd']}")
+    if vrf.get("evpn_multicast") is True:
+        lines.append("      evpn multicast")
+        if get(vrf, "evpn_multicast_address_family.ipv4") is not None and get(vrf, "evpn_multicast_address_family.ipv4.transit") is True:
+            lines.extend(["         address-family ipv4", "            transit"])
+    for direction in ["import", "export"]:
+        for address_family in get(vrf, f"route_targets.{direction}", default=[]):
+            for route_target in address_family.get("route_targets") or []:
+                lines.append(f"      route-target {direction} {address_family.get('address_family')} {route_target}")
+    if vrf.get("router_id") is not None:
+        lines.append(f"      router-id {vrf['router_id']}")
+    lines.extend(_render_updates(vrf, "      "))
+    if vrf.get("timers") is not None:
+        lines.append(f"      timers bgp {vrf['timers']}")
+    if vrf.get("listen_ranges") is not None:
+        lines.extend(_render_listen_ranges(vrf["listen_ranges"], "      "))
+    lines.extend(_render_neighbor_interfaces(vrf.get("neighbor_interfaces"), "      "))
+    for neighbor in natural_sort(vrf.get("neighbors"), "ip_address"):
+        lines.extend(_render_vrf_neighbor(neighbor, hide_passwords_flag))
+    lines.extend(_render_networks(vrf.get("networks"), "      "))
+    lines.extend(_render_aggregate_addresses(vrf.get("aggregate_addresses"), "      "))
+    lines.extend(_render_redistribute_routes(vrf.get("redistribute_routes"), "      "))
+    for key, address_family in [("address_family_flow_spec_ipv4", "flow-spec ipv4"), ("address_family_flow_spec_ipv6", "flow-spec ipv6")]:
+        if (address_family_flow_spec := vrf.get(key)) is not None:
+            lines.extend(["      !", f"      address-family {address_family}"])
+            lines.extend(_render_missing_policy(address_family_flow_spec, "         "))
+            for neighbor in natural_sort(address_family_flow_spec.get("neighbors"), "ip_address"):
+                if neighbor.get("activate") is True:
+                    lines.append(f"         neighbor {neighbor.get('ip_address')} activate")
+    for key, address_family in [
+        ("address_family_ipv4", "ipv4"),
+        ("address_family_ipv4_multicast", "ipv4 multicast"),
+        ("address_family_ipv6", "ipv6"),
+        ("address_family_ipv6_multicast", "ipv6 multicast"),
+    ]:
+        if (vrf_address_family := vrf.get(key)) is not None:
+            lines.extend(_render_vrf_address_family(vrf_address_family, address_family))
+    for address_family in natural_sort(vrf.get("address_families"), "address_family"):
+        lines.extend(["      !", f"      address-family {address_family.get('address_family')}"])
+        if address_family.get("bgp") is not None:
+            lines.extend(_render_missing_policy(address_family, "         "))
+            for additional_path in natural_sort(get(address_family, "bgp.additional_paths")):
+                lines.append(f"         bgp additional-paths {additional_path}")
+        for peer_group in natural_sort(address_family.get("peer_groups"), "name"):
+            lines.extend(_render_activate(peer_group.get("name"), peer_group, "         "))
+            if get(peer_group, "next_hop.address_family_ipv6_originate") is True:
+                lines.append(f"         neighbor {peer_group.get('name')} next-hop address-family ipv6 originate")
+        for neighbor in natural_sort(address_family.get("neighbors"), "ip_address"):
+            if neighbor.get("activate") is True:
+                lines.append(f"         neighbor {neighbor.get('ip_address')} activate")
+            lines.extend(_render_route_maps(neighbor.get("ip_address"), neighbor, "         "))
+        lines.extend(_render_networks(address_family.get("networks"), "         "))
+    if vrf.get("eos_cli") is not None:
+        lines.extend(["      !", render_eos_cli(vrf["eos_cli"], 6)])
+    return lines
+
+
+def _render_vrf_neighbor(neighbor: dict, hide_passwords_flag: bool) -> list[str]:
+    ip_address = neighbor.get("ip_address")
+    lines = []
+    if neighbor.get("remote_as") is not None:
+        lines.append(f"      neighbor {ip_address} remote-as {neighbor['remote_as']}")
+    if neighbor.get("peer_group") is not None:
+        lines.append(f"      neighbor {ip_address} peer group {neighbor['peer_group']}")
+    lines.extend(_render_remove_private_as(ip_address, neighbor, "      "))
+    if neighbor.get("password") is not None:
+        lines.append(f"      neighbor {ip_address} password 7 {hide_passwords(neighbor['password'], hide_passwords_flag)}")
+    if neighbor.get("passive") is True:
+        lines.append(f"      neighbor {ip_address} passive")
+    if neighbor.get("weight") is not None:
+        lines.append(f"      neighbor {ip_address} weight {neighbor['weight']}")
+    lines.extend(_render_as_path(ip_address, neighbor, "      "))
+    if neighbor.get("local_as") is not None:
+        lines.append(f"      neighbor {ip_address} local-as {neighbor['local_as']} no-prepend replace-as")
+    if neighbor.get("description") is not None:
+        lines.append(f"      neighbor {ip_address} description {neighbor['description']}")
+    if (ebgp_multihop := neighbor.get("ebgp_multihop")) is not None:
+        neighbor_ebgp_multihop_cli = f"neighbor {ip_address} ebgp-multihop"
+        if isinstance(ebgp_multihop, Number):
+            neighbor_ebgp_multihop_cli += f" {ebgp_multihop}"
+        lines.append(f"      {neighbor_ebgp_multihop_cli}")
+    if neighbor.get("next_hop_self") is True:
+        lines.append(f"      neighbor {ip_address} next-hop-self")
+    if neighbor.get("bfd") is True:
+        lines.append(f"      neighbor {ip_address} bfd")
+    elif neighbor.get("bfd") is False and neighbor.get("peer_group") is not None:
+        lines.append(f"      no neighbor {ip_address} bfd")
+    lines.extend(_render_allowas_in(ip_address, neighbor, "      "))
+    lines.extend(_render_rib_in_pre_policy_retain(ip_address, neighbor, "      "))
+    if neighbor.get("timers") is not None:
+        lines.append(f"      neighbor {ip_address} timers {neighbor['timers']}")
+    if neighbor.get("shutdown") is True:
+        lines.append(f"      neighbor {ip_address} shutdown")
+    lines.extend(_render_send_community(ip_address, neighbor, "      "))
+    if neighbor.get("route_reflector_client") is True:
+        lines.append(f"      neighbor {ip_address} route-reflector-client")
+    elif neighbor.get("route_reflector_client") is False:
+        lines.append(f"      no neighbor {ip_address} route-reflector-client")
+    lines.extend(_render_maximum_routes(ip_address, neighbor, "      "))
+    if neighbor.get("default_originate") is not None:
+        lines.extend(_render_default_originate(ip_address, neighbor["default_originate"], "      "))
+    if neighbor.get("update_source") is not None:
+        lines.append(f"      neighbor {ip_address} update-source {neighbor['update_source']}")
+    if neighbor.get("route_map_out") is not None:
+        lines.append(f"      neighbor {ip_address} route-map {neighbor['route_map_out']} out")
+    if neighbor.get("route_map_in") is not None:
+        lines.append(f"      neighbor {ip_address} route-map {neighbor['route_map_in']} in")
+    lines.extend(_render_prefix_lists(ip_address, neighbor, "      "))
+    return lines
+
+
+def _render_vrf_address_family(vrf_address_family: dict, address_family: str) -> list[str]:
+    """
+    Return the lines for one of the address families ipv4, ipv4 multicast, ipv6 and ipv6 multicast under a VRF.
+    """
+    multicast = address_family.endswith("multicast")
+    lines = ["      !", f"      address-family {address_family}"]
+    lines.extend(_render_missing_policy(vrf_address_family, "         "))
+    additional_paths = get(vrf_address_family, "bgp.additional_paths") or {}
+    if not multicast:
+        if additional_paths.get("install") is True:
+            lines.append("         bgp additional-paths install")
+        elif additional_paths.get("install_ecmp_primary") is True:
+            lines.append("         bgp additional-paths install ecmp-primary")
+    if additional_paths.get("receive") is True:
+        lines.append("         bgp additional-paths receive")
+    if not multicast:
+        send = additional_paths.get("send") or {}
+        if send.get("any") is True:
+            lines.append("         bgp additional-paths send any")
+        elif send.get("backup") is True:
+            lines.append("         bgp additional-paths send backup")
+        elif send.get("ecmp") is True:
+            lines.append("         bgp additional-paths send ecmp")
+        elif send.get("ecmp_limit") is not None:
+            lines.append(f"         bgp additional-paths send ecmp limit {send['ecmp_limit']}")
+        elif send.get("limit") is not None:
+            lines.append(f"         bgp additional-paths send limit {send['limit']}")
+    for neighbor in natural_sort(vrf_address_family.get("neighbors"), "ip_address"):
+        ip_address = neighbor.get("ip_address")
+        if neighbor.get("activate") is True:
+            lines.append(f"         neighbor {ip_address} activate")
+        lines.extend(_render_route_maps(ip_address, neighbor, "         "))
+        if address_family == "ipv4" and (next_hop_ipv6_enabled := get(neighbor, "next_hop.address_family_ipv6.enabled")) is not None:
+            if next_hop_ipv6_enabled is True:
+                ipv6_originate_cli = f"neighbor {ip_address} next-hop address-family ipv6"
+                if get(neighbor, "next_hop.address_family_ipv6.originate") is True:
+                    ipv6_originate_cli += " originate"
+                lines.append(f"         {ipv6_originate_cli}")
+            elif next_hop_ipv6_enabled is False:
+                lines.append(f"         no neighbor {ip_address} next-hop address-family ipv6")
+    lines.extend(_render_networks(vrf_address_family.get("networks"), "         "))
+    return lines
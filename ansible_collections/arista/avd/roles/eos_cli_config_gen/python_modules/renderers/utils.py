@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from jinja2.filters import do_indent
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+
+def render_eos_cli(eos_cli: str, width: int) -> str:
+    """
+    Return the "eos_cli" block indented like the templates do with "{{ eos_cli | indent(width, false) }}".
+    """
+    return " " * width + do_indent(eos_cli, width, False)
+
+
+def get_encapsulation_vlan_cli(interface: dict) -> str | None:
+    """
+    Return the "encapsulation vlan" sub-command of a subinterface or None.
+
+    Used for the types "l3dot1q" and "l2dot1q" when "encapsulation_dot1q_vlan" is not set.
+    """
+    encapsulation_vlan = interface.get("encapsulation_vlan")
+    if encapsulation_vlan is None:
+        return None
+
+    if (client_dot1q_vlan := get(encapsulation_vlan, "client.dot1q.vlan")) is not None:
+        encapsulation_cli = f"client dot1q {client_dot1q_vlan}"
+        if (network_dot1q_vlan := get(encapsulation_vlan, "network.dot1q.vlan")) is not None:
+            encapsulation_cli += f" network dot1q {network_dot1q_vlan}"
+        elif get(encapsulation_vlan, "network.client") is True:
+            encapsulation_cli += " network client"
+        return encapsulation_cli
+
+    if get(encapsulation_vlan, "client.dot1q.inner") is not None and get(encapsulation_vlan, "client.dot1q.outer") is not None:
+        encapsulation_cli = f"client dot1q outer {encapsulation_vlan['client']['dot1q']['outer']} inner {encapsulation_vlan['client']['dot1q']['inner']}"
+        if get(encapsulation_vlan, "network.dot1q.inner") is not None and get(encapsulation_vlan, "network.dot1q.outer") is not None:
+            # Keeping the order of inner and outer from the templates.
+            encapsulation_cli += (
+                f" network dot1q outer {encapsulation_vlan['network']['dot1q']['inner']} inner {encapsulation_vlan['network']['dot1q']['outer']}"
+            )
+        elif get(encapsulation_vlan, "network.dot1q.client") is True:
+            encapsulation_cli += " network client"
+        return encapsulation_cli
+
+    if get(encapsulation_vlan, "client.unmatched") is True:
+        return "client unmatched"
+
+    return None
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import re
+from copy import deepcopy
 from functools import cached_property
 from hashlib import sha256
 
-from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
 from ansible_collections.arista.avd.plugins.filter.esi_management import generate_esi, generate_route_target
 from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
@@ -28,38 +28,26 @@ class UtilsMixin:
         which are connected to this switch.
 
         Adapters are filtered to contain only the ones connected to this switch.
-        """
-        filtered_connected_endpoints = []
-        for connected_endpoints_key in self.shared_utils.connected_endpoints_keys:
-            connected_endpoints = convert_dicts(get(self._hostvars, connected_endpoints_key["key"], default=[]), "name")
-            for connected_endpoint in connected_endpoints:
-                if "adapters" not in connected_endpoint:
-                    continue
-
-                filtered_adapters = []
-                for adapter_index, adapter in enumerate(connected_endpoint["adapters"]):
-                    adapter_settings = self.shared_utils.get_merged_adapter_settings(adapter)
-
-                    if self.shared_utils.hostname not in adapter_settings.get("switches", []):
-                        continue
-
-                    # Verify that length of all lists are the same
-                    nodes_length = len(adapter_settings["switches"])
-                    endpoint_ports = adapter_settings.get("endpoint_ports")
-                    if len(adapter_settings["switch_ports"]) != nodes_length or (endpoint_ports is not None and len(endpoint_ports) != nodes_length):
-                        raise AristaAvdError(
-                            f"Length of lists 'switches', 'switch_ports', 'endpoint_ports' (if used) did not match on adapter {adapter_index} on"
-                            f" connected_endpoint '{connected_endpoint['name']}' under '{connected_endpoints_key['key']}'."
-                            " Notice that some or all of these variables could be inherited from 'port_profiles'"
-                        )
-
-                    filtered_adapters.append(adapter_settings)
-
-                connected_endpoint["adapters"] = filtered_adapters
-                connected_endpoint["type"] = connected_endpoints_key["type"]
-                filtered_connected_endpoints.append(connected_endpoint)
-
-        return filtered_connected_endpoints
+        Endpoints without any adapters connected to this switch are left out.
+        """
+        filtered_connected_endpoints = {}
+        for connected_endpoints_key, connected_endpoint, adapter_index, adapter_settings in self.shared_utils.connected_endpoints_adapters:
+            # Verify that length of all lists are the same
+            nodes_length = len(adapter_settings["switches"])
+            endpoint_ports = adapter_settings.get("endpoint_ports")
+            if len(adapter_settings["switch_ports"]) != nodes_length or (endpoint_ports is not None and len(endpoint_ports) != nodes_length):
+                raise AristaAvdError(
+                    f"Length of lists 'switches', 'switch_ports', 'endpoint_ports' (if used) did not match on adapter {adapter_index} on"
+                    f" connected_endpoint '{connected_endpoint['name']}' under '{connected_endpoints_key['key']}'."
+                    " Notice that some or all of these variables could be inherited from 'port_profiles'"
+                )
+
+            # The connected endpoint and adapter settings are shared with other switches, so they are copied before use.
+            if id(connected_endpoint) not in filtered_connected_endpoints:
+                filtered_connected_endpoints[id(connected_endpoint)] = {**connected_endpoint, "adapters": [], "type": connected_endpoints_key["type"]}
+            filtered_connected_endpoints[id(connected_endpoint)]["adapters"].append(deepcopy(adapter_settings))
+
+        return list(filtered_connected_endpoints.values())
 
     @cached_property
     def _filtered_network_ports(self) -> list:
@@ -67,22 +55,7 @@ class UtilsMixin:
         Return list of endpoints defined under "network_ports"
         which are connected to this switch.
         """
-        filtered_network_ports = []
-        for network_port in get(self._hostvars, "network_ports", default=[]):
-            network_port_settings = self.shared_utils.get_merged_adapter_settings(network_port)
-            if not self._match_regexes(network_port_settings.get("switches"), self.shared_utils.hostname):
-                continue
-
-            filtered_network_ports.append(network_port_settings)
-
-        return filtered_network_ports
-
-    def _match_regexes(self, regexes: list, value: str) -> bool:
-        """
-        Match a list of regexes with the supplied value.
-        Regex must match the full value to pass, so regex is wrapped in ^$
-        """
-        return any(re.match(rf"^{regex}$", value) for regex in regexes)
+        return self.shared_utils.connected_network_ports
 
     def _get_short_esi(self, adapter: dict, channel_group_id: int, short_esi: str = None, hash_extra_value: str = "") -> str | None:
         """
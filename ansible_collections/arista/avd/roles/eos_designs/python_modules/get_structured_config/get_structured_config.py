@@ -4,7 +4,9 @@ from collections import ChainMap
 
 from ansible_collections.arista.avd.plugins.plugin_utils.avdfacts import AvdFacts
 from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+from ansible_collections.arista.avd.plugins.plugin_utils.fingerprint import DeviceFingerprint
 from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
+from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import FUNCTIONS, MODULES, RenderTimings, render_timer
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
 from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
 
@@ -43,7 +45,15 @@ def get_structured_config(
     output_schema_tools: AvdSchemaTools,
     result: dict,
     templar: object | None = None,
+    fingerprint: DeviceFingerprint | None = None,
+    render_timings: RenderTimings | None = None,
 ) -> dict:
+    """
+    Generate the structured config for one device by rendering all the eos_designs python_modules.
+
+    If a DeviceFingerprint is given, the facts of all peers read during the generation are added to the fingerprint.
+    If a RenderTimings instance is given, the time spent on each module, each top-level key, convert_data and merge is recorded.
+    """
     structured_config = {}
     module_vars = ChainMap(
         structured_config,
@@ -60,21 +70,24 @@ def get_structured_config(
     vars.setdefault("network_services_keys", shared_utils.network_services_keys)
 
     # Validate input data
-    result.update(input_schema_tools.convert_and_validate_data(vars))
+    with render_timer(render_timings, FUNCTIONS, "convert_and_validate_data"):
+        result.update(input_schema_tools.convert_and_validate_data(vars))
     if result.get("failed"):
         # Input data validation failed so return empty dict. Calling function should check result.get("failed").
         return {}
 
     for cls in AVD_STRUCTURED_CONFIG_CLASSES:
-        eos_designs_module: AvdFacts = cls(module_vars, shared_utils)
-        results = eos_designs_module.render()
+        eos_designs_module: AvdFacts = cls(module_vars, shared_utils, render_timings)
+        with render_timer(render_timings, MODULES, cls.__name__):
+            results = eos_designs_module.render()
 
         # Modules can return a dict or a list of dicts
         if not isinstance(results, list):
             results = [results]
 
-        for result in results:
-            output_schema_tools.convert_data(result)
+        with render_timer(render_timings, FUNCTIONS, "convert_data"):
+            for result in results:
+                output_schema_tools.convert_data(result)
 
         # All lists will be merged with "append" except for custom structured configuration where
         # the default list merge is "append_rp" and can be overridden.
@@ -84,6 +97,10 @@ def get_structured_config(
         else:
             list_merge = "append"
 
-        merge(structured_config, *results, list_merge=list_merge, schema=output_schema_tools.avdschema)
+        with render_timer(render_timings, FUNCTIONS, "merge"):
+            merge(structured_config, *results, list_merge=list_merge, schema=output_schema_tools.avdschema)
+
+    if fingerprint is not None:
+        fingerprint.add_peer_facts(shared_utils)
 
     return structured_config
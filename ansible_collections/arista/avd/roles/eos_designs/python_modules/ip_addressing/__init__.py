@@ -1,3 +1,4 @@
 from .avdipaddressing import AvdIpAddressing
+from .ip_pool import IpPool, get_ip_pool
 
-__all__ = ["AvdIpAddressing"]
+__all__ = ["AvdIpAddressing", "IpPool", "get_ip_pool"]
@@ -1,9 +1,8 @@
-import ipaddress
 from collections import ChainMap
 
 from ansible_collections.arista.avd.plugins.plugin_utils.avdfacts import AvdFacts
-from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
 
+from .ip_pool import get_ip_pool
 from .utils import UtilsMixin
 
 
@@ -19,17 +18,12 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
     """
 
     def _ip(self, pool: str, prefixlen: int, subnet_offset: int, ip_offset: int) -> str:
-        pool_network = ipaddress.ip_network(pool, strict=False)
-        prefixlen_diff = prefixlen - pool_network.prefixlen
-        subnet_size = (int(pool_network.hostmask) + 1) >> prefixlen_diff
-        if (subnet_offset + 1) * subnet_size > pool_network.num_addresses:
-            raise AristaAvdError(f"Unable to get {subnet_offset + 1} /{prefixlen} subnets from pool {pool}")
-        subnet = ipaddress.ip_network((int(pool_network.network_address) + subnet_offset * subnet_size, prefixlen))
-        try:
-            ip = subnet[ip_offset]
-        except IndexError as e:
-            raise AristaAvdError(f"Unable to get {ip_offset+1} hosts in subnet {subnet} taken from pool {pool}") from e
-        return str(ip)
+        """
+        Return the IP address at ip_offset in the subnet of the given prefix length at subnet_offset in the pool.
+
+        The pool is only parsed once, and the address is computed with integer arithmetic.
+        """
+        return get_ip_pool(pool).get_ip(prefixlen, subnet_offset, ip_offset)
 
     def _template(self, template_path, **kwargs):
         template_vars = ChainMap(kwargs, self._hostvars)
@@ -170,6 +164,32 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         offset = ((self._id - 1) * self._max_uplink_switches * self._max_parallel_uplinks) + uplink_switch_index
         return self._ip(self._uplink_ipv4_pool, 31, offset, 0)
 
+    def p2p_uplinks_ips(self, uplink_switch_indexes: list[int]) -> list[tuple[str, str]]:
+        """
+        Return a tuple of the Child IP and the Parent IP for P2P Uplinks for each of the given uplink_switch_indexes
+
+        The Parent IPs are the P2P downlink IPs of the uplink switches.
+        The pool is only parsed once for all uplinks. If templates are set for "p2p_uplinks_ip" or "p2p_uplinks_peer_ip", or if
+        any of those methods or the "_ip" and "_uplink_ipv4_pool" helpers are overridden by a subclass, those are called for each uplink instead.
+        """
+        uplink_switch_indexes = [int(uplink_switch_index) for uplink_switch_index in uplink_switch_indexes]
+        if (
+            self.shared_utils.ip_addressing_templates.get("p2p_uplinks_ip")
+            or self.shared_utils.ip_addressing_templates.get("p2p_uplinks_peer_ip")
+            or type(self).p2p_uplinks_ip is not AvdIpAddressing.p2p_uplinks_ip
+            or type(self).p2p_uplinks_peer_ip is not AvdIpAddressing.p2p_uplinks_peer_ip
+            or type(self)._ip is not AvdIpAddressing._ip
+            or type(self)._uplink_ipv4_pool is not AvdIpAddressing._uplink_ipv4_pool
+        ):
+            return [(self.p2p_uplinks_ip(uplink_switch_index), self.p2p_uplinks_peer_ip(uplink_switch_index)) for uplink_switch_index in uplink_switch_indexes]
+
+        if not uplink_switch_indexes:
+            return []
+
+        offset = (self._id - 1) * self._max_uplink_switches * self._max_parallel_uplinks
+        pool = get_ip_pool(self._uplink_ipv4_pool)
+        return [tuple(pool.get_ips(31, offset + uplink_switch_index, [1, 0])) for uplink_switch_index in uplink_switch_indexes]
+
     def router_id(self) -> str:
         """
         Return IP address for Router ID
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import ipaddress
+from functools import lru_cache
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+
+
+class IpPool:
+    """
+    IP pool parsed once into integers, so subnets and host addresses are computed with integer arithmetic.
+
+    Addresses are only formatted as strings when returned.
+
+    Parameters
+    ----------
+    pool : str
+        IPv4 or IPv6 network like "10.255.0.0/27". Host bits are ignored.
+    """
+
+    __slots__ = ("pool", "network", "prefixlen", "size", "_max_prefixlen", "_address_class")
+
+    def __init__(self, pool: str):
+        pool_network = ipaddress.ip_network(pool, strict=False)
+        self.pool = pool
+        self.network = int(pool_network.network_address)
+        self.prefixlen = pool_network.prefixlen
+        self.size = pool_network.num_addresses
+        self._max_prefixlen = pool_network.max_prefixlen
+        self._address_class = ipaddress.IPv4Address if pool_network.version == 4 else ipaddress.IPv6Address
+
+    def _get_subnet(self, prefixlen: int, subnet_offset: int) -> tuple[int, int]:
+        """
+        Return the network address and size of the subnet with the given prefix length and offset in the pool.
+        """
+        subnet_size = 1 << (self._max_prefixlen - prefixlen)
+        if (subnet_offset + 1) * subnet_size > self.size:
+            raise AristaAvdError(f"Unable to get {subnet_offset + 1} /{prefixlen} subnets from pool {self.pool}")
+
+        return self.network + subnet_offset * subnet_size, subnet_size
+
+    def _get_address(self, subnet: int, subnet_size: int, prefixlen: int, ip_offset: int) -> str:
+        # Negative offsets count from the end of the subnet like indexing an ipaddress network.
+        address = subnet + ip_offset if ip_offset >= 0 else subnet + subnet_size + ip_offset
+        if not subnet <= address < subnet + subnet_size:
+            subnet_network = ipaddress.ip_network((self._address_class(subnet), prefixlen))
+            raise AristaAvdError(f"Unable to get {ip_offset+1} hosts in subnet {subnet_network} taken from pool {self.pool}")
+
+        return str(self._address_class(address))
+
+    def get_ip(self, prefixlen: int, subnet_offset: int, ip_offset: int) -> str:
+        """
+        Return the IP address at ip_offset in the subnet of the given prefix length at subnet_offset in the pool.
+        """
+        subnet, subnet_size = self._get_subnet(prefixlen, subnet_offset)
+        return self._get_address(subnet, subnet_size, prefixlen, ip_offset)
+
+    def get_ips(self, prefixlen: int, subnet_offset: int, ip_offsets: list[int]) -> list[str]:
+        """
+        Return the IP addresses at each of the ip_offsets in the subnet of the given prefix length at subnet_offset in the pool.
+        """
+        subnet, subnet_size = self._get_subnet(prefixlen, subnet_offset)
+        return [self._get_address(subnet, subnet_size, prefixlen, ip_offset) for ip_offset in ip_offsets]
+
+
+@lru_cache(maxsize=None)
+def get_ip_pool(pool: str) -> IpPool:
+    """
+    Return the parsed IpPool for the given pool. Each pool is only parsed once per process.
+    """
+    return IpPool(pool)
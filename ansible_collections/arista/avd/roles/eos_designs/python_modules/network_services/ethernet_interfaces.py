@@ -5,7 +5,7 @@ from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get
 
 from .utils import UtilsMixin
 
@@ -28,7 +28,7 @@ class EthernetInterfacesMixin(UtilsMixin):
             return None
 
         # Using temp variables to keep the order of interfaces from Jinja
-        ethernet_interfaces = []
+        ethernet_interfaces = IndexedList()
         subif_parent_interface_names = set()
 
         if self.shared_utils.network_services_l3:
@@ -248,6 +248,6 @@ class EthernetInterfacesMixin(UtilsMixin):
                     }
                 )
         if ethernet_interfaces:
-            return ethernet_interfaces
+            return list(ethernet_interfaces)
 
         return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, default, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, default, get
 
 from .utils import UtilsMixin
 
@@ -28,7 +28,7 @@ class IpIgmpSnoopingMixin(UtilsMixin):
         if not (igmp_snooping_enabled is True):
             return ip_igmp_snooping
 
-        vlans = []
+        vlans = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -52,7 +52,7 @@ class IpIgmpSnoopingMixin(UtilsMixin):
                     )
 
         if vlans:
-            ip_igmp_snooping["vlans"] = vlans
+            ip_igmp_snooping["vlans"] = list(vlans)
 
         return ip_igmp_snooping
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, get, get_item
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get, get_item
 
 from .utils import UtilsMixin
 
@@ -25,7 +25,7 @@ class LoopbackInterfacesMixin(UtilsMixin):
         if not (self.shared_utils.network_services_l3):
             return None
 
-        loopback_interfaces = []
+        loopback_interfaces = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 if (loopback := get(vrf, "vtep_diagnostic.loopback")) is None:
@@ -63,6 +63,6 @@ class LoopbackInterfacesMixin(UtilsMixin):
                     ignore_keys={"tenant"},
                 )
         if loopback_interfaces:
-            return loopback_interfaces
+            return list(loopback_interfaces)
 
         return None
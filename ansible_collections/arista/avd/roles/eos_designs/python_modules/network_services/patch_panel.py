@@ -4,7 +4,7 @@ import re
 from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get
 
 from .utils import UtilsMixin
 
@@ -24,7 +24,7 @@ class PatchPanelMixin(UtilsMixin):
         if not self.shared_utils.network_services_l1:
             return None
 
-        patches = []
+        patches = IndexedList()
         for tenant in self._filtered_tenants:
             if "point_to_point_services" not in tenant:
                 continue
@@ -99,6 +99,6 @@ class PatchPanelMixin(UtilsMixin):
                         )
 
         if patches:
-            return {"patches": patches}
+            return {"patches": list(patches)}
 
         return None
@@ -5,7 +5,7 @@ from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.filter.esi_management import generate_esi, generate_lacp_id, generate_route_target
 from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get
 
 from .utils import UtilsMixin
 
@@ -28,7 +28,7 @@ class PortChannelInterfacesMixin(UtilsMixin):
             return None
 
         # Using temp variables to keep the order of interfaces from Jinja
-        port_channel_interfaces = []
+        port_channel_interfaces = IndexedList()
         subif_parent_interfaces = []
 
         for tenant in self._filtered_tenants:
@@ -139,6 +139,6 @@ class PortChannelInterfacesMixin(UtilsMixin):
             )
 
         if port_channel_interfaces:
-            return port_channel_interfaces
+            return list(port_channel_interfaces)
 
         return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate
 
 from .utils import UtilsMixin
 
@@ -25,7 +25,7 @@ class RouteMapsMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        route_maps = []
+        route_maps = IndexedList()
 
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
@@ -68,7 +68,7 @@ class RouteMapsMixin(UtilsMixin):
             route_maps.append(self._bgp_mlag_peer_group_route_map())
 
         if route_maps:
-            return route_maps
+            return list(route_maps)
 
         return None
 
@@ -9,7 +9,7 @@ from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_s
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdMissingVariableError
 from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
 from ansible_collections.arista.avd.plugins.plugin_utils.strip_empties import strip_empties_from_dict
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, default, get, get_item, groupby
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, default, get, get_item, groupby
 
 from .utils import UtilsMixin
 
@@ -88,7 +88,7 @@ class RouterBgpMixin(UtilsMixin):
                 ]
             )
 
-        bgp_peer_groups = []
+        bgp_peer_groups = IndexedList()
         if peer_groups:
             for peer_group in peer_groups:
                 peer_group.pop("nodes", None)
@@ -111,7 +111,7 @@ class RouterBgpMixin(UtilsMixin):
             )
 
         if bgp_peer_groups:
-            return bgp_peer_groups
+            return list(bgp_peer_groups)
 
         return None
 
@@ -128,7 +128,7 @@ class RouterBgpMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        vrfs = []
+        vrfs = IndexedList()
 
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
@@ -284,7 +284,7 @@ class RouterBgpMixin(UtilsMixin):
                 )
 
         if vrfs:
-            return vrfs
+            return list(vrfs)
 
         return None
 
@@ -302,7 +302,7 @@ class RouterBgpMixin(UtilsMixin):
         ):
             return None
 
-        vlans = []
+        vlans = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -333,7 +333,7 @@ class RouterBgpMixin(UtilsMixin):
                     )
 
         if vlans:
-            return vlans
+            return list(vlans)
 
         return None
 
@@ -386,7 +386,7 @@ class RouterBgpMixin(UtilsMixin):
         if not self._evpn_vlan_aware_bundles:
             return None
 
-        bundles = []
+        bundles = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 if (bundle := self._router_bgp_vlan_aware_bundles_vrf(vrf, tenant)) is not None:
@@ -415,7 +415,7 @@ class RouterBgpMixin(UtilsMixin):
                     )
 
         if bundles:
-            return bundles
+            return list(bundles)
 
         return None
 
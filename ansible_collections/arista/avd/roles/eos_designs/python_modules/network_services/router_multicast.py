@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get
 from ansible_collections.arista.avd.roles.eos_designs.python_modules.network_services.utils import UtilsMixin
 
 
@@ -23,7 +23,7 @@ class RouterMulticastMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        vrfs = []
+        vrfs = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 if get(vrf, "_evpn_l3_multicast_enabled"):
@@ -33,6 +33,6 @@ class RouterMulticastMixin(UtilsMixin):
                     )
 
         if vrfs:
-            return {"vrfs": vrfs}
+            return {"vrfs": list(vrfs)}
 
         return None
@@ -3,7 +3,7 @@ from __future__ import annotations
 from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdMissingVariableError
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, default, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, default, get
 
 from .utils import UtilsMixin
 
@@ -26,7 +26,7 @@ class RouterOspfMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        ospf_processes = []
+        ospf_processes = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 if get(vrf, "ospf.enabled") is not True:
@@ -89,6 +89,6 @@ class RouterOspfMixin(UtilsMixin):
         if self._vrf_default_ipv4_static_routes["redistribute_in_underlay"] and self.shared_utils.underlay_routing_protocol in ["ospf", "ospf-ldp"]:
             ospf_processes.append({"id": int(self.shared_utils.underlay_ospf_process_id), "redistribute": {"static": {}}})
         if ospf_processes:
-            return {"process_ids": ospf_processes}
+            return {"process_ids": list(ospf_processes)}
 
         return None
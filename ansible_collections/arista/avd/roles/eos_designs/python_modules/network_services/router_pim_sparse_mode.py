@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get
 from ansible_collections.arista.avd.roles.eos_designs.python_modules.network_services.utils import UtilsMixin
 
 
@@ -23,7 +23,7 @@ class RouterPimSparseModeMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        vrfs = []
+        vrfs = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 if vrf_rps := get(vrf, "_pim_rp_addresses"):
@@ -37,6 +37,6 @@ class RouterPimSparseModeMixin(UtilsMixin):
                         list_of_dicts=vrfs, primary_key="name", new_dict=vrf_config, context="Router PIM Sparse-Mode for VRFs", context_keys=["name"]
                     )
         if vrfs:
-            return {"vrfs": vrfs}
+            return {"vrfs": list(vrfs)}
 
         return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate
 
 from .utils import UtilsMixin
 
@@ -25,7 +25,7 @@ class StructCfgsMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        vrf_struct_cfgs = []
+        vrf_struct_cfgs = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 if (structured_config := vrf.get("structured_config")) is not None:
@@ -4,7 +4,7 @@ from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdMissingVariableError
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, default, get
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, default, get
 
 from .utils import UtilsMixin
 
@@ -26,7 +26,7 @@ class VlanInterfacesMixin(UtilsMixin):
         if not (self.shared_utils.network_services_l2 and self.shared_utils.network_services_l3):
             return None
 
-        vlan_interfaces = []
+        vlan_interfaces = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -56,7 +56,7 @@ class VlanInterfacesMixin(UtilsMixin):
                 )
 
         if vlan_interfaces:
-            return vlan_interfaces
+            return list(vlan_interfaces)
 
         return None
 
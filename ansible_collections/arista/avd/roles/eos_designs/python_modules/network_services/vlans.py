@@ -3,7 +3,7 @@ from __future__ import annotations
 from functools import cached_property
 
 from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate
 
 from .utils import UtilsMixin
 
@@ -28,7 +28,7 @@ class VlansMixin(UtilsMixin):
         if not self.shared_utils.network_services_l2:
             return None
 
-        vlans = []
+        vlans = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -70,7 +70,7 @@ class VlansMixin(UtilsMixin):
                 )
 
         if vlans:
-            return vlans
+            return list(vlans)
 
         return None
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate
 
 from .utils import UtilsMixin
 
@@ -27,7 +27,7 @@ class VrfsMixin(UtilsMixin):
         if not self.shared_utils.network_services_l3:
             return None
 
-        vrfs = []
+        vrfs = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 vrf_name = vrf["name"]
@@ -62,7 +62,7 @@ class VrfsMixin(UtilsMixin):
                 )
 
         if vrfs:
-            return vrfs
+            return list(vrfs)
 
         return None
 
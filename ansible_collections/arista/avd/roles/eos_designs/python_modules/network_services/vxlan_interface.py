@@ -6,7 +6,7 @@ from typing import NoReturn
 from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
 from ansible_collections.arista.avd.plugins.filter.range_expand import range_expand
 from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError, AristaAvdMissingVariableError
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import append_if_not_duplicate, default, get, unique
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, default, get, unique
 
 from .utils import UtilsMixin
 
@@ -52,10 +52,10 @@ class VxlanInterfaceMixin(UtilsMixin):
         if self.shared_utils.overlay_cvx:
             vxlan["controller_client"] = {"enabled": True}
 
-        vlans = []
-        vrfs = []
+        vlans = IndexedList()
+        vrfs = IndexedList()
         # vnis is a list of dicts only used for duplication checks across multiple types of objects all having "vni" as a key.
-        vnis = []
+        vnis = IndexedList()
         for tenant in self._filtered_tenants:
             for vrf in tenant["vrfs"]:
                 for svi in vrf["svis"]:
@@ -145,10 +145,10 @@ class VxlanInterfaceMixin(UtilsMixin):
                     )
 
         if vlans:
-            vxlan["vlans"] = vlans
+            vxlan["vlans"] = list(vlans)
 
         if vrfs:
-            vxlan["vrfs"] = vrfs
+            vxlan["vrfs"] = list(vrfs)
 
         return {
             "Vxlan1": {
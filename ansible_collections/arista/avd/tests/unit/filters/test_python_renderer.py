@@ -0,0 +1,89 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+from copy import deepcopy
+from glob import glob
+
+import pytest
+import yaml
+from jinja2 import ChainableUndefined, Environment, FileSystemLoader
+
+from ansible_collections.arista.avd.plugins.filter.convert_dicts import convert_dicts
+from ansible_collections.arista.avd.plugins.filter.default import default
+from ansible_collections.arista.avd.plugins.filter.hide_passwords import hide_passwords
+from ansible_collections.arista.avd.plugins.filter.natural_sort import natural_sort
+from ansible_collections.arista.avd.plugins.filter.python_renderer import FilterModule, python_renderer
+from ansible_collections.arista.avd.plugins.filter.range_expand import range_expand
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+from ansible_collections.arista.avd.plugins.test.contains import contains
+from ansible_collections.arista.avd.plugins.test.defined import defined
+
+AVD_DIR = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../.."))
+TEMPLATES_DIR = os.path.join(AVD_DIR, "roles/eos_cli_config_gen/templates")
+STRUCTURED_CONFIG_FILES = sorted(
+    glob(os.path.join(AVD_DIR, "molecule/eos_cli_config_gen/intended/structured_configs/*.yml"))
+    + glob(os.path.join(AVD_DIR, "molecule/eos_designs_unit_tests/intended/structured_configs/*.yml"))
+)
+SECTION_TEMPLATES = {
+    "ethernet_interfaces": "eos/ethernet-interfaces.j2",
+    "port_channel_interfaces": "eos/port-channel-interfaces.j2",
+    "router_bgp": "eos/router-bgp.j2",
+}
+
+f = FilterModule()
+
+
+def get_test_cases():
+    for structured_config_file in STRUCTURED_CONFIG_FILES:
+        with open(structured_config_file, encoding="UTF-8") as file:
+            structured_config = yaml.load(file, Loader=yaml.CSafeLoader)
+        if not isinstance(structured_config, dict):
+            continue
+        for section in SECTION_TEMPLATES:
+            if section in structured_config:
+                yield pytest.param(structured_config, section, id=f"{os.path.basename(structured_config_file)}-{section}")
+
+
+@pytest.fixture(scope="module")
+def environment():
+    environment = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        undefined=ChainableUndefined,
+        trim_blocks=True,
+        extensions=["jinja2.ext.loopcontrols", "jinja2.ext.do"],
+    )
+    environment.filters.update(
+        {
+            "arista.avd.convert_dicts": convert_dicts,
+            "arista.avd.default": default,
+            "arista.avd.hide_passwords": hide_passwords,
+            "arista.avd.natural_sort": natural_sort,
+            "arista.avd.range_expand": range_expand,
+        }
+    )
+    environment.tests.update({"arista.avd.defined": defined, "arista.avd.contains": contains})
+    return environment
+
+
+class TestPythonRendererFilter:
+    @pytest.mark.parametrize("hide_passwords_flag", [False, True])
+    @pytest.mark.parametrize("structured_config, section", list(get_test_cases()))
+    def test_python_renderer_same_as_template(self, environment, structured_config, section, hide_passwords_flag):
+        template = environment.get_template(SECTION_TEMPLATES[section])
+        expected = template.render(deepcopy(structured_config), hide_passwords=hide_passwords_flag)
+        assert python_renderer(deepcopy(structured_config[section]), section, hide_passwords_flag) == expected
+
+    @pytest.mark.parametrize("section", SECTION_TEMPLATES)
+    def test_python_renderer_undefined(self, section):
+        assert python_renderer(ChainableUndefined(), section) == ""
+        assert python_renderer(None, section) == ""
+
+    def test_python_renderer_invalid_section(self):
+        with pytest.raises(AristaAvdError) as exc_info:
+            python_renderer({}, "router_ospf")
+        assert "Section 'router_ospf' is not supported" in str(exc_info.value)
+
+    def test_python_renderer_filter(self):
+        assert "python_renderer" in f.filters()
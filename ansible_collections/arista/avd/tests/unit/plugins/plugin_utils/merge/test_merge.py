@@ -7,6 +7,7 @@ import os
 import pytest
 import yaml
 
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
 from ansible_collections.arista.avd.plugins.plugin_utils.merge import merge
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschema import AvdSchema
 
@@ -20,6 +21,20 @@ with open(f"{script_dir}/acl2.yml", "r", encoding="utf-8") as data_file:
 with open(f"{script_dir}/acl_merged.yml", "r", encoding="utf-8") as data_file:
     acl_merged = yaml.load(data_file, Loader=yaml.SafeLoader)
 
+LIST_MERGE_TEST_CASES = [
+    ("append", [1, 2, 3, 2, 4]),
+    ("replace", [2, 4]),
+    ("keep", [1, 2, 3]),
+    ("prepend", [2, 4, 1, 2, 3]),
+    ("append_rp", [1, 2, 3, 4]),
+    ("prepend_rp", [2, 4, 1, 3]),
+]
+
+SAME_KEY_STRATEGY_TEST_CASES = [
+    ("override", {"a": "nxt", "b": ["nxt"], "c": {"d": "base", "e": "nxt"}}),
+    ("use_existing", {"a": "base", "b": "base", "c": {"d": "base", "e": "nxt"}}),
+]
+
 
 class TestMerge:
     def test_merge_of_lists_with_primary_keys(self):
@@ -39,3 +54,60 @@ class TestMerge:
         merge(merge_result, acl1, acl2, list_merge="replace", schema=schema)
         print(yaml.dump(merge_result, indent=2))
         assert merge_result == acl2
+
+    @pytest.mark.parametrize("LIST_MERGE, EXPECTED_RESULT", LIST_MERGE_TEST_CASES)
+    def test_list_merge(self, LIST_MERGE, EXPECTED_RESULT):
+        merge_result = merge({"list": [1, 2, 3]}, {"list": [2, 4]}, list_merge=LIST_MERGE)
+        assert merge_result == {"list": EXPECTED_RESULT}
+
+    @pytest.mark.parametrize("LIST_MERGE", ["append_rp", "prepend_rp"])
+    def test_list_merge_unique_with_unhashable_items(self, LIST_MERGE):
+        merge_result = merge({"list": [{"a": 1}, {"b": 2}]}, {"list": [{"b": 2}, {"c": 3}]}, list_merge=LIST_MERGE)
+        assert sorted(merge_result["list"], key=str) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    @pytest.mark.parametrize("SAME_KEY_STRATEGY, EXPECTED_RESULT", SAME_KEY_STRATEGY_TEST_CASES)
+    def test_same_key_strategy(self, SAME_KEY_STRATEGY, EXPECTED_RESULT):
+        base = {"a": "base", "b": "base", "c": {"d": "base"}}
+        nxt = {"a": "nxt", "b": ["nxt"], "c": {"e": "nxt"}}
+        assert merge(base, nxt, same_key_strategy=SAME_KEY_STRATEGY) == EXPECTED_RESULT
+
+    def test_same_key_strategy_must_match(self):
+        assert merge({"a": {"b": 1}}, {"a": {"b": 1, "c": 2}}, same_key_strategy="must_match") == {"a": {"b": 1, "c": 2}}
+        with pytest.raises(ValueError, match="Values of a.b do not match: 1 != 2"):
+            merge({"a": {"b": 1}}, {"a": {"b": 2}}, same_key_strategy="must_match")
+
+    def test_merge_not_destructive(self):
+        base = {"a": {"b": 1}}
+        nxt = {"a": {"c": 2}}
+        assert merge(base, nxt, destructive_merge=False) == {"a": {"b": 1, "c": 2}}
+        assert base == {"a": {"b": 1}}
+
+    @pytest.mark.parametrize("ARGUMENT", [{"list_merge": "invalid"}, {"same_key_strategy": "invalid"}])
+    def test_merge_with_invalid_arguments(self, ARGUMENT):
+        with pytest.raises(AristaAvdError):
+            merge({}, {}, **ARGUMENT)
+
+    def test_merge_of_lists_with_duplicate_primary_keys(self):
+        schema = AvdSchema(acl_schema)
+        base = {"access_lists": [{"name": "ACL-01"}, {"name": "ACL-02"}, {"name": "ACL-01", "counters_per_entry": False}]}
+        nxt = {"access_lists": [{"name": "ACL-01", "counters_per_entry": True}, {"name": "ACL-03"}, {"name": "ACL-03"}]}
+        assert merge(base, nxt, schema=schema) == {
+            "access_lists": [
+                {"name": "ACL-01", "counters_per_entry": True},
+                {"name": "ACL-02"},
+                {"name": "ACL-01", "counters_per_entry": True},
+                {"name": "ACL-03"},
+                {"name": "ACL-03"},
+            ]
+        }
+
+    def test_primary_key_index_updated_after_extend_schema(self):
+        schema = AvdSchema(acl_schema)
+        assert schema.primary_key_index == {("access_lists",): "name", ("access_lists", "sequence_numbers"): "sequence"}
+        merge_result = merge({"vrfs": [{"name": "A"}]}, {"vrfs": [{"name": "A", "id": 1}]}, schema=schema)
+        assert merge_result == {"vrfs": [{"name": "A"}, {"name": "A", "id": 1}]}
+
+        schema.extend_schema({"type": "dict", "keys": {"vrfs": {"type": "list", "primary_key": "name", "items": {"type": "dict"}}}})
+        assert schema.primary_key_index[("vrfs",)] == "name"
+        merge_result = merge({"vrfs": [{"name": "A"}]}, {"vrfs": [{"name": "A", "id": 1}]}, schema=schema)
+        assert merge_result == {"vrfs": [{"name": "A", "id": 1}]}
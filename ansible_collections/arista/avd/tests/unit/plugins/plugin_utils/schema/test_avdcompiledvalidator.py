@@ -0,0 +1,135 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+from collections import Counter
+from copy import deepcopy
+from glob import glob
+
+import pytest
+import yaml
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AvdValidationError
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschema import AvdSchema
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdvalidator import AvdValidator
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.default_schemas import DEFAULT_SCHEMAS
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.store import create_store
+
+script_dir = os.path.dirname(__file__)
+molecule_dir = os.path.abspath(os.path.join(script_dir, "../../../../../molecule"))
+
+with open(f"{script_dir}/combined.schema.yml", "r", encoding="utf-8") as schema_file:
+    combined_schema = yaml.load(schema_file, Loader=yaml.SafeLoader)
+
+# AvdValidator updates the schema in-place during validation (expanding dynamic_keys and dynamic_valid_values),
+# so we keep pristine copies of the schemas and give each legacy validator a fresh copy.
+PRISTINE_SCHEMAS = {}
+for schema_id in ["eos_cli_config_gen", "eos_designs"]:
+    with open(DEFAULT_SCHEMAS[schema_id], "r", encoding="utf-8") as schema_file:
+        PRISTINE_SCHEMAS[schema_id] = yaml.load(schema_file, Loader=yaml.SafeLoader)
+
+
+class MoleculeVarsLoader(yaml.SafeLoader):
+    pass
+
+
+# Keep tagged values as plain strings. They are just data for the validators.
+MoleculeVarsLoader.add_multi_constructor("!", lambda loader, tag_suffix, node: loader.construct_scalar(node))
+
+MOLECULE_INPUTS = [
+    ("eos_cli_config_gen", sorted(glob(f"{molecule_dir}/eos_cli_config_gen/inventory/host_vars/*.yml"))),
+    ("eos_designs", sorted(glob(f"{molecule_dir}/eos_designs_unit_tests/inventory/group_vars/*.yml"))),
+    ("eos_designs", sorted(glob(f"{molecule_dir}/eos_designs_unit_tests/inventory/host_vars/*.yml"))),
+]
+MOLECULE_TEST_CASES = [(schema_id, var_file) for schema_id, var_files in MOLECULE_INPUTS for var_file in var_files]
+
+# Compiling the validators is only done once per AvdSchema instance, so we reuse the instances across tests.
+COMPILED_AVD_SCHEMAS = {schema_id: AvdSchema(schema_id=schema_id, compiled_validator=True) for schema_id in PRISTINE_SCHEMAS}
+
+# Testing invalid data for "access-lists" data model. Covering all validators.
+INVALID_ACL_DATA = [
+    "String",
+    None,
+    {"access_lists": [None]},
+    {"access_lists": [{}]},
+    {"access_lists": [{"name": "name"}]},
+    {"access_lists": [{"name": "name", "sequence_numbers": [{"sequence": 10, "action": 123}]}]},
+    {"access_lists": [{"extra_key": "extra_value", "name": "name", "sequence_numbers": [{"sequence": 10, "action": "permit ip any any"}]}]},
+    {"access_lists": [{"name": "name", "sequence_numbers": [{"sequence": 10, "action": "permit ip any any"}, {"sequence": 10, "action": "deny ip any any"}]}]},
+    {"access_lists": [{"name": "name", "sequence_numbers": [{"sequence": 10, "action": "permit ip any any"}, {"action": "deny ip any any"}]}]},
+    {"access_lists": [{"name": "name", "sequence_numbers": [{"sequence": 0, "action": "permit ip any any"}]}]},
+    {"access_lists": [{"name": "name", "counters_per_entry": "yes", "sequence_numbers": [{"sequence": True, "action": "permit ip any any"}]}]},
+]
+
+
+def legacy_errors(schema: dict, data) -> list[str]:
+    store = create_store()
+    return [str(AvdValidationError(error=error)) for error in AvdValidator(schema, store).iter_errors(data)]
+
+
+def compiled_errors(schema: dict, data) -> list[str]:
+    return [str(error) for error in AvdSchema(schema, compiled_validator=True).validate(data)]
+
+
+class TestAvdCompiledValidator:
+    @pytest.mark.parametrize("INVALID_DATA", INVALID_ACL_DATA)
+    def test_compiled_validator_parity_with_invalid_data(self, INVALID_DATA):
+        expected_errors = legacy_errors(deepcopy(combined_schema), INVALID_DATA)
+        errors = compiled_errors(combined_schema, INVALID_DATA)
+        # Compare with Counter so duplicated or missing copies of the same error are caught.
+        assert Counter(errors) == Counter(expected_errors)
+
+    @pytest.mark.parametrize("SCHEMA_ID, VAR_FILE", MOLECULE_TEST_CASES, ids=[os.path.basename(var_file) for _, var_file in MOLECULE_TEST_CASES])
+    def test_compiled_validator_parity_with_molecule_inputs(self, SCHEMA_ID, VAR_FILE):
+        with open(VAR_FILE, "r", encoding="utf-8") as data_file:
+            data = yaml.load(data_file, Loader=MoleculeVarsLoader) or {}
+
+        expected_errors = legacy_errors(deepcopy(PRISTINE_SCHEMAS[SCHEMA_ID]), data)
+        errors = [str(error) for error in COMPILED_AVD_SCHEMAS[SCHEMA_ID].validate(data)]
+        assert Counter(errors) == Counter(expected_errors)
+
+    @pytest.mark.parametrize("SCHEMA_ID, VAR_FILE", MOLECULE_TEST_CASES, ids=[os.path.basename(var_file) for _, var_file in MOLECULE_TEST_CASES])
+    def test_convert_and_validate_parity_with_molecule_inputs(self, SCHEMA_ID, VAR_FILE):
+        with open(VAR_FILE, "r", encoding="utf-8") as data_file:
+            data = yaml.load(data_file, Loader=MoleculeVarsLoader) or {}
+
+        expected_data = deepcopy(data)
+        expected_conversions = [str(error) for error in COMPILED_AVD_SCHEMAS[SCHEMA_ID].convert(expected_data)]
+        expected_errors = legacy_errors(deepcopy(PRISTINE_SCHEMAS[SCHEMA_ID]), expected_data)
+
+        conversions = []
+        errors = []
+        for error in COMPILED_AVD_SCHEMAS[SCHEMA_ID].convert_and_validate(data):
+            if isinstance(error, AvdValidationError):
+                errors.append(str(error))
+            else:
+                conversions.append(str(error))
+
+        assert data == expected_data
+        assert Counter(conversions) == Counter(expected_conversions)
+        assert Counter(errors) == Counter(expected_errors)
+
+    def test_compiled_validator_dynamic_keys_and_valid_values(self):
+        schema = {
+            "type": "dict",
+            "keys": {
+                "node_type_keys": {"type": "list", "items": {"type": "dict", "keys": {"key": {"type": "str"}}}},
+                "default_type": {"type": "str", "dynamic_valid_values": "node_type_keys.key"},
+            },
+            "dynamic_keys": {"node_type_keys.key": {"type": "dict", "keys": {"id": {"type": "int", "required": True}}}},
+        }
+        data = {"node_type_keys": [{"key": "spine"}, {"key": "leaf"}], "default_type": "leaf", "spine": {"id": 1}, "leaf": {}}
+        assert compiled_errors(schema, data) == ["'Validation Error: leaf': Required key 'id' is not set in dict."]
+
+        data = {"node_type_keys": [{"key": "spine"}], "default_type": "leaf", "leaf": {"id": 1}}
+        assert compiled_errors(schema, data) == [
+            "'Validation Error: ': Unexpected key(s) 'leaf' found in dict.",
+            "'Validation Error: default_type': 'leaf' is not one of ['spine']",
+        ]
+
+    def test_compiled_validator_recompiled_after_extend_schema(self):
+        avdschema = AvdSchema({"type": "dict", "keys": {"a": {"type": "str"}}}, compiled_validator=True)
+        assert [str(error) for error in avdschema.validate({"b": "foo"})] == ["'Validation Error: ': Unexpected key(s) 'b' found in dict."]
+        avdschema.extend_schema({"type": "dict", "keys": {"b": {"type": "str"}}})
+        assert not list(avdschema.validate({"b": "foo"}))
@@ -0,0 +1,90 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from copy import deepcopy
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschema import AvdSchema
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.default_schemas import DEFAULT_SCHEMAS
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.schema_cache import (
+    build_schema_cache,
+    get_schema_cache_key,
+    read_schema_cache,
+    write_schema_cache,
+)
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.store import load_schema_cache
+
+SCHEMA_CACHE = build_schema_cache(DEFAULT_SCHEMAS, "cache_key")
+
+
+@pytest.fixture
+def schema_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AVD_SCHEMA_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("AVD_DISABLE_SCHEMA_CACHE", raising=False)
+    load_schema_cache.cache_clear()
+    yield tmp_path
+    load_schema_cache.cache_clear()
+
+
+class TestSchemaCache:
+    def test_write_and_read_schema_cache(self, tmp_path):
+        cache_file = tmp_path.joinpath("schemas.pickle")
+        write_schema_cache(cache_file, SCHEMA_CACHE)
+        assert read_schema_cache(cache_file, "cache_key") == SCHEMA_CACHE
+        assert read_schema_cache(cache_file) == SCHEMA_CACHE
+        assert read_schema_cache(cache_file, "other_cache_key") is None
+        assert read_schema_cache(tmp_path.joinpath("missing.pickle")) is None
+
+    def test_schema_cache_key(self):
+        cache_key = get_schema_cache_key(DEFAULT_SCHEMAS, "4.1.0")
+        assert cache_key == get_schema_cache_key(DEFAULT_SCHEMAS, "4.1.0")
+        assert cache_key != get_schema_cache_key(DEFAULT_SCHEMAS, "4.2.0")
+
+    @pytest.mark.parametrize("SCHEMA_ID", ["eos_cli_config_gen", "eos_designs"])
+    def test_schema_cache_matches_avdschema(self, SCHEMA_ID):
+        avdschema = AvdSchema(deepcopy(SCHEMA_CACHE["store"][SCHEMA_ID]))
+        assert SCHEMA_CACHE["resolved_schemas"][SCHEMA_ID] == avdschema.resolved_schema
+        assert SCHEMA_CACHE["primary_key_indexes"][SCHEMA_ID] == avdschema.primary_key_index
+
+    def test_load_schema_cache_from_disk(self, schema_cache_dir):
+        schema_cache = load_schema_cache()
+        cache_files = list(schema_cache_dir.glob("schemas-*.pickle"))
+        assert len(cache_files) == 1
+
+        load_schema_cache.cache_clear()
+        assert load_schema_cache() == schema_cache
+        assert list(schema_cache_dir.glob("schemas-*.pickle")) == cache_files
+
+    def test_avdschema_instances_copy_schema_cache(self, schema_cache_dir):
+        avdschema = AvdSchema(schema_id="eos_cli_config_gen")
+        assert avdschema.resolved_schema == load_schema_cache()["resolved_schemas"]["eos_cli_config_gen"]
+        assert avdschema.primary_key_index == load_schema_cache()["primary_key_indexes"]["eos_cli_config_gen"]
+
+        # Changes to the resolved schema or index of one instance must not leak into other instances or the shared cache.
+        avdschema.resolved_schema["keys"]["dns_domain"]["type"] = "int"
+        avdschema.primary_key_index[("my_new_list",)] = "name"
+        other_avdschema = AvdSchema(schema_id="eos_cli_config_gen")
+        assert other_avdschema.resolved_schema["keys"]["dns_domain"]["type"] == "str"
+        assert ("my_new_list",) not in other_avdschema.primary_key_index
+        assert load_schema_cache()["resolved_schemas"]["eos_cli_config_gen"]["keys"]["dns_domain"]["type"] == "str"
+
+        avdschema = AvdSchema(schema_id="eos_cli_config_gen")
+        avdschema.extend_schema({"type": "dict", "keys": {"my_new_key": {"type": "str"}}})
+        assert "my_new_key" in avdschema.resolved_schema["keys"]
+        assert "my_new_key" not in AvdSchema(schema_id="eos_cli_config_gen").resolved_schema["keys"]
+        assert "my_new_key" not in load_schema_cache()["store"]["eos_cli_config_gen"]["keys"]
+
+    def test_avdschema_instances_share_compiled_validators(self):
+        avdschema = AvdSchema(schema_id="eos_cli_config_gen", compiled_validator=True)
+        other_avdschema = AvdSchema(schema_id="eos_cli_config_gen", compiled_validator=True)
+        assert avdschema._compiled_validator is other_avdschema._compiled_validator
+        assert avdschema._compiled_converter_validator is other_avdschema._compiled_converter_validator
+        assert avdschema._compiled_validator is not avdschema._compiled_converter_validator
+
+        # Extended schemas are compiled separately.
+        avdschema.extend_schema({"type": "dict", "keys": {"my_new_key": {"type": "str"}}})
+        assert avdschema._compiled_validator is not other_avdschema._compiled_validator
+        assert list(avdschema.validate({"my_new_key": 1}))
+        assert not list(other_avdschema.validate({"my_new_key": 1}))
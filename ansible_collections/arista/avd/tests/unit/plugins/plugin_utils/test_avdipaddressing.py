@@ -0,0 +1,48 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+from ansible_collections.arista.avd.roles.eos_designs.python_modules.ip_addressing import AvdIpAddressing
+
+HOSTVARS = {
+    "inventory_hostname": "leaf1",
+    "type": "l3leaf",
+    "l3leaf": {
+        "defaults": {"uplink_ipv4_pool": "10.0.0.0/24", "uplink_switches": ["spine1", "spine2"]},
+        "nodes": [{"name": "leaf1", "id": 2}],
+    },
+}
+
+
+class CustomIp(AvdIpAddressing):
+    def _ip(self, pool: str, prefixlen: int, subnet_offset: int, ip_offset: int) -> str:
+        return f"custom-{super()._ip(pool, prefixlen, subnet_offset, ip_offset)}"
+
+
+class CustomUplinkPool(AvdIpAddressing):
+    @property
+    def _uplink_ipv4_pool(self) -> str:
+        return "10.1.0.0/24"
+
+
+def get_ip_addressing(cls: type[AvdIpAddressing]) -> AvdIpAddressing:
+    return cls(hostvars=HOSTVARS, shared_utils=SharedUtils(HOSTVARS, None))
+
+
+class TestAvdIpAddressing:
+    def test_p2p_uplinks_ips(self):
+        ip_addressing = get_ip_addressing(AvdIpAddressing)
+
+        assert ip_addressing.p2p_uplinks_ips([0, 1]) == [("10.0.0.5", "10.0.0.4"), ("10.0.0.7", "10.0.0.6")]
+        assert ip_addressing.p2p_uplinks_ips([]) == []
+
+    @pytest.mark.parametrize("cls", [CustomIp, CustomUplinkPool])
+    def test_p2p_uplinks_ips_with_overridden_helpers(self, cls):
+        ip_addressing = get_ip_addressing(cls)
+
+        expected = [(ip_addressing.p2p_uplinks_ip(index), ip_addressing.p2p_uplinks_peer_ip(index)) for index in (0, 1)]
+        assert ip_addressing.p2p_uplinks_ips([0, 1]) == expected
+        assert expected != get_ip_addressing(AvdIpAddressing).p2p_uplinks_ips([0, 1])
@@ -0,0 +1,102 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from copy import deepcopy
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils, clear_connected_endpoints_indexes
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils.connected_endpoints_index import (
+    CONNECTED_ENDPOINTS_INDEXES,
+    NETWORK_PORTS_INDEXES,
+    get_connected_endpoints_index,
+)
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils.index_cache import MAX_CACHED_INDEXES
+
+HOSTVARS = {
+    "port_profiles": [
+        {"profile": "parent", "mode": "trunk", "vlans": "1-10"},
+        {"profile": "pair", "parent_profile": "parent", "switches": ["leaf1", "leaf2"], "switch_ports": ["Ethernet10", "Ethernet10"]},
+    ],
+    "servers": [
+        {"name": "server1", "adapters": [{"switches": ["leaf1", "leaf1"], "switch_ports": ["Ethernet1", "Ethernet2"]}, {"profile": "pair"}]},
+        {"name": "server2", "adapters": [{"profile": "pair", "switches": ["leaf2"], "switch_ports": ["Ethernet3"]}]},
+        {"name": "server3"},
+    ],
+    "firewalls": {"firewall1": {"adapters": [{"profile": "pair", "vlans": "20"}]}},
+    "network_ports": [
+        {"switches": ["leaf[12]", "leaf1"], "switch_ports": ["Ethernet20"], "vlans": "30"},
+        {"profile": "pair", "switch_ports": ["Ethernet21"]},
+        {"switches": ["leaf1.+"], "switch_ports": ["Ethernet22"]},
+    ],
+}
+
+
+def get_adapters(hostname: str, hostvars: dict) -> list:
+    return SharedUtils({"inventory_hostname": hostname, **hostvars}, None).connected_endpoints_adapters
+
+
+class TestConnectedEndpointsIndex:
+    def setup_method(self):
+        clear_connected_endpoints_indexes()
+
+    def test_connected_endpoints_adapters(self):
+        hostvars = deepcopy(HOSTVARS)
+
+        adapters = get_adapters("leaf1", hostvars)
+        assert [(key["key"], endpoint["name"], adapter_index) for key, endpoint, adapter_index, _adapter in adapters] == [
+            ("servers", "server1", 0),
+            ("servers", "server1", 1),
+            ("firewalls", "firewall1", 0),
+        ]
+        assert adapters[1][3] == {
+            "mode": "trunk",
+            "vlans": "1-10",
+            "switches": ["leaf1", "leaf2"],
+            "switch_ports": ["Ethernet10", "Ethernet10"],
+            "profile": "pair",
+        }
+        assert adapters[2][3]["vlans"] == "20"
+
+        # "switches" on the adapter overrides the port profile.
+        adapters = get_adapters("leaf2", hostvars)
+        assert [(endpoint["name"], adapter_index) for _key, endpoint, adapter_index, _adapter in adapters] == [("server1", 1), ("server2", 0), ("firewall1", 0)]
+        assert get_adapters("leaf3", hostvars) == []
+
+        # The input data is not modified.
+        assert hostvars == HOSTVARS
+
+    def test_connected_endpoints_index_shared_by_equal_data(self):
+        leaf1_adapters = get_adapters("leaf1", HOSTVARS)
+        leaf2_adapters = get_adapters("leaf2", deepcopy(HOSTVARS))
+
+        assert len(CONNECTED_ENDPOINTS_INDEXES) == 1
+        # The merged adapter settings are computed once and shared.
+        assert leaf2_adapters[0][3] is leaf1_adapters[1][3]
+
+        get_adapters("leaf1", {**HOSTVARS, "port_profiles": []})
+        assert len(CONNECTED_ENDPOINTS_INDEXES) == 2
+        assert get_connected_endpoints_index([], [], []) not in CONNECTED_ENDPOINTS_INDEXES.indexes()[:2]
+
+    def test_connected_endpoints_indexes_are_bounded(self):
+        connected_endpoints_index = get_connected_endpoints_index([], [], [])
+        for index in range(2 * MAX_CACHED_INDEXES):
+            get_connected_endpoints_index([], [[{"name": f"server{index}"}]], [])
+
+        assert len(CONNECTED_ENDPOINTS_INDEXES) == MAX_CACHED_INDEXES
+        # The least recently used index was dropped and is built again.
+        assert get_connected_endpoints_index([], [], []) is not connected_endpoints_index
+
+    def test_connected_network_ports(self):
+        hostvars = deepcopy(HOSTVARS)
+
+        network_ports = SharedUtils({"inventory_hostname": "leaf1", **hostvars}, None).connected_network_ports
+        assert [network_port["switch_ports"] for network_port in network_ports] == [["Ethernet20"], ["Ethernet21"]]
+        # The port profile is applied.
+        assert network_ports[1]["mode"] == "trunk"
+        assert [network_port["switch_ports"] for network_port in SharedUtils({"inventory_hostname": "leaf11", **hostvars}, None).connected_network_ports] == [
+            ["Ethernet22"]
+        ]
+        assert len(NETWORK_PORTS_INDEXES) == 1
+
+        # The input data is not modified.
+        assert hostvars == HOSTVARS
@@ -0,0 +1,186 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.fabric_documentation import FabricDocumentation, get_fabric_documentation, get_node_types
+
+HOSTVARS = {
+    "spine1": {
+        "fabric_name": "FABRIC",
+        "dc_name": "DC1",
+        "underlay_routing_protocol": "isis",
+        "router_isis": {"net": "49.0001.0001.0000.0001.00"},
+        "loopback_interfaces": [{"name": "Loopback0", "ip_address": "10.255.0.1/32"}],
+        "ethernet_interfaces": [
+            {"name": "Ethernet10", "peer": "leaf2", "peer_interface": "Ethernet1", "peer_type": "l3leaf", "type": "routed", "ip_address": "10.10.0.2/31"},
+            {"name": "Ethernet2", "peer": "leaf1", "peer_interface": "Ethernet1", "peer_type": "l3leaf", "type": "routed", "ip_address": "10.10.0.0/31"},
+            {"name": "Ethernet3", "peer": "core1", "peer_interface": "Ethernet1", "peer_type": "other", "shutdown": True},
+        ],
+    },
+    "leaf1": {
+        "pod_name": "POD1",
+        "port_profiles": [{"profile": "PROFILE_A"}, {"profile": "PROFILE_B", "parent_profile": "PROFILE_A"}],
+        "loopback_interfaces": [{"name": "Loopback0", "ip_address": "10.255.0.3/32"}, {"name": "Loopback1", "ip_address": "10.255.1.3/32"}],
+        "vlan_interfaces": [{"name": "Vlan100", "ip_address": "172.16.0.3/24"}],
+        "port_channel_interfaces": [{"name": "Port-Channel6", "type": "switched", "mode": "trunk", "vlans": "1-10"}],
+        "ethernet_interfaces": {
+            "Ethernet1": {"peer": "spine1", "peer_interface": "Ethernet2", "peer_type": "spine", "type": "routed", "ip_address": "10.10.0.1/31"},
+            "Ethernet3": {"peer": "leaf2", "peer_interface": "Ethernet3", "peer_type": "mlag_peer", "type": "port-channel-member"},
+            "Ethernet5": {"peer": "server1", "peer_interface": "eth0", "peer_type": "server", "type": "switched", "mode": "access", "vlans": 110},
+            "Ethernet6": {
+                "peer": "server1",
+                "peer_interface": "eth1",
+                "peer_type": "server",
+                "type": "port-channel-member",
+                "channel_group": {"id": 6},
+                "description": "SERVER1_ETH1",
+                "port_profile": "PROFILE_B",
+            },
+        },
+    },
+    "leaf2": {
+        "pod_name": "POD1",
+        "is_deployed": False,
+        "port_profiles": [{"profile": "PROFILE_A"}],
+        "ethernet_interfaces": [
+            {"name": "Ethernet1", "peer": "spine1", "peer_interface": "Ethernet10", "peer_type": "spine", "type": "routed", "ip_address": "10.10.0.3/31"},
+            {"name": "Ethernet3", "peer": "leaf1", "peer_interface": "Ethernet3", "peer_type": "mlag_peer", "type": "port-channel-member"},
+            {"name": "Ethernet5", "peer": "server2", "peer_interface": "eth0", "peer_type": "server", "shutdown": True},
+        ],
+    },
+    # Not a fabric node type.
+    "core1": {
+        "ethernet_interfaces": [{"name": "Ethernet1", "peer": "spine1", "peer_interface": "Ethernet3", "peer_type": "spine", "ip_address": "10.0.0.1/31"}],
+    },
+}
+AVD_SWITCH_FACTS = {
+    "spine1": {
+        "switch": {
+            "type": "spine",
+            "mgmt_ip": "192.168.0.1/24",
+            "platform": "vEOS-lab",
+            "serial_number": "ABC123",
+            "uplink_ipv4_pool": None,
+            "loopback_ipv4_pool": "10.255.0.0/27",
+            "underlay_routing_protocol": "isis",
+        }
+    },
+    "leaf1": {
+        "switch": {
+            "type": "l3leaf",
+            "inband_mgmt_vlan": 100,
+            "uplink_ipv4_pool": "10.10.0.0/24",
+            "loopback_ipv4_pool": "10.255.0.0/27",
+            "vtep_loopback_ipv4_pool": "10.255.1.0/27",
+        }
+    },
+    "leaf2": {"switch": {"type": "l3leaf", "uplink_ipv4_pool": "10.10.0.0/24", "loopback_ipv4_pool": "10.255.0.0/27"}},
+    "core1": {"switch": {"type": "core"}},
+}
+FABRIC_HOSTS = ["spine1", "leaf2", "leaf1", "core1"]
+NODE_TYPES = ["spine", "l3leaf", "l2leaf"]
+
+
+def get_documentation(**kwargs) -> FabricDocumentation:
+    return FabricDocumentation("FABRIC", FABRIC_HOSTS, HOSTVARS, AVD_SWITCH_FACTS, NODE_TYPES, **kwargs)
+
+
+class TestFabricDocumentation:
+    def test_topology_csv(self):
+        assert "".join(get_documentation().topology_csv_lines()) == (
+            "Node Type,Node,Node Interface,Peer Type,Peer Node,Peer Interface,Node Interface Enabled\n"
+            "l3leaf,leaf1,Ethernet1,spine,spine1,Ethernet2,True\n"
+            "l3leaf,leaf1,Ethernet3,mlag_peer,leaf2,Ethernet3,True\n"
+            "l3leaf,leaf1,Ethernet5,server,server1,eth0,True\n"
+            "l3leaf,leaf1,Ethernet6,server,server1,eth1,True\n"
+            "l3leaf,leaf2,Ethernet1,spine,spine1,Ethernet10,True\n"
+            "l3leaf,leaf2,Ethernet3,mlag_peer,leaf1,Ethernet3,True\n"
+            "l3leaf,leaf2,Ethernet5,server,server2,eth0,False\n"
+            "spine,spine1,Ethernet2,l3leaf,leaf1,Ethernet1,True\n"
+            "spine,spine1,Ethernet3,other,core1,Ethernet1,False\n"
+            "spine,spine1,Ethernet10,l3leaf,leaf2,Ethernet1,True\n"
+        )
+
+    def test_p2p_links_csv(self):
+        # Each link is only listed from the first of the two nodes.
+        assert "".join(get_documentation().p2p_links_csv_lines()) == (
+            "Type,Node,Node Interface,Leaf IP Address,Peer Type,Peer Node,Peer Interface,Peer IP Address\n"
+            "l3leaf,leaf1,Ethernet1,10.10.0.1/31,spine,spine1,Ethernet2,10.10.0.0/31\n"
+            "l3leaf,leaf2,Ethernet1,10.10.0.3/31,spine,spine1,Ethernet10,10.10.0.2/31\n"
+        )
+
+    def test_documentation(self):
+        documentation = get_documentation(underlay_routing_protocol="isis").get_documentation()
+
+        assert documentation.startswith("# FABRIC\n\n## Table of Contents\n\n- [Fabric Switches and Management IP](#fabric-switches-and-management-ip)\n")
+        assert "<!-- toc -->" not in documentation
+        assert (
+            "| POD | Type | Node | Management IP | Platform | Provisioned in CloudVision | Serial Number |\n"
+            "| --- | ---- | ---- | ------------- | -------- | -------------------------- | ------------- |\n"
+            "| POD1 | l3leaf | leaf1 | - | - | Provisioned | - |\n"
+            "| POD1 | l3leaf | leaf2 | - | - | Not Available | - |\n"
+            "| DC1 | spine | spine1 | 192.168.0.1/24 | vEOS-lab | Provisioned | ABC123 |\n"
+        ) in documentation
+        assert "| POD1 | l3leaf | leaf1 | 172.16.0.3/24 | Vlan100 |\n" in documentation
+        assert (
+            "| l3leaf | leaf1 | Ethernet1 | spine | spine1 | Ethernet2 |\n"
+            "| l3leaf | leaf1 | Ethernet3 | mlag_peer | leaf2 | Ethernet3 |\n"
+            "| l3leaf | leaf2 | Ethernet1 | spine | spine1 | Ethernet10 |\n"
+            "\n"
+        ) in documentation
+        assert "| 10.10.0.0/24 | 256 | 4 | 1.57 % |\n" in documentation
+        assert "| 10.255.0.0/27 | 32 | 2 | 6.25 % |\n" in documentation
+        assert "| 10.255.1.0/27 | 32 | 1 | 3.13 % |\n" in documentation
+        assert "| leaf2 | Ethernet1 | 10.10.0.3/31 | spine1 | Ethernet10 | 10.10.0.2/31 |\n" in documentation
+        assert "| POD | Node | CLNS Address |\n| --- | ---- | ------------ |\n| DC1 | spine1 | 49.0001.0001.0000.0001.00 |\n\n" in documentation
+        assert documentation.endswith("| POD | Node | Loopback1 |\n| --- | ---- | --------- |\n| POD1 | leaf1 | 10.255.1.3/32 |\n")
+
+    def test_documentation_without_isis(self):
+        assert "ISIS CLNS interfaces" not in get_documentation(underlay_routing_protocol="ospf").get_documentation()
+
+    def test_connected_endpoints(self):
+        documentation = get_documentation(connected_endpoints=True).get_documentation()
+
+        assert "| servers | server | Server |\n" in documentation
+        assert documentation.endswith(
+            "### Servers\n"
+            "\n"
+            "| Name | Port | Fabric Device | Fabric Port | Description | Shutdown | Type | Mode | VLANs | Profile |\n"
+            "| ---- | ---- | ------------- | ------------| ----------- | -------- | ---- | ---- | ----- | ------- |\n"
+            "| server1 | eth0 | leaf1 | Ethernet5 | - | - | switched | access | 110 | - |\n"
+            "| server1 | eth1 | leaf1 | Ethernet6 | SERVER1_ETH1 | - | switched | trunk | 1-10 | PROFILE_B |\n"
+            "| server2 | eth0 | leaf2 | Ethernet5 | - | True | - | - | - | - |\n"
+            "\n"
+            "### Port Profiles\n"
+            "\n"
+            "| Profile Name | Parent Profile |\n"
+            "| ------------ | -------------- |\n"
+            "| PROFILE_A | - |\n"
+            "| PROFILE_B | PROFILE_A |\n"
+        )
+
+    def test_no_connected_endpoints(self):
+        documentation = FabricDocumentation("FABRIC", ["spine1"], HOSTVARS, AVD_SWITCH_FACTS, NODE_TYPES, connected_endpoints=True).get_documentation()
+        assert documentation.endswith("## Connected Endpoints\n\nNo connected endpoint configured!\n")
+
+    def test_get_fabric_documentation(self):
+        hostvars = {**HOSTVARS, "spine1": {**HOSTVARS["spine1"], "eos_designs_documentation": {"connected_endpoints": True}}}
+        fabric_documentation = get_fabric_documentation("FABRIC", FABRIC_HOSTS, hostvars, AVD_SWITCH_FACTS, "spine1")
+
+        assert fabric_documentation.node_types == ["spine", "l3leaf", "l2leaf", "super-spine", "overlay-controller"]
+        assert fabric_documentation.underlay_routing_protocol == "isis"
+        assert fabric_documentation.connected_endpoints is True
+
+    @pytest.mark.parametrize(
+        "node_type_keys, design_type, expected_node_types",
+        [
+            (None, None, ["spine", "l3leaf", "l2leaf", "super-spine", "overlay-controller"]),
+            (None, "mpls", ["p", "pe", "rr"]),
+            ([{"key": "spine", "type": "spine"}, {"key": "leaf", "type": "leaf"}], "l2ls", ["spine", "leaf"]),
+            ({"spine": {"type": "super"}}, None, ["super"]),
+        ],
+    )
+    def test_get_node_types(self, node_type_keys, design_type, expected_node_types):
+        assert get_node_types(node_type_keys, design_type) == expected_node_types
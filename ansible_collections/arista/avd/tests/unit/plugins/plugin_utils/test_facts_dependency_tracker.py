@@ -0,0 +1,118 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from functools import cached_property
+
+from ansible_collections.arista.avd.plugins.plugin_utils.avdfacts import AvdFacts
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_facts import FactsDependencyTracker, PeerIndex
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+HOSTS = {
+    "spine1": {"id": 1},
+    "leaf1": {"id": 11, "uplink_switches": ["spine1"]},
+    "leaf2": {"id": 12, "uplink_switches": ["spine1"], "mlag_peer": "leaf3"},
+    "leaf3": {"id": 13, "uplink_switches": ["spine1"], "mlag_peer": "leaf2"},
+    "l2leaf1": {"id": 21, "uplink_switches": ["leaf2"]},
+}
+
+
+class ExampleFacts(AvdFacts):
+    @cached_property
+    def id(self):
+        return get(self._hostvars, "id")
+
+    @cached_property
+    def uplink_peer_ids(self):
+        return [self.shared_utils.get_peer_facts(peer).id for peer in get(self._hostvars, "uplink_switches", default=[])] or None
+
+    @cached_property
+    def mlag_peer_uplink_peer_ids(self):
+        if (mlag_peer := get(self._hostvars, "mlag_peer")) is None:
+            return None
+        return self.shared_utils.get_peer_facts(mlag_peer).get("uplink_peer_ids")
+
+    @cached_property
+    def _uplink_switch_hostnames(self):
+        return [self.shared_utils.get_peer_facts(peer).shared_utils.hostname for peer in get(self._hostvars, "uplink_switches", default=[])]
+
+
+class DownstreamExampleFacts(ExampleFacts):
+    @cached_property
+    def uplink_peers(self):
+        return get(self._hostvars, "uplink_switches", default=[])
+
+    @cached_property
+    def downstream_ids(self):
+        peer_index: PeerIndex = get(self._hostvars, "avd_switch_facts_peer_index")
+        downstream_switches = peer_index.get_downstream_switches(self.shared_utils.hostname, self.shared_utils.dependency_tracker)
+        return [self.shared_utils.get_peer_facts(downstream_switch).id for downstream_switch in downstream_switches] or None
+
+
+def get_facts_instances(facts_class: type = ExampleFacts) -> dict:
+    avd_switch_facts = {}
+    peer_index = PeerIndex(avd_switch_facts)
+    for hostname, hostvars in HOSTS.items():
+        hostvars = {**hostvars, "inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts, "avd_switch_facts_peer_index": peer_index}
+        avd_switch_facts[hostname] = {"switch": facts_class(hostvars=hostvars, shared_utils=SharedUtils(hostvars=hostvars, templar=None))}
+    return avd_switch_facts
+
+
+def render(avd_switch_facts_instances: dict) -> dict:
+    facts = {hostname: {"switch": host_facts["switch"].render()} for hostname, host_facts in avd_switch_facts_instances.items()}
+    for host_facts in avd_switch_facts_instances.values():
+        host_facts["switch"]._uplink_switch_hostnames
+    return facts
+
+
+class TestFactsDependencyTracker:
+    def test_tracked_render_is_unchanged(self):
+        expected_facts = render(get_facts_instances())
+        avd_switch_facts_instances = get_facts_instances()
+        FactsDependencyTracker().track(avd_switch_facts_instances)
+        facts = render(avd_switch_facts_instances)
+        assert facts == expected_facts
+        assert list(facts["leaf2"]["switch"]) == list(expected_facts["leaf2"]["switch"])
+
+    def test_dependency_edges(self):
+        avd_switch_facts_instances = get_facts_instances()
+        dependency_tracker = FactsDependencyTracker()
+        dependency_tracker.track(avd_switch_facts_instances)
+        render(avd_switch_facts_instances)
+
+        assert ("leaf1", "uplink_peer_ids", "spine1", "id") in dependency_tracker.edges
+        assert ("leaf2", "mlag_peer_uplink_peer_ids", "leaf3", "uplink_peer_ids") in dependency_tracker.edges
+        assert ("l2leaf1", "_uplink_switch_hostnames", "leaf2", "shared_utils.hostname") in dependency_tracker.edges
+        # Reads done while computing the facts of leaf3 are recorded on leaf3, even if triggered by leaf2.
+        assert ("leaf3", "uplink_peer_ids", "spine1", "id") in dependency_tracker.edges
+        assert not any(device == "spine1" for device, _, _, _ in dependency_tracker.edges)
+
+        assert dependency_tracker.get_dependencies("leaf2") == {"spine1", "leaf3"}
+        assert dependency_tracker.get_dependents("leaf2") == {"leaf3", "l2leaf1"}
+        assert dependency_tracker.get_affected_devices(["leaf3"]) == ["l2leaf1", "leaf2", "leaf3"]
+        assert dependency_tracker.get_affected_devices(["spine1"]) == ["l2leaf1", "leaf1", "leaf2", "leaf3", "spine1"]
+        assert dependency_tracker.get_affected_devices(["l2leaf1"]) == ["l2leaf1"]
+
+    def test_to_dict(self):
+        avd_switch_facts_instances = get_facts_instances()
+        dependency_tracker = FactsDependencyTracker()
+        dependency_tracker.track(avd_switch_facts_instances)
+        render(avd_switch_facts_instances)
+
+        dependency_graph = dependency_tracker.to_dict()
+        assert {"device": "leaf1", "fact": "uplink_peer_ids", "peer": "spine1", "peer_fact": "id"} in dependency_graph["edges"]
+        assert dependency_graph["dependents"]["spine1"] == ["leaf1", "leaf2", "leaf3"]
+        assert len(dependency_graph["edges"]) == len(dependency_tracker.edges)
+
+    def test_peer_index_dependency_edges(self):
+        avd_switch_facts_instances = get_facts_instances(DownstreamExampleFacts)
+        dependency_tracker = FactsDependencyTracker()
+        dependency_tracker.track(avd_switch_facts_instances)
+        facts = render(avd_switch_facts_instances)
+        assert facts["leaf2"]["switch"]["downstream_ids"] == [21]
+        assert "downstream_ids" not in facts["leaf1"]["switch"]
+
+        # leaf1 has no downstream switches, but moving l2leaf1 to leaf1 changes the downstream switches of leaf1.
+        assert ("leaf1", "downstream_ids", "l2leaf1", "uplink_peers") in dependency_tracker.edges
+        assert dependency_tracker.get_affected_devices(["l2leaf1"]) == ["l2leaf1", "leaf1", "leaf2", "leaf3", "spine1"]
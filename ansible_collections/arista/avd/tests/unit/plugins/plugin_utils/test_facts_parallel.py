@@ -0,0 +1,80 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from functools import cached_property
+
+from ansible_collections.arista.avd.plugins.plugin_utils.avdfacts import AvdFacts
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_facts import PeerIndex, render_facts_in_parallel
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+HOSTS = {
+    "spine1": {"id": 1},
+    "spine2": {"id": 2},
+    "leaf1": {"id": 11, "uplink_switches": ["spine1", "spine2"]},
+    "leaf2": {"id": 12, "uplink_switches": ["spine1", "spine2"], "mlag_peer": "leaf3"},
+    "leaf3": {"id": 13, "uplink_switches": ["spine1", "spine2"], "mlag_peer": "leaf2"},
+    "l2leaf1": {"id": 21, "uplink_switches": ["leaf2", "leaf3"]},
+}
+
+
+class ExampleFacts(AvdFacts):
+    @cached_property
+    def _peer_index(self):
+        return PeerIndex(get(self._hostvars, "avd_switch_facts", required=True))
+
+    @cached_property
+    def id(self):
+        if get(self._hostvars, "fail"):
+            raise ValueError(self.shared_utils.hostname)
+        return get(self._hostvars, "id")
+
+    @cached_property
+    def uplink_peers(self):
+        return get(self._hostvars, "uplink_switches", default=[])
+
+    @cached_property
+    def uplink_peer_ids(self):
+        return [self.shared_utils.get_peer_facts(peer).id for peer in self.uplink_peers] or None
+
+    @cached_property
+    def mlag_peer_uplink_peer_ids(self):
+        if (mlag_peer := get(self._hostvars, "mlag_peer")) is None:
+            return None
+        return self.shared_utils.get_peer_facts(mlag_peer).get("uplink_peer_ids")
+
+    @cached_property
+    def downstream_switches(self):
+        return self._peer_index.get_downstream_switches(self.shared_utils.hostname) or None
+
+
+def get_facts_instances(failing_host: str | None = None) -> dict:
+    avd_switch_facts = {}
+    for hostname, hostvars in HOSTS.items():
+        hostvars = {**hostvars, "inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts, "fail": hostname == failing_host}
+        avd_switch_facts[hostname] = {"switch": ExampleFacts(hostvars=hostvars, shared_utils=SharedUtils(hostvars=hostvars, templar=None))}
+    return avd_switch_facts
+
+
+class TestRenderFactsInParallel:
+    def test_parallel_render_is_unchanged(self):
+        expected_facts = {hostname: {"switch": host_facts["switch"].render()} for hostname, host_facts in get_facts_instances().items()}
+        facts = render_facts_in_parallel(get_facts_instances(), max_workers=2)
+        assert facts == expected_facts
+        assert list(facts) == list(expected_facts)
+        assert list(facts["leaf2"]["switch"]) == list(expected_facts["leaf2"]["switch"])
+        assert facts["spine1"]["switch"]["downstream_switches"] == ["leaf1", "leaf2", "leaf3"]
+
+    def test_local_facts_are_cached(self):
+        avd_switch_facts_instances = get_facts_instances()
+        render_facts_in_parallel(avd_switch_facts_instances, max_workers=2)
+        leaf1_cache = avd_switch_facts_instances["leaf1"]["switch"].__dict__
+        assert leaf1_cache["id"] == 11
+        assert leaf1_cache["uplink_peers"] == ["spine1", "spine2"]
+        # Facts reading other devices are only computed in the workers.
+        assert "uplink_peer_ids" not in leaf1_cache
+        assert "downstream_switches" not in leaf1_cache
+
+    def test_failure_returns_none(self):
+        assert render_facts_in_parallel(get_facts_instances(failing_host="spine2"), max_workers=2) is None
@@ -0,0 +1,73 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdError
+from ansible_collections.arista.avd.plugins.plugin_utils.facts_slice import FactsSlice, get_device_facts_slice, get_facts_closure
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import get
+
+AVD_FACTS = {
+    "avd_switch_facts": {
+        "spine1": {"switch": {"type": "spine"}},
+        "spine2": {"switch": {"type": "spine"}},
+        "leaf1": {"switch": {"type": "l3leaf", "mlag_peer": "leaf2", "uplink_peers": ["spine1", "spine2"], "evpn_route_servers": ["spine1", "spine2"]}},
+        "leaf2": {"switch": {"type": "l3leaf", "mlag_peer": "leaf1", "uplink_peers": ["spine1", "spine2"], "evpn_route_servers": ["spine1", "spine2"]}},
+        "leaf3": {"switch": {"type": "l3leaf", "uplink_peers": ["spine1"], "evpn_route_servers": ["external-rs"]}},
+        "l2leaf1": {"switch": {"type": "l2leaf", "uplink_peers": ["leaf1", "leaf2"]}},
+    },
+    "avd_overlay_peers": {"spine1": ["leaf1", "leaf2"], "spine2": ["leaf1", "leaf2"], "external-rs": ["leaf3"]},
+    "avd_topology_peers": {"spine1": ["leaf1", "leaf2", "leaf3"], "spine2": ["leaf1", "leaf2"], "leaf1": ["l2leaf1"], "leaf2": ["l2leaf1"]},
+}
+
+
+class TestFactsSlice:
+    @pytest.mark.parametrize(
+        "hostname, expected_closure",
+        [
+            ("leaf1", ["spine1", "spine2", "leaf1", "leaf2", "l2leaf1"]),
+            ("leaf3", ["spine1", "leaf3"]),
+            ("spine2", ["spine2", "leaf1", "leaf2"]),
+            ("l2leaf1", ["leaf1", "leaf2", "l2leaf1"]),
+        ],
+    )
+    def test_get_facts_closure(self, hostname, expected_closure):
+        assert get_facts_closure(AVD_FACTS, hostname) == expected_closure
+
+    def test_get_facts_closure_extra_peers(self):
+        assert get_facts_closure(AVD_FACTS, "leaf3", extra_peers=["leaf1", "unknown"]) == ["spine1", "leaf1", "leaf3"]
+
+    def test_get_device_facts_slice(self):
+        facts_slice = get_device_facts_slice(AVD_FACTS, "spine2", strict=False)
+
+        assert {hostname: get(facts_slice["avd_switch_facts"], hostname) for hostname in AVD_FACTS["avd_switch_facts"]} == {
+            hostname: AVD_FACTS["avd_switch_facts"][hostname] if hostname in ["spine2", "leaf1", "leaf2"] else None
+            for hostname in AVD_FACTS["avd_switch_facts"]
+        }
+        assert facts_slice["avd_overlay_peers"] == {"spine2": ["leaf1", "leaf2"]}
+        assert facts_slice["avd_topology_peers"] == {"spine2": ["leaf1", "leaf2"]}
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_get_device_facts_slice_lists_all_fabric_devices(self, strict):
+        avd_switch_facts = get_device_facts_slice(AVD_FACTS, "leaf3", strict=strict)["avd_switch_facts"]
+
+        assert isinstance(avd_switch_facts, FactsSlice)
+        assert list(avd_switch_facts) == list(AVD_FACTS["avd_switch_facts"])
+        assert list(avd_switch_facts.keys()) == list(AVD_FACTS["avd_switch_facts"])
+        assert "leaf1" in avd_switch_facts
+        assert get(avd_switch_facts, "spine1..switch..type", separator="..") == "spine"
+        # Devices outside of the fabric are missing like with the full facts.
+        assert get(avd_switch_facts, "external-rs..switch", separator="..") is None
+
+    def test_get_device_facts_slice_strict(self):
+        avd_switch_facts = get_device_facts_slice(AVD_FACTS, "leaf3")["avd_switch_facts"]
+
+        with pytest.raises(AristaAvdError, match="'leaf1' is not part of the facts slice for 'leaf3'"):
+            get(avd_switch_facts, "leaf1..switch", separator="..")
+
+    def test_get_device_facts_slice_not_strict(self):
+        avd_switch_facts = get_device_facts_slice(AVD_FACTS, "leaf3", strict=False)["avd_switch_facts"]
+
+        # Fabric devices outside of the slice are missing like devices outside of the fabric.
+        assert get(avd_switch_facts, "leaf1..switch", separator="..") is None
@@ -0,0 +1,105 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from types import SimpleNamespace
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.fingerprint import DeviceFingerprint, read_fingerprint_file, write_fingerprint_file
+
+HOSTVARS = {
+    "inventory_hostname": "leaf1",
+    "fabric_name": "FABRIC",
+    "tenants": [{"name": "TENANT_A", "vrfs": [{"name": "VRF_A"}]}],
+    "ansible_host": "10.0.0.1",
+}
+AVD_SWITCH_FACTS = {
+    "leaf1": {"switch": {"id": 1, "uplink_switches": ["spine1"]}},
+    "leaf2": {"switch": {"id": 2, "uplink_switches": ["spine1"]}},
+    "spine1": {"switch": {"id": 1}},
+}
+
+CHANGED_INPUTS = [
+    ("vars", {**HOSTVARS, "tenants": []}, AVD_SWITCH_FACTS, "4.0.0"),
+    ("own_facts", HOSTVARS, {**AVD_SWITCH_FACTS, "leaf1": {"switch": {"id": 11, "uplink_switches": ["spine1"]}}}, "4.0.0"),
+    ("peer_facts", HOSTVARS, {**AVD_SWITCH_FACTS, "spine1": {"switch": {"id": 2}}}, "4.0.0"),
+    ("removed_peer", HOSTVARS, {key: value for key, value in AVD_SWITCH_FACTS.items() if key != "spine1"}, "4.0.0"),
+    ("avd_version", HOSTVARS, AVD_SWITCH_FACTS, "4.1.0"),
+]
+
+SPINE_HOSTVARS = {
+    "inventory_hostname": "spine1",
+    "fabric_name": "FABRIC",
+    "avd_topology_peers": {"spine1": ["leaf1", "leaf2"]},
+    "avd_overlay_peers": {"spine1": ["leaf1", "leaf2"]},
+}
+
+
+def get_previous_fingerprint(accessed_peers: set) -> dict:
+    fingerprint = DeviceFingerprint(HOSTVARS, "4.0.0")
+    shared_utils = SimpleNamespace(
+        hostvars={**HOSTVARS, "avd_switch_facts": AVD_SWITCH_FACTS}, accessed_peers=accessed_peers, accessed_all_fabric_devices=False
+    )
+    fingerprint.add_peer_facts(shared_utils)
+    return fingerprint.to_dict()
+
+
+class TestDeviceFingerprint:
+    def test_fingerprint_unchanged(self):
+        previous_fingerprint = get_previous_fingerprint({"spine1"})
+        assert set(previous_fingerprint["peer_facts"]) == {"leaf1", "spine1"}
+        assert DeviceFingerprint(HOSTVARS, "4.0.0").is_unchanged(previous_fingerprint, AVD_SWITCH_FACTS)
+
+    @pytest.mark.parametrize("CHANGE, NEW_HOSTVARS, NEW_AVD_SWITCH_FACTS, NEW_AVD_VERSION", CHANGED_INPUTS, ids=[change[0] for change in CHANGED_INPUTS])
+    def test_fingerprint_changed(self, CHANGE, NEW_HOSTVARS, NEW_AVD_SWITCH_FACTS, NEW_AVD_VERSION):
+        previous_fingerprint = get_previous_fingerprint({"spine1"})
+        assert not DeviceFingerprint(NEW_HOSTVARS, NEW_AVD_VERSION).is_unchanged(previous_fingerprint, NEW_AVD_SWITCH_FACTS)
+
+    def test_fingerprint_ignores_unrelated_changes(self):
+        previous_fingerprint = get_previous_fingerprint({"spine1"})
+        new_hostvars = {**HOSTVARS, "ansible_host": "10.0.0.2", "avd_switch_facts": {}}
+        new_avd_switch_facts = {**AVD_SWITCH_FACTS, "leaf2": {"switch": {"id": 3}}}
+        assert DeviceFingerprint(new_hostvars, "4.0.0").is_unchanged(previous_fingerprint, new_avd_switch_facts)
+
+    def test_fingerprint_all_fabric_devices(self):
+        fingerprint = DeviceFingerprint(HOSTVARS, "4.0.0")
+        shared_utils = SimpleNamespace(hostvars={**HOSTVARS, "avd_switch_facts": AVD_SWITCH_FACTS}, accessed_peers=set(), accessed_all_fabric_devices=True)
+        fingerprint.add_peer_facts(shared_utils)
+        previous_fingerprint = fingerprint.to_dict()
+        new_avd_switch_facts = {**AVD_SWITCH_FACTS, "leaf3": {"switch": {"id": 3}}}
+        assert DeviceFingerprint(HOSTVARS, "4.0.0").is_unchanged(previous_fingerprint, AVD_SWITCH_FACTS)
+        assert not DeviceFingerprint(HOSTVARS, "4.0.0").is_unchanged(previous_fingerprint, new_avd_switch_facts)
+
+    def test_missing_fingerprint(self, tmp_path):
+        assert read_fingerprint_file(str(tmp_path.joinpath("missing.fingerprint"))) is None
+        assert not DeviceFingerprint(HOSTVARS, "4.0.0").is_unchanged(None, AVD_SWITCH_FACTS)
+
+    def test_write_and_read_fingerprint_file(self, tmp_path):
+        fingerprint_file = str(tmp_path.joinpath("leaf1.yml.fingerprint"))
+        previous_fingerprint = get_previous_fingerprint({"spine1"})
+        write_fingerprint_file(fingerprint_file, previous_fingerprint)
+        assert read_fingerprint_file(fingerprint_file) == previous_fingerprint
+
+    @pytest.mark.parametrize("PEERS_KEY", ["avd_topology_peers", "avd_overlay_peers"])
+    def test_fingerprint_added_downlink(self, PEERS_KEY):
+        # The spine has no accessed peers and its own input variables do not change when a leaf is added.
+        fingerprint = DeviceFingerprint(SPINE_HOSTVARS, "4.0.0")
+        fingerprint.add_peer_facts(
+            SimpleNamespace(hostvars={**SPINE_HOSTVARS, "avd_switch_facts": AVD_SWITCH_FACTS}, accessed_peers=set(), accessed_all_fabric_devices=False)
+        )
+        previous_fingerprint = fingerprint.to_dict()
+        assert set(previous_fingerprint["peer_facts"]) == {"leaf1", "leaf2", "spine1"}
+        assert DeviceFingerprint(SPINE_HOSTVARS, "4.0.0").is_unchanged(previous_fingerprint, AVD_SWITCH_FACTS)
+
+        new_avd_switch_facts = {**AVD_SWITCH_FACTS, "leaf3": {"switch": {"id": 3, "uplink_switches": ["spine1"]}}}
+        new_hostvars = {**SPINE_HOSTVARS, PEERS_KEY: {"spine1": ["leaf1", "leaf2", "leaf3"]}}
+        assert not DeviceFingerprint(new_hostvars, "4.0.0").is_unchanged(previous_fingerprint, new_avd_switch_facts)
+
+    def test_fingerprint_changed_downlink_facts(self):
+        fingerprint = DeviceFingerprint(SPINE_HOSTVARS, "4.0.0")
+        fingerprint.add_peer_facts(
+            SimpleNamespace(hostvars={**SPINE_HOSTVARS, "avd_switch_facts": AVD_SWITCH_FACTS}, accessed_peers=set(), accessed_all_fabric_devices=False)
+        )
+        new_avd_switch_facts = {**AVD_SWITCH_FACTS, "leaf2": {"switch": {"id": 3, "uplink_switches": ["spine1"]}}}
+        assert not DeviceFingerprint(SPINE_HOSTVARS, "4.0.0").is_unchanged(fingerprint.to_dict(), new_avd_switch_facts)
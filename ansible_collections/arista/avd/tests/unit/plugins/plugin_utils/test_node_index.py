@@ -0,0 +1,65 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from copy import deepcopy
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils import SharedUtils, clear_node_indexes
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils.index_cache import MAX_CACHED_INDEXES
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_shared_utils.node_index import NODE_INDEXES, get_node_index
+
+L3LEAF = {
+    "defaults": {"platform": "vEOS-lab", "bgp_as": "65100"},
+    "nodes": [{"name": "leaf3", "id": 3}],
+    "node_groups": [
+        {"group": "pod1", "bgp_as": "65101", "nodes": [{"name": "leaf1", "id": 1}, {"name": "leaf2", "id": 2, "platform": "7050SX3"}]},
+        {"group": "pod2", "nodes": [{"name": "leaf3", "id": 30}, {"name": "leaf4", "id": 4}]},
+    ],
+}
+
+
+def get_switch_data(hostname: str, l3leaf: dict) -> dict:
+    return SharedUtils({"inventory_hostname": hostname, "type": "l3leaf", "l3leaf": l3leaf}, None).switch_data
+
+
+class TestNodeIndex:
+    def setup_method(self):
+        clear_node_indexes()
+
+    def test_switch_data(self):
+        l3leaf = deepcopy(L3LEAF)
+
+        switch_data = get_switch_data("leaf2", l3leaf)
+        assert switch_data["group"] == "pod1"
+        assert [node["name"] for node in switch_data["node_group"]["nodes"]] == ["leaf1", "leaf2"]
+        assert {key: switch_data["combined"][key] for key in ("platform", "bgp_as", "id")} == {"platform": "7050SX3", "bgp_as": "65101", "id": 2}
+
+        # Nodes under "nodes" take precedence over node_groups.
+        switch_data = get_switch_data("leaf3", l3leaf)
+        assert switch_data["node_group"] == {}
+        assert "group" not in switch_data
+        assert switch_data["combined"] == {"platform": "vEOS-lab", "bgp_as": "65100", "name": "leaf3", "id": 3}
+
+        # Unknown devices only get the defaults.
+        assert get_switch_data("unknown", l3leaf)["combined"] == L3LEAF["defaults"]
+
+        # The input data is not modified.
+        assert l3leaf == L3LEAF
+
+    def test_node_index_shared_by_equal_data(self):
+        node_index = get_node_index("l3leaf", L3LEAF)
+
+        assert get_node_index("l3leaf", deepcopy(L3LEAF)) is node_index
+        assert get_node_index("l3leaf", {**L3LEAF, "defaults": {}}) is not node_index
+        assert len(NODE_INDEXES["l3leaf"]) == 2
+        # The switch_data is computed once per device and shared.
+        assert get_switch_data("leaf1", deepcopy(L3LEAF)) is node_index.get_switch_data("leaf1")
+
+    def test_node_indexes_are_bounded(self):
+        node_index = get_node_index("l3leaf", L3LEAF)
+        for bgp_as in range(2 * MAX_CACHED_INDEXES):
+            get_node_index("l3leaf", {**L3LEAF, "defaults": {"bgp_as": str(bgp_as)}})
+
+        assert len(NODE_INDEXES["l3leaf"]) == MAX_CACHED_INDEXES
+        # The least recently used index was dropped and is built again.
+        assert get_node_index("l3leaf", L3LEAF) is not node_index
@@ -0,0 +1,36 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from types import SimpleNamespace
+
+from ansible_collections.arista.avd.plugins.plugin_utils.eos_designs_facts import PeerIndex
+
+UPLINK_PEERS = {
+    "spine1": [],
+    "spine2": [],
+    "leaf1": ["spine1", "spine2"],
+    "leaf2": ["spine1", "spine2"],
+    "l2leaf1": ["leaf1", "leaf2"],
+    "l2leaf2": ["leaf2"],
+}
+
+
+class TestPeerIndex:
+    def test_downstream_switches(self):
+        avd_switch_facts = {hostname: {"switch": SimpleNamespace(uplink_peers=uplink_peers)} for hostname, uplink_peers in UPLINK_PEERS.items()}
+        peer_index = PeerIndex(avd_switch_facts)
+
+        assert peer_index.get_downstream_switches("spine1") == ["leaf1", "leaf2"]
+        assert peer_index.get_downstream_switches("leaf2") == ["l2leaf1", "l2leaf2"]
+        assert peer_index.get_downstream_switches("l2leaf1") == []
+        assert peer_index.is_fabric_device("l2leaf2")
+        assert not peer_index.is_fabric_device("l2leaf3")
+
+    def test_downstream_switches_brute_force(self):
+        avd_switch_facts = {hostname: {"switch": SimpleNamespace(uplink_peers=uplink_peers)} for hostname, uplink_peers in UPLINK_PEERS.items()}
+        peer_index = PeerIndex(avd_switch_facts)
+
+        for hostname in UPLINK_PEERS:
+            expected = [fabric_switch for fabric_switch, uplink_peers in UPLINK_PEERS.items() if hostname in uplink_peers]
+            assert peer_index.get_downstream_switches(hostname) == expected
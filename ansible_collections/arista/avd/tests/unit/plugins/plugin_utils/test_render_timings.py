@@ -0,0 +1,100 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+from functools import cached_property
+
+from ansible_collections.arista.avd.plugins.plugin_utils.avdfacts import AvdFacts
+from ansible_collections.arista.avd.plugins.plugin_utils.render_timings import (
+    FUNCTIONS,
+    KEYS,
+    MODULES,
+    RenderTimings,
+    aggregate_render_timings,
+    render_timer,
+    write_render_timings_file,
+)
+
+
+class FactsUnderTest(AvdFacts):
+    @cached_property
+    def hostname(self):
+        return self._hostvars["inventory_hostname"]
+
+    @cached_property
+    def empty(self):
+        return None
+
+    @cached_property
+    def _internal(self):
+        return "internal"
+
+
+DEVICE_RENDER_TIMINGS = {
+    "leaf1": {
+        MODULES: {"AvdStructuredConfigBase": {"calls": 1, "seconds": 0.5}},
+        KEYS: {"router_bgp": {"calls": 2, "seconds": 0.25}, "hostname": {"calls": 1, "seconds": 0.125}},
+    },
+    "leaf2": {
+        MODULES: {"AvdStructuredConfigBase": {"calls": 1, "seconds": 1.0}},
+        KEYS: {"router_bgp": {"calls": 2, "seconds": 0.125}},
+    },
+}
+
+
+class TestRenderTimings:
+    def test_timer(self):
+        render_timings = RenderTimings()
+        with render_timings.timer(FUNCTIONS, "merge"):
+            pass
+        with render_timings.timer(FUNCTIONS, "merge"):
+            pass
+        render_timings.add(MODULES, "AvdStructuredConfigBase", 0.5)
+
+        timings = render_timings.to_dict()
+        assert timings[FUNCTIONS]["merge"]["calls"] == 2
+        assert timings[FUNCTIONS]["merge"]["seconds"] >= 0.0
+        assert timings[MODULES] == {"AvdStructuredConfigBase": {"calls": 1, "seconds": 0.5}}
+
+    def test_timer_records_on_exception(self):
+        render_timings = RenderTimings()
+        try:
+            with render_timings.timer(KEYS, "router_bgp"):
+                raise ValueError("failed")
+        except ValueError:
+            pass
+
+        assert render_timings.to_dict()[KEYS]["router_bgp"]["calls"] == 1
+
+    def test_render_timer_without_render_timings(self):
+        with render_timer(None, KEYS, "router_bgp"):
+            pass
+
+    def test_avdfacts_render_with_render_timings(self):
+        hostvars = {"inventory_hostname": "leaf1"}
+        render_timings = RenderTimings()
+
+        rendered = FactsUnderTest(hostvars, None, render_timings).render()
+
+        assert rendered == FactsUnderTest(hostvars, None).render() == {"hostname": "leaf1"}
+        assert set(render_timings.to_dict()[KEYS]) == {"hostname", "empty"}
+
+    def test_aggregate_render_timings(self):
+        aggregated = aggregate_render_timings(DEVICE_RENDER_TIMINGS)
+
+        assert aggregated["devices"] == 2
+        assert aggregated[MODULES]["AvdStructuredConfigBase"] == {"calls": 2, "seconds": 1.5, "max_seconds": 1.0, "max_device": "leaf2"}
+        assert aggregated[KEYS]["router_bgp"] == {"calls": 4, "seconds": 0.375, "max_seconds": 0.25, "max_device": "leaf1"}
+        # Sorted by the sum of seconds.
+        assert list(aggregated[KEYS]) == ["router_bgp", "hostname"]
+
+    def test_write_render_timings_file(self, tmp_path):
+        filename = str(tmp_path / "render_timings.json")
+        write_render_timings_file(filename, DEVICE_RENDER_TIMINGS)
+
+        with open(filename, encoding="UTF-8") as file:
+            data = json.load(file)
+
+        assert data["devices"] == DEVICE_RENDER_TIMINGS
+        assert data["fabric"] == aggregate_render_timings(DEVICE_RENDER_TIMINGS)
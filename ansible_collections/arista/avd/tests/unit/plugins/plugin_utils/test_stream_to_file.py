@@ -0,0 +1,80 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+from hashlib import sha1
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils.stream_to_file import is_octal_mode, stream_to_file
+
+TEMPLATES = {"main.j2": "{% for item in items %}item {{ item }}\n{% endfor %}"}
+
+
+def generate(items: list):
+    return Environment(loader=DictLoader(TEMPLATES), trim_blocks=True).get_template("main.j2").generate(items=items)
+
+
+class TestStreamToFile:
+    def test_new_file(self, tmp_path):
+        dest = tmp_path.joinpath("device.cfg")
+        result = stream_to_file(generate([1, 2]), str(dest), mode="0640")
+
+        assert result == {"changed": True, "dest": str(dest), "checksum": sha1(b"item 1\nitem 2\n").hexdigest()}
+        assert dest.read_text(encoding="UTF-8") == "item 1\nitem 2\n"
+        assert os.stat(dest).st_mode & 0o7777 == 0o640
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_unchanged_file(self, tmp_path):
+        dest = tmp_path.joinpath("device.cfg")
+        stream_to_file(generate([1, 2]), str(dest))
+        inode = os.stat(dest).st_ino
+
+        assert stream_to_file(generate([1, 2]), str(dest))["changed"] is False
+        assert os.stat(dest).st_ino == inode
+        assert list(tmp_path.iterdir()) == [dest]
+
+        # Only the mode is changed
+        assert stream_to_file(generate([1, 2]), str(dest), mode=0o600)["changed"] is True
+        assert os.stat(dest).st_mode & 0o7777 == 0o600
+
+    def test_changed_file_keeps_mode(self, tmp_path):
+        dest = tmp_path.joinpath("device.cfg")
+        stream_to_file(generate([1]), str(dest), mode=0o640)
+
+        assert stream_to_file(generate([1, 2]), str(dest))["changed"] is True
+        assert dest.read_text(encoding="UTF-8") == "item 1\nitem 2\n"
+        assert os.stat(dest).st_mode & 0o7777 == 0o640
+
+    def test_check_mode(self, tmp_path):
+        dest = tmp_path.joinpath("device.cfg")
+        stream_to_file(generate([1]), str(dest))
+
+        assert stream_to_file(generate([1]), str(dest), check_mode=True)["changed"] is False
+        assert stream_to_file(generate([1, 2]), str(dest), check_mode=True)["changed"] is True
+        assert dest.read_text(encoding="UTF-8") == "item 1\n"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_error_while_rendering(self, tmp_path):
+        dest = tmp_path.joinpath("device.cfg")
+        stream_to_file(generate([1]), str(dest))
+
+        def failing_chunks():
+            yield "item 1\n"
+            raise ValueError("Rendering failed")
+
+        with pytest.raises(ValueError, match="Rendering failed"):
+            stream_to_file(failing_chunks(), str(dest))
+
+        assert dest.read_text(encoding="UTF-8") == "item 1\n"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    @pytest.mark.parametrize("mode", [None, 0o640, "0640", "640"])
+    def test_is_octal_mode(self, mode):
+        assert is_octal_mode(mode) is True
+
+    @pytest.mark.parametrize("mode", ["u=rw,g=r,o=r", "preserve", "", True, 6.4])
+    def test_is_not_octal_mode(self, mode):
+        assert is_octal_mode(mode) is False
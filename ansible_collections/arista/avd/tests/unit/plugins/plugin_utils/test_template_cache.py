@@ -0,0 +1,54 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from jinja2 import DictLoader, Environment
+from jinja2.nativetypes import NativeEnvironment
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import template_cache
+from ansible_collections.arista.avd.plugins.plugin_utils.utils.template_cache import TemplateBytecodeCache
+
+TEMPLATES = {
+    "main.j2": "{% for item in items %}{% include 'item.j2' %}{% endfor %}",
+    "item.j2": "item {{ item }}\n",
+}
+
+
+def get_environment(bytecode_cache: TemplateBytecodeCache, templates: dict = None, environment_class=Environment) -> Environment:
+    return environment_class(loader=DictLoader(templates or TEMPLATES), bytecode_cache=bytecode_cache, trim_blocks=True)
+
+
+class TestTemplateBytecodeCache:
+    def test_render_from_cache(self, tmp_path):
+        bytecode_cache = TemplateBytecodeCache(directory=str(tmp_path))
+        expected_output = get_environment(None).get_template("main.j2").render(items=[1, 2])
+
+        assert get_environment(bytecode_cache).get_template("main.j2").render(items=[1, 2]) == expected_output
+        assert len(list(tmp_path.iterdir())) == 2
+
+        environment = get_environment(bytecode_cache)
+        assert bytecode_cache.get_bucket(environment, "item.j2", None, TEMPLATES["item.j2"]).code is not None
+        assert environment.get_template("main.j2").render(items=[1, 2]) == expected_output
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_cache_key(self, tmp_path):
+        bytecode_cache = TemplateBytecodeCache(directory=str(tmp_path))
+        get_environment(bytecode_cache).get_template("item.j2")
+
+        changed_source = "changed {{ item }}\n"
+        assert bytecode_cache.get_bucket(get_environment(bytecode_cache), "item.j2", None, changed_source).code is None
+        assert get_environment(bytecode_cache, {"item.j2": changed_source}).get_template("item.j2").render(item=1) == "changed 1"
+
+        # Code generated for other environments must not be shared.
+        native_environment = get_environment(bytecode_cache, environment_class=NativeEnvironment)
+        assert bytecode_cache.get_bucket(native_environment, "item.j2", None, TEMPLATES["item.j2"]).code is None
+        assert bytecode_cache.get_bucket(Environment(bytecode_cache=bytecode_cache), "item.j2", None, TEMPLATES["item.j2"]).code is None
+
+    def test_cache_key_covers_avd_version(self, tmp_path, monkeypatch):
+        bytecode_cache = TemplateBytecodeCache(directory=str(tmp_path))
+        get_environment(bytecode_cache).get_template("item.j2")
+        assert bytecode_cache.get_bucket(get_environment(bytecode_cache), "item.j2", None, TEMPLATES["item.j2"]).code is not None
+
+        # Code generated by another version of AVD may call filters and tests with other arguments.
+        monkeypatch.setattr(template_cache, "get_collection_version", lambda: "0.0.0")
+        assert bytecode_cache.get_bucket(get_environment(bytecode_cache), "item.j2", None, TEMPLATES["item.j2"]).code is None
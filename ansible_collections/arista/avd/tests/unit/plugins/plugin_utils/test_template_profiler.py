@@ -0,0 +1,100 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from jinja2 import DictLoader, Environment
+
+from ansible_collections.arista.avd.plugins.plugin_utils.template_profiler import (
+    TemplateProfiler,
+    aggregate_template_profiles,
+    format_folded_stacks,
+    write_template_profile_files,
+)
+
+TEMPLATES = {
+    "main.j2": "{% include 'section.j2' %}{% include 'section.j2' %}{{ items | arista.avd.sort | join(',') }}\n",
+    "section.j2": "{% for item in items | arista.avd.sort %}{% if item is arista.avd.even %}{{ item }}{% endif %}{% endfor %}\n",
+}
+TEMPLATE_VARS = {"items": [3, 2, 1]}
+DEVICE_TEMPLATE_PROFILES = {
+    "leaf1": {
+        "sections": {
+            "main.j2": {"calls": 1, "seconds": 0.5, "self_seconds": 0.25},
+            "section.j2": {"calls": 2, "seconds": 0.25, "self_seconds": 0.25},
+        },
+        "stacks": {"main.j2": 0.25, "main.j2;section.j2": 0.25},
+    },
+    "leaf2": {
+        "sections": {"main.j2": {"calls": 1, "seconds": 1.0, "self_seconds": 1.0}},
+        "stacks": {"main.j2": 1.0},
+    },
+}
+
+
+def get_environment() -> Environment:
+    environment = Environment(loader=DictLoader(TEMPLATES))
+    environment.filters["arista.avd.sort"] = sorted
+    environment.tests["arista.avd.even"] = lambda value: value % 2 == 0
+    return environment
+
+
+class TestTemplateProfiler:
+    def test_install(self):
+        environment = get_environment()
+        expected_output = environment.get_template("main.j2").render(TEMPLATE_VARS)
+
+        profiler = TemplateProfiler()
+        with profiler.install(environment), profiler.frame("main.j2"):
+            output = environment.get_template("main.j2").render(TEMPLATE_VARS)
+
+        assert output == expected_output
+        # The environment is restored when the context exits.
+        assert "get_template" not in vars(environment)
+        assert environment.filters["arista.avd.sort"] is sorted
+
+        template_profile = profiler.to_dict()
+        sections = template_profile["sections"]
+        assert list(sections)[0] == "main.j2"
+        assert sections["main.j2"]["calls"] == 1
+        assert sections["section.j2"]["calls"] == 2
+        assert sections["filter:arista.avd.sort"]["calls"] == 3
+        assert sections["test:arista.avd.even"]["calls"] == 6
+        assert sections["main.j2"]["seconds"] >= sections["section.j2"]["seconds"]
+        assert set(template_profile["stacks"]) == {
+            "main.j2",
+            "main.j2;load:main.j2",
+            "main.j2;load:section.j2",
+            "main.j2;section.j2",
+            "main.j2;section.j2;filter:arista.avd.sort",
+            "main.j2;section.j2;test:arista.avd.even",
+            "main.j2;filter:arista.avd.sort",
+        }
+
+    def test_profile_generator(self):
+        profiler = TemplateProfiler()
+        assert list(profiler.profile_generator("main.j2", iter(["a", "b"]))) == ["a", "b"]
+        assert profiler.to_dict()["sections"]["main.j2"]["calls"] == 1
+
+    def test_aggregate_template_profiles(self):
+        aggregated = aggregate_template_profiles(DEVICE_TEMPLATE_PROFILES)
+
+        assert aggregated["devices"] == 2
+        assert aggregated["sections"]["main.j2"] == {"calls": 2, "seconds": 1.5, "self_seconds": 1.25, "max_seconds": 1.0, "max_device": "leaf2"}
+        assert list(aggregated["sections"]) == ["main.j2", "section.j2"]
+        assert aggregated["stacks"] == {"main.j2": 1.25, "main.j2;section.j2": 0.25}
+
+    def test_format_folded_stacks(self):
+        assert format_folded_stacks({"stacks": {"main.j2;section.j2": 0.25, "main.j2": 1.25, "main.j2;load:section.j2": 0.0}}) == (
+            "main.j2 1250000\nmain.j2;section.j2 250000\n"
+        )
+
+    def test_write_template_profile_files(self, tmp_path):
+        filename = str(tmp_path / "leaf1.json")
+        write_template_profile_files(filename, DEVICE_TEMPLATE_PROFILES["leaf1"])
+
+        with open(filename, encoding="UTF-8") as file:
+            assert json.load(file) == DEVICE_TEMPLATE_PROFILES["leaf1"]
+        with open(str(tmp_path / "leaf1.folded"), encoding="UTF-8") as file:
+            assert file.read() == format_folded_stacks(DEVICE_TEMPLATE_PROFILES["leaf1"])
@@ -0,0 +1,72 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+from ansible.parsing.dataloader import DataLoader
+from ansible.parsing.vault import VaultLib, VaultSecret
+from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
+from ansible.utils.unsafe_proxy import AnsibleUnsafeText
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import dump_data, get_data_format, load_data, read_data_file
+
+DATA = {
+    "hostname": "leaf1",
+    "router_bgp": {"as": "65101", "router_id": "192.168.255.3", "neighbors": [{"ip_address": "10.0.0.1", "remote_as": 65100}]},
+    "ethernet_interfaces": [{"name": "Ethernet1", "shutdown": False, "mtu": 9214, "description": None}],
+}
+
+
+class TestDataFile:
+    @pytest.mark.parametrize(
+        "filename, expected_format",
+        [("leaf1.json", "json"), ("leaf1.yml", "yaml"), ("leaf1.YAML", "yaml"), ("/dev/stdin", None), ("leaf1.cfg", None)],
+    )
+    def test_get_data_format(self, filename, expected_format):
+        assert get_data_format(filename) == expected_format
+
+    @pytest.mark.parametrize("data_format", ["json", "yaml"])
+    def test_dump_and_load_data(self, data_format):
+        output = dump_data(DATA, data_format)
+
+        assert load_data(output, data_format) == DATA
+        # Without a format, JSON is tried before YAML.
+        assert load_data(output) == DATA
+        # Keys are not sorted.
+        assert list(load_data(output, data_format)) == list(DATA)
+
+    def test_dump_data_yaml_without_aliases(self):
+        shared = {"name": "shared"}
+        assert "&" not in dump_data({"a": shared, "b": shared}, "yaml")
+
+    def test_dump_data_yaml_with_unsafe_text(self):
+        data = {AnsibleUnsafeText("hostname"): AnsibleUnsafeText("leaf1"), "list": [AnsibleUnsafeText("value")]}
+        assert dump_data(data, "yaml") == "hostname: leaf1\nlist:\n- value\n"
+
+    @pytest.mark.parametrize("data_format", ["json", "yaml"])
+    def test_dump_data_with_vaulted_value(self, data_format):
+        vault_secret = VaultSecret(b"avd")
+        vaulted_value = AnsibleVaultEncryptedUnicode.from_plaintext("arista", VaultLib([("default", vault_secret)]), vault_secret)
+        output = dump_data({"local_users": [{"name": "admin", "secret": vaulted_value}]}, data_format)
+
+        # The value is written encrypted and is decrypted by the Ansible loader.
+        assert "arista" not in output
+        assert ("!vault |" in output) == (data_format == "yaml")
+        loader = DataLoader()
+        loader.set_vault_secrets([("default", vault_secret)])
+        assert loader.load(output)["local_users"][0]["secret"] == "arista"
+
+    @pytest.mark.parametrize("extension", ["json", "yml", "yaml"])
+    def test_read_data_file(self, tmp_path, extension):
+        filename = str(tmp_path / f"leaf1.{extension}")
+        with open(filename, "w", encoding="UTF-8") as file:
+            file.write(dump_data(DATA, get_data_format(filename)))
+
+        assert read_data_file(filename) == DATA
+
+    def test_read_data_file_unknown_extension(self, tmp_path):
+        filename = str(tmp_path / "leaf1")
+        with open(filename, "w", encoding="UTF-8") as file:
+            file.write("hostname: leaf1\n")
+
+        assert read_data_file(filename) == {"hostname": "leaf1"}
@@ -0,0 +1,51 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.errors import AristaAvdDuplicateDataError, AristaAvdMissingVariableError
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IndexedList, append_if_not_duplicate, get_item
+
+
+class TestIndexedList:
+    def test_get_item(self):
+        vlans = IndexedList([{"id": 1, "name": "one"}, "not_a_dict", {"id": 2, "name": "two"}, {"id": 1, "name": "duplicate"}])
+
+        assert get_item(vlans, "id", 1) == {"id": 1, "name": "one"}
+        assert get_item(vlans, "name", "two") == {"id": 2, "name": "two"}
+        assert get_item(vlans, "id", 3) is None
+        assert get_item(vlans, "id", 3, default={}) == {}
+        assert get_item(vlans, "id", ["unhashable"]) is None
+        with pytest.raises(AristaAvdMissingVariableError):
+            get_item(vlans, "id", 3, required=True)
+
+    def test_indexes_in_sync(self):
+        vlans = IndexedList()
+        assert get_item(vlans, "id", 1) is None
+
+        vlans.append({"id": 1})
+        vlans.extend(iter([{"id": 2}, {"id": 3}]))
+        vlans += [{"id": 4}]
+        assert [get_item(vlans, "id", vlan_id) for vlan_id in (1, 2, 3, 4)] == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+
+        vlans.insert(0, {"id": 3, "name": "first"})
+        assert get_item(vlans, "id", 3) == {"id": 3, "name": "first"}
+        vlans.pop(0)
+        assert get_item(vlans, "id", 3) == {"id": 3}
+        vlans[0] = {"id": 5}
+        assert get_item(vlans, "id", 1) is None
+        del vlans[0]
+        assert get_item(vlans, "id", 5) is None
+        vlans.clear()
+        assert get_item(vlans, "id", 2) is None
+
+    def test_append_if_not_duplicate(self):
+        vlans = IndexedList()
+        for vlan in [{"id": 1, "tenant": "a"}, {"id": 2, "tenant": "a"}, {"id": 1, "tenant": "b"}]:
+            append_if_not_duplicate(vlans, "id", vlan, context="VLANs", context_keys=["id", "tenant"], ignore_keys={"tenant"})
+
+        assert list(vlans) == [{"id": 1, "tenant": "a"}, {"id": 2, "tenant": "a"}]
+        assert type(list(vlans)) is list
+        with pytest.raises(AristaAvdDuplicateDataError, match="VLANs"):
+            append_if_not_duplicate(vlans, "id", {"id": 2, "name": "two"}, context="VLANs", context_keys=["id"])
@@ -0,0 +1,58 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import RegexMatcher, get_regex_matcher
+from ansible_collections.arista.avd.plugins.plugin_utils.utils.regex_matcher import _get_literal_prefix
+
+REGEXES = [
+    "DC1-LEAF1",
+    "DC1-LEAF1[AB]",
+    "DC1-LEAF.*",
+    "DC1-LEAF1",
+    "DC1-LEAF1?",
+    "DC1-LEAF\\d+",
+    "DC1-LEAF1{0,1}A",
+    "DC1-LEAF1+B",
+    ".*LEAF1",
+    "DC2-LEAF1|DC1-LEAF1",
+    "^DC1.*",
+    "DC1-(LEAF|SPINE)1",
+    "DC1-LEAF1A|LEAF2",
+]
+HOSTNAMES = ["DC1-LEAF1", "DC1-LEAF1A", "DC1-LEAF11", "DC1-LEAF", "DC1-LEAF1BB", "DC1-SPINE1", "DC2-LEAF1", "LEAF2", "DC1-", ""]
+
+
+class TestRegexMatcher:
+    @pytest.mark.parametrize(
+        "regex, expected_prefix",
+        [
+            ("DC1-LEAF1", "DC1-LEAF1"),
+            ("DC1-LEAF1[AB]", "DC1-LEAF1"),
+            ("DC1-LEAF1?", "DC1-LEAF"),
+            ("DC1-LEAF1{0,1}", "DC1-LEAF"),
+            ("DC1-LEAF1+", "DC1-LEAF1"),
+            ("DC1\\-LEAF1", "DC1"),
+            ("DC1|DC2", ""),
+            ("(?i)dc1", ""),
+            (".*", ""),
+        ],
+    )
+    def test_get_literal_prefix(self, regex, expected_prefix):
+        assert _get_literal_prefix(regex) == expected_prefix
+
+    @pytest.mark.parametrize("search", [False, True])
+    @pytest.mark.parametrize("hostname", HOSTNAMES)
+    def test_match(self, hostname, search):
+        expected_matches = [index for index, regex in enumerate(REGEXES) if (re.search if search else re.match)(rf"^{regex}$", hostname)]
+        assert RegexMatcher(REGEXES, search=search).match(hostname) == expected_matches
+
+    def test_get_regex_matcher(self):
+        matcher = get_regex_matcher(tuple(REGEXES))
+        assert get_regex_matcher(tuple(REGEXES)) is matcher
+        assert get_regex_matcher(tuple(REGEXES), search=True) is not matcher
+        assert get_regex_matcher(()).match("DC1-LEAF1") == []
@@ -1,9 +1,16 @@
+from .device_inputs_changed import device_inputs_changed
 from .get_avd_facts import get_avd_facts
 from .get_device_config import get_device_config
 from .get_device_doc import get_device_doc
+from .get_device_facts_slice import get_device_facts_slice
 from .get_device_structured_config import get_device_structured_config
+from .get_fabric_documentation import get_fabric_documentation
+from .get_structured_configs import get_structured_configs
 from .validate_inputs import validate_inputs
 from .vendor.version import VERSION
+from .write_device_config import write_device_config
+from .write_device_doc import write_device_doc
+from .write_fabric_documentation import write_fabric_documentation
 
 """ Library for running Arista Validated Designs (AVD) in Python
 """
@@ -24,9 +31,16 @@ __license__ = "Apache 2.0"
 __version__ = f"{AVD_VERSION}{PYAVD_VERSION}{DEV_VERSION}"
 
 __all__ = [
+    "device_inputs_changed",
     "get_avd_facts",
     "get_device_config",
     "get_device_doc",
+    "get_device_facts_slice",
     "get_device_structured_config",
+    "get_fabric_documentation",
+    "get_structured_configs",
     "validate_inputs",
+    "write_device_config",
+    "write_device_doc",
+    "write_fabric_documentation",
 ]
@@ -11,7 +11,7 @@ class AvdSchemaTools:
     Tools that wrap the various schema components for easy use
     """
 
-    def __init__(self, schema: dict = None, schema_id: str = None) -> None:
+    def __init__(self, schema: dict = None, schema_id: str = None, compiled_validator: bool = False) -> None:
         """
         Convert data according to the schema (convert_types)
         The data conversion is done in-place (updating the original "data" dict).
@@ -19,8 +19,10 @@ class AvdSchemaTools:
         Args:
             schema_id:
                 Name of AVD Schema to use for conversion and validation.
+            compiled_validator:
+                Validate data with the compiled validator instead of the jsonschema based validator.
         """
-        self.avdschema = AvdSchema(schema=schema, schema_id=schema_id)
+        self.avdschema = AvdSchema(schema=schema, schema_id=schema_id, compiled_validator=compiled_validator)
 
     def convert_data(self, data: dict) -> dict:
         """
@@ -84,7 +86,7 @@ class AvdSchemaTools:
 
     def convert_and_validate_data(self, data: dict) -> dict:
         """
-        Convert and validate data according to the schema
+        Convert and validate data according to the schema in a single pass over the data.
 
         Args:
             data:
@@ -98,9 +100,16 @@ class AvdSchemaTools:
                     Any errors raised during variable conversion and validation
                     This will contain errors raised as well as data validation issues.
         """
-        result = self.convert_data(data)
-        if result["failed"]:
-            return result
+        result = {"failed": False, "errors": []}
+
+        # avdschema.convert_and_validate returns a Generator, so we have to iterate through it to perform the actual conversions and validations.
+        exceptions: Generator = self.avdschema.convert_and_validate(data)
+        for exception in exceptions:
+            # Ignore conversions and deprecations
+            if exception is None or isinstance(exception, IGNORE_EXCEPTIONS):
+                continue
+
+            result["errors"].append(exception)
+            result["failed"] = True
 
-        result = self.validate_data(data)
         return result
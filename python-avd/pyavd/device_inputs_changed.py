@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from collections import ChainMap
+
+from .vendor.fingerprint import DeviceFingerprint
+from .vendor.version import VERSION
+
+
+def device_inputs_changed(hostname: str, hostvars: dict, avd_facts: dict, fingerprint: dict | None) -> bool:
+    """
+    Check if any of the inputs for the structured configuration of one device changed since the fingerprint was taken.
+
+    Changes to the inputs of other devices are only detected if they affect the avd_facts used for this device,
+    so only the changed devices and their dependents need to be regenerated.
+
+    Args:
+        hostname: Hostname of device.
+        hostvars: Dictionary of variables passed to AVD `eos_designs` modules.
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        fingerprint: Fingerprint stored from a previous call to `pyavd.get_device_structured_config` or None.
+
+    Returns:
+        False if the structured configuration from the previous run is still valid, otherwise True.
+    """
+    device_fingerprint = DeviceFingerprint(ChainMap({"inventory_hostname": hostname}, avd_facts, hostvars), VERSION)
+    return not device_fingerprint.is_unchanged(fingerprint, avd_facts["avd_switch_facts"])
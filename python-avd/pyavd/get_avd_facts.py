@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 from collections import ChainMap
 
-from .vendor.eos_designs.eos_designs_facts import EosDesignsFacts
-from .vendor.eos_designs.eos_designs_shared_utils import SharedUtils
+from .vendor.eos_designs.eos_designs_facts import EosDesignsFacts, FactsDependencyTracker, PeerIndex, render_facts_in_parallel
+from .vendor.eos_designs.eos_designs_shared_utils import SharedUtils, clear_connected_endpoints_indexes, clear_node_indexes
+from .vendor.render_timings import MODULES, RenderTimings
 
 
-def get_avd_facts(all_hostvars: dict[str, dict]) -> dict[str, dict]:
+def get_avd_facts(
+    all_hostvars: dict[str, dict], dependency_graph: dict | None = None, max_workers: int = 1, render_timings: dict | None = None
+) -> dict[str, dict]:
     """
     Build avd_facts using the AVD eos_designs_facts logic.
 
@@ -21,6 +26,28 @@ def get_avd_facts(all_hostvars: dict[str, dict]) -> dict[str, dict]:
                 ...
             }
             ```
+        dependency_graph: Optional dictionary which will be updated in-place with the graph of peer facts read by each device.
+            ```python
+            {
+                "edges": [{"device": str, "fact": str, "peer": str, "peer_fact": str}, ...],
+                "dependents": {"<peer>": ["<hostname1>", ...], ...},
+            }
+            ```
+            Recording the dependency graph requires rendering in a single process, so max_workers is ignored.
+        max_workers: Number of worker processes used to render the facts. With 1, the facts are rendered in the current process.
+            The output is identical regardless of the number of workers.
+        render_timings: Optional dictionary which will be updated in-place with the time spent on each fact per device.
+            ```python
+            {
+                "<hostname1>": {
+                    "modules": {"EosDesignsFacts": {"calls": int, "seconds": float}},
+                    "keys": {"<fact>": {"calls": int, "seconds": float}, ...},
+                },
+                ...
+            }
+            ```
+            Facts read from peer devices are computed when they are first needed, so the time is recorded on the fact reading them.
+            Recording the timings requires rendering in a single process, so max_workers is ignored.
 
     Returns:
         Nested dictionary with various internal "facts". The full dict must be given as argument to `pyavd.get_device_structured_config`:
@@ -33,8 +60,35 @@ def get_avd_facts(all_hostvars: dict[str, dict]) -> dict[str, dict]:
             ```
     """
 
-    avd_switch_facts_instances = _create_avd_switch_facts_instances(all_hostvars)
-    avd_switch_facts = _render_avd_switch_facts(avd_switch_facts_instances)
+    # Node and connected endpoints indexes are shared by all SharedUtils instances with equal input data,
+    # including the ones used later for structured config. Start from scratch to pick up any changed inputs.
+    clear_node_indexes()
+    clear_connected_endpoints_indexes()
+
+    device_render_timings = {hostname: RenderTimings() for hostname in all_hostvars} if render_timings is not None else None
+    avd_switch_facts_instances = _create_avd_switch_facts_instances(all_hostvars, device_render_timings)
+
+    dependency_tracker = None
+    if dependency_graph is not None:
+        dependency_tracker = FactsDependencyTracker()
+        dependency_tracker.track(avd_switch_facts_instances)
+
+    avd_switch_facts = None
+    if max_workers > 1 and dependency_tracker is None and device_render_timings is None:
+        avd_switch_facts = render_facts_in_parallel(avd_switch_facts_instances, max_workers)
+
+    if avd_switch_facts is None:
+        # Serial rendering. Also used if the parallel rendering failed, to raise the error for the first failing device.
+        avd_switch_facts = _render_avd_switch_facts(avd_switch_facts_instances, device_render_timings)
+
+    if dependency_tracker is not None:
+        dependency_graph.clear()
+        dependency_graph.update(dependency_tracker.to_dict())
+
+    if device_render_timings is not None:
+        render_timings.clear()
+        render_timings.update({hostname: device_timings.to_dict() for hostname, device_timings in device_render_timings.items()})
+
     avd_overlay_peers, avd_topology_peers = _render_peer_facts(avd_switch_facts)
 
     return {
@@ -44,7 +98,7 @@ def get_avd_facts(all_hostvars: dict[str, dict]) -> dict[str, dict]:
     }
 
 
-def _create_avd_switch_facts_instances(all_hostvars: dict[str, dict]) -> dict:
+def _create_avd_switch_facts_instances(all_hostvars: dict[str, dict], device_render_timings: dict[str, RenderTimings] | None = None) -> dict:
     """
     Validate input variables and return dictionary of EosDesignsFacts instances per device.
 
@@ -57,6 +111,7 @@ def _create_avd_switch_facts_instances(all_hostvars: dict[str, dict]) -> dict:
                 ...
             }
             ```
+        device_render_timings: Optional dictionary with a RenderTimings instance per device used to record the time spent on each fact.
 
     Returns:
         Dictionary with instances of EosDesignsFacts per device.
@@ -69,11 +124,13 @@ def _create_avd_switch_facts_instances(all_hostvars: dict[str, dict]) -> dict:
             ```
     """
     avd_switch_facts = {}
+    # Shared index used by all EosDesignsFacts instances to look up downstream switches without looping over all devices.
+    peer_index = PeerIndex(avd_switch_facts)
     for hostname, hostvars in all_hostvars.items():
         # Set 'inventory_hostname' on the input hostvars, to keep compatability with Ansible focused code.
         # Add reference to dict "avd_switch_facts" to access EosDesignsFacts objects of other switches during rendering of one switch.
         mapped_hostvars = ChainMap(
-            {"inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts},
+            {"inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts, "avd_switch_facts_peer_index": peer_index},
             hostvars,
         )
 
@@ -81,12 +138,13 @@ def _create_avd_switch_facts_instances(all_hostvars: dict[str, dict]) -> dict:
         shared_utils = SharedUtils(hostvars=mapped_hostvars, templar=None)
 
         # Notice templar is set as None, so any calls to jinja templates will fail with Nonetype has no "_loader" attribute
-        avd_switch_facts[hostname] = {"switch": EosDesignsFacts(hostvars=mapped_hostvars, shared_utils=shared_utils)}
+        render_timings = device_render_timings[hostname] if device_render_timings is not None else None
+        avd_switch_facts[hostname] = {"switch": EosDesignsFacts(hostvars=mapped_hostvars, shared_utils=shared_utils, render_timings=render_timings)}
 
     return avd_switch_facts
 
 
-def _render_avd_switch_facts(avd_switch_facts_instances: dict):
+def _render_avd_switch_facts(avd_switch_facts_instances: dict, device_render_timings: dict[str, RenderTimings] | None = None):
     """
     Run the render method on each EosDesignsFacts object
 
@@ -99,6 +157,7 @@ def _render_avd_switch_facts(avd_switch_facts_instances: dict):
                 ...
             }
             ```
+        device_render_timings: Optional dictionary with a RenderTimings instance per device used to record the time spent rendering each device.
 
     Returns:
         Nested Dictionaried with rendered "avd_switch_facts" per device.
@@ -110,12 +169,20 @@ def _render_avd_switch_facts(avd_switch_facts_instances: dict):
             }
             ```
     """
-    return {
-        hostname: {
-            "switch": avd_switch_facts_instances[hostname]["switch"].render(),
+    if device_render_timings is None:
+        return {
+            hostname: {
+                "switch": avd_switch_facts_instances[hostname]["switch"].render(),
+            }
+            for hostname in avd_switch_facts_instances
         }
-        for hostname in avd_switch_facts_instances
-    }
+
+    rendered_facts = {}
+    for hostname in avd_switch_facts_instances:
+        with device_render_timings[hostname].timer(MODULES, "EosDesignsFacts"):
+            rendered_facts[hostname] = {"switch": avd_switch_facts_instances[hostname]["switch"].render()}
+
+    return rendered_facts
 
 
 def _render_peer_facts(avd_switch_facts: dict) -> tuple[dict, dict]:
@@ -2,9 +2,10 @@ from collections import ChainMap
 
 from .constants import JINJA2_CONFIG_TEMPLATE
 from .templater import Templar
+from .vendor.template_profiler import TemplateProfiler
 
 
-def get_device_config(hostname: str, hostvars: dict) -> str:
+def get_device_config(hostname: str, hostvars: dict, template_profile: dict | None = None) -> str:
     """
     Render and return the device configuration using AVD eos_cli_config_gen templates.
 
@@ -12,6 +13,15 @@ def get_device_config(hostname: str, hostvars: dict) -> str:
         hostname: Hostname of device.
         hostvars: Dictionary of variables applied to template.
             Variables should be converted and validated according to AVD `eos_cli_config_gen` schema first using `pyavd.validate_inputs`.
+        template_profile: Optional dictionary which will be updated in-place with the time spent in each included template
+            and custom filter/test while rendering the configuration.
+            ```python
+            {
+                "sections": {"<template or filter>": {"calls": int, "seconds": float, "self_seconds": float}, ...},
+                "stacks": {"<frame1>;<frame2>;...": float, ...},
+            }
+            ```
+            Use `pyavd.vendor.template_profiler.format_folded_stacks` to convert the stacks to the format read by flamegraph tools.
 
     Returns:
         Device configuration in EOS CLI format.
@@ -20,5 +30,12 @@ def get_device_config(hostname: str, hostvars: dict) -> str:
     # Set 'inventory_hostname' on the input hostvars, to keep compatability with Ansible focused code.
     mapped_vars = ChainMap({"inventory_hostname": hostname}, hostvars)
 
-    templar = Templar()
-    return templar.render_template_from_file(JINJA2_CONFIG_TEMPLATE, mapped_vars)
+    profiler = TemplateProfiler() if template_profile is not None else None
+    templar = Templar(profiler=profiler)
+    result = templar.render_template_from_file(JINJA2_CONFIG_TEMPLATE, mapped_vars)
+
+    if profiler is not None:
+        template_profile.clear()
+        template_profile.update(profiler.to_dict())
+
+    return result
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from .vendor.facts_slice import get_device_facts_slice as _get_device_facts_slice
+
+
+def get_device_facts_slice(hostname: str, avd_facts: dict, strict: bool = True, fingerprint: dict | None = None) -> dict:
+    """
+    Return the subset of avd_facts needed to build the AVD structured configuration for one device.
+
+    The slice can be given to `pyavd.get_device_structured_config` instead of the full avd_facts, so a distributed build only has to
+    send the facts of the device and its peers like uplink switches, MLAG peer and route servers to each worker.
+
+    Peers only given in the input variables, like the nodes of `core_interfaces` or `l3_edge` p2p_links, `evpn_gateway.remote_peers`
+    or `overlay_cvx_servers`, and the devices read by `overlay_routing_protocol: her` or `bgp_mesh_pes: true` are only included
+    if they were read in a previous run recorded in `fingerprint`.
+
+    Args:
+        hostname: Hostname of device.
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        strict: If True, reading the facts of a fabric device outside of the slice raises an `AristaAvdError`, so a slice missing
+            a peer never gives a different structured config than the full avd_facts. If False, such devices are treated as missing.
+            All fabric devices are listed in `avd_switch_facts` in both modes.
+        fingerprint: Optional fingerprint stored from a previous call to `pyavd.get_device_structured_config`.
+            All peers read in that run are included in the slice.
+
+    Returns:
+        Dictionary with the same keys as avd_facts.
+            ```python
+            {
+                "avd_switch_facts": dict,
+                "avd_overlay_peers": dict,
+                "avd_topology_peers" : dict
+            }
+            ```
+    """
+    extra_peers = list((fingerprint or {}).get("peer_facts", []))
+    return _get_device_facts_slice(avd_facts, hostname, strict=strict, extra_peers=extra_peers)
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 from collections import ChainMap
 
 from .avd_schema_tools import AvdSchemaTools
 from .constants import EOS_CLI_CONFIG_GEN_SCHEMA_ID
 from .vendor.eos_designs.get_structured_config import get_structured_config
 from .vendor.errors import AristaAvdError
+from .vendor.fingerprint import DeviceFingerprint
+from .vendor.render_timings import RenderTimings
+from .vendor.version import VERSION
 
 
-def get_device_structured_config(hostname: str, hostvars: dict, avd_facts: dict) -> dict:
+def get_device_structured_config(hostname: str, hostvars: dict, avd_facts: dict, fingerprint: dict | None = None, render_timings: dict | None = None) -> dict:
     """
     Build and return the AVD structured configuration for one device.
 
@@ -15,11 +20,76 @@ def get_device_structured_config(hostname: str, hostvars: dict, avd_facts: dict)
         hostvars: Dictionary of variables passed to AVD `eos_designs` modules.
             Variables should be converted and validated according to AVD `eos_designs` schema first using `pyavd.validate_inputs`.
         avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        fingerprint: Optional dictionary which will be updated in-place with the fingerprint of the inputs used for this device.
+            Store it together with the structured configuration and pass it to `pyavd.device_inputs_changed` on the next run
+            to skip unchanged devices.
+        render_timings: Optional dictionary which will be updated in-place with the time spent on each module, top-level key and function.
+            ```python
+            {
+                "modules": {"<module class>": {"calls": int, "seconds": float}, ...},
+                "keys": {"<key>": {"calls": int, "seconds": float}, ...},
+                "functions": {"convert_data": {"calls": int, "seconds": float}, "merge": {...}, ...},
+            }
+            ```
 
     Returns:
         Device Structured Configuration as a dictionary
     """
 
+    # The input variables must be fingerprinted before generating the structured config, since the generation can update them in-place.
+    device_fingerprint = None
+    if fingerprint is not None:
+        device_fingerprint = DeviceFingerprint(ChainMap({"inventory_hostname": hostname}, avd_facts, hostvars), VERSION)
+
+    device_render_timings = RenderTimings() if render_timings is not None else None
+
+    input_schema_tools, output_schema_tools = _get_schema_tools()
+    structured_config = _get_structured_config(
+        hostname, hostvars, avd_facts, input_schema_tools, output_schema_tools, device_fingerprint, device_render_timings
+    )
+
+    if device_fingerprint is not None:
+        fingerprint.clear()
+        fingerprint.update(device_fingerprint.to_dict())
+
+    if device_render_timings is not None:
+        render_timings.clear()
+        render_timings.update(device_render_timings.to_dict())
+
+    return structured_config
+
+
+def _get_schema_tools() -> tuple[AvdSchemaTools, AvdSchemaTools]:
+    """
+    Build the input and output schema tools used by "get_structured_config".
+
+    The schema tools do not hold any state from the generation, so they can be reused across devices.
+
+    Returns:
+        Tuple of input schema tools and output schema tools.
+    """
+    # We do not validate input variables in this stage (done in "validate_inputs")
+    # So we feed the vendored code an empty schema to avoid failures.
+    input_schema_tools = AvdSchemaTools(schema={})
+    output_schema_tools = AvdSchemaTools(schema_id=EOS_CLI_CONFIG_GEN_SCHEMA_ID)
+    return input_schema_tools, output_schema_tools
+
+
+def _get_structured_config(
+    hostname: str,
+    hostvars: dict,
+    avd_facts: dict,
+    input_schema_tools: AvdSchemaTools,
+    output_schema_tools: AvdSchemaTools,
+    device_fingerprint: DeviceFingerprint | None = None,
+    device_render_timings: RenderTimings | None = None,
+) -> dict:
+    """
+    Build the structured configuration for one device with the given schema tools.
+
+    Raises:
+        AristaAvdError: Errors returned by the eos_designs logic.
+    """
     # Set 'inventory_hostname' on the input hostvars, to keep compatability with Ansible focused code.
     # Also map in avd_facts without touching the hostvars
     mapped_hostvars = ChainMap(
@@ -31,10 +101,6 @@ def get_device_structured_config(hostname: str, hostvars: dict, avd_facts: dict)
         hostvars,
     )
 
-    # We do not validate input variables in this stage (done in "validate_inputs")
-    # So we feed the vendored code an empty schema to avoid failures.
-    input_schema_tools = AvdSchemaTools(schema={})
-    output_schema_tools = AvdSchemaTools(schema_id=EOS_CLI_CONFIG_GEN_SCHEMA_ID)
     result = {}
     structured_config = get_structured_config(
         vars=mapped_hostvars,
@@ -42,6 +108,8 @@ def get_device_structured_config(hostname: str, hostvars: dict, avd_facts: dict)
         output_schema_tools=output_schema_tools,
         result=result,
         templar=None,
+        fingerprint=device_fingerprint,
+        render_timings=device_render_timings,
     )
     if result.get("failed"):
         raise AristaAvdError(f"{[str(error) for error in result['errors']]}")
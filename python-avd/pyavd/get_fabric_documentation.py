@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import ChainMap
+
+from .vendor.fabric_documentation import FabricDocumentation
+from .vendor.fabric_documentation import get_fabric_documentation as _get_fabric_documentation
+
+
+def _build_fabric_documentation(all_hostvars: dict[str, dict], avd_facts: dict, structured_configs: dict[str, dict]) -> FabricDocumentation:
+    """
+    Build the FabricDocumentation in one pass over the structured configs.
+
+    The settings like "fabric_name", "node_type_keys" and "eos_designs_documentation" are read from the first device in all_hostvars.
+    """
+    hostvars = {hostname: ChainMap(structured_configs.get(hostname, {}), device_hostvars) for hostname, device_hostvars in all_hostvars.items()}
+    hostname = next(iter(all_hostvars))
+    return _get_fabric_documentation(
+        fabric_name=all_hostvars[hostname].get("fabric_name"),
+        fabric_hosts=list(all_hostvars),
+        hostvars=hostvars,
+        avd_switch_facts=avd_facts.get("avd_switch_facts", {}),
+        hostname=hostname,
+    )
+
+
+def get_fabric_documentation(all_hostvars: dict[str, dict], avd_facts: dict, structured_configs: dict[str, dict]) -> dict[str, str]:
+    """
+    Build and return the AVD fabric documentation, fabric topology CSV and fabric point-to-point links CSV.
+
+    All outputs are built in one pass over the structured configs. The output is the same as generated by the `eos_designs` role.
+    The settings like `fabric_name`, `node_type_keys` and `eos_designs_documentation` are read from the first device in `all_hostvars`.
+
+    Args:
+        all_hostvars: A dictionary where keys are hostnames and values are dictionaries of all variables per devices.
+            Variables should be converted and validated according to AVD `eos_designs` schema first using `pyavd.validate_inputs`.
+            ```python
+            {
+                "<hostname1>": dict,
+                "<hostname2>": dict,
+                ...
+            }
+            ```
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        structured_configs: A dictionary where keys are hostnames and values are the structured configs
+            as returned from `pyavd.get_device_structured_config`.
+
+    Returns:
+        Dictionary with the fabric documentation in Markdown format and the CSV files as strings.
+            ```python
+            {
+                "fabric_documentation": str,
+                "topology_csv": str,
+                "p2p_links_csv": str,
+            }
+            ```
+    """
+    fabric_documentation = _build_fabric_documentation(all_hostvars, avd_facts, structured_configs)
+    return {
+        "fabric_documentation": fabric_documentation.get_documentation(),
+        "topology_csv": "".join(fabric_documentation.topology_csv_lines()),
+        "p2p_links_csv": "".join(fabric_documentation.p2p_links_csv_lines()),
+    }
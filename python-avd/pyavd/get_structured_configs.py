@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Generator
+
+from .get_device_structured_config import _get_schema_tools, _get_structured_config
+from .vendor.errors import AristaAvdError
+from .vendor.render_timings import RenderTimings
+
+# Leveraging copy on write from fork. The inputs are inherited by the workers instead of being pickled for every device.
+GLOBALS = {}
+
+
+def get_structured_configs(
+    all_hostvars: dict[str, dict],
+    avd_facts: dict,
+    workers: int | None = None,
+    timings: dict | None = None,
+    errors: dict | None = None,
+    render_timings: dict | None = None,
+) -> Generator[tuple[str, dict], None, None]:
+    """
+    Build the AVD structured configuration for multiple devices.
+
+    The schema tools are initialized once per worker and reused for all devices handled by that worker,
+    instead of once per device as done by `pyavd.get_device_structured_config`.
+
+    Results are yielded as soon as each device is done, so the order follows completion and not the order of `all_hostvars`.
+    A failing device does not abort the batch.
+
+    Args:
+        all_hostvars: A dictionary where keys are hostnames and values are dictionaries of all variables per devices.
+            Variables should be converted and validated according to AVD `eos_designs` schema first using `pyavd.validate_inputs`.
+            ```python
+            {
+                "<hostname1>": dict,
+                "<hostname2>": dict,
+                ...
+            }
+            ```
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        workers: Number of worker processes. Defaults to the number of CPUs. With 1, the devices are handled in the current process.
+        timings: Optional dictionary which will be updated in-place with the time in seconds spent on each device.
+            ```python
+            {
+                "<hostname1>": float,
+                ...
+            }
+            ```
+        errors: Optional dictionary which will be updated in-place with the error raised for each failing device.
+            Failing devices are not yielded.
+            ```python
+            {
+                "<hostname1>": AristaAvdError,
+                ...
+            }
+            ```
+        render_timings: Optional dictionary which will be updated in-place with the time spent on each module, top-level key and function
+            for each device. See `pyavd.get_device_structured_config` for the format per device.
+            ```python
+            {
+                "<hostname1>": dict,
+                ...
+            }
+            ```
+
+    Yields:
+        Tuple of hostname and Device Structured Configuration as a dictionary.
+
+    Raises:
+        AristaAvdError: List of errors across all failing devices, raised after all other devices have been yielded.
+            Only raised if `errors` is not given.
+    """
+    workers = workers or os.cpu_count() or 1
+    batch_errors = {} if errors is None else errors
+
+    for hostname, structured_config, duration, error, device_render_timings in _run(all_hostvars, avd_facts, workers, render_timings is not None):
+        if timings is not None:
+            timings[hostname] = duration
+
+        if device_render_timings is not None:
+            render_timings[hostname] = device_render_timings
+
+        if error is not None:
+            batch_errors[hostname] = error
+            continue
+
+        yield hostname, structured_config
+
+    if errors is None and batch_errors:
+        raise AristaAvdError(f"{[f'[{hostname}]: {error}' for hostname, error in batch_errors.items()]}")
+
+
+def _run(
+    all_hostvars: dict[str, dict], avd_facts: dict, workers: int, record_render_timings: bool = False
+) -> Generator[tuple[str, dict | None, float, AristaAvdError | None, dict | None], None, None]:
+    GLOBALS["all_hostvars"] = all_hostvars
+    GLOBALS["avd_facts"] = avd_facts
+    GLOBALS["record_render_timings"] = record_render_timings
+    try:
+        if workers == 1 or len(all_hostvars) < 2:
+            _init_worker()
+            for hostname in all_hostvars:
+                yield _get_structured_config_worker(hostname)
+            return
+
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("fork"), initializer=_init_worker)
+        try:
+            futures = [executor.submit(_get_structured_config_worker, hostname) for hostname in all_hostvars]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Also stops pending devices if the generator is closed before the batch is done.
+            executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        GLOBALS.clear()
+
+
+def _init_worker() -> None:
+    """
+    Initialize the schema tools once per worker process.
+    """
+    GLOBALS["schema_tools"] = _get_schema_tools()
+
+
+def _get_structured_config_worker(hostname: str) -> tuple[str, dict | None, float, AristaAvdError | None, dict | None]:
+    """
+    This function runs as a separate fork.
+
+    Build the structured configuration for one device, catching any error so the batch can continue.
+
+    Returns:
+        Tuple of hostname, structured configuration or None, duration in seconds, error or None and render timings or None.
+    """
+    input_schema_tools, output_schema_tools = GLOBALS["schema_tools"]
+    device_render_timings = RenderTimings() if GLOBALS["record_render_timings"] else None
+    start = perf_counter()
+    try:
+        structured_config = _get_structured_config(
+            hostname,
+            GLOBALS["all_hostvars"][hostname],
+            GLOBALS["avd_facts"],
+            input_schema_tools,
+            output_schema_tools,
+            device_render_timings=device_render_timings,
+        )
+    except Exception as error:
+        # Not all exception classes can be pickled back from the worker, so the error is passed on as a plain AristaAvdError.
+        return hostname, None, perf_counter() - start, AristaAvdError(f"{type(error).__name__}: {error}"), None
+
+    return hostname, structured_config, perf_counter() - start, None, device_render_timings.to_dict() if device_render_timings is not None else None
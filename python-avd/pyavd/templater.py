@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, StrictUndefined
 
 from .constants import JINJA2_EXTENSIONS, JINJA2_PRECOMPILED_TEMPLATE_PATH
@@ -7,9 +9,13 @@ from .vendor.j2.filter.hide_passwords import hide_passwords
 from .vendor.j2.filter.list_compress import list_compress
 from .vendor.j2.filter.natural_sort import natural_sort
 from .vendor.j2.filter.password import decrypt, encrypt
+from .vendor.j2.filter.python_renderer import python_renderer
 from .vendor.j2.filter.range_expand import range_expand
 from .vendor.j2.test.contains import contains
 from .vendor.j2.test.defined import defined
+from .vendor.template_profiler import TemplateProfiler
+from .vendor.utils.stream_to_file import stream_to_file
+from .vendor.utils.template_cache import get_template_bytecode_cache
 
 JINJA2_CUSTOM_FILTERS = {
     "arista.avd.default": default,
@@ -19,6 +25,7 @@ JINJA2_CUSTOM_FILTERS = {
     "arista.avd.hide_passwords": hide_passwords,
     "arista.avd.list_compress": list_compress,
     "arista.avd.natural_sort": natural_sort,
+    "arista.avd.python_renderer": python_renderer,
     "arista.avd.range_expand": range_expand,
 }
 JINJA2_CUSTOM_TESTS = {
@@ -53,7 +60,13 @@ class Undefined(StrictUndefined):
 
 
 class Templar:
-    def __init__(self, searchpaths: list[str] = None):
+    def __init__(self, searchpaths: list[str] = None, profiler: TemplateProfiler | None = None):
+        """
+        Args:
+            searchpaths: Paths to search for templates in addition to the precompiled eos_cli_config_gen templates.
+            profiler: Optional TemplateProfiler recording the time spent in each include and custom filter/test while rendering.
+        """
+        self.profiler = profiler
         self.loader = ChoiceLoader(
             [
                 ModuleLoader(JINJA2_PRECOMPILED_TEMPLATE_PATH),
@@ -66,12 +79,34 @@ class Templar:
             loader=self.loader,
             undefined=Undefined,
             trim_blocks=True,
+            # Only used for templates loaded from the searchpaths. The precompiled templates are loaded as modules.
+            bytecode_cache=get_template_bytecode_cache(),
         )
         self.environment.filters.update(JINJA2_CUSTOM_FILTERS)
         self.environment.tests.update(JINJA2_CUSTOM_TESTS)
 
     def render_template_from_file(self, template_file: str, template_vars: dict) -> str:
-        return self.environment.get_template(template_file).render(template_vars)
+        if self.profiler is None:
+            return self.environment.get_template(template_file).render(template_vars)
+
+        with self.profiler.install(self.environment), self.profiler.frame(template_file):
+            return self.environment.get_template(template_file).render(template_vars)
+
+    def render_template_to_file(self, template_file: str, template_vars: dict, dest: str, mode: int | None = None) -> bool:
+        """
+        Render the template and stream the output directly to the file 'dest'.
+
+        The output is written to a temporary file which is atomically renamed to 'dest' if the content changed.
+
+        Returns:
+            True if the file was changed.
+        """
+        if self.profiler is None:
+            return stream_to_file(self.environment.get_template(template_file).generate(template_vars), dest, mode=mode)["changed"]
+
+        with self.profiler.install(self.environment):
+            chunks = self.profiler.profile_generator(template_file, self.environment.get_template(template_file).generate(template_vars))
+            return stream_to_file(chunks, dest, mode=mode)["changed"]
 
     def compile_templates_in_paths(self, searchpaths: list[str]) -> None:
         print(JINJA2_PRECOMPILED_TEMPLATE_PATH)
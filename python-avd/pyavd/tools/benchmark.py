@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import glob
+import json
+import math
+import os
+from contextlib import redirect_stdout
+from copy import deepcopy
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+
+from ..avd_schema_tools import AvdSchemaTools
+from ..constants import EOS_CLI_CONFIG_GEN_SCHEMA_ID
+from ..get_avd_facts import get_avd_facts
+from ..get_device_config import get_device_config
+from ..get_device_doc import get_device_doc
+from ..get_device_structured_config import get_device_structured_config
+from ..get_structured_configs import get_structured_configs
+from ..validate_inputs import validate_inputs
+from ..vendor.j2.filter.convert_dicts import convert_dicts
+from ..vendor.j2.filter.natural_sort import natural_sort
+from ..vendor.j2.filter.range_expand import range_expand
+from ..vendor.merge import merge
+from .generate_fabric import generate_fabric
+from .multiprocess_runners import run_eos_cli_config_gen
+from .read_vars import read_vars
+from .write_result import write_data_result
+
+DEFAULT_SCALES = [0.125, 0.25, 0.5, 1.0]
+# Scaling exponents above this value are marked as superlinear in the report.
+SUPERLINEAR_EXPONENT = 1.2
+
+
+class FabricInputs:
+    """
+    Inputs for one fabric size.
+
+    Built by running the pipeline once outside of the timed stages, so every stage can be timed on its own with the output of the previous stages.
+    """
+
+    def __init__(self, all_hostvars: dict[str, dict]):
+        self.all_hostvars = all_hostvars
+
+        self.validated_hostvars = deepcopy(all_hostvars)
+        validate_inputs(self.validated_hostvars, eos_designs=True, eos_cli_config_gen=False)
+        self.avd_facts = get_avd_facts(deepcopy(self.validated_hostvars))
+
+        self.structured_configs = {
+            hostname: get_device_structured_config(hostname, deepcopy(hostvars), self.avd_facts) for hostname, hostvars in self.validated_hostvars.items()
+        }
+        self.validated_structured_configs = deepcopy(self.structured_configs)
+        validate_inputs(self.validated_structured_configs, eos_designs=False, eos_cli_config_gen=True)
+
+    @property
+    def size(self) -> int:
+        return len(self.all_hostvars)
+
+
+def get_stages(eos_cli_config_gen_schema: AvdSchemaTools) -> dict[str, Callable[[FabricInputs], Callable[[], None]]]:
+    """
+    Return the benchmark stages.
+
+    Each stage is a function taking the FabricInputs and returning the function to time.
+    Inputs are copied before returning the timed function, so in-place updates done by AVD do not affect the next run and copying is not timed.
+    """
+
+    def validate_inputs_eos_designs(fabric: FabricInputs):
+        all_hostvars = deepcopy(fabric.all_hostvars)
+        return lambda: validate_inputs(all_hostvars, eos_designs=True, eos_cli_config_gen=False)
+
+    def validate_inputs_eos_cli_config_gen(fabric: FabricInputs):
+        structured_configs = deepcopy(fabric.structured_configs)
+        return lambda: validate_inputs(structured_configs, eos_designs=False, eos_cli_config_gen=True)
+
+    def avd_facts(fabric: FabricInputs):
+        all_hostvars = deepcopy(fabric.validated_hostvars)
+        return lambda: get_avd_facts(all_hostvars)
+
+    def device_structured_config(fabric: FabricInputs):
+        all_hostvars = deepcopy(fabric.validated_hostvars)
+
+        def run():
+            for hostname, hostvars in all_hostvars.items():
+                get_device_structured_config(hostname, hostvars, fabric.avd_facts)
+
+        return run
+
+    def structured_configs_workers(fabric: FabricInputs):
+        all_hostvars = deepcopy(fabric.validated_hostvars)
+
+        def run():
+            for _ in get_structured_configs(all_hostvars, fabric.avd_facts, workers=os.cpu_count()):
+                pass
+
+        return run
+
+    def eos_cli_config_gen_runner(fabric: FabricInputs):
+        # Covers the process workers of the runner including reading the files. The fabric facts are given as common vars,
+        # since they are shared by all devices like large common vars in real inventories.
+        temp_dir = TemporaryDirectory()
+        os.makedirs(path.join(temp_dir.name, "vars"))
+        os.makedirs(path.join(temp_dir.name, "configs"))
+        common_varfile = path.join(temp_dir.name, "common_vars.json")
+        write_data_result(common_varfile, {"avd_facts": fabric.avd_facts})
+        for hostname, structured_config in fabric.structured_configs.items():
+            write_data_result(path.join(temp_dir.name, "vars", f"{hostname}.json"), structured_config)
+
+        def run():
+            # Keeps a reference to the temporary directory, so it is removed when the function is no longer used.
+            with redirect_stdout(StringIO()):
+                run_eos_cli_config_gen([common_varfile], path.join(temp_dir.name, "vars", "*.json"), None, path.join(temp_dir.name, "configs"), None)
+
+        return run
+
+    def device_config(fabric: FabricInputs):
+        def run():
+            for hostname, structured_config in fabric.validated_structured_configs.items():
+                get_device_config(hostname, structured_config)
+
+        return run
+
+    def device_doc(fabric: FabricInputs):
+        def run():
+            for hostname, structured_config in fabric.validated_structured_configs.items():
+                get_device_doc(hostname, structured_config)
+
+        return run
+
+    def merge_structured_config(fabric: FabricInputs):
+        # Same as merging a custom structured configuration covering the full device config.
+        merge_inputs = [(deepcopy(structured_config), deepcopy(structured_config)) for structured_config in fabric.validated_structured_configs.values()]
+
+        def run():
+            for base, custom_structured_configuration in merge_inputs:
+                merge(base, custom_structured_configuration, list_merge="append_rp", schema=eos_cli_config_gen_schema.avdschema)
+
+        return run
+
+    def range_expand_interfaces(fabric: FabricInputs):
+        interface_ranges = [f"Ethernet1/1-{len(ethernet_interfaces)}" for ethernet_interfaces in _get_ethernet_interfaces(fabric).values()]
+        return lambda: range_expand(interface_ranges)
+
+    def natural_sort_interfaces(fabric: FabricInputs):
+        interfaces = [
+            {"name": f"{hostname}_{ethernet_interface['name']}"}
+            for hostname, ethernet_interfaces in _get_ethernet_interfaces(fabric).items()
+            for ethernet_interface in ethernet_interfaces
+        ]
+        return lambda: natural_sort(interfaces, "name")
+
+    def convert_dicts_interfaces(fabric: FabricInputs):
+        interfaces = {
+            f"{hostname}_{ethernet_interface['name']}": {key: value for key, value in ethernet_interface.items() if key != "name"}
+            for hostname, ethernet_interfaces in _get_ethernet_interfaces(fabric).items()
+            for ethernet_interface in ethernet_interfaces
+        }
+        return lambda: convert_dicts(interfaces, "name")
+
+    return {
+        "validate_inputs_eos_designs": validate_inputs_eos_designs,
+        "validate_inputs_eos_cli_config_gen": validate_inputs_eos_cli_config_gen,
+        "get_avd_facts": avd_facts,
+        "get_device_structured_config": device_structured_config,
+        "get_structured_configs": structured_configs_workers,
+        "run_eos_cli_config_gen": eos_cli_config_gen_runner,
+        "get_device_config": device_config,
+        "get_device_doc": device_doc,
+        "merge": merge_structured_config,
+        "range_expand": range_expand_interfaces,
+        "natural_sort": natural_sort_interfaces,
+        "convert_dicts": convert_dicts_interfaces,
+    }
+
+
+def _get_ethernet_interfaces(fabric: FabricInputs) -> dict[str, list]:
+    return {hostname: structured_config.get("ethernet_interfaces", []) for hostname, structured_config in fabric.validated_structured_configs.items()}
+
+
+def split_fabric(all_hostvars: dict[str, dict], scales: list[float]) -> list[dict[str, dict]]:
+    """
+    Split the devices into subsets of increasing size.
+
+    Devices sharing an inventory group are kept together, since eos_designs looks up peers like MLAG peers and uplink switches.
+    Groups covering more than half of the devices, like the fabric group, are ignored when finding the devices to keep together.
+    The smallest sets of devices are added first, so the sizes get close to the given fractions. Subsets with the same size as the previous one are skipped.
+    """
+    hostnames = sorted(all_hostvars)
+    parents = {hostname: hostname for hostname in hostnames}
+
+    def find(hostname: str) -> str:
+        while parents[hostname] != hostname:
+            parents[hostname] = parents[parents[hostname]]
+            hostname = parents[hostname]
+        return hostname
+
+    for hostvars in all_hostvars.values():
+        for group_members in hostvars.get("groups", {}).values():
+            members = [member for member in group_members if member in parents]
+            if len(members) > len(hostnames) / 2:
+                continue
+            for member in members[1:]:
+                parents[find(member)] = find(members[0])
+
+    components = {}
+    for hostname in hostnames:
+        components.setdefault(find(hostname), []).append(hostname)
+
+    subsets = []
+    for scale in sorted(scales):
+        subset = []
+        for component in sorted(components.values(), key=len):
+            if len(subset) >= scale * len(hostnames):
+                break
+            subset.extend(component)
+        if subset and (not subsets or len(subset) > len(subsets[-1])):
+            subsets.append({hostname: all_hostvars[hostname] for hostname in subset})
+
+    return subsets
+
+
+def get_scaling_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """
+    Return the exponent 'k' of the least squares fit of "time = c * size^k".
+
+    An exponent of 1 means linear scaling, so the time per device is constant. Higher values mean superlinear scaling.
+    """
+    points = [(math.log(size), math.log(time)) for size, time in zip(sizes, times) if time > 0]
+    if len({log_size for log_size, _ in points}) < 2:
+        return None
+
+    mean_log_size = sum(log_size for log_size, _ in points) / len(points)
+    mean_log_time = sum(log_time for _, log_time in points) / len(points)
+    covariance = sum((log_size - mean_log_size) * (log_time - mean_log_time) for log_size, log_time in points)
+    variance = sum((log_size - mean_log_size) ** 2 for log_size, _ in points)
+    return covariance / variance
+
+
+def time_stage(stage: Callable[[FabricInputs], Callable[[], None]], fabric: FabricInputs, repeat: int) -> float:
+    """
+    Return the best time in seconds of 'repeat' runs.
+    """
+    best_time = None
+    for _ in range(repeat):
+        timed_function = stage(fabric)
+        start = perf_counter()
+        timed_function()
+        elapsed = perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time
+
+
+def generate_fabrics(synthetic_fabric: dict, scales: list[float]) -> list[dict[str, dict]]:
+    """
+    Generate synthetic fabrics of increasing size by scaling the number of leaf pairs.
+
+    All other size parameters are kept, so the number of L2 leafs and servers grow with the number of leaf pairs.
+    Fabrics with the same number of leaf pairs as the previous one are skipped.
+    """
+    leaf_pairs = synthetic_fabric.get("leaf_pairs", 2)
+    fabrics = []
+    previous_leaf_pairs = 0
+    for scale in sorted(scales):
+        scaled_leaf_pairs = max(1, round(scale * leaf_pairs))
+        if scaled_leaf_pairs > previous_leaf_pairs:
+            fabrics.append(generate_fabric(**{**synthetic_fabric, "leaf_pairs": scaled_leaf_pairs}))
+            previous_leaf_pairs = scaled_leaf_pairs
+
+    return fabrics
+
+
+def run_benchmarks(
+    device_varfiles: str | None = None,
+    scales: list[float] | None = None,
+    stages: list[str] | None = None,
+    repeat: int = 3,
+    output_file: str | None = None,
+    synthetic_fabric: dict | None = None,
+) -> dict:
+    """
+    Read variables from files, split them into fabrics of increasing size and time each stage of the AVD pipeline for every size.
+
+    Intended for CLI use via benchmark.py
+
+    Parameters
+    ----------
+    device_varfiles : str, optional
+        Glob for device specific var files including all eos_designs inputs like the ones exported from the molecule scenarios.
+        Filenames will be used as hostnames. Required unless synthetic_fabric is set.
+    scales : list[float], optional
+        Fractions of the devices to use for each fabric size.
+    stages : list[str], optional
+        Names of the stages to run. All stages are run by default.
+    repeat : int, default=3
+        Number of runs per stage and size. The best time is reported.
+    output_file : str, optional
+        Path to JSON file for the results.
+    synthetic_fabric : dict, optional
+        Size parameters for "generate_fabric". If set, synthetic fabrics are generated instead of reading device_varfiles.
+        The number of leaf pairs is multiplied by each of the scales.
+
+    Returns
+    -------
+    dict
+        Results per stage with the sizes, the time per device for each size and the scaling exponent.
+    """
+    all_stages = get_stages(AvdSchemaTools(schema_id=EOS_CLI_CONFIG_GEN_SCHEMA_ID))
+    unknown_stages = set(stages or []).difference(all_stages)
+    if unknown_stages:
+        raise ValueError(f"Unknown benchmark stages {sorted(unknown_stages)}. Valid stages are {list(all_stages)}")
+
+    if synthetic_fabric is not None:
+        subsets = generate_fabrics(synthetic_fabric, scales or DEFAULT_SCALES)
+    elif device_varfiles is not None:
+        all_hostvars = {}
+        for device_var_file in sorted(glob.iglob(device_varfiles)):
+            hostname = str(path.basename(device_var_file)).removesuffix(".yaml").removesuffix(".yml").removesuffix(".json")
+            all_hostvars[hostname] = read_vars(device_var_file)
+        subsets = split_fabric(all_hostvars, scales or DEFAULT_SCALES)
+    else:
+        raise ValueError("Either 'device_varfiles' or 'synthetic_fabric' must be set.")
+
+    fabrics = [FabricInputs(subset) for subset in subsets]
+    sizes = [fabric.size for fabric in fabrics]
+
+    results = {}
+    for stage_name, stage in all_stages.items():
+        if stages and stage_name not in stages:
+            continue
+
+        # Warm-up run to keep one-time costs like loading schemas and templates out of the results.
+        stage(fabrics[0])()
+        times = [time_stage(stage, fabric, repeat) for fabric in fabrics]
+        results[stage_name] = {
+            "sizes": sizes,
+            "seconds_per_device": [time / size for time, size in zip(times, sizes)],
+            "scaling_exponent": get_scaling_exponent(sizes, times),
+        }
+        print(format_result(stage_name, results[stage_name]), flush=True)
+
+    if output_file:
+        with open(output_file, "w", encoding="UTF-8") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+def format_result(stage_name: str, result: dict) -> str:
+    per_device = "  ".join(f"{size:>4}: {seconds * 1000:9.3f} ms" for size, seconds in zip(result["sizes"], result["seconds_per_device"]))
+    exponent = result["scaling_exponent"]
+    if exponent is None:
+        exponent_text = "n/a"
+    else:
+        exponent_text = f"{exponent:.2f}{' (superlinear)' if exponent > SUPERLINEAR_EXPONENT else ''}"
+    return f"{stage_name:<36} {per_device}  exponent: {exponent_text}"
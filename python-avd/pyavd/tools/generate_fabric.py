@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import json
+from ipaddress import IPv4Network
+from os import makedirs, path
+
+# First VLAN used for SVIs, L2VLANs and MLAG iBGP peering VLANs. The last VLANs are kept for the MLAG peer VLANs.
+FIRST_VLAN_ID = 10
+LAST_VLAN_ID = 4000
+MGMT_NETWORK = IPv4Network("172.16.0.0/12")
+SVI_NETWORK = IPv4Network("10.128.0.0/9")
+
+
+def generate_fabric_vars(
+    spines: int = 2,
+    leaf_pairs: int = 2,
+    l2leafs_per_leaf_pair: int = 1,
+    tenants: int = 1,
+    vrfs_per_tenant: int = 2,
+    svis_per_vrf: int = 2,
+    l2vlans_per_tenant: int = 2,
+    servers_per_leaf_pair: int = 2,
+    adapters_per_server: int = 2,
+    network_ports_per_l2leaf: int = 2,
+    use_default_node_types: bool = False,
+    fabric_name: str = "SYNTHETIC",
+) -> tuple[dict, dict[str, dict]]:
+    """
+    Generate eos_designs inputs for a L3LS EVPN fabric of the given size.
+
+    The fabric consists of:
+    - Spines connected to all L3 leafs.
+    - Pairs of MLAG L3 leafs with a number of single homed L2 leafs each.
+    - Tenants with VRFs, SVIs and L2VLANs configured on all leafs.
+    - Servers connected to each pair of L3 leafs. The first adapter of each server is an MLAG port-channel and the other adapters are single homed.
+    - One network_ports entry per L2 leaf matching the hostname of the L2 leaf.
+
+    Parameters
+    ----------
+    spines : int, default=2
+        Number of spines.
+    leaf_pairs : int, default=2
+        Number of MLAG pairs of L3 leafs.
+    l2leafs_per_leaf_pair : int, default=1
+        Number of L2 leafs connected to each pair of L3 leafs.
+    tenants : int, default=1
+        Number of tenants.
+    vrfs_per_tenant : int, default=2
+        Number of VRFs in each tenant.
+    svis_per_vrf : int, default=2
+        Number of SVIs in each VRF.
+    l2vlans_per_tenant : int, default=2
+        Number of L2VLANs in each tenant.
+    servers_per_leaf_pair : int, default=2
+        Number of servers connected to each pair of L3 leafs.
+    adapters_per_server : int, default=2
+        Number of adapters of each server.
+    network_ports_per_l2leaf : int, default=2
+        Number of ports in the network_ports entry of each L2 leaf.
+    use_default_node_types : bool, default=False
+        Set the node type using "default_node_types" instead of setting "type" for each device.
+    fabric_name : str, default="SYNTHETIC"
+        Fabric name.
+
+    Returns
+    -------
+    tuple[dict, dict[str, dict]]
+        Common vars like group_vars for the full fabric and device specific vars like host_vars per hostname.
+
+    Raises
+    ------
+    ValueError
+        If the number of VLANs or devices do not fit in the VLAN range or IP address pools.
+    """
+    vlan_count = tenants * (vrfs_per_tenant * (svis_per_vrf + 1) + l2vlans_per_tenant)
+    available_vlan_count = LAST_VLAN_ID - FIRST_VLAN_ID + 1
+    if vlan_count > available_vlan_count:
+        raise ValueError(f"The tenants require {vlan_count} VLANs including one MLAG iBGP peering VLAN per VRF, but only {available_vlan_count} are available.")
+    if svis_per_vrf < 1:
+        raise ValueError("'svis_per_vrf' must be at least 1, since VRFs without SVIs are not configured on any device.")
+    if min(spines, leaf_pairs) < 1:
+        raise ValueError("'spines' and 'leaf_pairs' must be at least 1.")
+
+    spine_names = [f"SPINE{spine}" for spine in range(1, spines + 1)]
+    leaf_pair_names = [(f"LEAF{pair}A", f"LEAF{pair}B") for pair in range(1, leaf_pairs + 1)]
+    l2leaf_names = [[f"L2LEAF{pair}-{l2leaf}" for l2leaf in range(1, l2leafs_per_leaf_pair + 1)] for pair in range(1, leaf_pairs + 1)]
+
+    device_count = spines + 2 * leaf_pairs + leaf_pairs * l2leafs_per_leaf_pair
+    if device_count > MGMT_NETWORK.num_addresses - 3:
+        raise ValueError(f"The fabric has {device_count} devices, but only {MGMT_NETWORK.num_addresses - 3} management IPs are available in {MGMT_NETWORK}.")
+    mgmt_ips = (f"{MGMT_NETWORK.network_address + index}/{MGMT_NETWORK.prefixlen}" for index in range(2, device_count + 2))
+
+    # Switch ports on the L3 leafs: Uplinks, MLAG, L2 leaf downlinks and servers.
+    mlag_interfaces = [f"Ethernet{spines + 1}", f"Ethernet{spines + 2}"]
+    first_l2leaf_port = spines + 3
+    first_server_port = first_l2leaf_port + l2leafs_per_leaf_pair
+
+    spine = {
+        "defaults": {
+            "platform": "vEOS-lab",
+            "loopback_ipv4_pool": "10.0.0.0/16",
+            "bgp_as": "65000",
+        },
+        "nodes": [{"name": name, "id": spine_id, "mgmt_ip": next(mgmt_ips)} for spine_id, name in enumerate(spine_names, start=1)],
+    }
+
+    l3leaf = {
+        "defaults": {
+            "platform": "vEOS-lab",
+            "loopback_ipv4_pool": "10.0.0.0/16",
+            "loopback_ipv4_offset": spines,
+            "vtep_loopback_ipv4_pool": "10.1.0.0/16",
+            "uplink_switches": spine_names,
+            "uplink_interfaces": [f"Ethernet{port}" for port in range(1, spines + 1)],
+            "uplink_ipv4_pool": "10.64.0.0/10",
+            "mlag_interfaces": mlag_interfaces,
+            "mlag_peer_ipv4_pool": "10.2.0.0/16",
+            "mlag_peer_l3_ipv4_pool": "10.3.0.0/16",
+            "virtual_router_mac_address": "00:1c:73:00:00:99",
+            "spanning_tree_mode": "mstp",
+            "spanning_tree_priority": 4096,
+        },
+        "node_groups": [],
+    }
+    l2leaf = {
+        "defaults": {
+            "platform": "vEOS-lab",
+            "uplink_interfaces": ["Ethernet1", "Ethernet2"],
+            "spanning_tree_mode": "mstp",
+        },
+        "node_groups": [],
+    }
+
+    leaf_id = 0
+    l2leaf_id = 0
+    for pair, (leaf_a, leaf_b) in enumerate(leaf_pair_names, start=1):
+        nodes = []
+        for name in (leaf_a, leaf_b):
+            leaf_id += 1
+            # Each L3 leaf is connected to the port matching its id on all spines.
+            nodes.append({"name": name, "id": leaf_id, "mgmt_ip": next(mgmt_ips), "uplink_switch_interfaces": [f"Ethernet{leaf_id}"] * spines})
+
+        # Private 4-byte AS numbers, so the number of leaf pairs is not limited by the 2-byte private range.
+        l3leaf["node_groups"].append({"group": f"LEAF{pair}", "bgp_as": str(4200000000 + pair), "nodes": nodes})
+
+        for index, name in enumerate(l2leaf_names[pair - 1]):
+            l2leaf_id += 1
+            l2leaf["node_groups"].append(
+                {
+                    "group": name,
+                    "uplink_switches": [leaf_a, leaf_b],
+                    "nodes": [
+                        {
+                            "name": name,
+                            "id": l2leaf_id,
+                            "mgmt_ip": next(mgmt_ips),
+                            "uplink_switch_interfaces": [f"Ethernet{first_l2leaf_port + index}"] * 2,
+                        }
+                    ],
+                }
+            )
+
+    network_services, svi_vlans = _generate_tenants(tenants, vrfs_per_tenant, svis_per_vrf, l2vlans_per_tenant)
+
+    servers = []
+    for pair, (leaf_a, leaf_b) in enumerate(leaf_pair_names, start=1):
+        for server in range(servers_per_leaf_pair):
+            server_name = f"SERVER{pair}-{server + 1}"
+            adapters = []
+            for adapter in range(adapters_per_server):
+                switch_port = f"Ethernet{first_server_port + server * adapters_per_server + adapter}"
+                if adapter == 0:
+                    adapters.append(
+                        {
+                            "endpoint_ports": ["PCI1", "PCI2"],
+                            "switch_ports": [switch_port, switch_port],
+                            "switches": [leaf_a, leaf_b],
+                            "vlans": svi_vlans,
+                            "mode": "trunk",
+                            "spanning_tree_portfast": "edge",
+                            "port_channel": {"description": f"PortChannel {server_name}", "mode": "active"},
+                        }
+                    )
+                else:
+                    adapters.append(
+                        {
+                            "endpoint_ports": [f"NIC{adapter}"],
+                            "switch_ports": [switch_port],
+                            "switches": [(leaf_a, leaf_b)[adapter % 2]],
+                            "vlans": str(FIRST_VLAN_ID),
+                            "mode": "access",
+                            "spanning_tree_portfast": "edge",
+                        }
+                    )
+            servers.append({"name": server_name, "adapters": adapters})
+
+    network_ports = []
+    if network_ports_per_l2leaf:
+        for names in l2leaf_names:
+            network_ports.extend(
+                {
+                    "switches": [name],
+                    "switch_ports": [f"Ethernet3-{2 + network_ports_per_l2leaf}"],
+                    "description": "ACCESS_PORT",
+                    "vlans": str(FIRST_VLAN_ID),
+                    "mode": "access",
+                    "spanning_tree_portfast": "edge",
+                }
+                for name in names
+            )
+
+    common_vars = {
+        "fabric_name": fabric_name,
+        "mgmt_gateway": str(MGMT_NETWORK.network_address + 1),
+        "underlay_routing_protocol": "ebgp",
+        "overlay_routing_protocol": "ebgp",
+        "p2p_uplinks_mtu": 1500,
+        "spine": spine,
+        "l3leaf": l3leaf,
+        "l2leaf": l2leaf,
+        "servers": servers,
+        "network_ports": network_ports,
+        **network_services,
+    }
+
+    node_types = {
+        "spine": spine_names,
+        "l3leaf": [name for names in leaf_pair_names for name in names],
+        "l2leaf": [name for names in l2leaf_names for name in names],
+    }
+    if use_default_node_types:
+        common_vars["default_node_types"] = [
+            {"node_type": "spine", "match_hostnames": ["SPINE[0-9]+"]},
+            {"node_type": "l3leaf", "match_hostnames": ["LEAF[0-9]+[AB]"]},
+            {"node_type": "l2leaf", "match_hostnames": ["L2LEAF[0-9]+-[0-9]+"]},
+        ]
+        device_vars = {hostname: {} for hostnames in node_types.values() for hostname in hostnames}
+    else:
+        device_vars = {hostname: {"type": node_type} for node_type, hostnames in node_types.items() for hostname in hostnames}
+
+    return common_vars, device_vars
+
+
+def _generate_tenants(tenants: int, vrfs_per_tenant: int, svis_per_vrf: int, l2vlans_per_tenant: int) -> tuple[dict, str]:
+    """
+    Return network services with unique VLANs, VNIs and subnets across all tenants and the range of SVI VLANs in the first VRF.
+    """
+    vlan_ids = iter(range(FIRST_VLAN_ID, LAST_VLAN_ID + 1))
+    vrf_vni = 0
+    tenant_list = []
+    for tenant in range(1, tenants + 1):
+        vrfs = []
+        for _ in range(vrfs_per_tenant):
+            vrf_vni += 1
+            svis = []
+            for _ in range(svis_per_vrf):
+                vlan_id = next(vlan_ids)
+                # One /24 per VLAN ID.
+                svis.append(
+                    {
+                        "id": vlan_id,
+                        "name": f"VRF{vrf_vni}_VLAN{vlan_id}",
+                        "enabled": True,
+                        "ip_address_virtual": f"{SVI_NETWORK.network_address + (vlan_id << 8) + 1}/24",
+                    }
+                )
+            vrfs.append({"name": f"VRF{vrf_vni}", "vrf_vni": vrf_vni, "mlag_ibgp_peering_vlan": next(vlan_ids), "svis": svis})
+
+        l2vlans = [{"id": (vlan_id := next(vlan_ids)), "name": f"L2_VLAN{vlan_id}"} for _ in range(l2vlans_per_tenant)]
+        tenant_list.append({"name": f"TENANT{tenant}", "mac_vrf_vni_base": 10000, "vrfs": vrfs, "l2vlans": l2vlans})
+
+    first_vrf_svis = tenant_list[0]["vrfs"][0]["svis"] if tenant_list and tenant_list[0]["vrfs"] else []
+    svi_vlans = f"{first_vrf_svis[0]['id']}-{first_vrf_svis[-1]['id']}" if first_vrf_svis else str(FIRST_VLAN_ID)
+    return {"tenants": tenant_list}, svi_vlans
+
+
+def generate_fabric(**kwargs) -> dict[str, dict]:
+    """
+    Generate eos_designs inputs for a L3LS EVPN fabric of the given size.
+
+    The generated variables can be given directly to `pyavd.validate_inputs` and `pyavd.get_avd_facts`.
+    Common vars are shared between the devices, like group_vars in Ansible.
+
+    Parameters
+    ----------
+    **kwargs
+        Size parameters passed on to "generate_fabric_vars".
+
+    Returns
+    -------
+    dict[str, dict]
+        All variables per device.
+    """
+    common_vars, device_vars = generate_fabric_vars(**kwargs)
+    return {hostname: {**common_vars, **hostvars} for hostname, hostvars in device_vars.items()}
+
+
+def run_generate_fabric(output_dir: str, **kwargs) -> None:
+    """
+    Generate eos_designs inputs for a L3LS EVPN fabric and write them to files.
+
+    Intended for CLI use via generate_fabric.py
+
+    Common vars are written to "<output_dir>/common_vars.json" and device vars to "<output_dir>/vars/<hostname>.json",
+    so the files can be used with "runner.py --common_varfile <output_dir>/common_vars.json --device_varfiles '<output_dir>/vars/*'".
+
+    Parameters
+    ----------
+    output_dir : str
+        Path to dir for the output files.
+    **kwargs
+        Size parameters passed on to "generate_fabric_vars".
+    """
+    common_vars, device_vars = generate_fabric_vars(**kwargs)
+
+    makedirs(path.join(output_dir, "vars"), exist_ok=True)
+    with open(path.join(output_dir, "common_vars.json"), "w", encoding="UTF-8") as file:
+        json.dump(common_vars, file)
+
+    for hostname, hostvars in device_vars.items():
+        with open(path.join(output_dir, "vars", f"{hostname}.json"), "w", encoding="UTF-8") as file:
+            json.dump(hostvars, file)
+
+    print(
+        f"Generated inputs for {len(device_vars)} devices with {sum(len(server['adapters']) for server in common_vars['servers'])} adapters in '{output_dir}'"
+    )
@@ -1,15 +1,27 @@
 import glob
+import os
 from concurrent.futures import ProcessPoolExecutor
-from itertools import repeat
+from multiprocessing import get_context
 from os import path
 
 from ..get_avd_facts import get_avd_facts
-from ..get_device_config import get_device_config
-from ..get_device_doc import get_device_doc
-from ..get_device_structured_config import get_device_structured_config
+from ..get_structured_configs import get_structured_configs
 from ..validate_inputs import validate_inputs
+from ..vendor.render_timings import write_render_timings_file
+from ..vendor.template_profiler import aggregate_template_profiles, write_template_profile_files
+from ..write_device_config import write_device_config
+from ..write_device_doc import write_device_doc
 from .read_vars import read_vars
-from .write_result import write_result, write_yaml_result
+from .write_result import write_data_result
+
+# Leveraging copy on write from fork. Data shared by all devices is inherited by the workers instead of being pickled for every device.
+GLOBALS = {}
+
+# Structured configs generated by run_eos_designs_structured_configs in this process, keyed by hostname.
+# When eos_cli_config_gen is run in the same invocation, the process workers are forked from this process and read the structured configs
+# from here instead of parsing the files written by eos_designs again.
+# The structured configs are only kept until the next run_eos_cli_config_gen call has finished.
+STRUCTURED_CONFIGS: dict[str, dict] = {}
 
 
 def run_eos_cli_config_gen_process(
@@ -18,7 +30,9 @@ def run_eos_cli_config_gen_process(
     struct_cfg_file_dir: str | None,
     cfg_file_dir: str | None,
     doc_file_dir: str | None,
-) -> None:
+    template_profile_dir: str | None = None,
+    struct_cfgfile_format: str = "yml",
+) -> tuple[str, dict | None, dict | None]:
     """
     Function run as process by ProcessPoolExecutor.
 
@@ -37,30 +51,54 @@ def run_eos_cli_config_gen_process(
         Path to dir for output config file if set.
     doc_file_dir: str | None
         Path to dir for output documentation file if set.
-    verbosity: int
-        Vebosity level for output. Passed along to other functions
+    template_profile_dir: str | None
+        Path to dir for output template profile files if set.
+    struct_cfgfile_format: str
+        File extension "yml" or "json" of the input structured_config files.
+
+    Returns
+    -------
+    tuple[str, dict | None, dict | None]
+        Hostname and the template profiles of the configuration and documentation if template_profile_dir is set.
     """
 
     render_configuration = cfg_file_dir is not None
     render_documentation = doc_file_dir is not None
+    config_template_profile = {} if render_configuration and template_profile_dir is not None else None
+    doc_template_profile = {} if render_documentation and template_profile_dir is not None else None
 
     device_vars = common_vars.copy()
     device_vars.update(read_vars(device_var_file))
     hostname = str(path.basename(device_var_file)).removesuffix(".yaml").removesuffix(".yml").removesuffix(".json")
-    if struct_cfg_file_dir is not None:
-        structured_config_file = path.join(struct_cfg_file_dir, f"{hostname}.yml")
+    if hostname in STRUCTURED_CONFIGS:
+        device_vars.update(STRUCTURED_CONFIGS[hostname])
+    elif struct_cfg_file_dir is not None:
+        structured_config_file = path.join(struct_cfg_file_dir, f"{hostname}.{struct_cfgfile_format}")
         device_vars.update(read_vars(structured_config_file))
 
     validate_inputs({hostname: device_vars}, eos_designs=False, eos_cli_config_gen=True)
 
     if render_configuration:
-        configuration = get_device_config(hostname, device_vars)
-        write_result(path.join(cfg_file_dir, f"{hostname}.cfg"), configuration)
+        write_device_config(hostname, device_vars, path.join(cfg_file_dir, f"{hostname}.cfg"), template_profile=config_template_profile)
     if render_documentation:
-        documentation = get_device_doc(hostname, device_vars)
-        write_result(path.join(doc_file_dir, f"{hostname}.md"), documentation)
+        write_device_doc(hostname, device_vars, path.join(doc_file_dir, f"{hostname}.md"), template_profile=doc_template_profile)
+
+    if config_template_profile is not None:
+        write_template_profile_files(path.join(template_profile_dir, "configs", f"{hostname}.json"), config_template_profile)
+    if doc_template_profile is not None:
+        write_template_profile_files(path.join(template_profile_dir, "devices", f"{hostname}.json"), doc_template_profile)
 
     print(f"OK: {hostname}")
+    return hostname, config_template_profile, doc_template_profile
+
+
+def _run_eos_cli_config_gen_worker(device_var_file: str) -> tuple[str, dict | None, dict | None]:
+    """
+    Function run as process by ProcessPoolExecutor.
+
+    Run eos_cli_config_gen for one device with the shared arguments inherited from the parent process.
+    """
+    return run_eos_cli_config_gen_process(device_var_file, **GLOBALS["eos_cli_config_gen_kwargs"])
 
 
 def run_eos_cli_config_gen(
@@ -69,6 +107,8 @@ def run_eos_cli_config_gen(
     struct_cfg_file_dir: str | None,
     cfgfiles_dir: str | None,
     docfiles_dir: str | None,
+    template_profile_dir: str | None = None,
+    struct_cfgfile_format: str = "yml",
 ) -> None:
     """
     Read common variables from files and run eos_cli_config_gen for each device in process workers.
@@ -88,6 +128,14 @@ def run_eos_cli_config_gen(
         Path to dir for output config files if set.
     docfiles_dir: str | None
         Path to dir for output documentation files if set.
+    template_profile_dir: str | None
+        Path to dir for output template profile files if set. Profiles are written per device to "configs/<hostname>.json"
+        and "devices/<hostname>.json" and aggregated across the fabric to "configs.json" and "devices.json".
+        The stacks are also written in the "folded stacks" format read by flamegraph tools to ".folded" files next to the JSON files.
+    struct_cfgfile_format: str
+        File extension "yml" or "json" of the input structured_config files.
+        Structured configs generated by run_eos_designs_structured_configs in the same process are used without reading the files.
+        They are released when this function returns.
     """
 
     # Read common vars
@@ -96,22 +144,41 @@ def run_eos_cli_config_gen(
     for file in common_varfiles:
         common_vars.update(read_vars(file))
 
-    with ProcessPoolExecutor(max_workers=20) as executor:
-        return_values = executor.map(
-            run_eos_cli_config_gen_process,
-            glob.iglob(device_varfiles),
-            repeat(common_vars),
-            repeat(struct_cfg_file_dir),
-            repeat(cfgfiles_dir),
-            repeat(docfiles_dir),
-        )
-
-    for return_value in return_values:
-        if return_value is not None:
-            print(return_value)
-
-
-def run_eos_designs_facts(common_varfiles: list[str], device_varfiles: str, facts_file: str) -> None:
+    if template_profile_dir is not None:
+        for subdir in ("configs", "devices"):
+            os.makedirs(path.join(template_profile_dir, subdir), exist_ok=True)
+
+    GLOBALS["eos_cli_config_gen_kwargs"] = {
+        "common_vars": common_vars,
+        "struct_cfg_file_dir": struct_cfg_file_dir,
+        "cfg_file_dir": cfgfiles_dir,
+        "doc_file_dir": docfiles_dir,
+        "template_profile_dir": template_profile_dir,
+        "struct_cfgfile_format": struct_cfgfile_format,
+    }
+    try:
+        # Only the path of the device var file is sent to the workers for each device.
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context("fork")) as executor:
+            return_values = list(executor.map(_run_eos_cli_config_gen_worker, glob.iglob(device_varfiles)))
+    finally:
+        GLOBALS.clear()
+        STRUCTURED_CONFIGS.clear()
+
+    config_template_profiles = {}
+    doc_template_profiles = {}
+    for hostname, config_template_profile, doc_template_profile in return_values:
+        if config_template_profile is not None:
+            config_template_profiles[hostname] = config_template_profile
+        if doc_template_profile is not None:
+            doc_template_profiles[hostname] = doc_template_profile
+
+    if config_template_profiles:
+        write_template_profile_files(path.join(template_profile_dir, "configs.json"), aggregate_template_profiles(config_template_profiles))
+    if doc_template_profiles:
+        write_template_profile_files(path.join(template_profile_dir, "devices.json"), aggregate_template_profiles(doc_template_profiles))
+
+
+def run_eos_designs_facts(common_varfiles: list[str], device_varfiles: str, facts_file: str, render_timings_dir: str | None = None) -> None:
     """
     Read variables from files and run eos_designs_facts.
 
@@ -125,7 +192,9 @@ def run_eos_designs_facts(common_varfiles: list[str], device_varfiles: str, fact
         Glob for device specific var files to import and merge on top of common vars.
         Filenames will be used as hostnames.
     facts_file: str
-        Path to output facts file
+        Path to output facts file. Written as JSON if the extension is ".json" and otherwise as YAML.
+    render_timings_dir: str | None
+        Path to dir for output render timings file "eos_designs_facts.json" if set.
     """
 
     # Read common vars
@@ -148,47 +217,16 @@ def run_eos_designs_facts(common_varfiles: list[str], device_varfiles: str, fact
 
     print("Validated ", end=None)
 
-    facts = get_avd_facts(all_hostvars)
+    render_timings = {} if render_timings_dir is not None else None
+    facts = get_avd_facts(all_hostvars, max_workers=os.cpu_count(), render_timings=render_timings)
 
     if facts_file:
-        write_yaml_result(facts_file, facts)
-
-    print("OK eos_designs_facts")
-
+        write_data_result(facts_file, facts)
 
-def run_eos_designs_structured_configs_process(device_var_file: str, common_vars: dict, avd_facts: dict, struct_cfg_file_dir: str) -> None:
-    """
-    Function run as process by ProcessPoolExecutor.
-
-    Read device variables from files and run eos_designs_structured_configs for one device.
+    if render_timings is not None:
+        write_render_timings_file(path.join(render_timings_dir, "eos_designs_facts.json"), render_timings)
 
-    Parameters
-    ----------
-    device_var_file : str
-        Path to device specific var file to import and shallow merge on top of common vars and facts.
-        Filename will be used as hostname.
-    common_vars : dict
-        Common vars to be applied to all devices.
-        Per-device facts will be extracted from avd_switch_facts and merged on top of device vars.
-    avd_facts : dict
-        Dictionary of avd_facts as returned from 'get_avd_facts'.
-    struct_cfg_file_dir: str
-        Path to dir for output structured_config files.
-    """
-
-    hostname = str(path.basename(device_var_file)).removesuffix(".yaml").removesuffix(".yml").removesuffix(".json")
-
-    device_vars = common_vars.copy()
-    device_vars.update(read_vars(device_var_file))
-
-    validate_inputs({hostname: device_vars}, eos_designs=True, eos_cli_config_gen=False)
-
-    structured_configuration = get_device_structured_config(hostname, device_vars, avd_facts)
-    write_yaml_result(
-        path.join(struct_cfg_file_dir, f"{hostname}.yml"),
-        structured_configuration,
-    )
-    print(f"OK: {hostname}")
+    print("OK eos_designs_facts")
 
 
 def run_eos_designs_structured_configs(
@@ -196,9 +234,11 @@ def run_eos_designs_structured_configs(
     fact_file: str,
     device_varfiles: str,
     struct_cfgfiles: str,
+    render_timings_dir: str | None = None,
+    struct_cfgfile_format: str = "yml",
 ) -> None:
     """
-    Read common variables from files and run eos_cli_config_gen for each device in process workers.
+    Read common variables from files and run eos_designs_structured_configs for each device in process workers.
 
     Intended for CLI use via runner.py
 
@@ -213,6 +253,11 @@ def run_eos_designs_structured_configs(
         Filenames will be used as hostname.
     struct_cfgfiles: str
         Path to dir for output structured_config files.
+    render_timings_dir: str | None
+        Path to dir for output render timings file "eos_designs_structured_configs.json" if set.
+    struct_cfgfile_format: str
+        File extension "yml" or "json" of the output structured_config files.
+        The structured configs are also kept in memory for run_eos_cli_config_gen in the same process.
     verbosity: int
         Vebosity level for output. Passed along to other functions
     """
@@ -225,15 +270,29 @@ def run_eos_designs_structured_configs(
 
     avd_facts = read_vars(fact_file)
 
-    with ProcessPoolExecutor(max_workers=10) as executor:
-        return_values = executor.map(
-            run_eos_designs_structured_configs_process,
-            glob.iglob(device_varfiles),
-            repeat(common_vars),
-            repeat(avd_facts),
-            repeat(struct_cfgfiles),
+    all_hostvars = {}
+    for device_var_file in glob.iglob(device_varfiles):
+        device_vars = common_vars.copy()
+        device_vars.update(read_vars(device_var_file))
+        hostname = str(path.basename(device_var_file)).removesuffix(".yaml").removesuffix(".yml").removesuffix(".json")
+
+        all_hostvars[hostname] = device_vars
+
+    validate_inputs(all_hostvars, eos_designs=True, eos_cli_config_gen=False)
+
+    # Drop structured configs left over from an earlier call which was not followed by run_eos_cli_config_gen.
+    STRUCTURED_CONFIGS.clear()
+    timings = {}
+    render_timings = {} if render_timings_dir is not None else None
+    for hostname, structured_configuration in get_structured_configs(
+        all_hostvars, avd_facts, workers=os.cpu_count(), timings=timings, render_timings=render_timings
+    ):
+        STRUCTURED_CONFIGS[hostname] = structured_configuration
+        write_data_result(
+            path.join(struct_cfgfiles, f"{hostname}.{struct_cfgfile_format}"),
+            structured_configuration,
         )
+        print(f"OK: {hostname} ({timings[hostname]:.3f}s)")
 
-    for return_value in return_values:
-        if return_value is not None:
-            print(return_value)
+    if render_timings is not None:
+        write_render_timings_file(path.join(render_timings_dir, "eos_designs_structured_configs.json"), render_timings)
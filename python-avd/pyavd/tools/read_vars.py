@@ -1,19 +1,11 @@
-from json import JSONDecodeError
-from json import loads as json_loads
 from sys import stdin
 
-from yaml import unsafe_load as yaml_load
+from ..vendor.utils import read_data_file
 
 
 def read_vars(filename):
     if filename == "/dev/stdin" and stdin.isatty():
         print("Write variables in YAML or JSON format and end with ctrl+d to exit")
-    with open(filename, "r", encoding="UTF-8") as file:
-        data = file.read()
 
-    try:
-        return json_loads(data)
-    except JSONDecodeError:
-        pass
-
-    return yaml_load(data) or {}
+    # The parser is selected by the file extension. Files without a known extension are parsed as JSON first and then as YAML.
+    return read_data_file(filename) or {}
@@ -1,12 +1,16 @@
+import os
 from concurrent.futures import ProcessPoolExecutor
 from glob import iglob
-from itertools import repeat
+from multiprocessing import get_context
 from os import path
 
 from ..templater import Templar
 from .read_vars import read_vars
 from .write_result import write_result
 
+# Leveraging copy on write from fork. The common vars are inherited by the workers instead of being pickled for every file.
+GLOBALS = {}
+
 
 def run_template_var_files_process(device_var_file: str, common_vars: dict):
     """
@@ -25,6 +29,13 @@ def run_template_var_files_process(device_var_file: str, common_vars: dict):
     print(f"OK: {device_var_file}")
 
 
+def _run_template_var_files_worker(device_var_file: str):
+    """
+    Function run as process by ProcessPoolExecutor
+    """
+    return run_template_var_files_process(device_var_file, GLOBALS["common_vars"])
+
+
 def run_template_var_files(common_varfiles: list[str], device_varfiles: str):
     # Read common vars
     common_vars = {}
@@ -32,21 +43,17 @@ def run_template_var_files(common_varfiles: list[str], device_varfiles: str):
     for file in common_varfiles:
         common_vars.update(read_vars(file))
 
-    # First template the common var files using their own vars
-    with ProcessPoolExecutor(max_workers=20) as executor:
-        return_values = executor.map(
-            run_template_var_files_process,
-            common_varfiles,
-            repeat(common_vars),
-        )
-
-    # Next template the device var files
-    with ProcessPoolExecutor(max_workers=20) as executor:
-        return_values = executor.map(
-            run_template_var_files_process,
-            iglob(device_varfiles),
-            repeat(common_vars),
-        )
+    GLOBALS["common_vars"] = common_vars
+    try:
+        # First template the common var files using their own vars
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context("fork")) as executor:
+            return_values = executor.map(_run_template_var_files_worker, common_varfiles)
+
+        # Next template the device var files
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context("fork")) as executor:
+            return_values = executor.map(_run_template_var_files_worker, iglob(device_varfiles))
+    finally:
+        GLOBALS.clear()
 
     for return_value in return_values:
         if return_value is not None:
@@ -1,9 +1,4 @@
-import yaml
-
-
-class NoAliasDumper(yaml.SafeDumper):
-    def ignore_aliases(self, data):
-        return True
+from ..vendor.utils import dump_data, get_data_format
 
 
 def write_result(filename, result):
@@ -16,4 +11,11 @@ def write_result(filename, result):
 
 
 def write_yaml_result(filename, data):
-    write_result(filename, yaml.dump(data, Dumper=NoAliasDumper, sort_keys=False, width=130))
+    write_result(filename, dump_data(data, "yaml"))
+
+
+def write_data_result(filename, data):
+    """
+    Write data as JSON or YAML depending on the file extension. Files without a known extension are written as YAML.
+    """
+    write_result(filename, dump_data(data, get_data_format(filename) or "yaml"))
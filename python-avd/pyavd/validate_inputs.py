@@ -31,10 +31,10 @@ def validate_inputs(
         AristaAvdError: List of validation errors across all devices.
     """
     if eos_designs:
-        eos_designs_schema_tools = AvdSchemaTools(schema_id=EOS_DESIGNS_SCHEMA_ID)
+        eos_designs_schema_tools = AvdSchemaTools(schema_id=EOS_DESIGNS_SCHEMA_ID, compiled_validator=True)
 
     if eos_cli_config_gen:
-        eos_cli_config_gen_schema_tools = AvdSchemaTools(schema_id=EOS_CLI_CONFIG_GEN_SCHEMA_ID)
+        eos_cli_config_gen_schema_tools = AvdSchemaTools(schema_id=EOS_CLI_CONFIG_GEN_SCHEMA_ID, compiled_validator=True)
 
     error_messages = []
     for hostname, hostvars in all_hostvars.items():
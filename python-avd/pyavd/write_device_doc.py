@@ -0,0 +1,45 @@
+from collections import ChainMap
+
+from .constants import JINJA2_DOCUMENTAITON_TEMPLATE
+from .templater import Templar
+from .vendor.template_profiler import TemplateProfiler
+
+
+def write_device_doc(hostname: str, hostvars: dict, dest: str, template_profile: dict | None = None) -> bool:
+    """
+    Render the device documentation using AVD eos_cli_config_gen templates and stream it directly to a file.
+
+    Same as `pyavd.get_device_doc` but without holding the full documentation in memory.
+    The documentation is written to a temporary file which is atomically renamed to `dest` if the content changed.
+
+    Args:
+        hostname: Hostname of device.
+        hostvars: Dictionary of variables applied to template.
+            Variables should be converted and validated according to AVD `eos_cli_config_gen` schema first using `pyavd.validate_inputs`.
+        dest: Path of the documentation file to write.
+        template_profile: Optional dictionary which will be updated in-place with the time spent in each included template
+            and custom filter/test while rendering the documentation.
+            ```python
+            {
+                "sections": {"<template or filter>": {"calls": int, "seconds": float, "self_seconds": float}, ...},
+                "stacks": {"<frame1>;<frame2>;...": float, ...},
+            }
+            ```
+            Use `pyavd.vendor.template_profiler.format_folded_stacks` to convert the stacks to the format read by flamegraph tools.
+
+    Returns:
+        True if the file was changed.
+    """
+
+    # Set 'inventory_hostname' on the input hostvars, to keep compatability with Ansible focused code.
+    mapped_hostvars = ChainMap({"inventory_hostname": hostname}, hostvars)
+
+    profiler = TemplateProfiler() if template_profile is not None else None
+    templar = Templar(profiler=profiler)
+    result = templar.render_template_to_file(JINJA2_DOCUMENTAITON_TEMPLATE, mapped_hostvars, dest)
+
+    if profiler is not None:
+        template_profile.clear()
+        template_profile.update(profiler.to_dict())
+
+    return result
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+
+from .get_fabric_documentation import _build_fabric_documentation
+from .vendor.utils.stream_to_file import stream_to_file
+
+
+def write_fabric_documentation(all_hostvars: dict[str, dict], avd_facts: dict, structured_configs: dict[str, dict], fabric_dir: str) -> bool:
+    """
+    Build the AVD fabric documentation, fabric topology CSV and fabric point-to-point links CSV and stream them directly to files.
+
+    Same as `pyavd.get_fabric_documentation` but the CSV rows are streamed to the files without joining them in memory.
+    The files are named like the files generated by the `eos_designs` role:
+    `<fabric_name>-documentation.md`, `<fabric_name>-topology.csv` and `<fabric_name>-p2p-links.csv`.
+    Each file is written to a temporary file which is atomically renamed to the destination if the content changed.
+
+    Args:
+        all_hostvars: A dictionary where keys are hostnames and values are dictionaries of all variables per devices.
+            Variables should be converted and validated according to AVD `eos_designs` schema first using `pyavd.validate_inputs`.
+            ```python
+            {
+                "<hostname1>": dict,
+                "<hostname2>": dict,
+                ...
+            }
+            ```
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        structured_configs: A dictionary where keys are hostnames and values are the structured configs
+            as returned from `pyavd.get_device_structured_config`.
+        fabric_dir: Path of the directory to write the files to. The directory must exist.
+
+    Returns:
+        True if any of the files were changed.
+    """
+    fabric_documentation = _build_fabric_documentation(all_hostvars, avd_facts, structured_configs)
+    fabric_name = fabric_documentation.fabric_name
+
+    changed = False
+    for filename, chunks in (
+        (f"{fabric_name}-documentation.md", [fabric_documentation.get_documentation()]),
+        (f"{fabric_name}-topology.csv", fabric_documentation.topology_csv_lines()),
+        (f"{fabric_name}-p2p-links.csv", fabric_documentation.p2p_links_csv_lines()),
+    ):
+        changed = stream_to_file(chunks, os.path.join(fabric_dir, filename))["changed"] or changed
+
+    return changed
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+import argparse
+
+from pyavd.tools.benchmark import DEFAULT_SCALES, run_benchmarks
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="Benchmark",
+        description=(
+            "Time each stage of the AVD pipeline for fabrics of increasing size built from the given device vars."
+            " Reports the time per device for each size and the scaling exponent of each stage, where 1.0 means linear scaling."
+        ),
+        epilog="See https://avd.sh/en/stable/ for details on supported variables",
+    )
+    parser.add_argument(
+        "--device_varfiles",
+        "-g",
+        help=(
+            "Glob covering paths to YAML or JSON Files where device variables are read from."
+            " Files matched by the glob will be iterated over,"
+            " and the filename will decide the hostname of each device."
+            " NOTE: Remember to enclose the glob in single quotes to avoid shell from expanding it."
+        ),
+    )
+    parser.add_argument(
+        "--synthetic_fabric",
+        "-s",
+        help=(
+            "Benchmark generated fabrics instead of the device var files."
+            " Comma separated list of size parameters for the fabric generator like 'leaf_pairs=64,servers_per_leaf_pair=20'."
+            " The number of leaf pairs is multiplied by each of the scales."
+            " Use an empty string to use the defaults of the generator."
+        ),
+    )
+    parser.add_argument(
+        "--scales",
+        help="Comma separated list of fractions of the devices to use for each fabric size.",
+        default=",".join(str(scale) for scale in DEFAULT_SCALES),
+    )
+    parser.add_argument(
+        "--stages",
+        help="Comma separated list of stages to run. All stages are run by default.",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        help="Number of runs per stage and size. The best time is reported.",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Destination JSON file for the results.",
+    )
+
+    args = parser.parse_args()
+
+    if args.device_varfiles is None and args.synthetic_fabric is None:
+        parser.error("one of the arguments --device_varfiles or --synthetic_fabric is required")
+
+    synthetic_fabric = None
+    if args.synthetic_fabric is not None:
+        synthetic_fabric = {}
+        for parameter in filter(None, args.synthetic_fabric.split(",")):
+            key, value = parameter.split("=", 1)
+            synthetic_fabric[key.strip()] = int(value) if value.strip().isdigit() else value.strip()
+
+    run_benchmarks(
+        args.device_varfiles,
+        scales=[float(scale) for scale in args.scales.split(",")],
+        stages=args.stages.split(",") if args.stages else None,
+        repeat=args.repeat,
+        output_file=args.output,
+        synthetic_fabric=synthetic_fabric,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,12 @@
 #!/usr/bin/env python3
-from pickle import HIGHEST_PROTOCOL, dump
 from sys import path
 
-from yaml import safe_load
-
 path.append(".")
 
-from pyavd.vendor.schema.default_schemas import DEFAULT_PICKLED_SCHEMAS, DEFAULT_SCHEMAS
+from pyavd.vendor.schema.default_schemas import DEFAULT_SCHEMA_CACHE_FILE, DEFAULT_SCHEMAS
+from pyavd.vendor.schema.schema_cache import build_schema_cache, get_schema_cache_key, write_schema_cache
+from pyavd.vendor.version import VERSION
 
-for schema, schema_file in DEFAULT_SCHEMAS.items():
-    print(f"Pickling schema {schema}: {schema_file}")
-    pickle_file = DEFAULT_PICKLED_SCHEMAS[schema]
-    with open(schema_file, "r", encoding="UTF-8") as file:
-        schema_file_data = safe_load(file.read())
-    with open(pickle_file, "wb") as file:
-        dump(schema_file_data, file, HIGHEST_PROTOCOL)
+print(f"Building schema cache {DEFAULT_SCHEMA_CACHE_FILE} from schemas {', '.join(DEFAULT_SCHEMAS)}")
+schema_cache = build_schema_cache(DEFAULT_SCHEMAS, get_schema_cache_key(DEFAULT_SCHEMAS, VERSION))
+write_schema_cache(DEFAULT_SCHEMA_CACHE_FILE, schema_cache)
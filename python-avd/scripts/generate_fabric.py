@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import argparse
+import inspect
+
+from pyavd.tools.generate_fabric import generate_fabric_vars, run_generate_fabric
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="Generate Fabric",
+        description=(
+            "Generate eos_designs inputs for a synthetic L3LS EVPN fabric of the given size."
+            " Common vars are written to <output_dir>/common_vars.json and device vars to <output_dir>/vars/<hostname>.json"
+            " for use with 'runner.py --common_varfile <output_dir>/common_vars.json --device_varfiles <output_dir>/vars/*'."
+        ),
+        epilog="See https://avd.sh/en/stable/ for details on supported variables",
+    )
+    parser.add_argument(
+        "--output_dir",
+        "-o",
+        help="Destination directory for the generated var files.",
+        required=True,
+    )
+    for name, parameter in inspect.signature(generate_fabric_vars).parameters.items():
+        if isinstance(parameter.default, bool):
+            parser.add_argument(f"--{name}", help=f"Default: {parameter.default}", action="store_true")
+        else:
+            parser.add_argument(f"--{name}", help=f"Default: {parameter.default}", type=type(parameter.default), default=parameter.default)
+
+    args = vars(parser.parse_args())
+    run_generate_fabric(args.pop("output_dir"), **args)
+
+
+if __name__ == "__main__":
+    main()
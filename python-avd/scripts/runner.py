@@ -73,9 +73,17 @@ def main():
         "-s",
         help=(
             "Source/Destination directory for device structured configuration files Filenames will be <hostname>.yml"
+            " or <hostname>.json depending on --struct_cfgfile_format."
             " Will be used as input for eos_cli_config_gen and output for eos_designs"
+            " When both are run in the same invocation, eos_cli_config_gen uses the structured configurations from memory."
         ),
     )
+    parser.add_argument(
+        "--struct_cfgfile_format",
+        help="File format of the device structured configuration files. JSON is much faster to write and read than YAML.",
+        choices=["yml", "json"],
+        default="yml",
+    )
     parser.add_argument(
         "--common_struct_cfgfile",
         "-t",
@@ -97,6 +105,23 @@ def main():
         "-d",
         help="Destination directory for device documentation files Filenames will be <hostname>.md",
     )
+    parser.add_argument(
+        "--render_timings_dir",
+        help=(
+            "Destination directory for render timings of eos_designs_facts and eos_designs_structured_configs."
+            " Timings per device and aggregated across the fabric are written to 'eos_designs_facts.json'"
+            " and 'eos_designs_structured_configs.json'. NOTE: Facts are rendered in a single process when this option is set."
+        ),
+    )
+    parser.add_argument(
+        "--template_profile_dir",
+        help=(
+            "Destination directory for template profiles of eos_cli_config_gen."
+            " The time spent in each included template and custom filter/test is written per device to 'configs/<hostname>.json'"
+            " and 'devices/<hostname>.json' and aggregated across the fabric to 'configs.json' and 'devices.json'."
+            " The stacks of templates are also written to '.folded' files in the format read by flamegraph tools."
+        ),
+    )
     parser.add_argument(
         "--template_vars",
         "-j",
@@ -116,7 +141,7 @@ def main():
         run_template_var_files(args.common_varfile, args.device_varfiles)
 
     if args.eos_designs_facts:
-        run_eos_designs_facts(args.common_varfile, args.device_varfiles, args.factsfile)
+        run_eos_designs_facts(args.common_varfile, args.device_varfiles, args.factsfile, args.render_timings_dir)
 
     if args.eos_designs_structured_configs:
         run_eos_designs_structured_configs(
@@ -124,6 +149,8 @@ def main():
             args.factsfile,
             args.device_varfiles,
             args.struct_cfgfiles,
+            args.render_timings_dir,
+            args.struct_cfgfile_format,
         )
 
     if args.eos_cli_config_gen:
@@ -133,6 +160,8 @@ def main():
             args.struct_cfgfiles,
             args.cfgfiles,
             args.docfiles,
+            args.template_profile_dir,
+            args.struct_cfgfile_format,
         )
 
 
@@ -7,8 +7,4 @@ DEFAULT_SCHEMAS = {
     "eos_designs": pyavd_dir.joinpath("vendor", "schemas", "eos_designs.schema.yml"),
 }
 
-DEFAULT_PICKLED_SCHEMAS = {
-    "avd_meta_schema": pyavd_dir.joinpath("vendor", "schemas", "avd_meta_schema.pickle"),
-    "eos_cli_config_gen": pyavd_dir.joinpath("vendor", "schemas", "eos_cli_config_gen.schema.pickle"),
-    "eos_designs": pyavd_dir.joinpath("vendor", "schemas", "eos_designs.schema.pickle"),
-}
+DEFAULT_SCHEMA_CACHE_FILE = pyavd_dir.joinpath("vendor", "schemas", "schemas.pickle")
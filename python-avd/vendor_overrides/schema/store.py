@@ -1,14 +1,24 @@
 from functools import lru_cache
-from pickle import load
 
-from pyavd.vendor.schema.default_schemas import DEFAULT_PICKLED_SCHEMAS
+from pyavd.vendor.schema.default_schemas import DEFAULT_SCHEMA_CACHE_FILE, DEFAULT_SCHEMAS
+from pyavd.vendor.schema.schema_cache import build_schema_cache, read_schema_cache
 
 
 @lru_cache
-def create_store():
-    store = {}
-    for id, schema_file in DEFAULT_PICKLED_SCHEMAS.items():
-        with open(schema_file, "rb") as file:
-            store[id] = load(file)
+def load_schema_cache() -> dict:
+    """
+    Load the builtin schemas, the fully resolved schemas and the derived indexes.
+
+    pyavd ships with the schema cache built by scripts/compile_schemas.py.
+    If the cache file is missing, the schemas are loaded from the schema files instead.
+
+    The loaded cache is shared by all AvdSchema instances in this process, so it must not be modified.
+    """
+    if (schema_cache := read_schema_cache(DEFAULT_SCHEMA_CACHE_FILE)) is not None:
+        return schema_cache
 
-    return store
+    return build_schema_cache(DEFAULT_SCHEMAS)
+
+
+def create_store():
+    return load_schema_cache()["store"]
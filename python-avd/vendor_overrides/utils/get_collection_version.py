@@ -0,0 +1,11 @@
+from functools import lru_cache
+
+from pyavd.vendor.version import VERSION
+
+
+@lru_cache
+def get_collection_version() -> str:
+    """
+    Returns the version of the arista.avd collection vendored in pyavd.
+    """
+    return VERSION
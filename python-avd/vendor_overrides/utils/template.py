@@ -5,3 +5,7 @@ Dummy. Not needed for pyavd, but is imported in __init__.py
 
 def template(*args) -> str:
     raise NotImplementedError("Jinja Templating is not implemented in pyavd")
+
+
+def template_generator(*args):
+    raise NotImplementedError("Jinja Templating is not implemented in pyavd")